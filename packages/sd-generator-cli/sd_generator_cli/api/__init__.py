@@ -6,9 +6,15 @@ session management, file I/O, progress reporting, and batch orchestration.
 """
 
 from .sdapi_client import SDAPIClient, GenerationConfig, PromptConfig
+from .http_transport import HTTPTransport, CircuitOpenError
+from .async_sdapi_client import AsyncSDAPIClient
+from .response_stream import StreamedImage
 from .session_manager import SessionManager
 from .image_writer import ImageWriter
 from .progress_reporter import ProgressReporter, SilentProgressReporter
+from .generation_pipeline import GenerationPipeline, PipelineResult
+from .backend_dispatcher import BackendDispatcher, BackendStats, create_api_client, create_pipeline
+from .result_cache import ResultCache, create_result_cache_from_config
 from .batch_generator import BatchGenerator, create_batch_generator
 from .annotation_worker import AnnotationWorker, create_annotation_worker_from_config
 
@@ -16,10 +22,22 @@ __all__ = [
     'SDAPIClient',
     'GenerationConfig',
     'PromptConfig',
+    'HTTPTransport',
+    'CircuitOpenError',
+    'AsyncSDAPIClient',
+    'StreamedImage',
     'SessionManager',
     'ImageWriter',
     'ProgressReporter',
     'SilentProgressReporter',
+    'GenerationPipeline',
+    'PipelineResult',
+    'BackendDispatcher',
+    'BackendStats',
+    'create_api_client',
+    'create_pipeline',
+    'ResultCache',
+    'create_result_cache_from_config',
     'BatchGenerator',
     'create_batch_generator',
     'AnnotationWorker',
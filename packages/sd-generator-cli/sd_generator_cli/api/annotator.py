@@ -5,7 +5,7 @@ Adds text annotations to generated images showing which variations were used
 (haircut, haircolor, expression, etc.) for easy reference and organization.
 """
 
-import json
+import io
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
 
@@ -20,6 +20,9 @@ except ImportError:
     ImageDraw = None  # type: ignore
     ImageFont = None  # type: ignore
 
+from .response_stream import write_atomic
+from ..execution.manifest import load_manifest
+
 
 class ImageAnnotator:
     """Annotates images with variation metadata text overlays."""
@@ -170,6 +173,11 @@ class ImageAnnotator:
         if save_path.suffix.lower() in ['.jpg', '.jpeg']:
             img = img.convert('RGB')  # type: ignore
 
+        # Encode in memory, then rename into place: the original may be a
+        # hardlink to a result cache entry, which must not be modified
+        buffer = io.BytesIO()
+        image_format = Image.registered_extensions().get(save_path.suffix.lower(), 'PNG')  # type: ignore
+
         # For PNG files, preserve metadata
         if save_path.suffix.lower() == '.png':
             from PIL import PngImagePlugin
@@ -186,11 +194,15 @@ class ImageAnnotator:
                             continue
                     pnginfo.add_text(key, str(value))
 
-            img.save(save_path, pnginfo=pnginfo)
+            img.save(buffer, format=image_format, pnginfo=pnginfo)
+        elif 'exif' in original_metadata:
+            # WebP/JPEG: SD parameters live in EXIF (see output_encoder)
+            img.save(buffer, format=image_format, exif=original_metadata['exif'])
         else:
             # Non-PNG formats (JPEG, etc.) - save normally
-            img.save(save_path)
+            img.save(buffer, format=image_format)
 
+        write_atomic(save_path, [buffer.getvalue()])
         return save_path
 
 
@@ -228,9 +240,8 @@ def annotate_session(
         print(f"Warning: No manifest.json found in {session_dir}")
         return 0
 
-    # Load manifest
-    with open(manifest_path, 'r', encoding='utf-8') as f:
-        manifest = json.load(f)
+    # Load manifest (interned manifests and images journal included)
+    manifest = load_manifest(session_dir)
 
     images = manifest.get('images', [])
     if not images:
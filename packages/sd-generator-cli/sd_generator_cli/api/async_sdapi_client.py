@@ -0,0 +1,295 @@
+"""
+Asynchronous HTTP client for Stable Diffusion WebUI API
+
+Same surface as SDAPIClient (generate_image, get_samplers, get_options...)
+as coroutines, for asyncio consumers (FastAPI backend, watchdogs): one event
+loop can keep several generations, progress polls and metadata queries in
+flight without threads.
+
+Built on httpx (optional dependency: ``pip install httpx``), with the same
+policies as HTTPTransport: pooled keep-alive connections, exponential-backoff
+retries for connection errors and transient 5xx, circuit breaker, TTL cache
+for metadata. Cancelling a generate_image() task also interrupts the render
+on the WebUI.
+"""
+
+import asyncio
+import copy
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore
+
+from .sdapi_client import GenerationConfig, PayloadBuilder, PromptConfig
+from .http_transport import CircuitBreaker, RETRY_STATUSES
+from ..templating.normalizers.normalizer import PromptNormalizer
+
+
+class AsyncSDAPIClient(PayloadBuilder):
+    """
+    Asyncio HTTP client for Stable Diffusion WebUI API
+
+    Example:
+        >>> async with AsyncSDAPIClient("http://127.0.0.1:7860") as client:
+        ...     samplers, response = await asyncio.gather(
+        ...         client.get_samplers(),
+        ...         client.generate_image(prompt_config)
+        ...     )
+    """
+
+    def __init__(self,
+                 api_url: str = "http://127.0.0.1:7860",
+                 max_connections: int = 8,
+                 max_retries: int = 5,
+                 backoff_factor: float = 1.0,
+                 max_backoff: float = 30.0,
+                 connect_timeout: float = 5.0,
+                 failure_threshold: int = 5,
+                 reset_timeout: float = 30.0,
+                 metadata_ttl: float = 60.0,
+                 transport: Optional["httpx.AsyncBaseTransport"] = None):
+        """
+        Initialize async API client
+
+        Args:
+            api_url: Base URL for Stable Diffusion WebUI API
+            max_connections: Max pooled connections
+            max_retries: Retries for connection errors and transient 5xx
+            backoff_factor: First retry delay in seconds (doubles each retry)
+            max_backoff: Max delay between retries
+            connect_timeout: Connection timeout in seconds (read timeout is per call)
+            failure_threshold: Consecutive failed calls before the circuit opens
+            reset_timeout: Seconds the circuit stays open
+            metadata_ttl: Seconds metadata responses are cached (0 = no cache)
+            transport: httpx transport (default: network; tests pass httpx.MockTransport)
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError("AsyncSDAPIClient requires httpx (pip install httpx)")
+
+        self.api_url = api_url.rstrip('/')
+        self.generation_config = GenerationConfig()
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.connect_timeout = connect_timeout
+        self.metadata_ttl = metadata_ttl
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self._normalizer = PromptNormalizer()
+        self._cache: Dict[str, Tuple[float, Any]] = {}  # url -> (expires_at, json)
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            transport=transport
+        )
+
+    async def __aenter__(self) -> "AsyncSDAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        await self._http.aclose()
+
+    async def test_connection(self, timeout: int = 5) -> bool:
+        """
+        Test connection to the API
+
+        Args:
+            timeout: Request timeout in seconds
+
+        Returns:
+            True if API is accessible, False otherwise
+        """
+        try:
+            response = await self._send("GET", "/sdapi/v1/options", timeout, retries=0)
+            response.raise_for_status()
+            return True
+        except Exception:
+            return False
+
+    async def generate_image(self, prompt_config: PromptConfig, timeout: int = 300,
+                             generation_config: Optional[GenerationConfig] = None) -> Dict[str, Any]:
+        """
+        Generate a single image via API
+
+        Cancelling the calling task interrupts the render on the WebUI.
+
+        Args:
+            prompt_config: Prompt configuration
+            timeout: Request timeout in seconds (default 300 = 5min)
+            generation_config: Generation parameters for this request
+                (default: current generation_config)
+
+        Returns:
+            dict: Raw API response (see SDAPIClient.generate_image)
+
+        Raises:
+            httpx.HTTPError: If API call fails
+        """
+        payload = self._build_payload(prompt_config, generation_config)
+
+        try:
+            response = await self._send("POST", "/sdapi/v1/txt2img", timeout, json=payload)
+        except asyncio.CancelledError:
+            await asyncio.shield(self._interrupt_quietly())
+            raise
+        response.raise_for_status()
+
+        result: Dict[str, Any] = response.json()
+        return result
+
+    async def interrupt(self, timeout: int = 5) -> None:
+        """
+        Interrupt the current generation on the WebUI
+
+        Raises:
+            httpx.HTTPError: If API call fails
+        """
+        response = await self._send("POST", "/sdapi/v1/interrupt", timeout, retries=0)
+        response.raise_for_status()
+
+    async def get_progress(self, timeout: int = 5) -> Dict[str, Any]:
+        """
+        Get progress of the current generation
+
+        Returns:
+            dict with keys: 'progress' (0-1), 'eta_relative', 'state', ...
+
+        Raises:
+            httpx.HTTPError: If API call fails
+        """
+        response = await self._send("GET", "/sdapi/v1/progress?skip_current_image=true", timeout, retries=0)
+        response.raise_for_status()
+        progress: Dict[str, Any] = response.json()
+        return progress
+
+    def clear_metadata_cache(self) -> None:
+        """
+        Drop cached metadata (call after changing models or settings)
+        """
+        self._cache.clear()
+
+    # ========== API Introspection Methods ==========
+
+    async def get_samplers(self, timeout: int = 5) -> List[Dict[str, Any]]:
+        """Get list of available samplers (see SDAPIClient.get_samplers)"""
+        samplers: List[Dict[str, Any]] = await self._get_metadata("/sdapi/v1/samplers", timeout)
+        return samplers
+
+    async def get_schedulers(self, timeout: int = 5) -> List[Dict[str, Any]]:
+        """Get list of available schedulers (see SDAPIClient.get_schedulers)"""
+        schedulers: List[Dict[str, Any]] = await self._get_metadata("/sdapi/v1/schedulers", timeout)
+        return schedulers
+
+    async def get_sd_models(self, timeout: int = 5) -> List[Dict[str, Any]]:
+        """Get list of available checkpoints (see SDAPIClient.get_sd_models)"""
+        sd_models: List[Dict[str, Any]] = await self._get_metadata("/sdapi/v1/sd-models", timeout)
+        return sd_models
+
+    async def get_upscalers(self, timeout: int = 5) -> List[Dict[str, Any]]:
+        """Get list of available upscalers (see SDAPIClient.get_upscalers)"""
+        upscalers: List[Dict[str, Any]] = await self._get_metadata("/sdapi/v1/upscalers", timeout)
+        return upscalers
+
+    async def get_options(self, timeout: int = 5) -> Dict[str, Any]:
+        """Get raw options/settings (see SDAPIClient.get_options)"""
+        options: Dict[str, Any] = await self._get_metadata("/sdapi/v1/options", timeout)
+        return options
+
+    async def get_model_checkpoint(self, timeout: int = 5) -> str:
+        """Get currently loaded model checkpoint name"""
+        options = await self.get_options(timeout)
+        return str(options.get("sd_model_checkpoint", "unknown"))
+
+    async def get_model_info(self, timeout: int = 5) -> Dict[str, Any]:
+        """Get checkpoint, VAE and clip skip (see SDAPIClient.get_model_info)"""
+        data = await self.get_options(timeout)
+
+        return {
+            "checkpoint": data.get("sd_model_checkpoint", "unknown"),
+            "vae": data.get("sd_vae", "auto"),
+            "clip_skip": data.get("CLIP_stop_at_last_layers", 1)
+        }
+
+    async def get_adetailer_models(self, timeout: int = 5) -> List[str]:
+        """Get list of available ADetailer detection models"""
+        ad_models: List[str] = await self._get_metadata("/adetailer/v1/ad_model", timeout)
+        return ad_models
+
+    async def get_controlnet_models(self, timeout: int = 5) -> Dict[str, List[str]]:
+        """Get available ControlNet models and modules (see SDAPIClient.get_controlnet_models)"""
+        models_data, modules_data = await asyncio.gather(
+            self._get_metadata("/controlnet/model_list", timeout),
+            self._get_metadata("/controlnet/module_list", timeout)
+        )
+
+        return {
+            "models": models_data.get("model_list", []),
+            "modules": modules_data.get("module_list", [])
+        }
+
+    # ========== Transport ==========
+
+    async def _get_metadata(self, path: str, timeout: int) -> Any:
+        """GET a metadata endpoint through the TTL cache"""
+        url = f"{self.api_url}{path}"
+        cached = self._cache.get(url)
+        if cached is not None and cached[0] > time.monotonic():
+            return copy.deepcopy(cached[1])
+
+        response = await self._send("GET", path, timeout)
+        response.raise_for_status()
+        data = response.json()
+
+        if self.metadata_ttl > 0:
+            self._cache[url] = (time.monotonic() + self.metadata_ttl, data)
+            return copy.deepcopy(data)
+        return data
+
+    async def _send(self, method: str, path: str, timeout: float,
+                    retries: Optional[int] = None, **kwargs: Any) -> "httpx.Response":
+        """Send a request with retries and circuit breaking"""
+        if not self.breaker.allow():
+            raise httpx.ConnectError(f"Circuit open for {self.api_url} (API failing, retrying later)")
+
+        retries = self.max_retries if retries is None else retries
+        request_timeout = httpx.Timeout(timeout, connect=self.connect_timeout)
+
+        attempt = 0
+        while True:
+            try:
+                response = await self._http.request(
+                    method, f"{self.api_url}{path}", timeout=request_timeout, **kwargs
+                )
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError, httpx.ReadError):
+                # Connection refused/reset (WebUI restarting)
+                if attempt >= retries:
+                    self.breaker.record_failure()
+                    raise
+            except httpx.HTTPError:
+                self.breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    self.breaker.record_success()
+                    return response
+                if attempt >= retries:
+                    self.breaker.record_failure()
+                    return response
+
+            await asyncio.sleep(min(self.backoff_factor * (2 ** attempt), self.max_backoff))
+            attempt += 1
+
+    async def _interrupt_quietly(self) -> None:
+        """Best-effort interrupt after cancellation"""
+        try:
+            await self.interrupt()
+        except Exception:
+            pass
@@ -0,0 +1,349 @@
+"""
+Multi-backend dispatcher for several Stable Diffusion WebUI instances
+
+Spreads generation requests over a list of endpoints:
+- Idle backends take the next image (self-scheduling, so faster backends
+  generate more images)
+- Failed requests (connection errors, timeouts, 5xx) are retried on
+  another backend
+- Backends failing repeatedly are taken out of rotation for a cooldown
+- Per-backend health and throughput are tracked for reporting
+
+Endpoints are given as a comma-separated api_url (``--api-url`` repeated,
+or a list in sdgen_config.json).
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+import requests
+
+from .sdapi_client import SDAPIClient, PromptConfig, GenerationConfig
+from .http_transport import HTTPTransport
+from .generation_pipeline import GenerationPipeline
+
+
+def parse_api_urls(api_url: str) -> List[str]:
+    """
+    Split a comma-separated api_url into endpoint URLs
+
+    Args:
+        api_url: One URL, or several separated by commas
+
+    Returns:
+        List of URLs (without trailing slashes)
+    """
+    return [url.strip().rstrip('/') for url in api_url.split(',') if url.strip()]
+
+
+def create_api_client(api_url: str, stream_images: bool = False) -> SDAPIClient:
+    """
+    Create the API client for one or several endpoints
+
+    Args:
+        api_url: One URL, or several separated by commas
+        stream_images: Spool txt2img images to files while they download
+            (see SDAPIClient)
+
+    Returns:
+        SDAPIClient for a single endpoint, BackendDispatcher for several
+    """
+    urls = parse_api_urls(api_url)
+    if len(urls) > 1:
+        return BackendDispatcher(urls, stream_images=stream_images)
+    return SDAPIClient(api_url=urls[0] if urls else api_url, stream_images=stream_images)
+
+
+def create_pipeline(api_client: SDAPIClient, max_in_flight: int = 2, throttle: float = 0.0) -> GenerationPipeline:
+    """
+    Create the generation pipeline suited to an API client
+
+    A single WebUI queues in-flight requests (max_in_flight deep), a
+    BackendDispatcher runs one request per backend in parallel.
+
+    Args:
+        api_client: SDAPIClient or BackendDispatcher
+        max_in_flight: Max requests sent to a single WebUI at once
+        throttle: Optional fixed delay before each request after the first
+
+    Returns:
+        Configured GenerationPipeline
+    """
+    if isinstance(api_client, BackendDispatcher):
+        return GenerationPipeline(
+            max_in_flight=api_client.capacity,
+            throttle=throttle,
+            queued_on_server=False
+        )
+    return GenerationPipeline(max_in_flight=max_in_flight, throttle=throttle)
+
+
+def _failover_client(api_url: str, stream_images: bool = False) -> SDAPIClient:
+    """Backend client without transport retries/breaker (the dispatcher fails over instead)"""
+    return SDAPIClient(
+        api_url=api_url,
+        transport=HTTPTransport(max_retries=0, failure_threshold=0),
+        stream_images=stream_images
+    )
+
+
+def is_retriable_error(error: BaseException) -> bool:
+    """
+    Check whether a failed request may succeed on another backend
+
+    Args:
+        error: Exception raised by the request
+
+    Returns:
+        True for connection errors, timeouts and 5xx responses
+    """
+    if isinstance(error, requests.exceptions.HTTPError):
+        response = error.response
+        return response is None or response.status_code >= 500
+    return isinstance(error, (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        ConnectionError,
+        TimeoutError
+    ))
+
+
+@dataclass
+class BackendStats:
+    """Health and throughput of one backend"""
+    url: str
+    completed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0  # Total time spent on successful requests
+    consecutive_failures: int = 0
+    down_until: float = 0.0  # time.monotonic() until which the backend is skipped
+
+    @property
+    def seconds_per_image(self) -> Optional[float]:
+        """Average request time (None until an image succeeded)"""
+        return self.busy_seconds / self.completed if self.completed else None
+
+    def is_healthy(self, now: Optional[float] = None) -> bool:
+        """True unless the backend is in cooldown"""
+        return (now if now is not None else time.monotonic()) >= self.down_until
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "url": self.url,
+            "completed": self.completed,
+            "failed": self.failed,
+            "seconds_per_image": self.seconds_per_image,
+            "healthy": self.is_healthy()
+        }
+
+
+class _Backend:
+    """Client, state and statistics of one endpoint"""
+
+    def __init__(self, client: SDAPIClient):
+        self.client = client
+        self.stats = BackendStats(url=client.api_url)
+        self.busy = False
+
+
+class BackendDispatcher(SDAPIClient):
+    """
+    API client dispatching generations over several WebUI instances
+
+    Drop-in replacement for SDAPIClient: generate_image() runs on the best
+    idle backend, other API calls (options, models...) go to the first
+    endpoint. Run up to ``capacity`` generate_image() calls concurrently
+    (GenerationPipeline does) to keep every backend busy.
+
+    Example:
+        >>> dispatcher = BackendDispatcher(["http://gpu1:7860", "http://gpu2:7860"])
+        >>> dispatcher.test_connection()
+        True
+        >>> response = dispatcher.generate_image(prompt_config)
+        >>> dispatcher.stats()[0]['completed']
+        1
+    """
+
+    def __init__(self,
+                 api_urls: Sequence[str],
+                 max_failures: int = 3,
+                 cooldown: float = 60.0,
+                 client_factory: Optional[Callable[[str], SDAPIClient]] = None,
+                 stream_images: bool = False):
+        """
+        Initialize dispatcher
+
+        Args:
+            api_urls: Endpoint URLs (at least one)
+            max_failures: Consecutive failures before a backend enters cooldown
+            cooldown: Seconds a failing backend is skipped
+            client_factory: Creates the client of each endpoint
+                (default: failover client without transport retries)
+            stream_images: Spool txt2img images to files (default factory only)
+        """
+        if not api_urls:
+            raise ValueError("BackendDispatcher needs at least one API URL")
+        if client_factory is None:
+            client_factory = lambda url: _failover_client(url, stream_images)  # noqa: E731
+
+        super().__init__(api_url=api_urls[0], stream_images=stream_images)
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.backends = [_Backend(client_factory(url)) for url in api_urls]
+        self._condition = threading.Condition()
+
+    @property
+    def capacity(self) -> int:
+        """Number of generations that can run at once (one per backend)"""
+        return len(self.backends)
+
+    def test_connection(self, timeout: int = 5) -> bool:
+        """
+        Test connection to every backend
+
+        Unreachable backends are put in cooldown.
+
+        Args:
+            timeout: Request timeout in seconds
+
+        Returns:
+            True if at least one backend is accessible
+        """
+        results: Dict[int, bool] = {}
+
+        def probe(position: int, backend: _Backend) -> None:
+            results[position] = backend.client.test_connection(timeout)
+
+        threads = [
+            threading.Thread(target=probe, args=(position, backend), daemon=True)
+            for position, backend in enumerate(self.backends)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with self._condition:
+            for position, backend in enumerate(self.backends):
+                if results.get(position):
+                    backend.stats.consecutive_failures = 0
+                    backend.stats.down_until = 0.0
+                else:
+                    backend.stats.down_until = time.monotonic() + self.cooldown
+            self._condition.notify_all()
+
+        return any(results.values())
+
+    def generate_image(self, prompt_config: PromptConfig, timeout: int = 300,
+                       generation_config: Optional[GenerationConfig] = None) -> dict:
+        """
+        Generate a single image on the best idle backend
+
+        This method:
+        1. Waits for an idle, healthy backend (fastest known first)
+        2. Sends the request to it
+        3. On connection errors, timeouts and 5xx responses, retries on a
+           backend not tried yet for this image
+
+        Args:
+            prompt_config: Prompt configuration
+            timeout: Request timeout in seconds (default 300 = 5min)
+            generation_config: Generation parameters for this request
+                (default: current generation_config)
+
+        Returns:
+            dict: Raw API response (see SDAPIClient.generate_image)
+
+        Raises:
+            requests.exceptions.RequestException: If every backend failed
+            ConnectionError: If no healthy backend is available
+        """
+        config = generation_config if generation_config is not None else self.generation_config
+        tried: set = set()
+        last_error: Optional[BaseException] = None
+
+        while True:
+            backend = self._acquire(tried)
+            if backend is None:
+                if last_error is not None:
+                    raise last_error
+                raise ConnectionError("No healthy Stable Diffusion backend available")
+
+            started = time.perf_counter()
+            try:
+                response = backend.client.generate_image(prompt_config, timeout, generation_config=config)
+            except Exception as e:
+                self._release(backend, success=False, seconds=time.perf_counter() - started)
+                if not is_retriable_error(e):
+                    raise
+                tried.add(id(backend))
+                last_error = e
+                continue
+
+            self._release(backend, success=True, seconds=time.perf_counter() - started)
+            return response
+
+    def stats(self) -> List[Dict]:
+        """
+        Per-backend statistics
+
+        Returns:
+            List of dicts with url, completed, failed, seconds_per_image, healthy
+        """
+        with self._condition:
+            return [backend.stats.to_dict() for backend in self.backends]
+
+    def summary_lines(self) -> List[str]:
+        """
+        Human readable per-backend summary
+
+        Returns:
+            One line per backend
+        """
+        lines = []
+        for stats in self.stats():
+            speed = f"{stats['seconds_per_image']:.1f}s/image" if stats['seconds_per_image'] else "-"
+            health = "" if stats['healthy'] else " (down)"
+            lines.append(f"{stats['url']}: {stats['completed']} ok, {stats['failed']} failed, {speed}{health}")
+        return lines
+
+    def _acquire(self, tried: set) -> Optional[_Backend]:
+        """Reserve the best idle backend (None if no untried healthy backend is left)"""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                candidates = [
+                    backend for backend in self.backends
+                    if id(backend) not in tried and backend.stats.is_healthy(now)
+                ]
+                if not candidates:
+                    return None
+
+                idle = [backend for backend in candidates if not backend.busy]
+                if idle:
+                    # Unknown speed first (measure new backends), then fastest
+                    backend = min(idle, key=lambda b: b.stats.seconds_per_image or 0.0)
+                    backend.busy = True
+                    return backend
+
+                self._condition.wait(timeout=1.0)
+
+    def _release(self, backend: _Backend, success: bool, seconds: float) -> None:
+        """Free a backend and update its statistics"""
+        with self._condition:
+            backend.busy = False
+            stats = backend.stats
+            if success:
+                stats.completed += 1
+                stats.busy_seconds += seconds
+                stats.consecutive_failures = 0
+            else:
+                stats.failed += 1
+                stats.consecutive_failures += 1
+                if stats.consecutive_failures >= self.max_failures:
+                    stats.down_until = time.monotonic() + self.cooldown
+                    stats.consecutive_failures = 0
+            self._condition.notify_all()
@@ -5,11 +5,14 @@ Coordinates API client, session manager, file I/O, and progress reporting
 to execute batch image generation workflows.
 """
 
-import time
-from typing import List, Tuple, Optional, Dict, Callable
+from typing import Any, Iterable, List, Tuple, Optional, Dict, Callable
 from pathlib import Path
 
 from .sdapi_client import SDAPIClient, PromptConfig, GenerationConfig
+from .generation_pipeline import GenerationPipeline, PipelineResult
+from .backend_dispatcher import create_api_client, create_pipeline
+from .result_cache import ResultCache, cache_key
+from .seed_batching import DEFAULT_MAX_BATCH_SIZE, batch_call, coalesce_seed_runs, expand_batch_result
 from .session_manager import SessionManager
 from .image_writer import ImageWriter
 from .progress_reporter import ProgressReporter
@@ -21,7 +24,12 @@ class BatchGenerator:
 
     Responsibility: Coordination and workflow orchestration
     - Coordinate API calls, file writes, and progress reporting
-    - Implement delay logic between generations
+    - Pipeline generations (next request in flight while the previous
+      image is saved and reported, see GenerationPipeline)
+    - Coalesce consecutive seeds of the same prompt into batched
+      requests (seed-sweep mode, see seed_batching)
+    - Reuse identical images generated by earlier sessions instead of
+      calling the API (optional, see ResultCache)
     - Handle dry-run vs production mode
     - Provide high-level batch generation interface
 
@@ -37,7 +45,10 @@ class BatchGenerator:
                  session_manager: SessionManager,
                  image_writer: ImageWriter,
                  progress_reporter: ProgressReporter,
-                 dry_run: bool = False):
+                 dry_run: bool = False,
+                 max_in_flight: int = 2,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 result_cache: Optional[ResultCache] = None):
         """
         Initialize batch generator
 
@@ -47,30 +58,50 @@ class BatchGenerator:
             image_writer: Image file writer
             progress_reporter: Progress reporter
             dry_run: If True, save JSON instead of generating images
+            max_in_flight: Max generation requests sent to the API at once
+            max_batch_size: Max consecutive-seed images per request (1 = one image per request)
+            result_cache: Cache of generated images (None = always call the API,
+                ignored in dry-run mode)
         """
         self.api_client = api_client
         self.session_manager = session_manager
         self.image_writer = image_writer
         self.progress = progress_reporter
         self.dry_run = dry_run
+        self.max_in_flight = max_in_flight
+        self.max_batch_size = max_batch_size
+        self.result_cache = result_cache if not dry_run else None
+
+        # Checkpoint hash of the running batch (part of cache keys), cache key by index
+        self._model_hash: Optional[str] = None
+        self._cache_keys: Dict[int, Optional[str]] = {}
+
+        # API latency of the last generated image (None in dry-run or on failure)
+        self.last_generation_time: Optional[float] = None
 
     def generate_batch(self,
-                      prompt_configs: List[PromptConfig],
-                      delay_between_images: float = 2.0,
-                      on_image_generated: Optional[Callable[[int, PromptConfig, bool, Optional[Dict]], None]] = None) -> Tuple[int, int]:
+                       prompt_configs: Iterable[PromptConfig],
+                       delay_between_images: float = 0.0,
+                       on_image_generated: Optional[Callable[[int, PromptConfig, bool, Optional[Dict]], None]] = None,
+                       total: Optional[int] = None) -> Tuple[int, int]:
         """
         Generate a batch of images
 
         Args:
-            prompt_configs: List of prompt configurations
-            delay_between_images: Delay in seconds between each generation
+            prompt_configs: Prompt configurations (list or lazy iterator)
+            delay_between_images: Optional fixed delay in seconds between requests
+                                 (default 0: the pipeline waits for the API instead)
             on_image_generated: Optional callback(index, prompt_config, success, api_response)
-                               Called after each image generation attempt
+                               Called after each image generation attempt, in index order,
+                               on the post-processing thread
                                api_response is None on failure, contains API response dict on success
+            total: Number of configs, required when prompt_configs is an iterator
 
         Returns:
             Tuple[int, int]: (success_count, total_count)
         """
+        total_images = total if total is not None else len(prompt_configs)  # type: ignore[arg-type]
+
         # Ensure output directory exists
         self.session_manager.create_session_dir()
 
@@ -78,82 +109,174 @@ class BatchGenerator:
         if not self.dry_run:
             if not self.api_client.test_connection():
                 print("❌ Impossible de se connecter à l'API WebUI")
-                return 0, len(prompt_configs)
+                return 0, total_images
+            if self.result_cache:
+                self._model_hash = self._fetch_model_hash()
 
         # Start batch
         self.progress.report_batch_start()
 
-        success_count = 0
-        total_images = len(prompt_configs)
+        self._success_count = 0
+        self._dispatched = 0
 
-        # Process each image
-        for i, prompt_config in enumerate(prompt_configs, 1):
-            self.progress.report_image_start(i, prompt_config.filename)
+        def complete(result: PipelineResult) -> None:
+            for image_result in expand_batch_result(result):
+                self._complete_image(image_result, on_image_generated)
 
-            success, api_response = self._generate_single_image(prompt_config)
+        # Dry-run saves one payload per image; templates setting batch_size/n_iter keep their requests
+        config = self.api_client.generation_config
+        max_batch_size = self.max_batch_size
+        if self.dry_run or config.batch_size != 1 or config.n_iter != 1:
+            max_batch_size = 1
+        groups = coalesce_seed_runs(prompt_configs, lambda prompt_config: prompt_config, max_batch_size)
 
-            if success:
-                success_count += 1
-                self.progress.report_image_success(prompt_config.filename)
-            else:
-                self.progress.report_image_failure(
-                    prompt_config.filename,
-                    "Voir logs pour détails"
-                )
+        if self.dry_run:
+            pipeline = GenerationPipeline(max_in_flight=1, throttle=delay_between_images)
+        else:
+            pipeline = create_pipeline(self.api_client, self.max_in_flight, delay_between_images)
+        pipeline.run(groups, request=self._request, complete=complete)
 
-            # Update progress
-            self.progress.increment_completed()
-            if success:
-                self.progress.increment_success()
+        # Final summary
+        self.progress.report_batch_complete()
 
-            # Call callback after each image (success or failure)
-            if on_image_generated:
-                on_image_generated(i - 1, prompt_config, success, api_response)
+        return self._success_count, total_images
 
-            # Delay between images (except after last)
-            if i < total_images:
-                time.sleep(delay_between_images)
+    def _request(self, group: List[Tuple[int, PromptConfig]]) -> Callable[[], List[Any]]:
+        """
+        Prepare the API call for a group of images (runs on the dispatch thread)
 
-            # Periodic progress update
-            self.progress.report_progress_update(i, update_interval=10)
+        Args:
+            group: (index, prompt config) pairs sent as one request
 
-        # Final summary
-        self.progress.report_batch_complete()
+        Returns:
+            Call to run on a request thread: returns one API response (or
+            exception) per image, or the payload in dry-run mode
+        """
+        prompt_configs = [prompt_config for _, prompt_config in group]
+        for prompt_config in prompt_configs:
+            self._dispatched += 1
+            self.progress.report_image_start(self._dispatched, prompt_config.filename)
+        generation_config = self.api_client.generation_config
+
+        if self.dry_run:
+            payload = self.api_client.get_payload_for_config(prompt_configs[0])
+            return lambda: [payload]
+
+        if self.result_cache and self._model_hash:
+            keys = [
+                cache_key(self.api_client.get_payload_for_config(prompt_config), self._model_hash)
+                for prompt_config in prompt_configs
+            ]
+            for (index, _), key in zip(group, keys):
+                self._cache_keys[index] = key
+            hits = [self.result_cache.lookup(key) for key in keys]
+            if all(hits):
+                # Every image of the request was generated before: no API call
+                responses = [
+                    {'images': [], 'info': info, 'cache_key': key}
+                    for key, (_, info) in zip(keys, hits)  # type: ignore[misc]
+                ]
+                return lambda: responses
+
+        return batch_call(self.api_client, prompt_configs, generation_config)
+
+    def _fetch_model_hash(self) -> Optional[str]:
+        """
+        Identify the loaded checkpoint (part of result cache keys)
 
-        return success_count, total_images
+        Returns:
+            Checkpoint hash (name when the WebUI reports no hash), or None
+            if options cannot be read (the cache is not used)
+        """
+        try:
+            options = self.api_client.get_options()
+        except Exception as e:
+            print(f"⚠️  Cache de résultats désactivé (options WebUI illisibles): {e}")
+            return None
+        return options.get('sd_checkpoint_hash') or options.get('sd_model_checkpoint')
+
+    def _complete_image(
+        self,
+        result: PipelineResult,
+        on_image_generated: Optional[Callable[[int, PromptConfig, bool, Optional[Dict]], None]]
+    ) -> None:
+        """
+        Save and report one image (runs on the post-processing thread)
 
-    def _generate_single_image(self, prompt_config: PromptConfig) -> Tuple[bool, Optional[Dict]]:
+        Args:
+            result: Pipeline result (item is the PromptConfig)
+            on_image_generated: Optional callback(index, prompt_config, success, api_response)
+        """
+        prompt_config = result.item
+        success, api_response = self._save_result(result)
+
+        if success:
+            self._success_count += 1
+            self.progress.report_image_success(prompt_config.filename)
+        else:
+            self.progress.report_image_failure(
+                prompt_config.filename,
+                "Voir logs pour détails"
+            )
+
+        # Update progress
+        self.progress.increment_completed()
+        if success:
+            self.progress.increment_success()
+
+        # Call callback after each image (success or failure)
+        if on_image_generated:
+            on_image_generated(result.index, prompt_config, success, api_response)
+
+        # Periodic progress update
+        self.progress.report_progress_update(result.index + 1, update_interval=10)
+
+    def _save_result(self, result: PipelineResult) -> Tuple[bool, Optional[Dict]]:
         """
-        Generate a single image
+        Write the output of one request
 
         Args:
-            prompt_config: Prompt configuration
+            result: Pipeline result
 
         Returns:
             Tuple[bool, Optional[Dict]]: (success, api_response)
                 - success: True if successful, False otherwise
                 - api_response: API response dict on success (contains 'info' with real seed), None on failure or dry-run
         """
+        prompt_config = result.item
+        self.last_generation_time = None
+        key = self._cache_keys.pop(result.index, None)
         try:
+            if result.error is not None:
+                raise result.error
+
             if self.dry_run:
                 # Dry-run mode: save JSON payload instead of generating
-                payload = self.api_client.get_payload_for_config(prompt_config)
-                self.image_writer.save_json_request(payload, prompt_config.filename)
+                self.image_writer.save_json_request(result.response, prompt_config.filename)
                 return True, None
-            else:
-                # Production mode: generate via API and save image
-                response = self.api_client.generate_image(prompt_config)
-                self.image_writer.save_image(response['images'][0], prompt_config.filename)
-                return True, response
+
+            if 'cache_key' in result.response:
+                # Cache hit: link the earlier image into the session
+                self.result_cache.materialize(  # type: ignore[union-attr]
+                    result.response['cache_key'], self.image_writer.output_dir / prompt_config.filename
+                )
+                return True, result.response
+
+            # Production mode: save image generated via API
+            self.last_generation_time = result.elapsed
+            image_path = self.image_writer.save_image(result.response['images'][0], prompt_config.filename)
+            if self.result_cache:
+                self.result_cache.store(key, image_path, result.response.get('info'))
+            return True, result.response
 
         except Exception as e:
             print(f"❌ Erreur génération {prompt_config.filename}: {e}")
             return False, None
 
     def save_batch_config(self,
-                         base_prompt: str = "",
-                         negative_prompt: str = "",
-                         additional_info: Optional[Dict] = None):
+                          base_prompt: str = "",
+                          negative_prompt: str = "",
+                          additional_info: Optional[Dict] = None):
         """
         Save session configuration file
 
@@ -207,7 +330,7 @@ def create_batch_generator(
         >>> generator.generate_batch(prompt_configs)
     """
     # Create components
-    api_client = SDAPIClient(api_url=api_url)
+    api_client = create_api_client(api_url, stream_images=True)
     session_manager = SessionManager(
         base_output_dir=base_output_dir,
         session_name=session_name,
@@ -0,0 +1,243 @@
+"""
+Pipelined executor for image generation.
+
+Overlaps API requests with post-processing, so the GPU never waits for the
+client between images:
+
+- Requests are dispatched in order, with at most ``max_in_flight`` sent to
+  the server at once. With the default of 2, the next request is queued on
+  the WebUI while the current one renders, and starts as soon as it ends.
+- Completed responses are post-processed (decode, save, manifest update,
+  events, annotation) in index order on a background thread, whatever
+  order they complete in (several backends, see BackendDispatcher).
+
+Backpressure replaces fixed sleeps between images: dispatch waits for the
+server (an in-flight request must complete before a new one is sent), and
+for post-processing (at most ``max_pending`` completed results are held).
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Iterable, Optional, Tuple, TypeVar
+
+
+T = TypeVar('T')
+
+_STOP = object()
+
+
+@dataclass
+class PipelineResult(Generic[T]):
+    """Outcome of one request, passed to the completion callback."""
+    index: int
+    item: T
+    response: Any = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0  # Time the server spent on this request (excludes server queue wait)
+
+    @property
+    def success(self) -> bool:
+        """True if the request succeeded."""
+        return self.error is None
+
+
+class _PostWorker:
+    """Background thread running completion callbacks in submission order."""
+
+    def __init__(self, complete: Callable[[PipelineResult], None], max_pending: int):
+        self._complete = complete
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self._error: Optional[BaseException] = None
+        self._aborted = threading.Event()
+        self._thread = threading.Thread(
+            target=self._worker_loop,
+            daemon=True,  # Dies when main thread exits
+            name="GenerationPostWorker"
+        )
+        self._thread.start()
+
+    def put(self, result: PipelineResult) -> None:
+        """Queue a result (blocks while max_pending results are waiting)."""
+        self._raise_error()
+        self._queue.put(result)
+
+    def close(self) -> None:
+        """Wait until every queued result is processed."""
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._raise_error()
+
+    def abort(self, timeout: float = 5.0) -> None:
+        """Drop queued results and stop after the current callback."""
+        self._aborted.set()
+        try:
+            self._queue.put_nowait(_STOP)
+        except queue.Full:
+            pass
+        self._thread.join(timeout=timeout)
+
+    def _worker_loop(self) -> None:
+        while True:
+            result = self._queue.get()
+            if result is _STOP or self._aborted.is_set():
+                break
+            if self._error is not None:
+                continue  # Drain without processing after a callback failure
+            try:
+                self._complete(result)
+            except BaseException as e:  # Re-raised on the dispatch thread
+                self._error = e
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+
+class GenerationPipeline:
+    """
+    Pipelined request/post-processing executor.
+
+    Example:
+        >>> pipeline = GenerationPipeline(max_in_flight=2)
+        >>> pipeline.run(
+        ...     prompt_configs,
+        ...     request=lambda cfg: (lambda: client.generate_image(cfg)),
+        ...     complete=lambda result: save(result.item, result.response)
+        ... )
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 2,
+        max_pending: int = 8,
+        throttle: float = 0.0,
+        queued_on_server: bool = True
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            max_in_flight: Max requests sent to the server at once (server queue depth)
+            max_pending: Max completed results waiting for post-processing
+            throttle: Optional fixed delay in seconds before each request after
+                the first (0 = rely on backpressure only)
+            queued_on_server: True if in-flight requests share one server queue
+                (elapsed times then exclude the wait behind earlier requests)
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_pending = max(1, max_pending)
+        self.throttle = throttle
+        self.queued_on_server = queued_on_server
+        self._last_finished = 0.0
+
+    def run(
+        self,
+        items: Iterable[T],
+        request: Callable[[T], Callable[[], Any]],
+        complete: Callable[[PipelineResult[T]], None]
+    ) -> int:
+        """
+        Run requests for all items, post-processing results in order.
+
+        This method:
+        1. Calls ``request(item)`` on the calling thread, in order (so shared
+           client state can be snapshotted), to get the API call to make
+        2. Runs the API call on a request thread, keeping at most
+           max_in_flight calls running (a new one starts when any ends)
+        3. Hands each result to ``complete`` on the post-processing thread,
+           in index order, as soon as it and all earlier results are done
+
+        Exceptions raised by ``request`` or by the API call are reported as
+        failed results. Exceptions raised by ``complete`` stop the run and
+        are re-raised.
+
+        Args:
+            items: Items to process (list or lazy iterator)
+            request: Prepares an item and returns the call to run for it
+            complete: Completion callback (runs on the post-processing thread)
+
+        Returns:
+            Number of items processed
+        """
+        post = _PostWorker(complete, self.max_pending)
+        in_flight: Dict[Future, Tuple[int, T]] = {}
+        done: Dict[int, PipelineResult[T]] = {}  # Completed, waiting for earlier indexes
+        self._last_finished = 0.0
+        next_index = 0
+        count = 0
+
+        try:
+            for index, item in enumerate(items):
+                if index > 0 and self.throttle > 0:
+                    time.sleep(self.throttle)
+                in_flight[self._submit(request, item)] = (index, item)
+                count += 1
+                while in_flight and (len(in_flight) >= self.max_in_flight or len(done) >= self.max_pending):
+                    self._collect(in_flight, done)
+                    next_index = self._flush(done, next_index, post)
+
+            while in_flight:
+                self._collect(in_flight, done)
+                next_index = self._flush(done, next_index, post)
+        except BaseException:
+            post.abort()
+            raise
+
+        post.close()
+        return count
+
+    def _submit(self, request: Callable[[T], Callable[[], Any]], item: T) -> Future:
+        """Prepare an item and start its API call on a request thread."""
+        future: Future = Future()
+        try:
+            call = request(item)
+        except Exception as e:
+            future.set_exception(e)
+            return future
+
+        entered = threading.Event()
+
+        def run_request() -> None:
+            entered.set()
+            started = time.perf_counter()
+            try:
+                response = call()
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result((response, started, time.perf_counter()))
+
+        thread = threading.Thread(target=run_request, daemon=True, name="GenerationRequest")
+        thread.start()
+        entered.wait()  # Requests reach the client in dispatch order
+        return future
+
+    def _collect(self, in_flight: Dict[Future, Tuple[int, T]], done: Dict[int, PipelineResult[T]]) -> None:
+        """Wait for at least one in-flight request and store its result."""
+        finished, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+        outcomes = []
+        for future in finished:
+            index, item = in_flight.pop(future)
+            try:
+                response, started, ended = future.result()
+            except Exception as e:
+                done[index] = PipelineResult(index=index, item=item, error=e)
+            else:
+                outcomes.append((ended, started, index, item, response))
+
+        for ended, started, index, item, response in sorted(outcomes, key=lambda outcome: outcome[0]):
+            if self.queued_on_server:
+                # Requests queued behind the previous one only start rendering when it ends
+                started = max(started, self._last_finished)
+                self._last_finished = ended
+            done[index] = PipelineResult(index=index, item=item, response=response, elapsed=ended - started)
+
+    def _flush(self, done: Dict[int, PipelineResult[T]], next_index: int, post: _PostWorker) -> int:
+        """Hand the completed prefix of results to post-processing, in order."""
+        while next_index in done:
+            post.put(done.pop(next_index))
+            next_index += 1
+        return next_index
@@ -0,0 +1,263 @@
+"""
+Pooled, resilient HTTP transport for the Stable Diffusion WebUI API
+
+Wraps a persistent requests.Session:
+- Keep-alive connection pool (one TCP/TLS handshake per connection, not per call)
+- Exponential-backoff retries for connection errors and transient 5xx
+  (502/503/504), long enough to ride out a WebUI restart
+- Circuit breaker: after repeated failures calls fail fast for a cooldown,
+  instead of every queued image waiting for its own retries
+- TTL cache for metadata endpoints (samplers, models, options...)
+- Separate connect and read timeouts (a dead host fails in seconds, a long
+  render still gets the full read timeout)
+"""
+
+import copy
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# Transient gateway/availability errors. 500 is not retried: the WebUI uses it
+# for errors that repeat (OOM, invalid extension parameters).
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without sending a request while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    Closed: calls go through. After ``failure_threshold`` consecutive
+    failures it opens: calls are refused for ``reset_timeout`` seconds,
+    then a trial call is let through (half-open). A success closes it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures before opening (0 = never open)
+            reset_timeout: Seconds the circuit stays open before a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls are refused"""
+        with self._lock:
+            return self._opened_at is not None and time.monotonic() - self._opened_at < self.reset_timeout
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may be sent
+
+        Returns:
+            False while open; True when closed or when the cooldown has
+            elapsed (the next call is the half-open trial)
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._opened_at = time.monotonic()  # One trial per cooldown
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Close the circuit"""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold"""
+        with self._lock:
+            self._failures += 1
+            if self.failure_threshold and self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class HTTPTransport:
+    """
+    Session-based HTTP transport with retries, circuit breaker and metadata cache
+
+    Example:
+        >>> transport = HTTPTransport()
+        >>> samplers = transport.get_json("http://127.0.0.1:7860/sdapi/v1/samplers", timeout=5, ttl=300)
+        >>> response = transport.post("http://127.0.0.1:7860/sdapi/v1/txt2img", json=payload, timeout=300)
+    """
+
+    def __init__(self,
+                 pool_size: int = 8,
+                 max_retries: int = 5,
+                 backoff_factor: float = 1.0,
+                 max_backoff: float = 30.0,
+                 connect_timeout: float = 5.0,
+                 failure_threshold: int = 5,
+                 reset_timeout: float = 30.0,
+                 session: Optional[requests.Session] = None):
+        """
+        Initialize transport
+
+        Args:
+            pool_size: Max pooled keep-alive connections per host
+            max_retries: Retries for connection errors and transient 5xx
+            backoff_factor: First retry delay in seconds (doubles each retry)
+            max_backoff: Max delay between retries
+            connect_timeout: Connection timeout in seconds (read timeout is per call)
+            failure_threshold: Consecutive failed calls before the circuit opens
+            reset_timeout: Seconds the circuit stays open
+            session: Session to use (default: new pooled session)
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.connect_timeout = connect_timeout
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+        self._cache: Dict[str, Tuple[float, Any]] = {}  # url -> (expires_at, json)
+        self._cache_lock = threading.Lock()
+
+    def get(self, url: str, timeout: float, retries: Optional[int] = None) -> requests.Response:
+        """
+        Send a GET request
+
+        Args:
+            url: Full URL
+            timeout: Read timeout in seconds
+            retries: Override max_retries for this call
+
+        Returns:
+            Response (status not checked)
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            requests.exceptions.RequestException: If the request failed after retries
+        """
+        return self._send("get", url, timeout, retries)
+
+    def post(self, url: str, json: Any, timeout: float, retries: Optional[int] = None,
+             stream: bool = False) -> requests.Response:
+        """
+        Send a POST request with a JSON body
+
+        Read timeouts are not retried (the server may still be working on
+        the request).
+
+        Args:
+            url: Full URL
+            json: JSON body
+            timeout: Read timeout in seconds
+            retries: Override max_retries for this call
+            stream: Defer downloading the body (read it with iter_content()
+                and close the response)
+
+        Returns:
+            Response (status not checked)
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            requests.exceptions.RequestException: If the request failed after retries
+        """
+        if stream:
+            return self._send("post", url, timeout, retries, json=json, stream=True)
+        return self._send("post", url, timeout, retries, json=json)
+
+    def get_json(self, url: str, timeout: float, ttl: float = 0.0) -> Any:
+        """
+        GET a JSON endpoint, served from cache for ``ttl`` seconds
+
+        Args:
+            url: Full URL
+            timeout: Read timeout in seconds
+            ttl: Cache lifetime in seconds (0 = no cache)
+
+        Returns:
+            Decoded JSON (a copy, callers may modify it)
+
+        Raises:
+            requests.exceptions.RequestException: If the request failed
+        """
+        if ttl > 0:
+            with self._cache_lock:
+                cached = self._cache.get(url)
+            if cached is not None and cached[0] > time.monotonic():
+                return copy.deepcopy(cached[1])
+
+        response = self.get(url, timeout)
+        response.raise_for_status()
+        data = response.json()
+
+        if ttl > 0:
+            with self._cache_lock:
+                self._cache[url] = (time.monotonic() + ttl, data)
+            return copy.deepcopy(data)
+        return data
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """
+        Drop cached metadata
+
+        Args:
+            url: URL to drop (None = everything)
+        """
+        with self._cache_lock:
+            if url is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(url, None)
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        self.session.close()
+
+    def _send(self, method: str, url: str, timeout: float, retries: Optional[int], **kwargs) -> requests.Response:
+        """Send a request with retries and circuit breaking"""
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {url} (API failing, retrying later)")
+
+        retries = self.max_retries if retries is None else retries
+        send = getattr(self.session, method)
+
+        attempt = 0
+        while True:
+            try:
+                response = send(url, timeout=(self.connect_timeout, timeout), **kwargs)
+            except requests.exceptions.ConnectionError:
+                # Connection refused/reset (includes connect timeouts)
+                if attempt >= retries:
+                    self.breaker.record_failure()
+                    raise
+            except requests.exceptions.RequestException:
+                self.breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    self.breaker.record_success()
+                    return response
+                if attempt >= retries:
+                    self.breaker.record_failure()
+                    return response
+                response.close()  # Release the connection before retrying
+
+            time.sleep(min(self.backoff_factor * (2 ** attempt), self.max_backoff))
+            attempt += 1
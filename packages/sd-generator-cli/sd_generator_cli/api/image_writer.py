@@ -5,17 +5,20 @@ Handles writing image data and JSON request payloads to disk.
 """
 
 import json
-import base64
 from pathlib import Path
 from typing import Union
 
+from .response_stream import StreamedImage, iter_base64_decoded, write_atomic
+
 
 class ImageWriter:
     """
     Handles image and JSON file I/O
 
     Responsibility: File operations only
-    - Save PNG images from base64 data
+    - Save PNG images from base64 data or streamed responses
+      (atomically: a file never exists half-written, so watchers only
+      ever see complete images)
     - Save JSON request payloads (dry-run mode)
 
     Does NOT handle:
@@ -33,12 +36,16 @@ class ImageWriter:
         """
         self.output_dir = Path(output_dir)
 
-    def save_image(self, image_data_b64: str, filename: str) -> Path:
+    def save_image(self, image_data_b64: Union[str, StreamedImage], filename: str) -> Path:
         """
         Save base64-encoded image to PNG file
 
+        The image is written to a temporary file in the output directory,
+        then renamed to its final name.
+
         Args:
-            image_data_b64: Base64-encoded image data (from API response)
+            image_data_b64: Base64-encoded image data (from API response),
+                or StreamedImage (streamed API response, moved into place)
             filename: Output filename (e.g., "image_001.png")
 
         Returns:
@@ -47,15 +54,13 @@ class ImageWriter:
         Raises:
             IOError: If file cannot be written
         """
-        # Decode base64 to bytes
-        image_bytes = base64.b64decode(image_data_b64)
-
-        # Write to file
         filepath = self.output_dir / filename
-        with open(filepath, 'wb') as f:
-            f.write(image_bytes)
 
-        return filepath
+        if isinstance(image_data_b64, StreamedImage):
+            return image_data_b64.move_to(filepath)
+
+        # Decode base64 chunk by chunk while writing
+        return write_atomic(filepath, iter_base64_decoded(image_data_b64))
 
     def save_json_request(self, payload: dict, filename: str) -> Path:
         """
@@ -0,0 +1,241 @@
+"""
+Post-encode stage for generated images
+
+The WebUI returns plain PNGs: large files that slow down session listing
+and thumbnailing. OutputEncoder re-encodes saved images in a process pool:
+
+- png: optimized PNG (max zlib compression)
+- webp: lossless WebP
+- jpeg: high-quality JPEG (no chroma subsampling)
+
+SD metadata is preserved: PNG text chunks are copied as-is, WebP/JPEG get
+the ``parameters`` text in the EXIF UserComment tag (AUTOMATIC1111
+convention), which the webui's extract_png_metadata() reads as well.
+"""
+
+import io
+import os
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .response_stream import write_atomic
+
+
+FORMAT_EXTENSIONS = {
+    'png': '.png',
+    'webp': '.webp',
+    'jpeg': '.jpg',
+}
+
+# EXIF tags (UserComment lives in the Exif sub-IFD)
+EXIF_IFD = 0x8769
+USER_COMMENT = 0x9286
+
+
+def final_filename(filename: str, image_format: str) -> str:
+    """
+    Filename of an image once encoded
+
+    Args:
+        filename: Filename written by the API stage (e.g. "image_0001.png")
+        image_format: Target format (png, webp, jpeg)
+
+    Returns:
+        Filename with the extension of the target format
+    """
+    return str(Path(filename).with_suffix(FORMAT_EXTENSIONS[image_format]))
+
+
+def encode_user_comment(text: str) -> bytes:
+    """Encode text as an EXIF UserComment (UNICODE, big-endian UTF-16)"""
+    return b'UNICODE\x00' + text.encode('utf-16-be')
+
+
+def encode_image(source: Union[str, Path], image_format: str, quality: int = 95) -> Path:
+    """
+    Re-encode one image, preserving its SD metadata
+
+    Runs in worker processes. The encoded file is written under a
+    temporary name and renamed into place; the source is removed when the
+    target has another name.
+
+    Args:
+        source: PNG written by the API stage
+        image_format: Target format (png, webp, jpeg)
+        quality: JPEG quality (WebP is lossless, PNG is lossless)
+
+    Returns:
+        Path of the encoded image
+
+    Raises:
+        ImportError: If Pillow is not installed
+        OSError: If the image cannot be read or written
+    """
+    from PIL import Image, PngImagePlugin
+
+    source = Path(source)
+    target = source.with_suffix(FORMAT_EXTENSIONS[image_format])
+
+    with Image.open(source) as img:
+        img.load()
+        text_chunks = {key: value for key, value in img.info.items() if isinstance(value, str)}
+
+        options: Dict[str, Any] = {}
+        if image_format == 'png':
+            pnginfo = PngImagePlugin.PngInfo()
+            for key, value in text_chunks.items():
+                pnginfo.add_text(key, value)
+            options = {'format': 'PNG', 'optimize': True, 'pnginfo': pnginfo}
+        else:
+            exif = Image.Exif()
+            if 'parameters' in text_chunks:
+                exif.get_ifd(EXIF_IFD)[USER_COMMENT] = encode_user_comment(text_chunks['parameters'])
+            if image_format == 'webp':
+                options = {'format': 'WEBP', 'lossless': True, 'quality': 100, 'method': 4, 'exif': exif}
+            else:
+                img = img.convert('RGB')  # JPEG has no alpha channel
+                options = {'format': 'JPEG', 'quality': quality, 'subsampling': 0, 'exif': exif}
+
+        buffer = io.BytesIO()
+        img.save(buffer, **options)
+
+    write_atomic(target, [buffer.getvalue()])
+    if target != source:
+        os.unlink(source)
+    return target
+
+
+class OutputEncoder:
+    """
+    Process pool re-encoding saved images
+
+    Example:
+        >>> encoder = OutputEncoder("webp")
+        >>> filename = encoder.final_filename("image_0001.png")  # image_0001.webp
+        >>> future = encoder.submit(session_dir / "image_0001.png", on_complete=record)
+        >>> encoder.shutdown()  # Waits for pending images (and their on_complete)
+    """
+
+    def __init__(self, image_format: str = "webp", quality: int = 95, max_workers: Optional[int] = None):
+        """
+        Initialize encoder
+
+        Args:
+            image_format: Target format (png, webp, jpeg)
+            quality: JPEG quality (1-100)
+            max_workers: Worker processes (default: CPU count)
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        image_format = image_format.lower()
+        if image_format == 'jpg':
+            image_format = 'jpeg'
+        if image_format not in FORMAT_EXTENSIONS:
+            raise ValueError(
+                f"Unsupported output format: {image_format} "
+                f"(expected one of: {', '.join(FORMAT_EXTENSIONS)})"
+            )
+
+        self.image_format = image_format
+        self.quality = quality
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def final_filename(self, filename: str) -> str:
+        """Filename of an image once encoded (see final_filename())"""
+        return final_filename(filename, self.image_format)
+
+    def submit(
+        self,
+        image_path: Union[str, Path],
+        on_complete: Optional[Callable[[Path, Optional[str]], Any]] = None
+    ) -> "Future[Path]":
+        """
+        Queue an image for encoding
+
+        Args:
+            image_path: PNG written by the API stage
+            on_complete: Called once the image file is final, with its path
+                and format: the encoded image, or the source PNG and None
+                when encoding failed or was cancelled (the PNG is kept)
+
+        Returns:
+            Future resolving to the encoded image path
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_ignore_sigint)
+
+        with self._lock:
+            self._pending += 1
+        future = self._executor.submit(encode_image, str(image_path), self.image_format, self.quality)
+        future.add_done_callback(self._on_done)
+        if on_complete is not None:
+            future.add_done_callback(lambda f: on_complete(*self._outcome(f, image_path)))
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker processes
+
+        Args:
+            wait: Wait for pending images (otherwise they are cancelled and
+                stay as PNG)
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+            self._executor = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of images queued or being encoded"""
+        return self._pending
+
+    def _outcome(self, future: Future, source: Union[str, Path]) -> Tuple[Path, Optional[str]]:
+        """File left on disk by an encode: (path, format), format None if the source PNG was kept"""
+        if future.cancelled() or future.exception() is not None:
+            return Path(source), None
+        return future.result(), self.image_format
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+        if not future.cancelled() and future.exception() is not None:
+            print(f"Warning: Failed to encode image: {future.exception()}")
+
+
+def _ignore_sigint() -> None:
+    """Worker initializer: Ctrl+C is handled by the main process, which drains the pool"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def create_output_encoder_from_config(encoding_config: Any) -> Optional[OutputEncoder]:
+    """
+    Create OutputEncoder from template config
+
+    Args:
+        encoding_config: EncodingConfig from template (output.encoding)
+
+    Returns:
+        OutputEncoder, or None when encoding is not configured or Pillow is missing
+    """
+    if not encoding_config:
+        return None
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("⚠ Pillow not installed, keeping raw PNG output")
+        print("  Install with: pip install Pillow")
+        return None
+
+    return OutputEncoder(
+        image_format=encoding_config.format,
+        quality=encoding_config.quality,
+        max_workers=encoding_config.workers or None
+    )
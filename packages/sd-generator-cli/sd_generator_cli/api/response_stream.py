@@ -0,0 +1,346 @@
+"""
+Streaming decoder for txt2img responses
+
+A txt2img response holds every image as a multi-megabyte base64 string.
+Parsing it with response.json() keeps the whole body, then the decoded
+bytes, in memory. This module parses the body incrementally instead:
+
+- Strings of the top-level ``images`` array are base64-decoded chunk by
+  chunk straight into spool files (StreamedImage)
+- The rest of the body (parameters, info) is small and parsed as usual
+
+Peak memory per image is one network chunk, whatever the image size.
+ImageWriter moves spool files into place atomically (see ImageWriter.save_image).
+"""
+
+import base64
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Union
+
+
+CHUNK_SIZE = 64 * 1024
+
+
+class StreamedImage:
+    """
+    Decoded image spooled to a temporary file
+
+    Stands in for the base64 string in ``response['images']``. The spool
+    file is deleted when the object is garbage collected, unless it was
+    moved into place with move_to().
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize streamed image
+
+        Args:
+            path: Spool file holding the decoded image
+        """
+        self.path: Optional[Path] = Path(path)
+
+    @property
+    def size(self) -> int:
+        """Decoded size in bytes"""
+        return self.path.stat().st_size if self.path else 0
+
+    def read_bytes(self) -> bytes:
+        """Read the decoded image"""
+        if self.path is None:
+            raise ValueError("Streamed image was already moved")
+        return self.path.read_bytes()
+
+    def to_base64(self) -> str:
+        """Encode back to base64 (for consumers expecting API strings)"""
+        return base64.b64encode(self.read_bytes()).decode('ascii')
+
+    def move_to(self, target: Union[str, Path]) -> Path:
+        """
+        Move the spool file to its final path, atomically
+
+        The target never exists half-written: same-filesystem spool files
+        are renamed, others are copied to a temporary file next to the
+        target first, then renamed.
+
+        Args:
+            target: Final path
+
+        Returns:
+            Final path
+        """
+        if self.path is None:
+            raise ValueError("Streamed image was already moved")
+        target = Path(target)
+        try:
+            os.replace(self.path, target)
+        except OSError:
+            # Cross-device: copy next to the target, then rename
+            with open(self.path, 'rb') as source:
+                write_atomic(target, iter(lambda: source.read(CHUNK_SIZE), b''))
+            self.discard()
+        self.path = None
+        return target
+
+    def discard(self) -> None:
+        """Delete the spool file"""
+        if self.path is not None:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+            self.path = None
+
+    def __del__(self) -> None:
+        self.discard()
+
+    def __repr__(self) -> str:
+        return f"StreamedImage({self.path})"
+
+
+def write_atomic(target: Union[str, Path], chunks: Iterable[bytes]) -> Path:
+    """
+    Write chunks to a temporary file next to target, then rename it into place
+
+    Args:
+        target: Final path
+        chunks: Data to write
+
+    Returns:
+        Final path
+
+    Raises:
+        IOError: If the file cannot be written
+    """
+    target = Path(target)
+    fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".part")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(temp_path, target)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return target
+
+
+def iter_base64_decoded(data: str, chunk_chars: int = CHUNK_SIZE) -> Iterable[bytes]:
+    """
+    Decode a base64 string chunk by chunk
+
+    Args:
+        data: Base64 string
+        chunk_chars: Characters decoded at once (multiple of 4)
+
+    Yields:
+        Decoded chunks
+    """
+    for start in range(0, len(data), chunk_chars):
+        yield base64.b64decode(data[start:start + chunk_chars])
+
+
+class _Base64Sink:
+    """Incremental base64 decoder writing to a spool file"""
+
+    def __init__(self, spool_dir: Optional[str]):
+        fd, self.path = tempfile.mkstemp(dir=spool_dir, prefix="sdgen-", suffix=".part")
+        self.file: BinaryIO = os.fdopen(fd, 'wb')
+        self._pending = b''
+
+    def write(self, data: bytes) -> None:
+        data = self._pending + data
+        usable = len(data) - len(data) % 4
+        if usable:
+            self.file.write(base64.b64decode(data[:usable]))
+        self._pending = data[usable:]
+
+    def close(self) -> StreamedImage:
+        if self._pending:
+            self.file.write(base64.b64decode(self._pending + b'=' * (-len(self._pending) % 4)))
+        self.file.close()
+        return StreamedImage(self.path)
+
+    def abort(self) -> None:
+        self.file.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+class ImagesStreamParser:
+    """
+    Incremental parser for a txt2img JSON body
+
+    Example:
+        >>> parser = ImagesStreamParser()
+        >>> for chunk in response.iter_content(CHUNK_SIZE):
+        ...     parser.feed(chunk)
+        >>> result = parser.close()  # {'images': [StreamedImage, ...], 'info': ...}
+    """
+
+    def __init__(self, spool_dir: Optional[str] = None):
+        """
+        Initialize parser
+
+        Args:
+            spool_dir: Directory for spool files (default: system temp dir)
+        """
+        self.spool_dir = spool_dir
+        self._skeleton = bytearray()  # Body without image strings (replaced by null)
+        self._images: List[StreamedImage] = []
+        self._sink: Optional[_Base64Sink] = None  # Set while inside an image string
+        self._sink_escape = False
+
+        # Skeleton tokenizer state
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string = bytearray()
+        self._last_key: Optional[bytes] = None
+        self._images_depth: Optional[int] = None  # Depth inside the images array
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Parse the next chunk of the body
+
+        Args:
+            chunk: Raw bytes
+        """
+        position = 0
+        length = len(chunk)
+        while position < length:
+            sink = self._sink
+            if sink is not None:
+                position = self._feed_image(sink, chunk, position)
+            else:
+                position = self._feed_skeleton(chunk, position)
+
+    def close(self) -> Dict[str, Any]:
+        """
+        Finish parsing
+
+        Returns:
+            Response dict with StreamedImage objects in ``images``
+
+        Raises:
+            ValueError: If the body is incomplete or not a JSON object
+        """
+        if self._sink is not None:
+            self._sink.abort()
+            self._sink = None
+            raise ValueError("Response ended inside an image")
+
+        result = json.loads(bytes(self._skeleton))
+        if not isinstance(result, dict):
+            raise ValueError("Response is not a JSON object")
+        images = iter(self._images)
+        self._images = []  # The result owns the spool files from now on
+        if isinstance(result.get('images'), list):
+            result['images'] = [next(images) if value is None else value for value in result['images']]
+        return result
+
+    def abort(self) -> None:
+        """Drop partial output (spool files)"""
+        if self._sink is not None:
+            self._sink.abort()
+            self._sink = None
+        for image in self._images:
+            image.discard()
+        self._images = []
+
+    def _feed_image(self, sink: _Base64Sink, chunk: bytes, position: int) -> int:
+        """Stream image string bytes to the decoder, up to the closing quote"""
+        if self._sink_escape:
+            # JSON escapes in base64: only "\/" is meaningful, newlines are skipped
+            if chunk[position:position + 1] == b'/':
+                sink.write(b'/')
+            self._sink_escape = False
+            return position + 1
+
+        quote = chunk.find(b'"', position)
+        backslash = chunk.find(b'\\', position, quote if quote >= 0 else len(chunk))
+        if backslash >= 0:
+            sink.write(chunk[position:backslash])
+            self._sink_escape = True
+            return backslash + 1
+        if quote < 0:
+            sink.write(chunk[position:])
+            return len(chunk)
+
+        sink.write(chunk[position:quote])
+        self._images.append(sink.close())
+        self._sink = None
+        self._skeleton += b'null'
+        return quote + 1
+
+    def _feed_skeleton(self, chunk: bytes, position: int) -> int:
+        """Tokenize skeleton bytes until an image string starts"""
+        length = len(chunk)
+        start = position
+        while position < length:
+            byte = chunk[position]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif byte == 0x5C:  # backslash
+                    self._escape = True
+                elif byte == 0x22:  # closing quote
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_key = bytes(self._string)
+                    self._string.clear()
+                    position += 1
+                    continue
+                if self._depth == 1:
+                    self._string.append(byte)
+            elif byte == 0x22:  # opening quote
+                if self._images_depth is not None and self._depth == self._images_depth:
+                    self._skeleton += chunk[start:position]
+                    self._sink = _Base64Sink(self.spool_dir)
+                    return position + 1
+                self._in_string = True
+            elif byte in (0x7B, 0x5B):  # { [
+                self._depth += 1
+                if byte == 0x5B and self._depth == 2 and self._last_key == b'images':
+                    self._images_depth = 2
+            elif byte in (0x7D, 0x5D):  # } ]
+                if self._images_depth is not None and self._depth == self._images_depth:
+                    self._images_depth = None
+                self._depth -= 1
+            elif byte == 0x2C and self._depth == 1:  # , between top-level members
+                self._last_key = None
+            position += 1
+
+        self._skeleton += chunk[start:position]
+        return position
+
+
+def parse_streamed_response(chunks: Iterable[bytes], spool_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Parse a txt2img body, spooling images to files
+
+    Args:
+        chunks: Body chunks (e.g. response.iter_content(CHUNK_SIZE))
+        spool_dir: Directory for spool files (default: system temp dir)
+
+    Returns:
+        Response dict with StreamedImage objects in ``images``
+
+    Raises:
+        ValueError: If the body is not a JSON object
+    """
+    parser = ImagesStreamParser(spool_dir)
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+        return parser.close()
+    except BaseException:
+        parser.abort()
+        raise
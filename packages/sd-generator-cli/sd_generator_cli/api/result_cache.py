@@ -0,0 +1,307 @@
+"""
+Content-addressed cache of generation results
+
+Rerunning a template often regenerates exact (prompt, negative, seed,
+sampler, steps, cfg, size, extensions) tuples already rendered by an
+earlier session, e.g. after a template tweak that left some combinations
+unchanged. ResultCache keys every image on a canonical hash of its API
+payload plus the checkpoint hash, and serves repeats without a GPU call:
+
+- Cached images are stored once in ``objects/`` and hardlinked into
+  sessions (copied when the cache is on another filesystem)
+- The index is a local SQLite file (``index.sqlite``), shared by
+  concurrent sdgen processes
+- prune() evicts entries by age, then least recently used ones above
+  the size limit
+
+Only reproducible images are cached: random seeds (-1) are never keys.
+Session images may share their inode with the cache, so every stage that
+modifies images writes a new file and renames it into place
+(ImageWriter, OutputEncoder, ImageAnnotator).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .response_stream import CHUNK_SIZE, write_atomic
+
+
+INDEX_FILENAME = "index.sqlite"
+OBJECTS_DIRNAME = "objects"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    info TEXT,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used_at);
+"""
+
+
+def cache_key(payload: Dict[str, Any], model_hash: str) -> Optional[str]:
+    """
+    Canonical hash of an image request
+
+    Args:
+        payload: txt2img payload of one image (batch_size 1)
+        model_hash: Checkpoint hash (or name) of the WebUI
+
+    Returns:
+        Hex digest, or None if the request is not reproducible (random seed)
+    """
+    seed = payload.get('seed', -1)
+    if seed is None or seed < 0:
+        return None
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    digest = hashlib.sha256()
+    digest.update(model_hash.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(canonical.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def link_or_copy(source: Union[str, Path], target: Union[str, Path]) -> Path:
+    """
+    Hardlink source to target, copying when linking is not possible
+
+    The target is replaced atomically if it exists.
+
+    Args:
+        source: Existing file
+        target: Path to create
+
+    Returns:
+        Target path
+    """
+    source = Path(source)
+    target = Path(target)
+    temp_path = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.link")
+    try:
+        os.link(source, temp_path)
+        os.replace(temp_path, target)
+    except OSError:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        # Other filesystem, or no hardlink support
+        with open(source, 'rb') as f:
+            write_atomic(target, iter(lambda: f.read(CHUNK_SIZE), b''))
+    return target
+
+
+class ResultCache:
+    """
+    Global cache of generated images, keyed on the API payload
+
+    Thread-safe: lookups run on the dispatch thread, stores on the
+    post-processing thread of the generation pipeline.
+
+    Example:
+        >>> cache = ResultCache("~/.cache/sdgen/results")
+        >>> key = cache_key(payload, model_hash)
+        >>> hit = cache.lookup(key)  # (object path, info) or None
+        >>> if hit:
+        ...     cache.materialize(key, session_dir / "image_0001.png")
+        ... else:
+        ...     cache.store(key, session_dir / "image_0001.png", response['info'])
+        >>> cache.close()  # Evicts old entries
+    """
+
+    def __init__(self,
+                 cache_dir: Union[str, Path],
+                 max_age_days: Optional[float] = 30,
+                 max_size_mb: Optional[float] = 20480):
+        """
+        Open (or create) a cache directory
+
+        Args:
+            cache_dir: Cache directory (index and objects)
+            max_age_days: Entries unused for longer are evicted (None = no limit)
+            max_size_mb: Total size above which least recently used entries
+                are evicted (None = no limit)
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.max_age_days = max_age_days
+        self.max_size_mb = max_size_mb
+        self.objects_dir = self.cache_dir / OBJECTS_DIRNAME
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.cache_dir / INDEX_FILENAME), timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+        self.hits = 0
+        self.stores = 0
+
+    def object_path(self, key: str) -> Path:
+        """Path of the cached image for a key"""
+        return self.objects_dir / key[:2] / f"{key}.png"
+
+    def lookup(self, key: Optional[str]) -> Optional[Tuple[Path, Optional[str]]]:
+        """
+        Find a cached image
+
+        Entries whose image was deleted behind the cache's back are dropped.
+
+        Args:
+            key: Cache key (None = not cacheable)
+
+        Returns:
+            (object path, API 'info' JSON string) or None
+        """
+        if key is None:
+            return None
+        with self._lock:
+            row = self._db.execute("SELECT info FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            path = self.object_path(key)
+            if not path.is_file():
+                self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            self._db.execute("UPDATE results SET last_used_at = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+        return path, row[0]
+
+    def materialize(self, key: str, target: Union[str, Path]) -> Path:
+        """
+        Link a cached image into a session
+
+        Args:
+            key: Cache key (see lookup())
+            target: Session image path
+
+        Returns:
+            Target path
+
+        Raises:
+            OSError: If the cached image disappeared
+        """
+        path = link_or_copy(self.object_path(key), target)
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def store(self, key: Optional[str], image_path: Union[str, Path], info: Optional[str] = None) -> None:
+        """
+        Add a freshly generated image to the cache
+
+        Failures are reported but never interrupt generation.
+
+        Args:
+            key: Cache key (None = not cacheable, ignored)
+            image_path: Saved session image (raw API output)
+            info: API 'info' JSON string (real seed, etc.)
+        """
+        if key is None:
+            return
+        path = self.object_path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            link_or_copy(image_path, path)
+            now = time.time()
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results (key, size, info, created_at, last_used_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, path.stat().st_size, info, now, now)
+                )
+                self._db.commit()
+                self.stores += 1
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Failed to cache {Path(image_path).name}: {e}")
+
+    def prune(self) -> int:
+        """
+        Evict entries by age, then by size (least recently used first)
+
+        Returns:
+            Number of evicted entries
+        """
+        evicted = []
+        with self._lock:
+            if self.max_age_days is not None:
+                cutoff = time.time() - self.max_age_days * 86400
+                evicted += [key for (key,) in self._db.execute(
+                    "SELECT key FROM results WHERE last_used_at < ?", (cutoff,)
+                )]
+                self._db.execute("DELETE FROM results WHERE last_used_at < ?", (cutoff,))
+
+            if self.max_size_mb is not None:
+                excess = self._total_size() - int(self.max_size_mb * 1024 * 1024)
+                if excess > 0:
+                    for key, size in self._db.execute(
+                        "SELECT key, size FROM results ORDER BY last_used_at"
+                    ).fetchall():
+                        if excess <= 0:
+                            break
+                        self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                        evicted.append(key)
+                        excess -= size
+            self._db.commit()
+
+        for key in evicted:
+            try:
+                self.object_path(key).unlink()
+            except OSError:
+                pass
+        return len(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and total size of the cache"""
+        with self._lock:
+            count = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            return {"entries": count, "size_bytes": self._total_size()}
+
+    def clear(self) -> None:
+        """Remove every entry and cached image"""
+        with self._lock:
+            self._db.execute("DELETE FROM results")
+            self._db.commit()
+            shutil.rmtree(self.objects_dir, ignore_errors=True)
+            self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+    def close(self) -> None:
+        """Evict old entries and close the index"""
+        try:
+            self.prune()
+        finally:
+            self._db.close()
+
+    def _total_size(self) -> int:
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+
+def create_result_cache_from_config(global_config: Any) -> Optional[ResultCache]:
+    """
+    Create ResultCache from global config
+
+    Args:
+        global_config: GlobalConfig (result_cache_dir, result_cache_max_age_days,
+            result_cache_max_size_mb)
+
+    Returns:
+        ResultCache, or None when result_cache_dir is not set
+    """
+    cache_dir = getattr(global_config, 'result_cache_dir', None)
+    if not cache_dir:
+        return None
+    return ResultCache(
+        cache_dir,
+        max_age_days=global_config.result_cache_max_age_days,
+        max_size_mb=global_config.result_cache_max_size_mb
+    )
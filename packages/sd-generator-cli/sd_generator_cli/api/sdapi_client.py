@@ -5,10 +5,12 @@ This client handles ONLY API communication - no filesystem operations,
 no progress reporting, no session management.
 """
 
-import requests
-from typing import Optional
+from typing import Any, Optional
 from dataclasses import dataclass, field
 from ..templating.normalizers.normalizer import PromptNormalizer
+from .http_transport import HTTPTransport
+from .response_stream import CHUNK_SIZE, parse_streamed_response
+from ..utils.image_encoder import ImageEncoder, default_encoded_image_cache
 
 
 @dataclass
@@ -41,34 +43,17 @@ class PromptConfig:
     parameters: dict = field(default_factory=dict)  # Optional parameters (SD WebUI settings, extensions like ADetailer)
 
 
-class SDAPIClient:
+class PayloadBuilder:
     """
-    Pure HTTP client for Stable Diffusion WebUI API
-
-    Responsibility: API communication only
-    - Test connection
-    - Send generation requests
-    - Return raw API responses
+    txt2img payload building, shared by SDAPIClient and AsyncSDAPIClient
 
-    Does NOT handle:
-    - File I/O
-    - Progress reporting
-    - Session management
-    - Batch orchestration
+    Subclasses set ``generation_config`` and ``_normalizer``.
     """
 
-    def __init__(self, api_url: str = "http://127.0.0.1:7860"):
-        """
-        Initialize API client
-
-        Args:
-            api_url: Base URL for Stable Diffusion WebUI API
-        """
-        self.api_url = api_url.rstrip('/')
-        self.generation_config = GenerationConfig()
-        self._normalizer = PromptNormalizer()
+    generation_config: GenerationConfig
+    _normalizer: PromptNormalizer
 
-    def set_generation_config(self, config: GenerationConfig):
+    def set_generation_config(self, config: GenerationConfig) -> None:
         """
         Set default generation configuration
 
@@ -77,26 +62,6 @@ class SDAPIClient:
         """
         self.generation_config = config
 
-    def test_connection(self, timeout: int = 5) -> bool:
-        """
-        Test connection to the API
-
-        Args:
-            timeout: Request timeout in seconds
-
-        Returns:
-            True if API is accessible, False otherwise
-        """
-        try:
-            response = requests.get(
-                f"{self.api_url}/sdapi/v1/options",
-                timeout=timeout
-            )
-            response.raise_for_status()
-            return True
-        except Exception:
-            return False
-
     def _normalize_for_api(self, prompt: str) -> str:
         """
         Normalize prompt for API submission (convert newlines + normalize).
@@ -107,52 +72,24 @@ class SDAPIClient:
         Returns:
             API-ready prompt (newlines → commas, normalized)
         """
-        # Step 1: Replace newlines with ", "
-        single_line = prompt.replace('\n', ', ').replace('\r', '')
-
-        # Step 2: Normalize with PromptNormalizer (commas, spacing, etc.)
-        normalized = self._normalizer.normalize_prompt(single_line)
-
-        return normalized
-
-    def generate_image(self, prompt_config: PromptConfig, timeout: int = 300) -> dict:
-        """
-        Generate a single image via API
-
-        Args:
-            prompt_config: Prompt configuration
-            timeout: Request timeout in seconds (default 300 = 5min)
-
-        Returns:
-            dict: Raw API response containing:
-                - images: List[str] - Base64-encoded image data
-                - parameters: dict - Generation parameters used
-                - info: str - Generation info JSON string
-
-        Raises:
-            requests.exceptions.RequestException: If API call fails
-        """
-        payload = self._build_payload(prompt_config)
-
-        response = requests.post(
-            f"{self.api_url}/sdapi/v1/txt2img",
-            json=payload,
-            timeout=timeout
-        )
-        response.raise_for_status()
-
-        return response.json()
+        # Replace newlines with ", " and normalize (commas, spacing, etc.)
+        # in a single pass
+        return self._normalizer.normalize_single_line(prompt)
 
-    def _build_payload(self, prompt_config: PromptConfig) -> dict:
+    def _build_payload(self, prompt_config: PromptConfig,
+                       generation_config: Optional[GenerationConfig] = None) -> dict:
         """
         Build API payload from prompt config
 
         Args:
             prompt_config: Prompt configuration
+            generation_config: Generation parameters (default: current generation_config)
 
         Returns:
             dict: API payload ready to send
         """
+        gen = generation_config if generation_config is not None else self.generation_config
+
         # Normalize prompts for API: newlines → commas + cleanup
         prompt = self._normalize_for_api(prompt_config.prompt)
         negative_prompt = self._normalize_for_api(prompt_config.negative_prompt)
@@ -161,37 +98,37 @@ class SDAPIClient:
             "prompt": prompt,
             "negative_prompt": negative_prompt,
             "seed": prompt_config.seed if prompt_config.seed is not None else -1,
-            "steps": self.generation_config.steps,
-            "cfg_scale": self.generation_config.cfg_scale,
-            "width": self.generation_config.width,
-            "height": self.generation_config.height,
-            "sampler_name": self.generation_config.sampler_name,
-            "batch_size": self.generation_config.batch_size,
-            "n_iter": self.generation_config.n_iter
+            "steps": gen.steps,
+            "cfg_scale": gen.cfg_scale,
+            "width": gen.width,
+            "height": gen.height,
+            "sampler_name": gen.sampler_name,
+            "batch_size": gen.batch_size,
+            "n_iter": gen.n_iter
         }
 
         # Add scheduler if specified
-        if self.generation_config.scheduler is not None:
-            payload["scheduler"] = self.generation_config.scheduler
+        if gen.scheduler is not None:
+            payload["scheduler"] = gen.scheduler
 
         # Add Hires Fix parameters if enabled
-        if self.generation_config.enable_hr:
+        if gen.enable_hr:
             payload["enable_hr"] = True
-            payload["hr_scale"] = self.generation_config.hr_scale
-            payload["hr_upscaler"] = self.generation_config.hr_upscaler
-            payload["denoising_strength"] = self.generation_config.denoising_strength
+            payload["hr_scale"] = gen.hr_scale
+            payload["hr_upscaler"] = gen.hr_upscaler
+            payload["denoising_strength"] = gen.denoising_strength
 
             # Calculate target resolution
             payload["hr_resize_x"] = round(
-                self.generation_config.width * self.generation_config.hr_scale
+                gen.width * gen.hr_scale
             )
             payload["hr_resize_y"] = round(
-                self.generation_config.height * self.generation_config.hr_scale
+                gen.height * gen.hr_scale
             )
 
             # Add second pass steps if specified
-            if self.generation_config.hr_second_pass_steps is not None:
-                payload["hr_second_pass_steps"] = self.generation_config.hr_second_pass_steps
+            if gen.hr_second_pass_steps is not None:
+                payload["hr_second_pass_steps"] = gen.hr_second_pass_steps
 
         # Build alwayson_scripts for extensions (ADetailer, ControlNet, etc.)
         alwayson_scripts: dict[str, Any] = {}
@@ -210,20 +147,10 @@ class SDAPIClient:
             controlnet_config = prompt_config.parameters['controlnet']
             # controlnet_config should be a ControlNetConfig object with to_api_dict() method
             if hasattr(controlnet_config, 'to_api_dict'):
-                # Encode images just before sending (units contain file paths)
-                if hasattr(controlnet_config, 'units'):
-                    from sd_generator_cli.utils.image_encoder import ImageEncoder
-                    for unit in controlnet_config.units:
-                        if unit.image and isinstance(unit.image, str):
-                            # Only encode if it's a file path (not already base64)
-                            if not ImageEncoder.is_base64_encoded(unit.image):
-                                try:
-                                    unit.image = ImageEncoder.encode_image_file_from_path(unit.image)
-                                except FileNotFoundError as e:
-                                    raise RuntimeError(f"ControlNet image not found: {unit.image}") from e
-
                 controlnet_payload = controlnet_config.to_api_dict()
                 if controlnet_payload:  # Only add if not None (i.e., has units)
+                    # Encode images just before sending (units keep their file paths)
+                    self._encode_controlnet_images(controlnet_payload)
                     alwayson_scripts.update(controlnet_payload)
 
         # Only add alwayson_scripts if we have extensions configured
@@ -232,6 +159,28 @@ class SDAPIClient:
 
         return payload
 
+    def _encode_controlnet_images(self, controlnet_payload: dict) -> None:
+        """
+        Replace ControlNet image paths with their base64 encoding
+
+        Encodings come from the shared EncodedImageCache: a reference image
+        is read and encoded once per run, and payloads share the string.
+
+        Args:
+            controlnet_payload: Payload from ControlNetConfig.to_api_dict() (modified in place)
+
+        Raises:
+            RuntimeError: If an image file doesn't exist
+        """
+        for unit_args in controlnet_payload.get('controlnet', {}).get('args', []):
+            image = unit_args.get('image')
+            # Only encode file paths (not already base64)
+            if image and isinstance(image, str) and not ImageEncoder.is_base64_encoded(image):
+                try:
+                    unit_args['image'] = default_encoded_image_cache().encode(image)
+                except FileNotFoundError as e:
+                    raise RuntimeError(f"ControlNet image not found: {image}") from e
+
     def get_payload_for_config(self, prompt_config: PromptConfig) -> dict:
         """
         Build payload without sending request (useful for dry-run)
@@ -244,8 +193,135 @@ class SDAPIClient:
         """
         return self._build_payload(prompt_config)
 
+
+class SDAPIClient(PayloadBuilder):
+    """
+    Pure HTTP client for Stable Diffusion WebUI API
+
+    Responsibility: API communication only
+    - Test connection
+    - Send generation requests
+    - Return raw API responses
+
+    Requests go through a pooled HTTPTransport (keep-alive, retries,
+    circuit breaker). Metadata (samplers, models, options...) is cached
+    for ``metadata_ttl`` seconds.
+
+    Does NOT handle:
+    - File I/O
+    - Progress reporting
+    - Session management
+    - Batch orchestration
+    """
+
+    def __init__(self, api_url: str = "http://127.0.0.1:7860",
+                 transport: Optional[HTTPTransport] = None,
+                 metadata_ttl: float = 60.0,
+                 stream_images: bool = False,
+                 spool_dir: Optional[str] = None):
+        """
+        Initialize API client
+
+        Args:
+            api_url: Base URL for Stable Diffusion WebUI API
+            transport: HTTP transport (default: new pooled HTTPTransport)
+            metadata_ttl: Seconds metadata responses are cached (0 = no cache)
+            stream_images: Decode txt2img responses while they download,
+                spooling images to files (StreamedImage) instead of
+                holding base64 strings in memory
+            spool_dir: Directory for spooled images (default: system temp dir)
+        """
+        self.api_url = api_url.rstrip('/')
+        self.generation_config = GenerationConfig()
+        self.transport = transport or HTTPTransport()
+        self.metadata_ttl = metadata_ttl
+        self.stream_images = stream_images
+        self.spool_dir = spool_dir
+        self._normalizer = PromptNormalizer()
+
+    def test_connection(self, timeout: int = 5) -> bool:
+        """
+        Test connection to the API
+
+        Args:
+            timeout: Request timeout in seconds
+
+        Returns:
+            True if API is accessible, False otherwise
+        """
+        try:
+            response = self.transport.get(
+                f"{self.api_url}/sdapi/v1/options",
+                timeout=timeout,
+                retries=0
+            )
+            response.raise_for_status()
+            return True
+        except Exception:
+            return False
+
+    def clear_metadata_cache(self) -> None:
+        """
+        Drop cached metadata (call after changing models or settings)
+        """
+        self.transport.invalidate()
+
+    def generate_image(self, prompt_config: PromptConfig, timeout: int = 300,
+                       generation_config: Optional[GenerationConfig] = None) -> dict:
+        """
+        Generate a single image via API
+
+        Args:
+            prompt_config: Prompt configuration
+            timeout: Request timeout in seconds (default 300 = 5min)
+            generation_config: Generation parameters for this request
+                (default: current generation_config). Pass a snapshot when
+                requests run on other threads.
+
+        Returns:
+            dict: Raw API response containing:
+                - images: List[str] - Base64-encoded image data
+                  (List[StreamedImage] with stream_images)
+                - parameters: dict - Generation parameters used
+                - info: str - Generation info JSON string
+
+        Raises:
+            requests.exceptions.RequestException: If API call fails
+        """
+        payload = self._build_payload(prompt_config, generation_config)
+
+        response = self.transport.post(
+            f"{self.api_url}/sdapi/v1/txt2img",
+            json=payload,
+            timeout=timeout,
+            stream=self.stream_images
+        )
+        if not self.stream_images:
+            response.raise_for_status()
+            return response.json()
+
+        with response:
+            response.raise_for_status()
+            return parse_streamed_response(response.iter_content(CHUNK_SIZE), self.spool_dir)
+
     # ========== API Introspection Methods ==========
 
+    def _get_metadata(self, path: str, timeout: int) -> Any:
+        """
+        GET a metadata endpoint through the TTL cache
+
+        Args:
+            path: Endpoint path (e.g. "/sdapi/v1/samplers")
+            timeout: Request timeout in seconds
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            requests.exceptions.RequestException: If API call fails
+        """
+        return self.transport.get_json(f"{self.api_url}{path}", timeout, ttl=self.metadata_ttl)
+
     def get_samplers(self, timeout: int = 5) -> list[dict]:
         """
         Get list of available samplers from SD WebUI
@@ -262,12 +338,7 @@ class SDAPIClient:
         Raises:
             requests.exceptions.RequestException: If API call fails
         """
-        response = requests.get(
-            f"{self.api_url}/sdapi/v1/samplers",
-            timeout=timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get_metadata("/sdapi/v1/samplers", timeout)
 
     def get_schedulers(self, timeout: int = 5) -> list[dict]:
         """
@@ -285,12 +356,7 @@ class SDAPIClient:
         Raises:
             requests.exceptions.RequestException: If API call fails
         """
-        response = requests.get(
-            f"{self.api_url}/sdapi/v1/schedulers",
-            timeout=timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get_metadata("/sdapi/v1/schedulers", timeout)
 
     def get_sd_models(self, timeout: int = 5) -> list[dict]:
         """
@@ -312,12 +378,7 @@ class SDAPIClient:
         Raises:
             requests.exceptions.RequestException: If API call fails
         """
-        response = requests.get(
-            f"{self.api_url}/sdapi/v1/sd-models",
-            timeout=timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get_metadata("/sdapi/v1/sd-models", timeout)
 
     def get_upscalers(self, timeout: int = 5) -> list[dict]:
         """
@@ -343,12 +404,7 @@ class SDAPIClient:
         Raises:
             requests.exceptions.RequestException: If API call fails
         """
-        response = requests.get(
-            f"{self.api_url}/sdapi/v1/upscalers",
-            timeout=timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get_metadata("/sdapi/v1/upscalers", timeout)
 
     def get_options(self, timeout: int = 5) -> dict:
         """
@@ -360,12 +416,7 @@ class SDAPIClient:
         Raises:
             requests.exceptions.RequestException: If API call fails
         """
-        response = requests.get(
-            f"{self.api_url}/sdapi/v1/options",
-            timeout=timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get_metadata("/sdapi/v1/options", timeout)
 
     def get_model_checkpoint(self, timeout: int = 5) -> str:
         """
@@ -422,12 +473,7 @@ class SDAPIClient:
         Raises:
             requests.exceptions.RequestException: If API call fails
         """
-        response = requests.get(
-            f"{self.api_url}/adetailer/v1/ad_model",
-            timeout=timeout
-        )
-        response.raise_for_status()
-        return response.json()
+        return self._get_metadata("/adetailer/v1/ad_model", timeout)
 
     def get_controlnet_models(self, timeout: int = 5) -> dict[str, list[str]]:
         """
@@ -455,21 +501,8 @@ class SDAPIClient:
         Raises:
             requests.exceptions.RequestException: If API call fails
         """
-        # Get models list
-        models_response = requests.get(
-            f"{self.api_url}/controlnet/model_list",
-            timeout=timeout
-        )
-        models_response.raise_for_status()
-        models_data = models_response.json()
-
-        # Get modules list
-        modules_response = requests.get(
-            f"{self.api_url}/controlnet/module_list",
-            timeout=timeout
-        )
-        modules_response.raise_for_status()
-        modules_data = modules_response.json()
+        models_data = self._get_metadata("/controlnet/model_list", timeout)
+        modules_data = self._get_metadata("/controlnet/module_list", timeout)
 
         return {
             "models": models_data.get("model_list", []),
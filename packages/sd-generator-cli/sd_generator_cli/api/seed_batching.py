@@ -0,0 +1,207 @@
+"""
+Seed-sweep request coalescing
+
+Seed-sweep mode renders the same prompt on a list of seeds. When seeds are
+consecutive (``--seeds 20#1000``, ``--seeds 1000-1019``), the WebUI can render
+them in a single txt2img call: with ``batch_size=N`` and seed S, it generates
+seeds S, S+1, ..., S+N-1 in one GPU batch.
+
+- coalesce_seed_runs() groups consecutive compatible prompt configs (same
+  prompt, negative prompt and parameters, seed = previous seed + 1)
+- batch_call() sends a group as one request and splits the response back
+  into one response per image, each with its real seed in 'info'
+- expand_batch_result() turns a pipeline result for a group into one
+  result per image, so saving, manifest updates and events are unchanged
+"""
+
+import json
+from dataclasses import replace
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+import requests
+
+from .sdapi_client import SDAPIClient, GenerationConfig, PromptConfig
+from .generation_pipeline import PipelineResult
+
+
+T = TypeVar('T')
+
+# Images per coalesced request (GPU batch)
+DEFAULT_MAX_BATCH_SIZE = 4
+
+
+def can_coalesce(previous: PromptConfig, current: PromptConfig) -> bool:
+    """
+    Check whether an image can join the request of the previous one
+
+    Args:
+        previous: Last prompt config of the group
+        current: Candidate prompt config
+
+    Returns:
+        True if prompts and parameters match and the seed follows the
+        previous seed (random seeds are never coalesced)
+    """
+    if previous.seed is None or current.seed is None or previous.seed < 0:
+        return False
+    if current.seed != previous.seed + 1:
+        return False
+    if current.prompt != previous.prompt or current.negative_prompt != previous.negative_prompt:
+        return False
+    parameters = current.parameters or {}
+    if parameters.get('batch_size', 1) != 1 or parameters.get('batch_count', parameters.get('n_iter', 1)) != 1:
+        return False  # Template already batches its requests
+    try:
+        return bool((previous.parameters or {}) == parameters)
+    except Exception:  # Parameter objects without a usable __eq__
+        return False
+
+
+def coalesce_seed_runs(
+    items: Iterable[T],
+    prompt_config: Callable[[T], PromptConfig],
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+) -> Iterator[List[Tuple[int, T]]]:
+    """
+    Group consecutive-seed runs of the same prompt (lazy)
+
+    Args:
+        items: Items in generation order (list or lazy iterator)
+        prompt_config: Returns the PromptConfig of an item
+        max_batch_size: Max images per group (1 = no coalescing)
+
+    Yields:
+        Groups of (index, item), in order, each sent as one request
+    """
+    group: List[Tuple[int, T]] = []
+    for index, item in enumerate(items):
+        if group and (
+            len(group) >= max_batch_size
+            or not can_coalesce(prompt_config(group[-1][1]), prompt_config(item))
+        ):
+            yield group
+            group = []
+        group.append((index, item))
+    if group:
+        yield group
+
+
+def split_batch_response(api_response: dict, count: int) -> List[dict]:
+    """
+    Split a batched txt2img response into one response per image
+
+    The WebUI may prepend a grid image (``index_of_first_image`` in info);
+    it is dropped. Each response gets its own seed, subseed and infotext.
+
+    Args:
+        api_response: Raw API response for a batch of ``count`` images
+        count: Number of images requested
+
+    Returns:
+        List of ``count`` responses shaped like single-image responses
+
+    Raises:
+        ValueError: If the response holds fewer images than requested
+    """
+    info_raw = api_response.get('info', '{}')
+    try:
+        info = json.loads(info_raw) if isinstance(info_raw, str) else dict(info_raw or {})
+    except ValueError:
+        info = {}
+
+    first = int(info.get('index_of_first_image', 0) or 0)
+    images = api_response.get('images', [])[first:]
+    if len(images) < count:
+        raise ValueError(f"Batched request returned {len(images)} images, expected {count}")
+
+    all_seeds = info.get('all_seeds') or [info.get('seed', -1) + i for i in range(count)]
+    all_subseeds = info.get('all_subseeds') or []
+    infotexts = (info.get('infotexts') or [])[first:]
+
+    responses = []
+    for i in range(count):
+        image_info = dict(info)
+        image_info['seed'] = all_seeds[i] if i < len(all_seeds) else info.get('seed', -1) + i
+        if i < len(all_subseeds):
+            image_info['subseed'] = all_subseeds[i]
+        if i < len(infotexts):
+            image_info['infotexts'] = [infotexts[i]]
+        image_info['all_seeds'] = [image_info['seed']]
+        image_info['index_of_first_image'] = 0
+        image_info['batch_size'] = 1
+
+        response = dict(api_response)
+        response['images'] = [images[i]]
+        response['info'] = json.dumps(image_info)
+        responses.append(response)
+
+    return responses
+
+
+def batch_call(
+    api_client: SDAPIClient,
+    prompt_configs: List[PromptConfig],
+    generation_config: GenerationConfig
+) -> Callable[[], List[Any]]:
+    """
+    Build the API call for a group of coalesced images
+
+    Args:
+        api_client: API client
+        prompt_configs: Group from coalesce_seed_runs() (first seed starts the batch)
+        generation_config: Snapshot of the generation parameters
+
+    Returns:
+        Call returning one entry per image: its API response, or the
+        exception that made it fail
+    """
+    if len(prompt_configs) == 1:
+        return lambda: [api_client.generate_image(prompt_configs[0], generation_config=generation_config)]
+
+    batched_config = replace(generation_config, batch_size=len(prompt_configs), n_iter=1)
+
+    def call() -> List[Any]:
+        try:
+            response = api_client.generate_image(prompt_configs[0], generation_config=batched_config)
+            return split_batch_response(response, len(prompt_configs))
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code != 500:
+                raise
+            # 500 on a batch is usually out of VRAM: fall back to one image per request
+
+        outcomes: List[Any] = []
+        for prompt_config in prompt_configs:
+            try:
+                outcomes.append(api_client.generate_image(prompt_config, generation_config=generation_config))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    return call
+
+
+def expand_batch_result(result: PipelineResult) -> List[PipelineResult]:
+    """
+    Turn the pipeline result of a group into one result per image
+
+    Args:
+        result: Result whose item is a group of (index, item) and whose
+            response is the list returned by the batch call
+
+    Returns:
+        Per-image results (original indexes, elapsed time shared evenly)
+    """
+    group = result.item
+    elapsed = result.elapsed / len(group)
+    results = []
+    for position, (index, item) in enumerate(group):
+        error: Optional[BaseException] = result.error
+        response = None
+        if error is None:
+            outcome = result.response[position]
+            if isinstance(outcome, BaseException):
+                error = outcome
+            else:
+                response = outcome
+        results.append(PipelineResult(index=index, item=item, response=response, error=error, elapsed=elapsed))
+    return results
@@ -33,7 +33,8 @@ class SessionManager:
                  session_name: Optional[str] = None,
                  dry_run: bool = False,
                  theme_name: Optional[str] = None,
-                 style: str = "default"):
+                 style: str = "default",
+                 output_dir: Optional[Path] = None):
         """
         Initialize session manager
 
@@ -43,6 +44,8 @@ class SessionManager:
             dry_run: If True, creates sessions in /dryrun subdirectory
             theme_name: Optional theme name (for themable templates)
             style: Art style (default, cartoon, realistic, etc.)
+            output_dir: Existing session directory to reuse (resumed
+                sessions); default is a new timestamped directory
         """
         self.base_output_dir = base_output_dir
         self.session_name = session_name
@@ -50,7 +53,7 @@ class SessionManager:
         self.theme_name = theme_name
         self.style = style
         self.session_start_time = datetime.now()
-        self._output_dir: Optional[Path] = None
+        self._output_dir: Optional[Path] = Path(output_dir) if output_dir is not None else None
 
     @property
     def output_dir(self) -> Path:
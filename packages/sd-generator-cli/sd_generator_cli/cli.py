@@ -17,13 +17,14 @@ Usage:
 
 import json
 import os
+import random
 import re
 import sys
 import signal
 import atexit
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Any, IO
+from typing import Optional, Any, IO, List
 
 import typer
 from rich.console import Console
@@ -34,7 +35,25 @@ from sd_generator_cli.config.global_config import load_global_config, ensure_glo
 
 # Global references for signal handlers
 _annotation_worker_instance: Optional[Any] = None
+_output_encoder_instance: Optional[Any] = None
 _current_manifest_path: Optional[Path] = None
+_manifest_journal_instance: Optional[Any] = None
+
+
+def _cleanup_output_encoder() -> None:
+    """Finish pending encodes on exit, so files match manifest filenames."""
+    global _output_encoder_instance
+    if _output_encoder_instance:
+        console = Console()
+        try:
+            pending = _output_encoder_instance.pending_count
+            if pending > 0:
+                console.print(f"\n[cyan]⏳ Waiting for {pending} pending encodes to complete...[/cyan]")
+            _output_encoder_instance.shutdown(wait=True)
+        except Exception as e:
+            console.print(f"[yellow]⚠ Error stopping output encoder: {e}[/yellow]")
+        finally:
+            _output_encoder_instance = None
 
 
 def _cleanup_annotation_worker() -> None:
@@ -55,15 +74,19 @@ def _cleanup_annotation_worker() -> None:
 
 
 def _update_manifest_status_aborted() -> None:
-    """Update manifest status to 'aborted' on interruption."""
-    global _current_manifest_path
+    """Update manifest status to 'aborted' on interruption (compacts the images journal)."""
+    global _current_manifest_path, _manifest_journal_instance
+    if _manifest_journal_instance:
+        try:
+            _manifest_journal_instance.close()  # Flushes entries not yet written
+        except Exception:
+            pass
+        finally:
+            _manifest_journal_instance = None
     if _current_manifest_path and _current_manifest_path.exists():
         try:
-            with open(_current_manifest_path, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
-            manifest["status"] = "aborted"
-            with open(_current_manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=2, ensure_ascii=False)
+            from sd_generator_cli.execution.manifest import compact_manifest
+            compact_manifest(_current_manifest_path.parent, status="aborted")
         except Exception:
             pass  # Silently fail if manifest update fails
 
@@ -72,6 +95,7 @@ def _signal_handler(signum: int, frame: Any) -> None:
     """Handle Ctrl+C/SIGTERM gracefully."""
     console = Console()
     console.print("\n[yellow]⚠ Interrupted by user (Ctrl+C)[/yellow]")
+    _cleanup_output_encoder()  # Records pending images before the manifest is compacted
     _update_manifest_status_aborted()
     _cleanup_annotation_worker()
     sys.exit(0)
@@ -81,6 +105,7 @@ def _signal_handler(signum: int, frame: Any) -> None:
 signal.signal(signal.SIGINT, _signal_handler)  # Ctrl+C
 signal.signal(signal.SIGTERM, _signal_handler)  # kill
 atexit.register(_cleanup_annotation_worker)  # Normal exit
+atexit.register(_cleanup_output_encoder)  # Registered last: runs before annotation cleanup
 
 # Initialize Typer app and Rich console
 app = typer.Typer(
@@ -196,7 +221,10 @@ def _generate(
     style: str = "default",
     skip_validation: bool = False,
     use_fixed: Optional[str] = None,
-    seeds: Optional[str] = None
+    seeds: Optional[str] = None,
+    jobs: int = 1,
+    resume_state: Optional[Any] = None,
+    use_result_cache: bool = True
 ):
     """
     Generate images using Template System V2.0.
@@ -219,6 +247,11 @@ def _generate(
         theme_name: Optional theme name (for themable templates)
         style: Art style (default, cartoon, realistic, etc.)
         use_fixed: Fix placeholder values (format: "placeholder:key|placeholder2:key2")
+        jobs: Worker processes for prompt rendering (1 = in-process)
+        resume_state: ResumeState of an interrupted session (--resume): its
+            prompt sequence is rebuilt and generated indexes are skipped
+        use_result_cache: Reuse identical images from earlier sessions when
+            result_cache_dir is configured (False = --no-cache)
     """
     # ========================================================================
     # Feature Flag: New Orchestrator Architecture (Strangler Fig Pattern)
@@ -227,7 +260,9 @@ def _generate(
     # Default: false (use legacy monolithic code for backward compatibility)
     USE_NEW_ORCHESTRATOR = os.getenv("SDGEN_USE_NEW_ARCH", "false").lower() == "true"
 
-    if USE_NEW_ORCHESTRATOR:
+    if USE_NEW_ORCHESTRATOR and resume_state is not None:
+        console.print("[yellow]--resume uses the legacy generation code[/yellow]\n")
+    elif USE_NEW_ORCHESTRATOR:
         # NEW ARCHITECTURE: Use GenerationOrchestrator (Phases 1-5)
         from sd_generator_cli.orchestrator import GenerationOrchestrator
 
@@ -251,7 +286,8 @@ def _generate(
                 style=style,
                 skip_validation=skip_validation,
                 use_fixed=use_fixed,
-                seeds=seeds
+                seeds=seeds,
+                jobs=jobs
             )
         except SystemExit:
             # orchestrator already handled cleanup
@@ -268,11 +304,18 @@ def _generate(
     # This code will be removed after new orchestrator is validated in production.
     console.print("[dim]Using legacy generation code (default)[/dim]\n")
 
-    global _current_manifest_path  # Declare at start of function
+    global _current_manifest_path, _manifest_journal_instance  # Declare at start of function
 
     from sd_generator_cli.templating.orchestrator import V2Pipeline
-    from sd_generator_cli.api import SDAPIClient, BatchGenerator, SessionManager, ImageWriter, ProgressReporter
+    from sd_generator_cli.templating.loaders.validation_memo import default_validation_memo
+    from sd_generator_cli.api import (
+        BackendDispatcher, BatchGenerator, create_api_client,
+        SessionManager, ImageWriter, ProgressReporter
+    )
     from sd_generator_cli.api import PromptConfig
+    from sd_generator_cli.execution.manifest import ManifestJournal, compact_manifest, write_manifest
+    from sd_generator_cli.execution.session_index import SessionIndex
+    from sd_generator_cli.execution.resume import build_resume_info, image_index
     from sd_generator_cli.templating.validators.schema_validator import SchemaValidator
 
     try:
@@ -312,6 +355,10 @@ def _generate(
         config = pipeline.load(str(template_path))
         resolved_config, context = pipeline.resolve(config, theme_name, theme_file, style)
 
+        validation_report = default_validation_memo().report()
+        if validation_report.skipped:
+            console.print(f"[dim]{validation_report.summary()}[/dim]")
+
         # Apply fixed placeholder values if specified
         fixed_placeholders = {}
         if use_fixed:
@@ -340,7 +387,15 @@ def _generate(
                 console.print(f"[red]✗ Invalid --seeds format:[/red] {e}")
                 raise typer.Exit(code=1)
 
-        prompts = pipeline.generate(resolved_config, context)
+        # Key variation draws, so that --resume rebuilds the same prompt sequence
+        if resolved_config.generation:
+            if resume_state is not None:
+                resolved_config.generation.stream_key = resume_state.options.get('stream_key')
+            elif resolved_config.generation.stream_key is None:
+                resolved_config.generation.stream_key = random.getrandbits(64)
+
+        # Lazy prompt stream: prompts are rendered one at a time as images are generated
+        prompts = pipeline.generate_stream(resolved_config, context)
 
         # Display variation statistics
         template_str = resolved_config.template if resolved_config.template else ""
@@ -386,6 +441,15 @@ def _generate(
 
         console.print(f"[green]✓ Generated {len(prompts)} prompt variations[/green]\n")
 
+        # Indexes already generated by the interrupted session (--resume)
+        done_indices: set[int] = set()
+        if resume_state is not None:
+            done_indices = {idx for idx in resume_state.done if idx < len(prompts)}
+            console.print(
+                f"[cyan]Resuming session:[/cyan] {len(done_indices)}/{len(prompts)} images already generated\n"
+            )
+        remaining_count = len(prompts) - len(done_indices)
+
         # Session setup
         # Priority: CLI override > config.output.session_name > config.name > filename
         if session_name_override:
@@ -400,28 +464,38 @@ def _generate(
         output_base_dir = Path(global_config.output_dir)
 
         # Initialize API components
-        api_client = SDAPIClient(api_url=api_url)
+        api_client = create_api_client(api_url, stream_images=True)
         session_manager = SessionManager(
             base_output_dir=str(output_base_dir),
             session_name=session_name,
             dry_run=dry_run,
             theme_name=theme_name,
-            style=style
+            style=style,
+            output_dir=resume_state.session_dir if resume_state is not None else None
         )
         image_writer = ImageWriter(session_manager.output_dir)
         progress_reporter = ProgressReporter(
-            total_images=len(prompts),
+            total_images=remaining_count,
             output_dir=session_manager.output_dir,
             verbose=True
         )
 
+        # Result cache: identical requests reuse images from earlier sessions
+        result_cache = None
+        if not dry_run and use_result_cache:
+            from sd_generator_cli.api.result_cache import create_result_cache_from_config
+            result_cache = create_result_cache_from_config(global_config)
+            if result_cache:
+                console.print(f"[cyan]Result cache:[/cyan] {result_cache.cache_dir}")
+
         # Create batch generator
         generator = BatchGenerator(
             api_client=api_client,
             session_manager=session_manager,
             image_writer=image_writer,
             progress_reporter=progress_reporter,
-            dry_run=dry_run
+            dry_run=dry_run,
+            result_cache=result_cache
         )
 
         session_dir = Path(session_manager.output_dir)
@@ -481,21 +555,22 @@ def _generate(
                     "count": len(all_values)
                 }
 
-        # 2. Extract actually used values from generated prompts
-        for prompt_dict in prompts:
-            variations = prompt_dict.get('variations', {})
-            for key, value in variations.items():
-                if key in variations_map and isinstance(variations_map[key], dict):
-                    used_list = variations_map[key].get("used")
-                    if isinstance(used_list, list) and value not in used_list:
-                        used_list.append(value)
-                else:
-                    # Fallback: if placeholder not in imports (shouldn't happen)
-                    variations_map[key] = {
-                        "available": [value],
-                        "used": [value],
-                        "count": 1
-                    }
+        # 2. Extract actually used values from generated prompts (computed without rendering them)
+        from sd_generator_cli.templating.generators.prompt_stream import collect_used_variations, iter_parallel
+        for key, used_values in collect_used_variations(prompts).items():
+            if key in variations_map and isinstance(variations_map[key], dict):
+                used_list = variations_map[key].get("used")
+                if isinstance(used_list, list):
+                    for value in used_values:
+                        if value not in used_list:
+                            used_list.append(value)
+            else:
+                # Fallback: if placeholder not in imports (shouldn't happen)
+                variations_map[key] = {
+                    "available": [used_values[0]],
+                    "used": list(used_values),
+                    "count": 1
+                }
 
         # Build generation params
         gen_mode = config.generation.mode if config.generation else "combinatorial"
@@ -541,22 +616,61 @@ def _generate(
             "fixed_placeholders": fixed_placeholders,
             # Themable Templates metadata (Phase 2)
             "theme_name": theme_name,
-            "style": style
+            "style": style,
+            # Everything needed to rebuild the prompt sequence (--resume)
+            "resume": build_resume_info(
+                template_path=template_path,
+                stream_key=resolved_config.generation.stream_key if resolved_config.generation else None,
+                count=count,
+                session_name=session_name,
+                theme_file=theme_file,
+                use_fixed=use_fixed,
+                seeds=seeds,
+                dry_run=dry_run
+            )
         }
 
-        # Save temporary snapshot (will be updated after generation with real seeds)
+        # Save temporary snapshot; images are appended to the images.jsonl
+        # journal, compacted into manifest.json when the session ends
         manifest_path = session_dir / "manifest.json"
-        temp_manifest = {
-            "snapshot": snapshot,
-            "images": [],  # Will be filled after generation
-            "status": "ongoing"  # FSM: ongoing → completed|aborted
-        }
-
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(temp_manifest, f, indent=2, ensure_ascii=False)
+        if resume_state is not None:
+            # Keep the original snapshot and images, record images saved
+            # right before the interruption but missing from the manifest
+            temp_manifest = resume_state.manifest
+            temp_manifest["status"] = "ongoing"
+            for idx in sorted(resume_state.unrecorded):
+                if idx >= len(prompts):
+                    continue
+                prompt_dict = prompts[idx]
+                filename = next(
+                    path.name for path in session_dir.iterdir()
+                    if not path.name.startswith('.') and image_index(path.name) == idx
+                )
+                if dry_run:
+                    filename = str(Path(filename).with_suffix('.png'))  # Request JSON → image name
+                temp_manifest["images"].append({
+                    "filename": filename,
+                    "seed": prompt_dict.get('seed', -1),
+                    "prompt": prompt_dict['prompt'],
+                    "negative_prompt": prompt_dict.get('negative_prompt', ''),
+                    "applied_variations": prompt_dict.get('variations', {})
+                })
+            compact_manifest(session_dir, manifest=temp_manifest)
+        else:
+            temp_manifest = {
+                "snapshot": snapshot,
+                "images": [],  # Filled from the images journal when the session ends
+                "status": "ongoing"  # FSM: ongoing → completed|aborted
+            }
+            write_manifest(session_dir, temp_manifest)
+        manifest_journal = ManifestJournal(session_dir)
+        session_index = SessionIndex(session_dir)
+        if resume_state is not None:
+            session_index.add_many(temp_manifest["images"])  # Also indexes sessions created without it
 
-        # Set global manifest path for signal handler
+        # Set global manifest path and journal for signal handler
         _current_manifest_path = manifest_path
+        _manifest_journal_instance = manifest_journal
 
         console.print(f"[green]✓ Manifest initialized:[/green] {manifest_path}\n")
 
@@ -604,90 +718,124 @@ def _generate(
                 console.print("[yellow]⚠ Pillow not installed, skipping annotations[/yellow]")
                 console.print("[dim]  Install with: pip install Pillow[/dim]")
 
-        # Convert V2 prompts to PromptConfig list
-        prompt_configs = []
-        for idx, prompt_dict in enumerate(prompts):
-            # Resolve ControlNet image variations (but don't encode yet)
-            parameters = prompt_dict.get('parameters', {}).copy()
-            variations = prompt_dict.get('variations', {}).copy()  # Copy for enrichment
-
-            if 'controlnet' in parameters:
-                # Deep copy controlnet config to avoid sharing between prompts
-                import copy
-                controlnet_config = copy.deepcopy(parameters['controlnet'])
-                parameters['controlnet'] = controlnet_config
-
-                if hasattr(controlnet_config, 'units'):
-                    for unit_idx, unit in enumerate(controlnet_config.units):
-                        if unit.image:
-                            # Handle dict variations (key → path mapping)
-                            if isinstance(unit.image, dict):
-                                # Find which key was used in this variation
-                                # The dict has import name as key with None value
-                                # We need to look in variations dict for the actual value
-                                for import_name in unit.image.keys():
-                                    # For ControlNet images, we need to pick a variation manually
-                                    # since the generator doesn't handle parameters placeholders
-                                    if import_name in context.imports and isinstance(context.imports[import_name], dict):
-                                        # Pick a random variation (or first one if already in variations)
-                                        if import_name not in variations:
-                                            import random
-                                            image_path = random.choice(list(context.imports[import_name].values()))
-                                            variations[import_name] = image_path
-                                        else:
-                                            image_path = variations[import_name]
-
-                                        # Resolve path relative to template file
-                                        image_path_obj = Path(image_path)
-                                        if not image_path_obj.is_absolute():
-                                            # Resolve relative to the template's directory
-                                            template_dir = config.source_file.parent
-                                            resolved_path = (template_dir / image_path).resolve()
-                                            image_path = str(resolved_path)
-
-                                        # Store resolved path (will be encoded in sdapi_client)
-                                        unit.image = image_path
-                                        break
-                            # Handle direct string path
-                            elif isinstance(unit.image, str):
-                                # For direct paths, add to variations with a generated key
-                                variation_key = f"ControlNetImage_{unit_idx}"
-                                variations[variation_key] = unit.image
-
-                                # Resolve path relative to template file if needed
-                                image_path_obj = Path(unit.image)
-                                if not image_path_obj.is_absolute():
-                                    template_dir = config.source_file.parent
-                                    resolved_path = (template_dir / unit.image).resolve()
-                                    unit.image = str(resolved_path)
-
-            # Update variations in prompt_dict for manifest
-            prompt_dict['variations'] = variations
-
-            # Build filename with seed if present
-            seed = prompt_dict.get('seed', -1)
-            if seed != -1:
-                filename = f"{session_name}_{idx:04d}_seed-{seed}.png"
-            else:
-                filename = f"{session_name}_{idx:04d}.png"
-
-            prompt_cfg = PromptConfig(
-                prompt=prompt_dict['prompt'],
-                negative_prompt=prompt_dict.get('negative_prompt', ''),
-                seed=seed,
-                filename=filename,
-                parameters=parameters
-            )
-            prompt_configs.append(prompt_cfg)
+        # Start output encoder if configured (process pool re-encoding saved PNGs)
+        global _output_encoder_instance
+        output_encoder = None
+        if not dry_run and config.output and config.output.encoding:
+            from sd_generator_cli.api.output_encoder import create_output_encoder_from_config
+            output_encoder = create_output_encoder_from_config(config.output.encoding)
+            if output_encoder:
+                _output_encoder_instance = output_encoder  # For signal handlers
+                console.print(f"[cyan]✓ Output encoder started ({output_encoder.image_format})[/cyan]")
+
+        # Convert V2 prompts to PromptConfig lazily (one at a time, as images are generated)
+        # Enriched prompt dicts awaiting their manifest entry, keyed by index
+        pending_prompts: dict[int, dict] = {}
+
+        def iter_prompt_configs():
+            # Pipeline position of the next yielded prompt (differs from idx when resuming)
+            position = 0
+            # ControlNet image draws follow the variation draws key (restored by --resume)
+            stream_key = resolved_config.generation.stream_key if resolved_config.generation else None
+            if stream_key is None:
+                stream_key = random.getrandbits(64)
+            # Prompts are rendered by a process pool when --jobs > 1
+            for idx, prompt_dict in enumerate(iter_parallel(prompts, jobs)):
+                if idx in done_indices:
+                    continue  # Already generated (--resume)
+
+                # Resolve ControlNet image variations (but don't encode yet)
+                parameters = prompt_dict.get('parameters', {})
+                variations = prompt_dict.get('variations', {})
+
+                if 'controlnet' in parameters:
+                    # Copy for enrichment (parameters are shared between prompts)
+                    parameters = parameters.copy()
+                    variations = variations.copy()
+
+                    # Copy controlnet config and units to avoid sharing resolved paths
+                    # between prompts (images stay paths, encoded once at send time)
+                    import copy
+                    controlnet_config = copy.copy(parameters['controlnet'])
+                    if hasattr(controlnet_config, 'units'):
+                        controlnet_config.units = [copy.copy(unit) for unit in controlnet_config.units]
+                    parameters['controlnet'] = controlnet_config
+
+                    if hasattr(controlnet_config, 'units'):
+                        for unit_idx, unit in enumerate(controlnet_config.units):
+                            if unit.image:
+                                # Handle dict variations (key → path mapping)
+                                if isinstance(unit.image, dict):
+                                    # Find which key was used in this variation
+                                    # The dict has import name as key with None value
+                                    # We need to look in variations dict for the actual value
+                                    for import_name in unit.image.keys():
+                                        # For ControlNet images, we need to pick a variation manually
+                                        # since the generator doesn't handle parameters placeholders
+                                        if import_name in context.imports and isinstance(context.imports[import_name], dict):
+                                            # Pick a random variation (or first one if already in variations)
+                                            if import_name not in variations:
+                                                # Keyed by prompt index, so that --resume picks the same image
+                                                picker = random.Random(f"{stream_key}:{idx}:{import_name}")
+                                                image_path = picker.choice(list(context.imports[import_name].values()))
+                                                variations[import_name] = image_path
+                                            else:
+                                                image_path = variations[import_name]
+
+                                            # Resolve path relative to template file
+                                            image_path_obj = Path(image_path)
+                                            if not image_path_obj.is_absolute():
+                                                # Resolve relative to the template's directory
+                                                template_dir = config.source_file.parent
+                                                resolved_path = (template_dir / image_path).resolve()
+                                                image_path = str(resolved_path)
+
+                                            # Store resolved path (will be encoded in sdapi_client)
+                                            unit.image = image_path
+                                            break
+                                # Handle direct string path
+                                elif isinstance(unit.image, str):
+                                    # For direct paths, add to variations with a generated key
+                                    variation_key = f"ControlNetImage_{unit_idx}"
+                                    variations[variation_key] = unit.image
+
+                                    # Resolve path relative to template file if needed
+                                    image_path_obj = Path(unit.image)
+                                    if not image_path_obj.is_absolute():
+                                        template_dir = config.source_file.parent
+                                        resolved_path = (template_dir / unit.image).resolve()
+                                        unit.image = str(resolved_path)
+
+                # Update variations in prompt_dict for manifest
+                prompt_dict['variations'] = variations
+
+                # Build filename with seed if present
+                seed = prompt_dict.get('seed', -1)
+                if seed != -1:
+                    filename = f"{session_name}_{idx:04d}_seed-{seed}.png"
+                else:
+                    filename = f"{session_name}_{idx:04d}.png"
+
+                prompt_cfg = PromptConfig(
+                    prompt=prompt_dict['prompt'],
+                    negative_prompt=prompt_dict.get('negative_prompt', ''),
+                    seed=seed,
+                    filename=filename,
+                    parameters=parameters
+                )
+                pending_prompts[position] = prompt_dict
+                position += 1
+                yield prompt_cfg
 
         # Define callback to update manifest after each image
         def update_manifest_incremental(idx: int, prompt_cfg: PromptConfig, success: bool, api_response: Optional[dict]):
             """Update manifest after each image generation"""
+            prompt_dict = pending_prompts.pop(idx)
             if not success:
                 return  # Skip failed images
 
             # Get real seed from API response
-            real_seed = prompts[idx].get('seed', -1)
+            real_seed = prompt_dict.get('seed', -1)
 
             if api_response and 'info' in api_response:
                 try:
@@ -698,53 +846,77 @@ def _generate(
                     # Fallback to original seed if parsing fails
                     pass
 
-            # Read current manifest
-            try:
-                with open(manifest_path, 'r', encoding='utf-8') as f:
-                    current_manifest = json.load(f)
-            except Exception:
-                # If manifest doesn't exist or is corrupted, recreate it
-                current_manifest = {"snapshot": snapshot, "images": []}
-
-            # Add new image entry
+            # New image entry (recorded once its final file exists)
             new_image = {
                 "filename": prompt_cfg.filename,
                 "seed": real_seed,
-                "prompt": prompts[idx]['prompt'],
-                "negative_prompt": prompts[idx].get('negative_prompt', ''),
-                "applied_variations": prompts[idx].get('variations', {})
+                "prompt": prompt_dict['prompt'],
+                "negative_prompt": prompt_dict.get('negative_prompt', ''),
+                "applied_variations": prompt_dict.get('variations', {})
             }
+            # API latency, used by --plan to estimate run durations
+            if generator.last_generation_time is not None:
+                new_image["generation_time"] = round(generator.last_generation_time, 3)
 
-            current_manifest["images"].append(new_image)
+            image_path = session_dir / prompt_cfg.filename
+            variations = prompt_dict.get('variations', {})
+            encoder = output_encoder
+            encoded_filename = encoder.final_filename(prompt_cfg.filename) if encoder else prompt_cfg.filename
+
+            def record_image(path: Path, image_format: Optional[str]) -> None:
+                entry = new_image
+                if image_format is not None:
+                    entry = dict(new_image, filename=encoded_filename)
+                    entry["format"] = image_format
 
-            # Write updated manifest
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(current_manifest, f, indent=2, ensure_ascii=False)
+                # Append to the images journal (one line, no manifest rewrite)
+                manifest_journal.append(entry)
+                session_index.add(entry)
 
-            # Submit to annotation worker (real-time annotation)
-            if annotation_worker:
-                image_path = session_dir / prompt_cfg.filename
-                variations = prompts[idx].get('variations', {})
-                annotation_worker.submit(image_path, variations)
+                # Submit to annotation worker (real-time annotation)
+                if annotation_worker:
+                    annotation_worker.submit(path, variations)
+
+            # Re-encode in the background: recorded once encoded (or kept as PNG on failure)
+            if encoder:
+                encoder.submit(image_path, on_complete=record_image)
+            else:
+                record_image(image_path, None)
 
         # Generate images with incremental manifest updates
         success_count, total_count = generator.generate_batch(
-            prompt_configs=prompt_configs,
-            delay_between_images=2.0,
-            on_image_generated=update_manifest_incremental
+            prompt_configs=iter_prompt_configs(),
+            on_image_generated=update_manifest_incremental,
+            total=remaining_count
         )
 
         fail_count = total_count - success_count
 
+        # Wait for pending encodes (files must match the manifest before it is completed)
+        if output_encoder:
+            pending = output_encoder.pending_count
+            if pending > 0:
+                console.print(f"[cyan]⏳ Waiting for {pending} pending encodes to complete...[/cyan]")
+            output_encoder.shutdown(wait=True)
+            _output_encoder_instance = None  # Clear global ref
+
+        if isinstance(api_client, BackendDispatcher):
+            for line in api_client.summary_lines():
+                console.print(f"[dim]Backend {line}[/dim]")
+
+        if result_cache:
+            if result_cache.hits:
+                console.print(f"[green]♻ {result_cache.hits} images reused from the result cache[/green]")
+            result_cache.close()  # Evicts old entries
+
         console.print(f"[green]✓ Manifest updated incrementally ({success_count} images)[/green]\n")
 
-        # Update manifest status to "completed"
+        # Update manifest status to "completed" (compacts the images journal)
         try:
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                final_manifest = json.load(f)
-            final_manifest["status"] = "completed"
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(final_manifest, f, indent=2, ensure_ascii=False)
+            manifest_journal.close()
+            _manifest_journal_instance = None
+            session_index.close()
+            compact_manifest(session_dir, status="completed")
         except Exception as e:
             console.print(f"[yellow]Warning: Could not update manifest status: {e}[/yellow]")
 
@@ -777,17 +949,19 @@ def _generate(
 
     except Exception as e:
         # Update manifest status to "aborted" on error
+        _cleanup_output_encoder()  # Records pending images before the manifest is compacted
         try:
             if 'manifest_path' in locals() and manifest_path.exists():
-                with open(manifest_path, 'r', encoding='utf-8') as f:
-                    error_manifest = json.load(f)
-                error_manifest["status"] = "aborted"
-                with open(manifest_path, 'w', encoding='utf-8') as f:
-                    json.dump(error_manifest, f, indent=2, ensure_ascii=False)
+                if 'manifest_journal' in locals():
+                    manifest_journal.close()
+                if 'session_index' in locals():
+                    session_index.close()
+                compact_manifest(manifest_path.parent, status="aborted")
         except Exception:
             pass  # Silently fail if manifest update fails
         finally:
-            _current_manifest_path = None  # Clear global
+            _current_manifest_path = None  # Clear globals
+            _manifest_journal_instance = None
 
         console.print(f"\n[red]✗ V2 Pipeline error:[/red] {e}")
         import traceback
@@ -795,6 +969,137 @@ def _generate(
         raise typer.Exit(code=1)
 
 
+def _format_duration(seconds: float) -> str:
+    """Format a duration in seconds as e.g. '2d 3h', '1h 05m', '4m 10s'."""
+    seconds = int(round(seconds))
+    days, rest = divmod(seconds, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, secs = divmod(rest, 60)
+    if days:
+        return f"{days}d {hours}h"
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {secs:02d}s"
+    return f"{secs}s"
+
+
+def _plan(
+    template_path: Path,
+    global_config: Any,
+    count: Optional[int],
+    console: Console,
+    theme_name: Optional[str] = None,
+    theme_file: Optional[Path] = None,
+    style: str = "default",
+    use_fixed: Optional[str] = None,
+    seeds: Optional[str] = None
+):
+    """
+    Print the exact generation plan of a template without generating anything.
+
+    Shows per-placeholder cardinalities after selectors, loop order,
+    combination count, image total (seed sweeps and --count included) and a
+    wall-clock estimate from the API latency recorded in past sessions.
+    No prompt is rendered and no session directory is created.
+
+    Args:
+        template_path: Path to template file
+        global_config: Global configuration object
+        count: Maximum number of images to generate
+        console: Rich console for output
+        theme_name: Optional theme name (for themable templates)
+        theme_file: Optional theme file (bypasses template's themes: block)
+        style: Art style (default, cartoon, realistic, etc.)
+        use_fixed: Fix placeholder values (format: "placeholder:key|placeholder2:key2")
+        seeds: Seed specification for seed-sweep mode
+    """
+    from sd_generator_cli.templating.orchestrator import V2Pipeline
+    from sd_generator_cli.templating.generators.planner import estimate_latency, SOURCE_GENERATION_TIME
+
+    pipeline = V2Pipeline(configs_dir=str(global_config.configs_dir))
+    config = pipeline.load(str(template_path))
+    resolved_config, context = pipeline.resolve(config, theme_name, theme_file, style)
+
+    if use_fixed:
+        from sd_generator_cli.templating.utils.fixed_placeholders import parse_fixed_values
+        try:
+            context = _apply_fixed_to_context(context, parse_fixed_values(use_fixed))
+        except ValueError as e:
+            console.print(f"[red]✗ Invalid --use-fixed format:[/red] {e}")
+            raise typer.Exit(code=1)
+
+    if seeds:
+        from sd_generator_cli.templating.utils.seed_utils import parse_seeds
+        try:
+            resolved_config.generation.seed_list = parse_seeds(seeds)
+        except ValueError as e:
+            console.print(f"[red]✗ Invalid --seeds format:[/red] {e}")
+            raise typer.Exit(code=1)
+
+    plan = pipeline.plan(resolved_config, context)
+
+    if plan.placeholders:
+        table = Table(title=f"Placeholders ({plan.mode})")
+        table.add_column("#", style="cyan", width=4)
+        table.add_column("Placeholder", style="green")
+        table.add_column("Selected", justify="right")
+        table.add_column("Available", justify="right", style="dim")
+        table.add_column("Weight", justify="right")
+        table.add_column("Role")
+
+        for idx, placeholder in enumerate(plan.placeholders, 1):
+            if not placeholder.looped:
+                role = "random per combination"
+            elif plan.mode == 'combinatorial':
+                role = "loop"
+            else:
+                role = "random combination"
+            table.add_row(
+                str(idx),
+                placeholder.name,
+                f"{placeholder.selected:,}",
+                f"{placeholder.available:,}",
+                str(placeholder.weight),
+                role
+            )
+        console.print(table)
+    else:
+        console.print("[yellow]No placeholders detected in template[/yellow]")
+
+    images = plan.total_images
+    if count is not None:
+        images = min(images, count)
+
+    lines = []
+    if plan.mode == 'combinatorial' and plan.loop_order:
+        lines.append(f"[bold]Loop order:[/bold] {' → '.join(plan.loop_order)} (outer → inner)")
+    lines.append(f"[bold]Combinations:[/bold] {plan.combinations:,}")
+    if plan.seeds_per_combination > 1:
+        lines.append(f"[bold]Seeds per combination:[/bold] {plan.seeds_per_combination:,}")
+    if plan.max_images > 0 and plan.max_images < plan.combinations * plan.seeds_per_combination:
+        lines.append(f"[bold]max_images:[/bold] {plan.max_images:,}")
+    if count is not None and count < plan.total_images:
+        lines.append(f"[bold]--count:[/bold] {count:,}")
+    lines.append(f"[bold]Images:[/bold] {images:,}")
+
+    latency = estimate_latency(Path(global_config.output_dir))
+    if latency is None:
+        lines.append("[bold]Estimated time:[/bold] [dim]unknown (no past sessions in output directory)[/dim]")
+    else:
+        if latency.source == SOURCE_GENERATION_TIME:
+            basis = f"median API latency of {latency.samples:,} past images"
+        else:
+            basis = f"median throughput of {latency.samples:,} past sessions"
+        duration = latency.estimate_seconds(images)
+        lines.append(
+            f"[bold]Estimated time:[/bold] {_format_duration(duration)} "
+            f"[dim]({latency.seconds_per_image:.1f}s/image, {basis})[/dim]"
+        )
+
+    console.print(Panel("\n".join(lines), title="Generation Plan", border_style="cyan"))
+
+
 def select_template_interactive(configs_dir: Path) -> Path:
     """
     Interactive template selection with Rich formatting.
@@ -891,10 +1196,10 @@ def generate_images(
         help="Maximum number of variations to generate",
         min=1,
     ),
-    api_url: Optional[str] = typer.Option(
+    api_url: Optional[List[str]] = typer.Option(
         None,
         "--api-url",
-        help="Override Stable Diffusion API URL",
+        help="Override Stable Diffusion API URL (repeat to spread images over several WebUI instances)",
     ),
     dry_run: bool = typer.Option(
         False,
@@ -921,6 +1226,27 @@ def generate_images(
         "--seeds",
         help="Seed specification for seed-sweep mode (formats: '1000,1005,1008' | '1000-1019' | '20#1000')",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs", "-j",
+        min=1,
+        help="Worker processes for prompt rendering (speeds up dry runs of very large sessions)",
+    ),
+    plan: bool = typer.Option(
+        False,
+        "--plan",
+        help="Show exact combination counts, image total and estimated time, then exit",
+    ),
+    resume: Optional[str] = typer.Option(
+        None,
+        "--resume",
+        help="Continue an interrupted session (name or path), skipping images already generated",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always call the API, even for images found in the result cache",
+    ),
 ):
     """
     Generate images from YAML template using V2.0 Template System.
@@ -942,6 +1268,25 @@ def generate_images(
       * Range: --seeds 1000-1019
       * Count + start: --seeds 20#1000
 
+    Parallel prompt rendering (--jobs):
+    - Shards prompt rendering across N worker processes
+    - Prompts keep the same order and content as with a single process
+
+    Planning (--plan):
+    - Exact counts after selectors, loop order and image total (seed sweeps included)
+    - Estimated time from the API latency recorded in past sessions
+    - Nothing is generated, no session is created
+
+    Resuming (--resume):
+    - Reuses the template and options recorded in the session manifest
+    - Rebuilds the same prompt sequence and skips images already on disk
+    - New images are appended to the same session directory and manifest
+
+    Result cache (result_cache_dir in sdgen_config.json):
+    - Images already generated with the same payload and checkpoint are
+      linked from the cache instead of being generated again
+    - --no-cache always calls the API
+
     Examples:
         sdgen generate
         sdgen generate -t portrait.yaml
@@ -950,6 +1295,9 @@ def generate_images(
         sdgen generate -t character.template.yaml --theme cyberpunk --style realistic
         sdgen generate -t scene.template.yaml --theme scifi --style cartoon
         sdgen generate -t test.yaml --seeds 20#1000 (seed-sweep: 20 seeds starting at 1000)
+        sdgen generate -t huge.yaml --dry-run --jobs 8
+        sdgen generate -t huge.yaml --seeds 20#1000 --plan
+        sdgen generate --resume 20251014_143052_portrait
     """
     try:
         # Validate theme options (mutually exclusive)
@@ -970,7 +1318,7 @@ def generate_images(
             raise typer.Exit(code=1)
 
         configs_dir = Path(global_config.configs_dir).resolve()
-        api_url = api_url or global_config.api_url
+        api_urls = ",".join(api_url) if api_url else global_config.api_url
 
         # Verify configs directory exists
         if not configs_dir.exists():
@@ -978,6 +1326,31 @@ def generate_images(
             console.print("\n[yellow]Create the directory or update your sdgen_config.json[/yellow]")
             raise typer.Exit(code=1)
 
+        # Resume: template and options come from the session manifest
+        resume_state = None
+        if resume:
+            from sd_generator_cli.execution.resume import resolve_session_dir, load_resume_state
+            try:
+                resume_state = load_resume_state(resolve_session_dir(resume, Path(global_config.output_dir)))
+            except (FileNotFoundError, ValueError) as e:
+                console.print(f"[red]✗ Cannot resume session:[/red] {e}")
+                raise typer.Exit(code=1)
+
+            options = resume_state.options
+            snapshot = resume_state.manifest.get("snapshot", {})
+            template = Path(options["template_path"])
+            if not template.exists():
+                console.print(f"[red]✗ Template of the session not found:[/red] {template}")
+                raise typer.Exit(code=1)
+            count = options.get("count")
+            session_name = options.get("session_name")
+            theme_file = Path(options["theme_file"]) if options.get("theme_file") else None
+            use_fixed = options.get("use_fixed")
+            seeds = options.get("seeds")
+            dry_run = bool(options.get("dry_run"))
+            theme = snapshot.get("theme_name")
+            style = snapshot.get("style") or "default"
+
         # Determine template path
         if template is None:
             # Interactive selection
@@ -1009,11 +1382,25 @@ def generate_images(
             border_style="cyan"
         ))
 
+        if plan:
+            _plan(
+                template_path=template_path,
+                global_config=global_config,
+                count=count,
+                console=console,
+                theme_name=theme,
+                theme_file=theme_file,
+                style=style,
+                use_fixed=use_fixed,
+                seeds=seeds
+            )
+            return
+
         _generate(
             template_path=template_path,
             global_config=global_config,
             count=count,
-            api_url=api_url,
+            api_url=api_urls,
             dry_run=dry_run,
             console=console,
             session_name_override=session_name,
@@ -1022,7 +1409,10 @@ def generate_images(
             style=style,
             skip_validation=skip_validation,
             seeds=seeds,
-            use_fixed=use_fixed
+            use_fixed=use_fixed,
+            jobs=jobs,
+            resume_state=resume_state,
+            use_result_cache=not no_cache
         )
 
     except typer.Exit:
@@ -1383,13 +1773,13 @@ def list_samplers(
 ):
     """List available samplers from SD WebUI."""
     try:
-        from sd_generator_cli.api import SDAPIClient
+        from sd_generator_cli.api import create_api_client
 
         if api_url is None:
             global_config = load_global_config()
             api_url = global_config.api_url
 
-        api_client = SDAPIClient(api_url=api_url)
+        api_client = create_api_client(api_url)
 
         console.print(f"[cyan]Connecting to SD API:[/cyan] {api_url}")
         if not api_client.test_connection():
@@ -1426,13 +1816,13 @@ def list_schedulers(
 ):
     """List available schedulers from SD WebUI."""
     try:
-        from sd_generator_cli.api import SDAPIClient
+        from sd_generator_cli.api import create_api_client
 
         if api_url is None:
             global_config = load_global_config()
             api_url = global_config.api_url
 
-        api_client = SDAPIClient(api_url=api_url)
+        api_client = create_api_client(api_url)
 
         console.print(f"[cyan]Connecting to SD API:[/cyan] {api_url}")
         if not api_client.test_connection():
@@ -1468,13 +1858,13 @@ def list_models(
 ):
     """List available SD models/checkpoints."""
     try:
-        from sd_generator_cli.api import SDAPIClient
+        from sd_generator_cli.api import create_api_client
 
         if api_url is None:
             global_config = load_global_config()
             api_url = global_config.api_url
 
-        api_client = SDAPIClient(api_url=api_url)
+        api_client = create_api_client(api_url)
 
         console.print(f"[cyan]Connecting to SD API:[/cyan] {api_url}")
         if not api_client.test_connection():
@@ -1510,13 +1900,13 @@ def list_upscalers(
 ):
     """List available upscalers (for Hires Fix)."""
     try:
-        from sd_generator_cli.api import SDAPIClient
+        from sd_generator_cli.api import create_api_client
 
         if api_url is None:
             global_config = load_global_config()
             api_url = global_config.api_url
 
-        api_client = SDAPIClient(api_url=api_url)
+        api_client = create_api_client(api_url)
 
         console.print(f"[cyan]Connecting to SD API:[/cyan] {api_url}")
         if not api_client.test_connection():
@@ -1552,13 +1942,13 @@ def show_model_info(
 ):
     """Show currently loaded model information."""
     try:
-        from sd_generator_cli.api import SDAPIClient
+        from sd_generator_cli.api import create_api_client
 
         if api_url is None:
             global_config = load_global_config()
             api_url = global_config.api_url
 
-        api_client = SDAPIClient(api_url=api_url)
+        api_client = create_api_client(api_url)
 
         console.print(f"[cyan]Connecting to SD API:[/cyan] {api_url}")
         if not api_client.test_connection():
@@ -1593,13 +1983,13 @@ def list_adetailer_models(
 ):
     """List available ADetailer detection models."""
     try:
-        from sd_generator_cli.api import SDAPIClient
+        from sd_generator_cli.api import create_api_client
 
         if api_url is None:
             global_config = load_global_config()
             api_url = global_config.api_url
 
-        api_client = SDAPIClient(api_url=api_url)
+        api_client = create_api_client(api_url)
 
         console.print(f"[cyan]Connecting to SD API:[/cyan] {api_url}")
         if not api_client.test_connection():
@@ -1646,13 +2036,13 @@ def list_controlnet_models(
 ):
     """List available ControlNet models and preprocessor modules."""
     try:
-        from sd_generator_cli.api import SDAPIClient
+        from sd_generator_cli.api import create_api_client
 
         if api_url is None:
             global_config = load_global_config()
             api_url = global_config.api_url
 
-        api_client = SDAPIClient(api_url=api_url)
+        api_client = create_api_client(api_url)
 
         console.print(f"[cyan]Connecting to SD API:[/cyan] {api_url}")
         if not api_client.test_connection():
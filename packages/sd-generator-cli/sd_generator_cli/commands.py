@@ -21,6 +21,7 @@ from rich.table import Table
 
 from sd_generator_cli import daemon
 from sd_generator_cli.config.global_config import load_global_config
+from sd_generator_cli.api.backend_dispatcher import parse_api_urls
 
 console = Console()
 
@@ -56,7 +57,7 @@ def start_command(
     try:
         # Load config
         config = load_global_config()
-        api_url = config.api_url
+        api_url = parse_api_urls(config.api_url)[0]  # Local instance (first endpoint)
 
         # 1. Start Automatic1111 (if requested)
         if start_a1111:
@@ -182,7 +183,7 @@ def status_command() -> None:
     statuses = daemon.get_all_services_status()
 
     # Check if services are actually responding via HTTP (handles external launches)
-    a1111_api_running = daemon.is_automatic1111_running(config.api_url)
+    a1111_api_running = daemon.is_automatic1111_running(parse_api_urls(config.api_url)[0])
     backend_api_running = daemon.is_backend_running(port=8000)  # TODO: Get from config?
     frontend_running = daemon.is_frontend_running(port=5173)   # TODO: Get from config?
 
@@ -248,7 +249,10 @@ def config_command(
         sdgen config renew-token        # Generate new WebUI token
     """
     # Define valid config keys
-    VALID_KEYS = ["api_url", "configs_dir", "output_dir", "webui_token"]
+    VALID_KEYS = [
+        "api_url", "configs_dir", "output_dir", "webui_token",
+        "result_cache_dir", "result_cache_max_age_days", "result_cache_max_size_mb"
+    ]
 
     config_path = Path.cwd() / "sdgen_config.json"
 
@@ -2,7 +2,7 @@
 Global Configuration System for SD Generator
 
 Manages sdgen_config.json in the current working directory.
-Supports configs_dir, output_dir, api_url, and webui_token settings.
+Supports configs_dir, output_dir, api_url, webui_token and result cache settings.
 
 Config location: ./sdgen_config.json (current directory only)
 """
@@ -19,8 +19,12 @@ class GlobalConfig:
     """Global configuration settings"""
     configs_dir: str = "./prompts"
     output_dir: str = "./results"
-    api_url: str = "http://127.0.0.1:7860"
+    api_url: str = "http://127.0.0.1:7860"  # Several WebUI instances: comma-separated
     webui_token: Optional[str] = None
+    # Result cache (reuse identical images across sessions): disabled when unset
+    result_cache_dir: Optional[str] = None
+    result_cache_max_age_days: float = 30
+    result_cache_max_size_mb: float = 20480
 
     def to_dict(self) -> dict:
         """Convert to dictionary"""
@@ -29,11 +33,18 @@ class GlobalConfig:
     @classmethod
     def from_dict(cls, data: dict) -> 'GlobalConfig':
         """Create from dictionary"""
+        api_url = data.get("api_url", cls.api_url)
+        if isinstance(api_url, list):  # List of WebUI instances
+            api_url = ",".join(api_url)
         return cls(
             configs_dir=data.get("configs_dir", cls.configs_dir),
             output_dir=data.get("output_dir", cls.output_dir),
-            api_url=data.get("api_url", cls.api_url),
-            webui_token=data.get("webui_token")
+            api_url=api_url,
+            webui_token=data.get("webui_token"),
+            result_cache_dir=data.get("result_cache_dir"),
+            # Values set with `sdgen config` are strings
+            result_cache_max_age_days=float(data.get("result_cache_max_age_days", cls.result_cache_max_age_days)),
+            result_cache_max_size_mb=float(data.get("result_cache_max_size_mb", cls.result_cache_max_size_mb))
         )
 
 
@@ -3,13 +3,47 @@ Manifest generation and writing for V2 snapshot system
 
 This module handles the creation and writing of manifest.json files
 with complete snapshot information for reproducibility.
+
+During generation, a session has two manifest files:
+
+- manifest.json: snapshot and status (written at start and at the end)
+- images.jsonl: append-only journal, one image entry per line
+
+Appending an image costs one line instead of a rewrite of the whole
+manifest, written in batches by a background thread (ManifestJournal).
+compact_manifest() merges the journal into manifest.json when the session
+ends. Readers use load_manifest(), which merges both forms.
+
+Compacted manifests use the interned format (intern_manifest()): image
+entries reference variation values and negative prompts by index instead
+of repeating the resolved strings, and prompts are rebuilt from the
+normalized template. load_manifest() expands them back.
+
+manifest.json is always replaced atomically (temporary file, fsync,
+rename): a crash leaves either the previous or the new manifest, never a
+truncated one.
 """
 
 import json
+import os
+import tempfile
+import threading
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from typing import Deque, Dict, List, Optional, TextIO
 from pathlib import Path
 
+# Compact manifest schema, shared with the webui
+from sd_generator_common.models.manifest import (
+    INTERNED_FORMAT,
+    expand_manifest,
+    intern_manifest as _intern_manifest,
+)
+
+
+MANIFEST_FILENAME = "manifest.json"
+IMAGES_JOURNAL_FILENAME = "images.jsonl"
+
 
 @dataclass
 class ManifestImage:
@@ -37,7 +71,7 @@ class ManifestWriter:
 
     Responsibilities:
     - Format snapshot and image data
-    - Write manifest.json to output directory
+    - Write manifest.json to output directory (atomically, see write_manifest())
     - Ensure proper JSON encoding (UTF-8, indented)
     """
 
@@ -66,12 +100,7 @@ class ManifestWriter:
             "images": [img.to_dict() for img in images]
         }
 
-        manifest_path = self.output_dir / "manifest.json"
-
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
-
-        return manifest_path
+        return write_manifest(self.output_dir, manifest)
 
     def write_manifest_dict(self, manifest: dict) -> Path:
         """
@@ -83,9 +112,312 @@ class ManifestWriter:
         Returns:
             Path to written manifest.json file
         """
-        manifest_path = self.output_dir / "manifest.json"
+        return write_manifest(self.output_dir, manifest)
+
+
+def parse_images_journal(text: str) -> List[dict]:
+    """
+    Parse an images.jsonl journal
+
+    A torn last line (process killed mid-write) is ignored.
+
+    Args:
+        text: Journal content
+
+    Returns:
+        Image entries, in generation order
+    """
+    images = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            images.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return images
+
+
+def merge_images_journal(manifest: dict, journal_images: List[dict]) -> dict:
+    """
+    Append journal entries to the images of a manifest
 
-        with open(manifest_path, 'w', encoding='utf-8') as f:
+    Entries already in the manifest (compaction interrupted before the
+    journal was removed) are skipped.
+
+    Args:
+        manifest: Parsed manifest.json (modified in place)
+        journal_images: Entries from parse_images_journal()
+
+    Returns:
+        The manifest
+    """
+    images = manifest.setdefault("images", [])
+    if journal_images:
+        known = {image.get("filename") for image in images}
+        images.extend(image for image in journal_images if image.get("filename") not in known)
+    return manifest
+
+
+def intern_manifest(manifest: dict) -> dict:
+    """
+    Convert a manifest to the interned format (see sd_generator_common)
+
+    Prompts are recorded normalized (PromptNormalizer), so the raw template
+    (``prompt: |`` blocks end with a newline, separators as typed) rarely
+    rebuilds them. Substitution commutes with normalization for values
+    without leading/trailing separators, so the normalized template forms
+    are tried first for ``tables.prompt_template``.
+
+    Args:
+        manifest: Manifest in the full format (returned as-is if already interned)
+
+    Returns:
+        New manifest dict, ``format`` = INTERNED_FORMAT
+    """
+    template = ((manifest.get("snapshot") or {}).get("resolved_template") or {}).get("prompt")
+    if manifest.get("format") == INTERNED_FORMAT or template is None:
+        return _intern_manifest(manifest)
+
+    # Imported here: the templating package imports this module
+    from ..templating.normalizers import PromptNormalizer
+
+    normalizer = PromptNormalizer()
+    candidates = [normalizer.normalize_prompt(template), normalizer.normalize_single_line(template)]
+    return _intern_manifest(manifest, template_candidates=candidates)
+
+
+def load_manifest(session_dir: Path) -> dict:
+    """
+    Read a session manifest, including images still in the journal
+
+    Interned manifests are expanded (full image entries).
+
+    Args:
+        session_dir: Session directory
+
+    Returns:
+        Manifest dict (snapshot, images, status)
+
+    Raises:
+        FileNotFoundError: If the session has no manifest.json
+        ValueError: If manifest.json is not valid JSON
+    """
+    session_dir = Path(session_dir)
+    with open(session_dir / MANIFEST_FILENAME, 'r', encoding='utf-8') as f:
+        manifest = expand_manifest(json.load(f))
+
+    journal_path = session_dir / IMAGES_JOURNAL_FILENAME
+    if journal_path.exists():
+        merge_images_journal(manifest, parse_images_journal(journal_path.read_text(encoding='utf-8')))
+    return manifest
+
+
+def write_manifest(session_dir: Path, manifest: dict) -> Path:
+    """
+    Write manifest.json atomically (temporary file, fsync, then rename)
+
+    Args:
+        session_dir: Session directory
+        manifest: Complete manifest dict
+
+    Returns:
+        Path to manifest.json
+    """
+    manifest_path = Path(session_dir) / MANIFEST_FILENAME
+    fd, temp_path = tempfile.mkstemp(dir=session_dir, prefix=f".{MANIFEST_FILENAME}.", suffix=".part")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
             json.dump(manifest, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, manifest_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(manifest_path.parent)
+    return manifest_path
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist a rename (best effort: directories cannot be opened on Windows)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def compact_manifest(session_dir: Path, status: Optional[str] = None, manifest: Optional[dict] = None) -> dict:
+    """
+    Merge the images journal into manifest.json and remove the journal
+
+    manifest.json is written in the interned format (see intern_manifest()).
+    A corrupted manifest.json is moved aside to manifest.json.corrupt (its
+    snapshot can be recovered from there) and rebuilt around the journal.
+
+    Args:
+        session_dir: Session directory
+        status: New status (ongoing, completed, aborted), None = unchanged
+        manifest: Merged manifest to write (default: read from disk)
+
+    Returns:
+        Compacted manifest (full format)
+
+    Raises:
+        FileNotFoundError: If the session has no manifest.json
+    """
+    session_dir = Path(session_dir)
+    if manifest is None:
+        try:
+            manifest = load_manifest(session_dir)
+        except ValueError:
+            manifest_path = session_dir / MANIFEST_FILENAME
+            os.replace(manifest_path, manifest_path.with_name(manifest_path.name + ".corrupt"))
+            journal_path = session_dir / IMAGES_JOURNAL_FILENAME
+            journal = journal_path.read_text(encoding='utf-8') if journal_path.exists() else ""
+            manifest = {"snapshot": {}, "images": parse_images_journal(journal), "status": "ongoing"}
+
+    if status is not None:
+        manifest["status"] = status
+    write_manifest(session_dir, intern_manifest(manifest))
+
+    try:
+        os.unlink(session_dir / IMAGES_JOURNAL_FILENAME)
+    except FileNotFoundError:
+        pass
+    return manifest
+
+
+class ManifestJournal:
+    """
+    Append-only images journal of a running session (images.jsonl)
+
+    Group commit: append() only queues the entry, a background thread
+    writes pending entries in batches (every batch_size entries or
+    flush_interval seconds) and fsyncs them. Generation never waits for
+    the disk; a hard crash loses at most the last batch, whose images are
+    still found on disk by --resume.
+
+    Example:
+        >>> journal = ManifestJournal(session_dir)
+        >>> journal.append({"filename": "image_0001.png", "seed": 42, ...})
+        >>> journal.close()  # Flushes pending entries
+        >>> compact_manifest(session_dir, status="completed")
+    """
+
+    def __init__(self, session_dir: Path, batch_size: int = 32, flush_interval: float = 1.0):
+        """
+        Open the journal of a session (created on first flush)
+
+        Args:
+            session_dir: Session directory
+            batch_size: Pending entries that trigger a flush
+            flush_interval: Maximum delay (seconds) before pending entries are flushed
+        """
+        self.path = Path(session_dir) / IMAGES_JOURNAL_FILENAME
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._file: Optional[TextIO] = None
+        self._pending: Deque[str] = deque()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        # Reentrant: the SIGINT handler may flush while the main thread flushes
+        self._write_lock = threading.RLock()
+
+    def append(self, image: dict) -> None:
+        """
+        Queue one image entry (written by the background thread)
+
+        Args:
+            image: Manifest image entry (filename, seed, prompt, ...)
+        """
+        self._pending.append(json.dumps(image, ensure_ascii=False) + "\n")
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="manifest-journal", daemon=True)
+                    self._thread.start()
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """Write pending entries and sync them to disk"""
+        with self._write_lock:
+            if not self._pending:
+                return
+            if self._file is None:
+                self._file = self._open()
+            journal_file = self._file
+            synced_size = os.fstat(journal_file.fileno()).st_size
+            lines = []
+            while self._pending:
+                lines.append(self._pending.popleft())
+            try:
+                journal_file.write("".join(lines))
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+            except OSError:
+                # Requeue the batch: it is retried by the next flush
+                self._pending.extendleft(reversed(lines))
+                self._rollback(synced_size)
+                raise
+
+    def close(self) -> None:
+        """Stop the background thread, flush pending entries and close the journal file"""
+        thread, self._thread = self._thread, None
+        self._wakeup.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+        with self._write_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of entries not yet written"""
+        return len(self._pending)
+
+    def _run(self) -> None:
+        """Background thread: flush on batch size or interval, until close()"""
+        current = threading.current_thread()
+        while self._thread is current:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except OSError as e:
+                print(f"Warning: Failed to write manifest journal: {e}")
+
+    def _rollback(self, size: int) -> None:
+        """Close the journal file after a failed write and cut it back to its synced size"""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+        try:
+            os.truncate(self.path, size)
+        except OSError:
+            pass  # The next flush reopens the journal and drops a torn last line
 
-        return manifest_path
+    def _open(self) -> TextIO:
+        """Open for appending, dropping a torn last line left by a killed process"""
+        if self.path.exists():
+            with open(self.path, 'rb+') as f:
+                content = f.read()
+                if content and not content.endswith(b"\n"):
+                    f.truncate(content.rfind(b"\n") + 1)
+        return open(self.path, 'a', encoding='utf-8')
@@ -0,0 +1,183 @@
+"""
+Resume support for interrupted generation sessions
+
+A session records in its manifest snapshot everything needed to rebuild
+its prompt sequence (``snapshot["resume"]``): template path, CLI options
+and the stream key of the variation draws. Image filenames carry their
+index in the sequence (``{session}_{index:04d}[_seed-N].png``), so a
+resumed run rebuilds the same sequence and skips every index already on
+disk or recorded in ``images[]``.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set
+
+from .manifest import IMAGES_JOURNAL_FILENAME, MANIFEST_FILENAME, load_manifest
+
+# {session}_{index:04d}[_seed-{seed}].{ext}
+_INDEX_PATTERN = re.compile(r'_(\d{4,})(?:_seed--?\d+)?\.(\w+)$')
+
+
+def image_index(filename: str) -> Optional[int]:
+    """
+    Extract the sequence index from an image filename
+
+    Args:
+        filename: Image (or dry-run JSON) filename
+
+    Returns:
+        Index, or None if the name does not follow the session pattern
+    """
+    match = _INDEX_PATTERN.search(filename)
+    return int(match.group(1)) if match else None
+
+
+def build_resume_info(
+    template_path: Path,
+    stream_key: Optional[int],
+    count: Optional[int] = None,
+    session_name: Optional[str] = None,
+    theme_file: Optional[Path] = None,
+    use_fixed: Optional[str] = None,
+    seeds: Optional[str] = None,
+    dry_run: bool = False
+) -> Dict[str, Any]:
+    """
+    Build the ``snapshot["resume"]`` record of a new session
+
+    Theme name and style are already part of the snapshot.
+
+    Args:
+        template_path: Template the session was generated from
+        stream_key: Key of the variation draws (GenerationConfig.stream_key)
+        count: --count limit
+        session_name: Session name used in filenames
+        theme_file: --theme-file
+        use_fixed: --use-fixed specification
+        seeds: --seeds specification
+        dry_run: Dry-run session
+
+    Returns:
+        JSON-serializable dict
+    """
+    return {
+        "template_path": str(Path(template_path).resolve()),
+        "stream_key": stream_key,
+        "count": count,
+        "session_name": session_name,
+        "theme_file": str(Path(theme_file).resolve()) if theme_file else None,
+        "use_fixed": use_fixed,
+        "seeds": seeds,
+        "dry_run": dry_run
+    }
+
+
+@dataclass
+class ResumeState:
+    """
+    What an interrupted session already produced
+
+    Attributes:
+        session_dir: Session directory
+        manifest: Current manifest content (images journal merged)
+        options: ``snapshot["resume"]`` record (see build_resume_info)
+        recorded: Indexes listed in manifest images[]
+        on_disk: Indexes with an output file in the session directory
+    """
+    session_dir: Path
+    manifest: Dict[str, Any]
+    options: Dict[str, Any]
+    recorded: Set[int] = field(default_factory=set)
+    on_disk: Set[int] = field(default_factory=set)
+
+    @property
+    def done(self) -> Set[int]:
+        """Indexes to skip"""
+        return self.recorded | self.on_disk
+
+    @property
+    def unrecorded(self) -> Set[int]:
+        """Indexes saved to disk but missing from the manifest (crash in between)"""
+        return self.on_disk - self.recorded
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path of manifest.json"""
+        return self.session_dir / MANIFEST_FILENAME
+
+
+def resolve_session_dir(session: str, output_dir: Path) -> Path:
+    """
+    Find a session directory from a path or a name
+
+    Args:
+        session: Session directory path, or its name in the output directory
+            (dry-run sessions included)
+        output_dir: Output directory of the global config
+
+    Returns:
+        Session directory
+
+    Raises:
+        FileNotFoundError: If no such session exists
+    """
+    candidates = [Path(session), Path(output_dir) / session, Path(output_dir) / "dryrun" / session]
+    for candidate in candidates:
+        if (candidate / MANIFEST_FILENAME).is_file():
+            return candidate
+    raise FileNotFoundError(f"No session with a manifest found for '{session}'")
+
+
+def _indexes(filenames: Iterable[str]) -> Set[int]:
+    indexes = set()
+    for filename in filenames:
+        index = image_index(filename)
+        if index is not None:
+            indexes.add(index)
+    return indexes
+
+
+def load_resume_state(session_dir: Path) -> ResumeState:
+    """
+    Load the manifest of a session and list what it already produced
+
+    Args:
+        session_dir: Session directory
+
+    Returns:
+        ResumeState
+
+    Raises:
+        FileNotFoundError: If the session has no manifest
+        ValueError: If the manifest is unreadable or has no resume record
+            (sessions created before resume support)
+    """
+    session_dir = Path(session_dir)
+    try:
+        manifest = load_manifest(session_dir)
+    except ValueError as e:
+        raise ValueError(f"Corrupted manifest {session_dir / MANIFEST_FILENAME}: {e}") from e
+
+    options = (manifest.get("snapshot") or {}).get("resume")
+    if not options or not options.get("template_path"):
+        raise ValueError(
+            f"Session {session_dir.name} cannot be resumed: its manifest has no resume "
+            "information (created by an older sdgen)"
+        )
+
+    recorded = _indexes(image.get("filename", "") for image in manifest.get("images", []))
+    on_disk = _indexes(
+        path.name for path in session_dir.iterdir()
+        if path.is_file() and path.name not in (MANIFEST_FILENAME, IMAGES_JOURNAL_FILENAME)
+        and not path.name.startswith('.')
+    )
+
+    return ResumeState(
+        session_dir=session_dir,
+        manifest=manifest,
+        options=options,
+        recorded=recorded,
+        on_disk=on_disk
+    )
@@ -0,0 +1,154 @@
+"""
+Per-session SQLite index of generated images
+
+Filtering a large session ("images where Outfit=X and seed in range",
+"which values of placeholder P were used") would otherwise mean loading
+and scanning the whole manifest. SessionIndex maintains ``index.sqlite``
+next to manifest.json, one row per image, populated as images are
+recorded.
+
+Schema (read by the webui's SessionIndexRepository):
+
+- ``images``: idx (sequence index), filename, seed, prompt_hash, and one
+  column per placeholder (``v1``, ``v2``, ...)
+- ``placeholders``: placeholder name -> column name
+
+The index is derived data: manifest.json stays the source of truth, and
+index failures never interrupt generation.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from .resume import image_index
+
+
+INDEX_FILENAME = "index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    idx INTEGER PRIMARY KEY,
+    filename TEXT NOT NULL,
+    seed INTEGER,
+    prompt_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS images_seed ON images (seed);
+CREATE TABLE IF NOT EXISTS placeholders (
+    name TEXT PRIMARY KEY,
+    column_name TEXT NOT NULL UNIQUE
+);
+"""
+
+
+def prompt_hash(prompt: str) -> str:
+    """Short hash of a resolved prompt (groups images sharing a prompt)"""
+    return hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:16]
+
+
+class SessionIndex:
+    """
+    Writer of a session's index.sqlite
+
+    Thread-safe: images are recorded from the post-processing thread of
+    the generation pipeline.
+
+    Example:
+        >>> index = SessionIndex(session_dir)
+        >>> index.add({"filename": "s_0001_seed-42.png", "seed": 42, "prompt": "...",
+        ...            "applied_variations": {"Outfit": "red dress"}})
+        >>> index.close()
+    """
+
+    def __init__(self, session_dir: Path):
+        """
+        Open the index of a session (created on first add)
+
+        Args:
+            session_dir: Session directory
+        """
+        self.path = Path(session_dir) / INDEX_FILENAME
+        self._db: Optional[sqlite3.Connection] = None
+        self._columns: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._failed = False
+
+    def add(self, image: dict, idx: Optional[int] = None) -> None:
+        """
+        Record one image entry (replaces a previous entry with the same index)
+
+        Args:
+            image: Manifest image entry (filename, seed, prompt, applied_variations)
+            idx: Sequence index (default: parsed from the filename)
+        """
+        self.add_many([image], [idx])
+
+    def add_many(self, images: Iterable[dict], indexes: Optional[Iterable[Optional[int]]] = None) -> None:
+        """
+        Record image entries in a single transaction (e.g. a whole manifest)
+
+        Args:
+            images: Manifest image entries
+            indexes: Sequence indexes (default: parsed from the filenames)
+        """
+        images = list(images)
+        indexes = list(indexes) if indexes is not None else [None] * len(images)
+        with self._lock:
+            if self._failed:
+                return
+            try:
+                db = self._connect()
+                for image, idx in zip(images, indexes):
+                    self._insert(db, image, idx)
+                db.commit()
+            except sqlite3.Error as e:
+                # Derived data: disable the index rather than the generation
+                self._failed = True
+                print(f"Warning: Session index disabled ({self.path}): {e}")
+
+    def close(self) -> None:
+        """Close the index"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+            self._columns = dict(self._db.execute("SELECT name, column_name FROM placeholders"))
+        return self._db
+
+    def _column(self, db: sqlite3.Connection, placeholder: str) -> str:
+        """Column of a placeholder, added on first use"""
+        column = self._columns.get(placeholder)
+        if column is None:
+            column = f"v{len(self._columns) + 1}"
+            db.execute(f"ALTER TABLE images ADD COLUMN {column} TEXT")
+            db.execute(f"CREATE INDEX images_{column} ON images ({column})")
+            db.execute("INSERT INTO placeholders (name, column_name) VALUES (?, ?)", (placeholder, column))
+            self._columns[placeholder] = column
+        return column
+
+    def _insert(self, db: sqlite3.Connection, image: dict, idx: Optional[int]) -> None:
+        filename = image.get("filename", "")
+        if idx is None:
+            idx = image_index(filename)
+
+        values = {
+            "idx": idx,  # None = next free index
+            "filename": filename,
+            "seed": image.get("seed"),
+            "prompt_hash": prompt_hash(image.get("prompt", "")),
+        }
+        for placeholder, value in (image.get("applied_variations") or {}).items():
+            values[self._column(db, placeholder)] = None if value is None else str(value)
+
+        columns = ", ".join(values)
+        marks = ", ".join("?" * len(values))
+        db.execute(f"INSERT OR REPLACE INTO images ({columns}) VALUES ({marks})", list(values.values()))
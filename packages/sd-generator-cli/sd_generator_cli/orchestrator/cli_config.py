@@ -26,6 +26,7 @@ class CLIConfig:
         skip_validation: Skip YAML schema validation
         use_fixed: Fixed placeholder values (format: "Hair=blue,Eyes=green")
         seeds: Seed-sweep mode (comma-separated seeds: "42,43,44")
+        jobs: Worker processes for prompt rendering (1 = in-process)
     """
 
     # Required parameters
@@ -43,6 +44,7 @@ class CLIConfig:
     skip_validation: bool = False
     use_fixed: Optional[str] = None
     seeds: Optional[str] = None
+    jobs: int = 1
 
     def __post_init__(self) -> None:
         """Validate CLI config after initialization."""
@@ -58,6 +60,10 @@ class CLIConfig:
         if self.count is not None and self.count <= 0:
             raise ValueError(f"Count must be positive, got: {self.count}")
 
+        # Validate jobs is positive
+        if self.jobs < 1:
+            raise ValueError(f"Jobs must be at least 1, got: {self.jobs}")
+
         # Validate use_fixed format if specified
         if self.use_fixed:
             self._validate_fixed_placeholders(self.use_fixed)
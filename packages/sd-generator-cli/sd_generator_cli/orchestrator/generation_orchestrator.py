@@ -1,13 +1,18 @@
 """GenerationOrchestrator - high-level orchestration of generation workflow."""
 
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Sequence
 
 from rich.console import Console
 
 from ..config.global_config import GlobalConfig
 from ..templating.orchestrator import V2Pipeline
+from ..templating.generators.prompt_stream import iter_parallel
+from ..templating.loaders.validation_memo import default_validation_memo
 from ..api.sdapi_client import SDAPIClient
+from ..api.backend_dispatcher import BackendDispatcher, parse_api_urls
+from ..api.output_encoder import create_output_encoder_from_config
+from ..templating.models.config_models import EncodingConfig
 from .cli_config import CLIConfig
 from .session_config import SessionConfig
 from .session_config_builder import SessionConfigBuilder
@@ -92,7 +97,8 @@ class GenerationOrchestrator:
         style: str = "default",
         skip_validation: bool = False,
         use_fixed: Optional[str] = None,
-        seeds: Optional[str] = None
+        seeds: Optional[str] = None,
+        jobs: int = 1
     ) -> None:
         """Execute complete generation workflow.
 
@@ -111,6 +117,7 @@ class GenerationOrchestrator:
             skip_validation: Skip template validation (CLI --skip-validation)
             use_fixed: Fixed placeholder values (CLI --use-fixed)
             seeds: Seed sweep list (CLI --seeds)
+            jobs: Worker processes for prompt rendering (CLI --jobs)
 
         Raises:
             SystemExit: On validation errors or critical failures
@@ -127,7 +134,8 @@ class GenerationOrchestrator:
                 style=style,
                 skip_validation=skip_validation,
                 use_fixed=use_fixed,
-                seeds=seeds
+                seeds=seeds,
+                jobs=jobs
             )
 
             # Phase 2: Validate template (unless skipped)
@@ -178,7 +186,8 @@ class GenerationOrchestrator:
         style: str,
         skip_validation: bool,
         use_fixed: Optional[str],
-        seeds: Optional[str]
+        seeds: Optional[str],
+        jobs: int = 1
     ) -> SessionConfig:
         """Build unified SessionConfig from CLI args and template.
 
@@ -202,7 +211,8 @@ class GenerationOrchestrator:
             style=style,
             skip_validation=skip_validation,
             use_fixed=use_fixed,
-            seeds=seeds
+            seeds=seeds,
+            jobs=jobs
         )
 
         # Step 2: Load PromptConfig from template
@@ -259,8 +269,13 @@ class GenerationOrchestrator:
         """
         self.events.emit(EventType.API_CONNECTION_TEST_START)
 
-        # Create API client
-        self.api_client = SDAPIClient(api_url=session_config.api_url)
+        # Create API client (dispatcher when several endpoints are configured).
+        # Images are streamed to spool files and moved into place by ImageWriter.
+        api_urls = parse_api_urls(session_config.api_url)
+        if len(api_urls) > 1:
+            self.api_client = BackendDispatcher(api_urls, stream_images=True)
+        else:
+            self.api_client = SDAPIClient(api_url=session_config.api_url, stream_images=True)
 
         # Test connection
         if not self.api_client.test_connection():
@@ -309,6 +324,10 @@ class GenerationOrchestrator:
 
         self.events.emit(EventType.TEMPLATE_LOADED)
 
+        validation_report = default_validation_memo().report()
+        if validation_report.skipped:
+            self.events.emit(EventType.INFO, {"message": validation_report.summary()})
+
         return context, resolved_config
 
     # ========================================================================
@@ -320,7 +339,7 @@ class GenerationOrchestrator:
         session_config: SessionConfig,
         context: Any,
         resolved_config: Any
-    ) -> tuple[list[dict], dict]:
+    ) -> tuple[Sequence[dict], dict]:
         """Generate prompts from resolved template.
 
         This phase:
@@ -334,7 +353,7 @@ class GenerationOrchestrator:
             resolved_config: Resolved config
 
         Returns:
-            Tuple of (prompts, stats)
+            Tuple of (prompts, stats) - prompts is a lazy PromptStream
         """
         # Create PromptGenerator
         prompt_generator = PromptGenerator(
@@ -360,7 +379,7 @@ class GenerationOrchestrator:
         session_config: SessionConfig,
         context: Any,
         resolved_config: Any,
-        prompts: list,
+        prompts: Sequence[dict],
         stats: dict
     ) -> None:
         """Prepare and initialize manifest.
@@ -411,13 +430,13 @@ class GenerationOrchestrator:
     def _run_generation(
         self,
         session_config: SessionConfig,
-        prompts: list,
+        prompts: Sequence[dict],
         context: Any
     ) -> None:
         """Run image generation.
 
         This phase:
-        - Converts prompts to PromptConfig objects
+        - Converts prompts to PromptConfig objects (lazily, one at a time)
         - Executes batch generation via ImageGenerator
         - Updates manifest incrementally
         - Emits GENERATION_* events
@@ -433,21 +452,30 @@ class GenerationOrchestrator:
             context=context
         )
 
-        # Convert prompts to PromptConfig list
-        prompt_configs = converter.convert_prompts(prompts)
+        # Convert prompts lazily - each config is built right before its image
+        # (prompts are rendered by a process pool when --jobs > 1)
+        prompt_items = converter.iter_convert(iter_parallel(prompts, session_config.jobs))
+
+        # Output encoder (template output.encoding), drained by ImageGenerator
+        output = getattr(session_config.prompt_config, 'output', None)
+        encoding = getattr(output, 'encoding', None)
+        output_encoder = None
+        if isinstance(encoding, EncodingConfig):
+            output_encoder = create_output_encoder_from_config(encoding)
 
         # Create ImageGenerator
         image_generator = ImageGenerator(
             api_client=self.api_client,
             manifest_manager=self.manifest_manager,
             events=self.events,
-            session_config=session_config
+            session_config=session_config,
+            output_encoder=output_encoder
         )
 
         # Generate images
-        success_count, total_count = image_generator.generate_images(
-            prompt_configs=prompt_configs,
-            prompts=prompts
+        success_count, total_count = image_generator.generate_stream(
+            prompt_items,
+            total=len(prompts)
         )
 
     # ========================================================================
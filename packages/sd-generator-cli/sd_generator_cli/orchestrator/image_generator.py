@@ -1,10 +1,14 @@
 """ImageGenerator - orchestrates image generation via API."""
 
-import time
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
 
 from ..api.sdapi_client import SDAPIClient, PromptConfig, GenerationConfig
 from ..api.image_writer import ImageWriter
+from ..api.generation_pipeline import PipelineResult
+from ..api.backend_dispatcher import BackendDispatcher, create_pipeline
+from ..api.seed_batching import DEFAULT_MAX_BATCH_SIZE, batch_call, coalesce_seed_runs, expand_batch_result
+from ..api.output_encoder import OutputEncoder
 from .session_config import SessionConfig
 from .session_event_collector import SessionEventCollector
 from .manifest_manager import ManifestManager
@@ -15,8 +19,13 @@ class ImageGenerator:
     """Orchestrates image generation via SD WebUI API.
 
     This class handles:
-    - Calling API generate_batch with prompt configs
-    - Providing callback for incremental manifest updates
+    - Calling API generate_image for each prompt config, pipelined: the
+      next request is in flight while the previous image is saved,
+      recorded and reported (see GenerationPipeline)
+    - Coalescing consecutive seeds of the same prompt into batched
+      requests (seed-sweep mode, see seed_batching)
+    - Optional re-encoding of saved images (see OutputEncoder)
+    - Incremental manifest updates
     - Event emission for progress tracking
     - Success/failure counting
 
@@ -30,7 +39,10 @@ class ImageGenerator:
         api_client: SDAPIClient,
         manifest_manager: ManifestManager,
         events: SessionEventCollector,
-        session_config: SessionConfig
+        session_config: SessionConfig,
+        max_in_flight: int = 2,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        output_encoder: Optional[OutputEncoder] = None
     ):
         """Initialize image generator.
 
@@ -39,11 +51,18 @@ class ImageGenerator:
             manifest_manager: Manifest manager for incremental updates
             events: Event collector for output management
             session_config: Session configuration
+            max_in_flight: Max generation requests sent to the API at once
+            max_batch_size: Max consecutive-seed images per request (1 = one image per request)
+            output_encoder: Re-encodes saved images (None = keep API PNGs);
+                shut down (drained) when generation completes
         """
         self.api_client = api_client
         self.manifest_manager = manifest_manager
         self.events = events
         self.session_config = session_config
+        self.max_in_flight = max_in_flight
+        self.max_batch_size = max_batch_size
+        self.output_encoder = output_encoder
         # Create ImageWriter for saving images to disk
         self.image_writer = ImageWriter(output_dir=str(session_config.session_path))
 
@@ -54,16 +73,40 @@ class ImageGenerator:
     ) -> tuple[int, int]:
         """Generate images via API with incremental manifest updates.
 
+        List-based variant of generate_stream().
+
+        Args:
+            prompt_configs: List of PromptConfig for API
+            prompts: Original V2 prompt dicts (with variations)
+
+        Returns:
+            Tuple of (success_count, total_count)
+        """
+        return self.generate_stream(
+            zip(prompts, prompt_configs),
+            total=len(prompt_configs)
+        )
+
+    def generate_stream(
+        self,
+        items: Iterable[tuple[dict, PromptConfig]],
+        total: int
+    ) -> tuple[int, int]:
+        """Generate images from a lazy (prompt dict, PromptConfig) stream.
+
         This method:
         1. Emits IMAGE_GENERATION_START event
-        2. Calls API generate_batch with callback
-        3. Callback updates manifest incrementally
+        2. Sends each request as soon as the API can take it (no fixed delay)
+        3. Saves images and updates manifest incrementally on a background
+           thread, in index order, while the next image renders (re-encoded
+           images are recorded once their encode completes)
         4. Emits IMAGE_GENERATION_COMPLETE event
         5. Returns success/total counts
 
         Args:
-            prompt_configs: List of PromptConfig for API
-            prompts: Original V2 prompt dicts (with variations)
+            items: Iterable of (prompt dict, PromptConfig), e.g. from
+                PromptConfigConverter.iter_convert()
+            total: Number of items (for progress reporting)
 
         Returns:
             Tuple of (success_count, total_count)
@@ -71,38 +114,107 @@ class ImageGenerator:
         # Emit start event
         self.events.emit(
             EventType.IMAGE_GENERATION_START,
-            {"total_images": len(prompt_configs)}
+            {"total_images": total}
         )
 
-        # Generate images one by one with incremental manifest updates
-        success_count = 0
-        total_count = len(prompt_configs)
-        delay_between_images = 2.0
+        self._success_count = 0
+        total_count = total
 
-        for idx, prompt_cfg in enumerate(prompt_configs):
-            try:
-                # Apply parameters to API client before generation (like legacy V2Executor)
-                if prompt_cfg.parameters:
-                    self._apply_parameters(prompt_cfg.parameters)
+        groups = coalesce_seed_runs(items, lambda item: item[1], self.max_batch_size)
+        pipeline = create_pipeline(self.api_client, self.max_in_flight)
+        try:
+            pipeline.run(groups, request=self._request, complete=self._complete_batch)
+        finally:
+            if self.output_encoder is not None:
+                self.output_encoder.shutdown(wait=True)  # Files must match manifest filenames
+        success_count = self._success_count
 
-                # Generate image via API
-                api_response = self.api_client.generate_image(prompt_cfg)
+        if isinstance(self.api_client, BackendDispatcher):
+            for line in self.api_client.summary_lines():
+                self.events.emit(EventType.INFO, {"message": f"Backend {line}"})
 
-                # Save image to disk
-                self.image_writer.save_images_from_response(
-                    api_response=api_response,
-                    filename=prompt_cfg.filename
-                )
+        # Emit complete event
+        self.events.emit(
+            EventType.IMAGE_GENERATION_COMPLETE,
+            {
+                "success_count": success_count,
+                "total_count": total_count,
+                "failed_count": total_count - success_count
+            }
+        )
 
-                success = True
-                success_count += 1
+        return success_count, total_count
+
+    def _request(self, group: list[tuple[int, tuple[dict, PromptConfig]]]) -> Callable[[], list]:
+        """Prepare the API call for a group of images (runs on the dispatch thread).
+
+        Parameters are applied to the API client in order and snapshotted,
+        so requests running concurrently use their own settings. Images of
+        a group share their parameters (see coalesce_seed_runs).
+
+        Args:
+            group: (index, (prompt dict, PromptConfig)) pairs sent as one request
+
+        Returns:
+            Call returning one API response (or exception) per image
+        """
+        prompt_cfgs = [prompt_cfg for _, (_, prompt_cfg) in group]
+
+        # Apply parameters to API client before generation (like legacy V2Executor)
+        if prompt_cfgs[0].parameters:
+            self._apply_parameters(prompt_cfgs[0].parameters)
+        generation_config = self.api_client.generation_config
+
+        return batch_call(self.api_client, prompt_cfgs, generation_config)
+
+    def _complete_batch(self, result: PipelineResult) -> None:
+        """Complete each image of a request (runs on the post-processing thread).
+
+        Args:
+            result: Pipeline result of a group of images
+        """
+        for image_result in expand_batch_result(result):
+            self._complete_image(image_result)
+
+    def _complete_image(self, result: PipelineResult) -> None:
+        """Save, record and report one image (runs on the post-processing thread).
+
+        Args:
+            result: Pipeline result (item is the (prompt dict, PromptConfig) pair)
+        """
+        prompt_dict, prompt_cfg = result.item
+        idx = result.index
+
+        try:
+            if result.error is not None:
+                raise result.error
+            api_response = result.response
+
+            # Save image to disk
+            saved_paths = self.image_writer.save_images_from_response(
+                api_response=api_response,
+                filename=prompt_cfg.filename
+            )
+
+            self._success_count += 1
+
+            encoder = self.output_encoder
+            encoded_filename = prompt_cfg.filename
+            if encoder is not None:
+                encoded_filename = encoder.final_filename(prompt_cfg.filename)
+
+            def record(path: Path, image_format: Optional[str]) -> None:
+                filename = encoded_filename if image_format is not None else prompt_cfg.filename
 
                 # Update manifest incrementally on success
+                # (generation_time is the API latency, used for planning estimates)
                 self.manifest_manager.update_incremental(
                     idx=idx,
-                    filename=prompt_cfg.filename,
-                    prompt_dict=prompts[idx],
-                    api_response=api_response
+                    filename=filename,
+                    prompt_dict=prompt_dict,
+                    api_response=api_response,
+                    generation_time=result.elapsed,
+                    image_format=image_format
                 )
 
                 # Emit success event to update progress bar
@@ -110,37 +222,28 @@ class ImageGenerator:
                     EventType.IMAGE_SUCCESS,
                     {
                         "index": idx,
-                        "path": prompt_cfg.filename,
+                        "path": filename,
                         "seed": prompt_cfg.seed
                     }
                 )
 
-            except Exception as e:
-                # Generation failed - log but continue
-                success = False
-                self.events.emit(
-                    EventType.IMAGE_ERROR,
-                    {
-                        "index": idx,
-                        "error": str(e)
-                    }
-                )
-
-            # Delay before next image (except for last one)
-            if idx < total_count - 1 and delay_between_images > 0:
-                time.sleep(delay_between_images)
-
-        # Emit complete event
-        self.events.emit(
-            EventType.IMAGE_GENERATION_COMPLETE,
-            {
-                "success_count": success_count,
-                "total_count": total_count,
-                "failed_count": total_count - success_count
-            }
-        )
+            # Re-encode in the background: the image is recorded and reported
+            # once encoded (under the final name), or as PNG if encoding fails
+            if encoder is not None:
+                for i, path in enumerate(saved_paths):
+                    encoder.submit(path, on_complete=record if i == 0 else None)
+            else:
+                record(Path(prompt_cfg.filename), None)
 
-        return success_count, total_count
+        except Exception as e:
+            # Generation failed - log but continue
+            self.events.emit(
+                EventType.IMAGE_ERROR,
+                {
+                    "index": idx,
+                    "error": str(e)
+                }
+            )
 
     def _apply_parameters(self, parameters: dict[str, Any]) -> None:
         """Apply generation parameters to API client.
@@ -2,10 +2,11 @@
 
 import re
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from ..api.sdapi_client import SDAPIClient
 from ..templating.models.config_models import PromptConfig
+from ..templating.generators.prompt_stream import collect_used_variations
 from .session_config import SessionConfig
 from .session_event_collector import SessionEventCollector
 from .event_types import EventType
@@ -54,7 +55,7 @@ class ManifestBuilder:
         session_config: SessionConfig,
         context: Any,  # ResolvedContext from V2Pipeline
         resolved_config: Any,  # ResolvedConfig from V2Pipeline
-        prompts: list[dict],
+        prompts: Sequence[dict],
         stats: dict
     ) -> dict:
         """Build complete manifest snapshot.
@@ -65,7 +66,7 @@ class ManifestBuilder:
             session_config: Session configuration (contains prompt_config)
             context: Resolved context (from V2Pipeline.resolve())
             resolved_config: Resolved config (from V2Pipeline.resolve())
-            prompts: Generated prompts list
+            prompts: Generated prompts (list or PromptStream)
             stats: Prompt generation statistics
 
         Returns:
@@ -137,7 +138,7 @@ class ManifestBuilder:
         self,
         context: Any,
         resolved_config: Any,
-        prompts: list[dict]
+        prompts: Sequence[dict]
     ) -> dict:
         """Extract variations: complete pool + actually used values.
 
@@ -197,20 +198,21 @@ class ManifestBuilder:
                 }
 
         # Step 4: Extract actually used values from generated prompts
-        for prompt_dict in prompts:
-            variations = prompt_dict.get('variations', {})
-            for key, value in variations.items():
-                if key in variations_map and isinstance(variations_map[key], dict):
-                    used_list = variations_map[key].get("used")
-                    if isinstance(used_list, list) and value not in used_list:
-                        used_list.append(value)
-                else:
-                    # Fallback: if placeholder not in imports (shouldn't happen)
-                    variations_map[key] = {
-                        "available": [value],
-                        "used": [value],
-                        "count": 1
-                    }
+        # (PromptStream computes these without rendering any prompt)
+        for key, used_values in collect_used_variations(prompts).items():
+            if key in variations_map and isinstance(variations_map[key], dict):
+                used_list = variations_map[key].get("used")
+                if isinstance(used_list, list):
+                    for value in used_values:
+                        if value not in used_list:
+                            used_list.append(value)
+            else:
+                # Fallback: if placeholder not in imports (shouldn't happen)
+                variations_map[key] = {
+                    "available": [used_values[0]],
+                    "used": list(used_values),
+                    "count": 1
+                }
 
         return variations_map
 
@@ -218,7 +220,7 @@ class ManifestBuilder:
         self,
         prompt_config: PromptConfig,
         resolved_config: Any,
-        prompts: list[dict],
+        prompts: Sequence[dict],
         stats: dict
     ) -> dict:
         """Build generation parameters object.
@@ -254,7 +256,7 @@ class ManifestBuilder:
 
         return generation_params
 
-    def build_api_params(self, prompts: list[dict]) -> dict:
+    def build_api_params(self, prompts: Sequence[dict]) -> dict:
         """Build API parameters from first prompt.
 
         Serializes extension configs (ADetailer, ControlNet) to dicts.
@@ -4,6 +4,8 @@ import json
 from pathlib import Path
 from typing import Optional
 
+from ..execution.manifest import ManifestJournal, compact_manifest, write_manifest
+from ..execution.session_index import SessionIndex
 from .session_event_collector import SessionEventCollector
 from .event_types import EventType
 
@@ -13,8 +15,10 @@ class ManifestManager:
 
     This class handles:
     - Manifest initialization with 'ongoing' status
-    - Incremental updates (adding image entries)
-    - Status finalization (ongoing → completed/aborted)
+    - Incremental updates (one line appended to images.jsonl per image,
+      one row in the index.sqlite image index)
+    - Status finalization (ongoing → completed/aborted), which compacts
+      the images journal into manifest.json
 
     The manager uses a simple FSM for status:
     - ongoing: Generation in progress
@@ -41,6 +45,8 @@ class ManifestManager:
         """
         self.manifest_path = manifest_path
         self.events = events
+        self.journal = ManifestJournal(manifest_path.parent)
+        self.index = SessionIndex(manifest_path.parent)
 
     def initialize(self, snapshot: dict) -> None:
         """Create initial manifest with 'ongoing' status.
@@ -59,9 +65,10 @@ class ManifestManager:
             "status": "ongoing"
         }
 
-        # Write manifest
-        with open(self.manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        # Write manifest (a previous images journal belongs to the old manifest)
+        write_manifest(self.manifest_path.parent, manifest)
+        self.journal.close()
+        self.journal.path.unlink(missing_ok=True)
 
         # Emit event
         self.events.emit(
@@ -74,34 +81,28 @@ class ManifestManager:
         idx: int,
         filename: str,
         prompt_dict: dict,
-        api_response: Optional[dict]
+        api_response: Optional[dict],
+        generation_time: Optional[float] = None,
+        image_format: Optional[str] = None
     ) -> None:
         """Add new image entry to manifest.
 
         This method:
-        1. Reads current manifest
-        2. Extracts real seed from API response (if available)
-        3. Adds new image entry
-        4. Writes updated manifest
+        1. Extracts real seed from API response (if available)
+        2. Appends the image entry to the images journal (images.jsonl),
+           without rewriting manifest.json
+        3. Records it in the session image index (index.sqlite)
 
         Args:
             idx: Image index in prompts list
             filename: Generated image filename
             prompt_dict: Prompt dictionary with seed, variations, etc.
             api_response: Optional API response (contains real seed in 'info')
+            generation_time: Optional API latency in seconds (recorded for
+                planning estimates, see `sdgen generate --plan`)
+            image_format: Output format when images are re-encoded
+                (png, webp, jpeg; omitted for raw API PNGs)
         """
-        # Read current manifest (with error recovery)
-        try:
-            with open(self.manifest_path, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
-        except Exception:
-            # Manifest corrupted or missing - recreate minimal structure
-            manifest = {
-                "snapshot": {},  # Lost snapshot, but we can continue
-                "images": [],
-                "status": "ongoing"
-            }
-
         # Extract real seed from API response
         real_seed = prompt_dict.get('seed', -1)
 
@@ -122,33 +123,29 @@ class ManifestManager:
             "negative_prompt": prompt_dict.get('negative_prompt', ''),
             "applied_variations": prompt_dict.get('variations', {})
         }
+        if generation_time is not None:
+            image_entry["generation_time"] = round(generation_time, 3)
+        if image_format is not None:
+            image_entry["format"] = image_format
 
-        # Add to manifest
-        manifest["images"].append(image_entry)
-
-        # Write updated manifest
-        with open(self.manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        # Append to the images journal (merged into manifest.json by finalize)
+        self.journal.append(image_entry)
+        self.index.add(image_entry, idx=idx)
 
     def finalize(self, status: str = "completed") -> None:
         """Update manifest status (completed/aborted).
 
-        This is the final step in manifest lifecycle.
+        This is the final step in manifest lifecycle: the images journal
+        is compacted into manifest.json (a corrupted manifest is rebuilt
+        around the journal).
 
         Args:
             status: Final status ("completed" or "aborted")
         """
         try:
-            # Read current manifest
-            with open(self.manifest_path, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
-
-            # Update status
-            manifest["status"] = status
-
-            # Write updated manifest
-            with open(self.manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=2, ensure_ascii=False)
+            self.journal.close()
+            self.index.close()
+            compact_manifest(self.manifest_path.parent, status=status)
 
             # Emit event
             self.events.emit(
@@ -3,7 +3,7 @@
 import copy
 import random
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from ..api.sdapi_client import PromptConfig
 from .session_config import SessionConfig
@@ -16,7 +16,8 @@ class PromptConfigConverter:
     - ControlNet image path resolution (dict and string variations)
     - Variations dict enrichment
     - Filename generation (with/without seed)
-    - Parameters deep copying (to avoid sharing between prompts)
+    - Parameters copying when ControlNet units are resolved (parameters
+      are otherwise shared between prompts, read-only)
 
     Example:
         >>> converter = PromptConfigConverter(session_config, context)
@@ -37,31 +38,53 @@ class PromptConfigConverter:
         self.session_config = session_config
         self.context = context
 
-    def convert_prompts(self, prompts: list[dict]) -> list[PromptConfig]:
+    def convert_prompts(self, prompts: Iterable[dict]) -> list[PromptConfig]:
         """Convert V2 prompt dicts to PromptConfig list.
 
+        Eager variant of iter_convert().
+
+        Args:
+            prompts: List of prompt dicts from V2Pipeline.generate()
+
+        Returns:
+            List of PromptConfig objects ready for API
+        """
+        return [prompt_cfg for _, prompt_cfg in self.iter_convert(prompts)]
+
+    def iter_convert(self, prompts: Iterable[dict]) -> Iterator[tuple[dict, PromptConfig]]:
+        """Lazily convert V2 prompt dicts to PromptConfig objects.
+
         This method:
         1. Resolves ControlNet image paths (dict and string variations)
         2. Enriches variations dict with ControlNet info
         3. Generates filenames (with/without seed)
         4. Creates PromptConfig objects
 
+        Each prompt dict is yielded together with its PromptConfig, so
+        consumers of a PromptStream keep the enriched dict (with ControlNet
+        variations) for the manifest without re-rendering it.
+
         Args:
-            prompts: List of prompt dicts from V2Pipeline.generate()
+            prompts: Prompt dicts (list or PromptStream from V2Pipeline)
 
-        Returns:
-            List of PromptConfig objects ready for API
+        Yields:
+            Tuples of (enriched prompt dict, PromptConfig)
         """
-        prompt_configs = []
-
         for idx, prompt_dict in enumerate(prompts):
             # Resolve ControlNet image variations (but don't encode yet)
-            parameters = prompt_dict.get('parameters', {}).copy()
-            variations = prompt_dict.get('variations', {}).copy()  # Copy for enrichment
+            parameters = prompt_dict.get('parameters', {})
+            variations = prompt_dict.get('variations', {})
 
             if 'controlnet' in parameters:
-                # Deep copy controlnet config to avoid sharing between prompts
-                controlnet_config = copy.deepcopy(parameters['controlnet'])
+                # Copy for enrichment (parameters and variations are shared)
+                parameters = parameters.copy()
+                variations = variations.copy()
+
+                # Copy controlnet config and units to avoid sharing resolved paths
+                # between prompts (images stay paths, encoded once at send time)
+                controlnet_config = copy.copy(parameters['controlnet'])
+                if hasattr(controlnet_config, 'units'):
+                    controlnet_config.units = [copy.copy(unit) for unit in controlnet_config.units]
                 parameters['controlnet'] = controlnet_config
 
                 if hasattr(controlnet_config, 'units'):
@@ -127,6 +150,4 @@ class PromptConfigConverter:
                 filename=filename,
                 parameters=parameters if parameters else None
             )
-            prompt_configs.append(prompt_cfg)
-
-        return prompt_configs
+            yield prompt_dict, prompt_cfg
@@ -1,6 +1,6 @@
 """PromptGenerator - generates prompts and provides statistics."""
 
-from typing import Optional, Any
+from typing import Optional, Any, Sequence
 
 from ..templating.orchestrator import V2Pipeline
 from .session_config import SessionConfig
@@ -45,7 +45,7 @@ class PromptGenerator:
         session_config: SessionConfig,
         context: Any,  # ResolvedContext
         resolved_config: Any  # ResolvedConfig
-    ) -> tuple[list[dict], dict]:
+    ) -> tuple[Sequence[dict], dict]:
         """Generate prompts and return with statistics.
 
         This is the main entry point that:
@@ -61,14 +61,14 @@ class PromptGenerator:
 
         Returns:
             Tuple of (prompts, stats):
-            - prompts: List of prompt dicts
+            - prompts: Lazy sequence of prompt dicts (PromptStream)
             - stats: Statistics dict with placeholders info
         """
         # Emit start event
         self.events.emit(EventType.PROMPT_GENERATION_START)
 
-        # Generate prompts
-        prompts = self.pipeline.generate(resolved_config, context)
+        # Generate prompts lazily (rendered on access, never materialized)
+        prompts = self.pipeline.generate_stream(resolved_config, context)
 
         # Calculate statistics
         template_str = resolved_config.template if resolved_config.template else ""
@@ -154,17 +154,19 @@ class PromptGenerator:
 
     def apply_count_limit(
         self,
-        prompts: list[dict],
+        prompts: Sequence[dict],
         count_limit: Optional[int]
-    ) -> list[dict]:
+    ) -> Sequence[dict]:
         """Apply count limit to prompts list.
 
+        Slicing a PromptStream is lazy, so this never builds prompts.
+
         Args:
-            prompts: List of prompt dicts
+            prompts: List or PromptStream of prompt dicts
             count_limit: Optional limit (None = no limit)
 
         Returns:
-            Limited prompts list
+            Limited prompts sequence
         """
         if count_limit is None:
             return prompts
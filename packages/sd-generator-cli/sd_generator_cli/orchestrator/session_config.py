@@ -54,6 +54,7 @@ class SessionConfig:
         # Flags
         skip_validation: Skip YAML schema validation
         annotations_enabled: Enable annotation worker
+        jobs: Worker processes for prompt rendering (1 = in-process)
     """
 
     # ========================================================================
@@ -99,6 +100,7 @@ class SessionConfig:
     # ========================================================================
     skip_validation: bool = False
     annotations_enabled: bool = False
+    jobs: int = 1
 
     def __post_init__(self) -> None:
         """Post-initialization validation and defaults."""
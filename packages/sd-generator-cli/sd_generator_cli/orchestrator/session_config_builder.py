@@ -97,6 +97,7 @@ class SessionConfigBuilder:
             # Flags
             skip_validation=cli_config.skip_validation,
             annotations_enabled=annotations_enabled,
+            jobs=cli_config.jobs,
         )
 
     def _resolve_session_name(
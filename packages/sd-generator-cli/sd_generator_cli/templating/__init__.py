@@ -17,6 +17,7 @@ from .models.config_models import (
     GenerationConfig,
     OutputConfig,
     AnnotationsConfig,
+    EncodingConfig,
     ResolvedContext
 )
 
@@ -28,5 +29,6 @@ __all__ = [
     'GenerationConfig',
     'OutputConfig',
     'AnnotationsConfig',
+    'EncodingConfig',
     'ResolvedContext',
 ]
@@ -5,16 +5,16 @@ This module handles execution of prompts via SD WebUI API,
 integrating with the existing V1 API client and output management.
 """
 
-import base64
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Union
 from datetime import datetime
 
 from rich.console import Console
 from rich.panel import Panel
 
 from sd_generator_cli.api.sdapi_client import SDAPIClient, PromptConfig, GenerationConfig
+from sd_generator_cli.api.response_stream import StreamedImage, iter_base64_decoded, write_atomic
 from sd_generator_cli.execution.manifest import ManifestWriter, ManifestImage
 
 console = Console()
@@ -250,21 +250,21 @@ class V2Executor:
             expand=False
         ))
 
-    def _save_image(self, base64_data: str, image_number: int, prompt_dict: Dict[str, Any]) -> Path:
+    def _save_image(self, base64_data: Union[str, StreamedImage], image_number: int,
+                    prompt_dict: Dict[str, Any]) -> Path:
         """
         Save base64 image data to file.
 
+        The file is written under a temporary name and renamed once complete.
+
         Args:
-            base64_data: Base64-encoded PNG image
+            base64_data: Base64-encoded PNG image (or StreamedImage from a streaming client)
             image_number: Image number for filename
             prompt_dict: Prompt dict containing seed and variations
 
         Returns:
             Path to saved image file
         """
-        # Decode base64
-        image_bytes = base64.b64decode(base64_data)
-
         # Generate filename with seed (if present)
         seed = prompt_dict.get('seed', -1)
         if seed != -1:
@@ -275,9 +275,9 @@ class V2Executor:
         image_path = self.session_dir / filename
 
         # Save file
-        image_path.write_bytes(image_bytes)
-
-        return image_path
+        if isinstance(base64_data, StreamedImage):
+            return base64_data.move_to(image_path)
+        return write_atomic(image_path, iter_base64_decoded(base64_data))
 
     def _save_metadata(
         self,
@@ -1,5 +1,10 @@
 """Generators for Template System V2.0."""
 
 from .generator import PromptGenerator
+from .planner import GenerationPlan, LatencyEstimate, PlaceholderPlan, estimate_latency
+from .prompt_stream import CombinationSpace, IndexPermutation, PromptStream, collect_used_variations
 
-__all__ = ['PromptGenerator']
+__all__ = [
+    'PromptGenerator', 'CombinationSpace', 'IndexPermutation', 'PromptStream', 'collect_used_variations',
+    'GenerationPlan', 'PlaceholderPlan', 'LatencyEstimate', 'estimate_latency'
+]
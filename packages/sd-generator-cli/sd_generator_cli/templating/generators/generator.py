@@ -6,7 +6,6 @@ with support for weight-based loop ordering and selector application.
 """
 
 import random
-import itertools
 from typing import Dict, List, Any, Tuple, Optional
 
 from sd_generator_cli.templating.models.config_models import (
@@ -14,7 +13,15 @@ from sd_generator_cli.templating.models.config_models import (
     ResolvedContext
 )
 from sd_generator_cli.templating.resolvers.template_resolver import TemplateResolver
+from sd_generator_cli.templating.resolvers.render_plan import RenderPlan
 from sd_generator_cli.templating.normalizers.normalizer import PromptNormalizer
+from sd_generator_cli.templating.generators.prompt_stream import (
+    CombinationSpace,
+    IndexPermutation,
+    PromptStream,
+    mix64
+)
+from sd_generator_cli.templating.generators.planner import GenerationPlan, PlaceholderPlan
 
 
 class PromptGenerator:
@@ -55,6 +62,8 @@ class PromptGenerator:
         """
         Generate prompts according to generation mode.
 
+        Eager variant of iter_prompts() - builds the full list.
+
         Args:
             template: Template string with placeholders
             context: Resolved context with imports and chunks
@@ -69,31 +78,120 @@ class PromptGenerator:
                 'variations': Dict[str, str]  # Variation values used
             }
         """
+        return list(self.iter_prompts(template, context, generation))
+
+    def iter_prompts(
+        self,
+        template: str,
+        context: ResolvedContext,
+        generation: GenerationConfig
+    ) -> PromptStream:
+        """
+        Generate prompts lazily according to generation mode.
+
+        The returned stream supports len(), indexing, slicing and iteration.
+        In both modes each prompt is decoded from its index, so the
+        first prompt is available in constant time whatever the size of the
+        combination space.
+
+        Args:
+            template: Template string with placeholders
+            context: Resolved context with imports and chunks
+            generation: Generation configuration (mode, seed, max_images)
+
+        Returns:
+            PromptStream of prompt dicts (same format as generate_prompts)
+        """
         # Extract variations from imports
         variations_dict = self._extract_variations(template, context)
 
         if not variations_dict:
             # No variations - single prompt
-            return self._generate_single_prompt(template, context, generation)
+            return PromptStream.from_list(
+                self._generate_single_prompt(template, context, generation)
+            )
+
+        # Source of variation draws: keyed (reproducible) or fresh
+        draws = random.Random(generation.stream_key) if generation.stream_key is not None else None
 
         # Apply selectors to get selected variations
-        selected_variations = self._apply_selectors(template, variations_dict, context)
+        selected_variations = self._apply_selectors(template, variations_dict, context, draws)
 
         if generation.mode == 'combinatorial':
-            return self._generate_combinatorial(
+            return self._stream_combinatorial(
                 template,
                 selected_variations,
                 context,
-                generation
+                generation,
+                draws
             )
         else:  # random
-            return self._generate_random(
+            return self._stream_random(
                 template,
                 selected_variations,
                 context,
-                generation
+                generation,
+                draws
             )
 
+    def plan(
+        self,
+        template: str,
+        context: ResolvedContext,
+        generation: GenerationConfig
+    ) -> GenerationPlan:
+        """
+        Plan a generation without rendering any prompt.
+
+        Selectors are applied exactly as iter_prompts() does, so the counts
+        are those of the actual stream: per-placeholder cardinalities, loop
+        order, combination count and image total (seed sweeps included).
+
+        Args:
+            template: Template string with placeholders
+            context: Resolved context with imports and chunks
+            generation: Generation configuration (mode, seed_list, max_images)
+
+        Returns:
+            GenerationPlan for this template and generation config
+        """
+        variations_dict = self._extract_variations(template, context)
+
+        if not variations_dict:
+            # No variations - single prompt, single seed
+            return GenerationPlan(mode=generation.mode, max_images=generation.max_images)
+
+        selected_variations = self._apply_selectors(template, variations_dict, context)
+        weights = self.resolver.extract_weights(template)
+
+        if generation.mode == 'combinatorial':
+            combinatorial_vars, non_combinatorial_vars = self._split_by_weight(template, selected_variations)
+            placeholders = [
+                PlaceholderPlan(name, len(variations_dict[name]), len(values), weight, looped=True)
+                for name, values, weight in combinatorial_vars
+            ] + [
+                PlaceholderPlan(name, len(variations_dict[name]), len(values), weights.get(name, 1), looped=False)
+                for name, values in non_combinatorial_vars
+            ]
+        else:  # random - all placeholders form the combination space
+            placeholders = [
+                PlaceholderPlan(name, len(variations_dict[name]), len(values), weights.get(name, 1), looped=True)
+                for name, values in selected_variations.items()
+            ]
+
+        combinations = 1
+        for placeholder in placeholders:
+            if placeholder.looped:
+                combinations *= placeholder.selected
+
+        return GenerationPlan(
+            mode=generation.mode,
+            placeholders=placeholders,
+            combinations=combinations,
+            seeds_per_combination=len(generation.seed_list or []) or 1,
+            max_images=generation.max_images
+        )
+
     def _extract_variations(
         self,
         template: str,
@@ -169,7 +267,8 @@ class PromptGenerator:
         self,
         template: str,
         variations_dict: Dict[str, Dict[str, str]],
-        context: ResolvedContext
+        context: ResolvedContext,
+        draws: Optional[random.Random] = None
     ) -> Dict[str, List[str]]:
         """
         Apply selectors to get selected variation values.
@@ -178,6 +277,7 @@ class PromptGenerator:
             template: Template string with selectors
             variations_dict: Dict of all variations
             context: Resolved context
+            draws: Random source for limit selectors (None = system randomness)
 
         Returns:
             Dict mapping placeholder names to lists of selected values
@@ -204,7 +304,7 @@ class PromptGenerator:
                 selected_values = self.resolver._apply_selector(
                     variation_dict,
                     selector,
-                    {'imports': context.imports}
+                    {'imports': context.imports, 'random': draws}
                 )
                 selected[name] = selected_values
             else:
@@ -261,19 +361,110 @@ class PromptGenerator:
         """
         Generate prompts using combinatorial mode (nested loops).
 
+        Eager wrapper around _stream_combinatorial().
+
+        Args:
+            template: Template string
+            selected_variations: Selected variation values
+            context: Resolved context
+            generation: Generation config
+
+        Returns:
+            List of prompt dicts
+        """
+        return list(self._stream_combinatorial(template, selected_variations, context, generation))
+
+    def _stream_combinatorial(
+        self,
+        template: str,
+        selected_variations: Dict[str, List[str]],
+        context: ResolvedContext,
+        generation: GenerationConfig,
+        draws: Optional[random.Random] = None
+    ) -> PromptStream:
+        """
+        Build a lazy combinatorial prompt stream (nested loops).
+
         Weight-based ordering:
         - Extract weights from template ($W syntax)
         - Sort placeholders by weight (lower = outer loop)
-        - Weight 0 = excluded from loops (random per iteration)
+        - Weight 0 = excluded from loops (random per combination)
+
+        Image index → (combination index, seed position). The combination
+        index is decoded mixed-radix over the weight-ordered placeholders,
+        so no product is ever built. Weight-0 values are derived from a
+        per-stream salt, so the same index always decodes to the same prompt.
 
         Args:
             template: Template string
             selected_variations: Selected variation values
             context: Resolved context
             generation: Generation config
+            draws: Random source for the weight-0 salt (None = module random)
 
         Returns:
-            List of prompt dicts
+            PromptStream of prompt dicts
+        """
+        combinatorial_vars, non_combinatorial_vars = self._split_by_weight(template, selected_variations)
+
+        space = CombinationSpace(
+            [name for name, _, _ in combinatorial_vars],
+            [variations for _, variations, _ in combinatorial_vars]
+        )
+
+        # Compile template once (chunk injection already done in Phase 1)
+        renderer = CombinationRenderer(
+            plan=self._compile_plan(template, selected_variations, context),
+            normalizer=self.normalizer,
+            space=space,
+            generation=generation,
+            non_combinatorial_vars=non_combinatorial_vars,
+            salt=(draws or random).getrandbits(64)
+        )
+
+        total = len(space) * renderer.per_combination
+        if generation.max_images > 0:
+            total = min(total, generation.max_images)
+
+        def used_values(indices: range) -> Dict[str, List[Any]]:
+            if not indices:
+                return {}
+            first = indices.start // renderer.per_combination
+            stop = (indices[-1] // renderer.per_combination) + 1
+
+            used: Dict[str, List[Any]] = {}
+            for name, values, digits in zip(space.names, space.value_lists, space.used_digits(first, stop)):
+                used[name] = _dedupe([values[digit] for digit in digits])
+
+            for slot, (name, values) in enumerate(non_combinatorial_vars):
+                seen: List[int] = []
+                for combination_index in range(first, stop):
+                    if len(seen) >= len(values):
+                        break
+                    pick = mix64(renderer.salt, combination_index, slot) % len(values)
+                    if pick not in seen:
+                        seen.append(pick)
+                used[name] = _dedupe([values[pick] for pick in seen])
+
+            return used
+
+        return PromptStream(renderer, range(total), used_values)
+
+    def _split_by_weight(
+        self,
+        template: str,
+        selected_variations: Dict[str, List[Any]]
+    ) -> Tuple[List[Tuple[str, List[Any], int]], List[Tuple[str, List[Any]]]]:
+        """
+        Split placeholders into loops and weight-0 placeholders.
+
+        Args:
+            template: Template string ($W weights)
+            selected_variations: Selected variation values
+
+        Returns:
+            Tuple of (combinatorial vars as (name, values, weight) sorted by
+            weight - outer to inner, weight-0 vars as (name, values))
         """
         # Extract weights
         weights = self.resolver.extract_weights(template)
@@ -292,96 +483,37 @@ class PromptGenerator:
         # Sort combinatorial vars by weight (ascending = outer to inner)
         combinatorial_vars.sort(key=lambda x: x[2])
 
-        # Generate all combinations of combinatorial vars
-        if combinatorial_vars:
-            names = [name for name, _, _ in combinatorial_vars]
-            variation_lists = [variations for _, variations, _ in combinatorial_vars]
-            combinations = list(itertools.product(*variation_lists))
-        else:
-            combinations = [()]
-
-        # Generate prompts
-        prompts = []
-
-        # Seed-sweep mode: iterate combinations × seeds
-        if generation.seed_list:
-            image_index = 0
-            for combo in combinations:
-                # Build variation state for this combination
-                variation_state = {}
-                for name_idx, name in enumerate(names) if combinatorial_vars else []:
-                    variation_state[name] = combo[name_idx]
-
-                # Add random values for non-combinatorial vars (weight 0)
-                for name, variations in non_combinatorial_vars:
-                    variation_state[name] = random.choice(variations)
-
-                # Test this variation on all seeds in the list
-                for seed in generation.seed_list:
-                    if generation.max_images > 0 and image_index >= generation.max_images:
-                        return prompts
-
-                    # Build context
-                    prompt_context = {
-                        'imports': context.imports,
-                        'chunks': {**context.chunks, **variation_state},
-                        'defaults': {}
-                    }
-
-                    # Resolve template
-                    resolved = self.resolver.resolve_template(template, prompt_context, skip_chunk_injection=True)
-
-                    # Normalize
-                    normalized = self.normalizer.normalize_prompt(resolved)
-
-                    prompts.append({
-                        'prompt': normalized,
-                        'negative_prompt': '',
-                        'seed': seed,
-                        'variations': variation_state.copy()
-                    })
-
-                    image_index += 1
-
-        # Normal mode: iterate combinations once
-        else:
-            for idx, combo in enumerate(combinations):
-                if generation.max_images > 0 and idx >= generation.max_images:
-                    break
-
-                # Build variation state for this combination
-                variation_state = {}
-                for name_idx, name in enumerate(names) if combinatorial_vars else []:
-                    variation_state[name] = combo[name_idx]
-
-                # Add random values for non-combinatorial vars (weight 0)
-                for name, variations in non_combinatorial_vars:
-                    variation_state[name] = random.choice(variations)
+        return combinatorial_vars, non_combinatorial_vars
 
-                # Build context with variation_state
-                prompt_context = {
-                    'imports': context.imports,
-                    'chunks': {**context.chunks, **variation_state},
-                    'defaults': {}
-                }
-
-                # Resolve template (skip chunk injection - already done in Phase 1)
-                resolved = self.resolver.resolve_template(template, prompt_context, skip_chunk_injection=True)
-
-                # Normalize
-                normalized = self.normalizer.normalize_prompt(resolved)
+    def _compile_plan(
+        self,
+        template: str,
+        selected_variations: Dict[str, List[Any]],
+        context: ResolvedContext
+    ) -> RenderPlan:
+        """
+        Compile the template into a render plan for this generation.
 
-                # Calculate seed
-                seed = self._calculate_seed(generation, idx)
+        Placeholders with selected variations become slots filled from the
+        variation state; everything else is resolved once.
 
-                prompts.append({
-                    'prompt': normalized,
-                    'negative_prompt': '',
-                    'seed': seed,
-                    'variations': variation_state.copy()
-                })
+        Args:
+            template: Template string
+            selected_variations: Selected variation values
+            context: Resolved context
 
-        return prompts
+        Returns:
+            RenderPlan rendering variation states to (unnormalized) prompts
+        """
+        return self.resolver.compile_template(
+            template,
+            {
+                'imports': context.imports,
+                'chunks': context.chunks,
+                'defaults': {}
+            },
+            selected_variations.keys()
+        )
 
     def _generate_random(
         self,
@@ -393,10 +525,7 @@ class PromptGenerator:
         """
         Generate prompts using random mode.
 
-        Selects random values from each variation, ensuring uniqueness.
-
-        When seed_list is provided, each unique variation combination
-        is tested on all seeds in the list.
+        Eager wrapper around _stream_random().
 
         Args:
             template: Template string
@@ -407,108 +536,82 @@ class PromptGenerator:
         Returns:
             List of prompt dicts
         """
-        prompts: List[Dict[str, Any]] = []
-        used_combinations: set[tuple[tuple[str, str], ...]] = set()
+        return list(self._stream_random(template, selected_variations, context, generation))
 
-        # Seed-sweep mode: pick random combinations, test on all seeds
-        if generation.seed_list:
-            # Calculate how many unique combinations we need
-            num_combinations_needed = generation.max_images // len(generation.seed_list)
-            if generation.max_images % len(generation.seed_list) > 0:
-                num_combinations_needed += 1
-
-            # Limit attempts to avoid infinite loop
-            max_attempts = num_combinations_needed * 10
-
-            for attempt in range(max_attempts):
-                if len(used_combinations) >= num_combinations_needed:
-                    break
-
-                # Generate random combination
-                variation_state = {}
-                for name, variations in selected_variations.items():
-                    variation_state[name] = random.choice(variations)
-
-                # Check uniqueness
-                combo_key = tuple(sorted(variation_state.items()))
-                if combo_key in used_combinations:
-                    continue
-
-                used_combinations.add(combo_key)
-
-                # Test this combination on all seeds
-                for seed in generation.seed_list:
-                    if generation.max_images > 0 and len(prompts) >= generation.max_images:
-                        return prompts
-
-                    # Build context
-                    prompt_context = {
-                        'imports': context.imports,
-                        'chunks': {**context.chunks, **variation_state},
-                        'defaults': {}
-                    }
+    def _stream_random(
+        self,
+        template: str,
+        selected_variations: Dict[str, List[str]],
+        context: ResolvedContext,
+        generation: GenerationConfig,
+        draws: Optional[random.Random] = None
+    ) -> PromptStream:
+        """
+        Build a lazy random-mode prompt stream.
 
-                    # Resolve template
-                    resolved = self.resolver.resolve_template(template, prompt_context, skip_chunk_injection=True)
+        Random combinations are distinct indexes of the combination space,
+        taken in the order of a keyed permutation (IndexPermutation) and
+        decoded. Every draw is O(1) and combinations are unique by
+        construction, up to the full size of the space.
 
-                    # Normalize
-                    normalized = self.normalizer.normalize_prompt(resolved)
+        When seed_list is provided, each unique variation combination
+        is tested on all seeds in the list.
 
-                    prompts.append({
-                        'prompt': normalized,
-                        'negative_prompt': '',
-                        'seed': seed,
-                        'variations': variation_state.copy()
-                    })
+        Args:
+            template: Template string
+            selected_variations: Selected variation values
+            context: Resolved context
+            generation: Generation config (max_images <= 0 = all combinations)
+            draws: Random source for the permutation key (None = module random)
 
-        # Normal mode: pick random combinations with calculated seeds
-        else:
-            # Limit attempts to avoid infinite loop
-            max_attempts = generation.max_images * 10
+        Returns:
+            PromptStream of prompt dicts
+        """
+        space = CombinationSpace(list(selected_variations.keys()), list(selected_variations.values()))
+
+        # Random order, independent of the seed parameter (which only affects
+        # SD image generation); reproducible only through generation.stream_key
+        order = IndexPermutation(len(space), (draws or random).getrandbits(64))
+
+        # Compile template once (chunk injection already done in Phase 1)
+        renderer = CombinationRenderer(
+            plan=self._compile_plan(template, selected_variations, context),
+            normalizer=self.normalizer,
+            space=space,
+            generation=generation,
+            order=order
+        )
 
-            for attempt in range(max_attempts):
-                if len(prompts) >= generation.max_images:
+        total = len(space) * renderer.per_combination
+        if generation.max_images > 0:
+            total = min(total, generation.max_images)
+
+        def used_values(indices: range) -> Dict[str, List[Any]]:
+            if not indices:
+                return {}
+            first = indices.start // renderer.per_combination
+            stop = (indices[-1] // renderer.per_combination) + 1
+
+            # Decode digits only, stop once every value has been seen
+            seen: List[List[int]] = [[] for _ in space.names]
+            remaining = sum(space.radices)
+            for position in range(first, stop):
+                if remaining == 0:
                     break
+                for digit, digits_seen in zip(space.digits(order[position]), seen):
+                    if digit not in digits_seen:
+                        digits_seen.append(digit)
+                        remaining -= 1
+
+            return {
+                name: _dedupe([values[digit] for digit in digits])
+                for name, values, digits in zip(space.names, space.value_lists, seen)
+            }
 
-                # Generate random combination (truly random - not seeded)
-                # The seed parameter only affects SD image generation, not variation selection
-                variation_state = {}
-                for name, variations in selected_variations.items():
-                    variation_state[name] = random.choice(variations)
-
-                # Check uniqueness
-                combo_key = tuple(sorted(variation_state.items()))
-                if combo_key in used_combinations:
-                    continue
-
-                used_combinations.add(combo_key)
-
-                # Build context
-                prompt_context = {
-                    'imports': context.imports,
-                    'chunks': {**context.chunks, **variation_state},
-                    'defaults': {}
-                }
-
-                # Resolve template (skip chunk injection - already done in Phase 1)
-                resolved = self.resolver.resolve_template(template, prompt_context, skip_chunk_injection=True)
-
-                # Normalize
-                normalized = self.normalizer.normalize_prompt(resolved)
-
-                # Calculate seed
-                seed = self._calculate_seed(generation, len(prompts))
-
-                prompts.append({
-                    'prompt': normalized,
-                    'negative_prompt': '',
-                    'seed': seed,
-                    'variations': variation_state.copy()
-                })
-
-        return prompts
+        return PromptStream(renderer, range(total), used_values)
 
-    def _calculate_seed(self, generation: GenerationConfig, index: int) -> int:
+    @staticmethod
+    def _calculate_seed(generation: GenerationConfig, index: int) -> int:
         """
         Calculate seed for a specific image index.
 
@@ -530,3 +633,120 @@ class PromptGenerator:
             return generation.seed + index
         else:  # random
             return -1
+
+
+class CombinationRenderer:
+    """
+    Renders the prompt dict for an image index.
+
+    Holds everything needed to render a prompt (compiled template,
+    combination space, weight-0 tables, seed settings) and nothing tied to
+    the generator, so it can be pickled and shipped once to worker
+    processes (see PromptStream.iter_parallel()).
+
+    Image index → (combination position, seed position). The combination
+    position is mapped through ``order`` (random mode) and decoded from the
+    combination space. Weight-0 values are derived from ``salt``, so the
+    same index always renders the same prompt, in any process.
+    """
+
+    def __init__(
+        self,
+        plan: RenderPlan,
+        normalizer: PromptNormalizer,
+        space: CombinationSpace,
+        generation: GenerationConfig,
+        order: Optional[IndexPermutation] = None,
+        non_combinatorial_vars: Optional[List[Tuple[str, List[Any]]]] = None,
+        salt: int = 0
+    ):
+        """
+        Initialize the renderer.
+
+        Args:
+            plan: Compiled template
+            normalizer: Prompt normalizer
+            space: Combination space of combinatorial placeholders
+            generation: Generation config (seed settings)
+            order: Optional permutation of combination indexes (random mode)
+            non_combinatorial_vars: (name, values) for weight-0 placeholders
+            salt: Per-stream salt for weight-0 picks
+        """
+        self.plan = plan
+        self.normalizer = normalizer
+        self.space = space
+        self.generation = generation
+        self.order = order
+        self.non_combinatorial_vars = non_combinatorial_vars or []
+        self.salt = salt
+
+        # Seed-sweep mode: each combination is emitted once per seed
+        self.seed_list = generation.seed_list or []
+        self.per_combination = len(self.seed_list) or 1
+
+        # Consecutive seeds share a combination - keep its rendered prompt
+        self._last_combination: Optional[int] = None
+        self._last_prompt = ''
+
+    def combination_state(self, combination_index: int) -> Dict[str, Any]:
+        """
+        Build the variation state for one combination index.
+
+        Args:
+            combination_index: Index in the combination space
+
+        Returns:
+            Dict mapping placeholder names to values
+        """
+        variation_state = self.space.decode(combination_index)
+
+        # Add "random" values for non-combinatorial vars (weight 0)
+        for slot, (name, variations) in enumerate(self.non_combinatorial_vars):
+            if not variations:
+                raise IndexError(f"No variations available for placeholder '{name}'")
+            variation_state[name] = variations[mix64(self.salt, combination_index, slot) % len(variations)]
+
+        return variation_state
+
+    def __call__(self, index: int) -> Dict[str, Any]:
+        """
+        Render the prompt dict for an image index.
+
+        Args:
+            index: Image index
+
+        Returns:
+            Prompt dict (prompt, negative_prompt, seed, variations)
+        """
+        position, seed_position = divmod(index, self.per_combination)
+        combination_index = self.order[position] if self.order is not None else position
+        variation_state = self.combination_state(combination_index)
+
+        if self._last_combination == combination_index:
+            normalized = self._last_prompt
+        else:
+            # Render compiled template, then normalize
+            normalized = self.normalizer.normalize_prompt(self.plan.render(variation_state))
+            self._last_combination = combination_index
+            self._last_prompt = normalized
+
+        if self.seed_list:
+            seed = self.seed_list[seed_position]
+        else:
+            seed = PromptGenerator._calculate_seed(self.generation, index)
+
+        return {
+            'prompt': normalized,
+            'negative_prompt': '',
+            'seed': seed,
+            'variations': variation_state
+        }
+
+
+def _dedupe(values: List[Any]) -> List[Any]:
+    """Drop repeated values (by equality), keeping first-appearance order."""
+    unique: List[Any] = []
+    for value in values:
+        if value not in unique:
+            unique.append(value)
+    return unique
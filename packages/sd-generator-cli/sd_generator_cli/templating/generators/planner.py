@@ -0,0 +1,156 @@
+"""
+Generation planning for Template System V2.0.
+
+A GenerationPlan describes what a session would generate - per-placeholder
+cardinalities after selectors, loop order, exact combination count and image
+total (seed sweeps included) - without rendering a single prompt. Plans are
+built by PromptGenerator.plan().
+
+A LatencyEstimate turns the image total into a wall-clock estimate, using
+the per-image API latency recorded in the manifests of past sessions.
+"""
+
+import statistics
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from ...execution.manifest import load_manifest
+
+
+# Latency estimate sources
+SOURCE_GENERATION_TIME = 'generation_time'  # Recorded per-image API latency
+SOURCE_SESSION_DURATION = 'session_duration'  # Session duration / image count
+
+
+@dataclass
+class PlaceholderPlan:
+    """Cardinality of one placeholder after selectors."""
+    name: str
+    available: int  # Values in the import
+    selected: int  # Values left after selectors
+    weight: int  # Loop weight ($W, default 1)
+    looped: bool  # Part of the combination space (False = weight 0, picked per combination)
+
+
+@dataclass
+class GenerationPlan:
+    """
+    Exact plan of a generation session.
+
+    In combinatorial mode, ``placeholders`` lists the loops from outer to
+    inner, then the weight-0 placeholders. In random mode every placeholder
+    is part of the combination space and combinations are drawn in random
+    order.
+    """
+    mode: str  # 'combinatorial' | 'random'
+    placeholders: List[PlaceholderPlan] = field(default_factory=list)
+    combinations: int = 1  # Distinct variation combinations
+    seeds_per_combination: int = 1  # len(seed_list) in seed-sweep mode
+    max_images: int = 0  # From generation config (<= 0 = all)
+
+    @property
+    def loop_order(self) -> List[str]:
+        """Names of the placeholders in the combination space (outer → inner)."""
+        return [placeholder.name for placeholder in self.placeholders if placeholder.looped]
+
+    @property
+    def total_images(self) -> int:
+        """Images the session generates (before any --count limit)."""
+        total = self.combinations * self.seeds_per_combination
+        if self.max_images > 0:
+            total = min(total, self.max_images)
+        return total
+
+
+@dataclass
+class LatencyEstimate:
+    """Per-image generation time measured on past sessions."""
+    seconds_per_image: float
+    samples: int  # Images (generation_time) or sessions (session_duration) measured
+    source: str  # SOURCE_GENERATION_TIME or SOURCE_SESSION_DURATION
+
+    def estimate_seconds(self, images: int, delay_between_images: float = 0.0) -> float:
+        """
+        Estimate the wall-clock duration of a run.
+
+        Recorded API latencies exclude the delay between images, session
+        durations already include it.
+
+        Args:
+            images: Number of images to generate
+            delay_between_images: Delay in seconds between each generation
+
+        Returns:
+            Estimated duration in seconds
+        """
+        if images <= 0:
+            return 0.0
+        duration = images * self.seconds_per_image
+        if self.source == SOURCE_GENERATION_TIME:
+            duration += (images - 1) * delay_between_images
+        return duration
+
+
+def estimate_latency(output_dir: Path, max_sessions: int = 20) -> Optional[LatencyEstimate]:
+    """
+    Estimate per-image generation time from past session manifests.
+
+    This function:
+    1. Reads the manifests of the most recent sessions in output_dir
+       (dry-run sessions live in output_dir/dryrun and are not scanned)
+    2. Uses the median recorded API latency (image 'generation_time')
+    3. Falls back to the median of session duration / image count for
+       completed sessions without recorded latencies
+
+    Args:
+        output_dir: Base output directory (global config output_dir)
+        max_sessions: Most recent sessions to read
+
+    Returns:
+        LatencyEstimate, or None if no past session can be measured
+    """
+    output_dir = Path(output_dir)
+    if not output_dir.is_dir():
+        return None
+
+    manifests = sorted(
+        output_dir.glob('*/manifest.json'),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True
+    )[:max_sessions]
+
+    latencies: List[float] = []
+    session_rates: List[float] = []
+
+    for manifest_path in manifests:
+        try:
+            manifest = load_manifest(manifest_path.parent)
+        except (OSError, ValueError):
+            continue
+
+        images = manifest.get('images') or []
+        recorded = [
+            image['generation_time'] for image in images
+            if isinstance(image, dict) and isinstance(image.get('generation_time'), (int, float))
+        ]
+        if recorded:
+            latencies.extend(recorded)
+            continue
+
+        if manifest.get('status') != 'completed' or not images:
+            continue
+        try:
+            started = datetime.fromisoformat(manifest['snapshot']['timestamp'])
+        except (KeyError, TypeError, ValueError):
+            continue
+        duration = manifest_path.stat().st_mtime - started.timestamp()
+        if duration > 0:
+            session_rates.append(duration / len(images))
+
+    if latencies:
+        return LatencyEstimate(statistics.median(latencies), len(latencies), SOURCE_GENERATION_TIME)
+    if session_rates:
+        return LatencyEstimate(statistics.median(session_rates), len(session_rates), SOURCE_SESSION_DURATION)
+    return None
@@ -0,0 +1,434 @@
+"""
+Lazy prompt streams for Template System V2.0.
+
+A PromptStream is a read-only, index-addressable sequence of prompt dicts.
+Prompts are rendered on access, so ``len()``, indexing, slicing and
+iteration never materialize the full combination product.
+
+CombinationSpace decodes a combination index into placeholder values
+(mixed-radix over the weight-ordered placeholders), which is what lets the
+combinatorial generator address any prompt directly. IndexPermutation
+shuffles combination indexes without storing them, which gives random mode
+unique combinations with O(1) draws.
+
+Streams whose renderer can be pickled can also be rendered by a process
+pool (PromptStream.iter_parallel), in deterministic order.
+"""
+
+import pickle
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import (
+    Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union, overload
+)
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def mix64(seed: int, a: int, b: int = 0) -> int:
+    """
+    Deterministically hash (seed, a, b) to a 64-bit integer (splitmix64).
+
+    Used to derive per-index "random" choices that are stable across
+    repeated accesses of the same index.
+
+    Args:
+        seed: Stream salt
+        a: Primary index (e.g. combination index)
+        b: Secondary index (e.g. placeholder slot)
+
+    Returns:
+        64-bit unsigned integer
+    """
+    z = (seed + (a + 1) * 0x9E3779B97F4A7C15 + (b + 1) * 0xD1B54A32D192ED03) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+class CombinationSpace:
+    """
+    Mixed-radix view over weight-ordered placeholder value lists.
+
+    Placeholders are ordered outer → inner (ascending weight). The innermost
+    placeholder changes fastest, which matches ``itertools.product`` order.
+
+    Example:
+        >>> space = CombinationSpace(['Outfit', 'Angle'], [['casual', 'formal'], ['front', 'side']])
+        >>> len(space)
+        4
+        >>> space.decode(1)
+        {'Outfit': 'casual', 'Angle': 'side'}
+    """
+
+    def __init__(self, names: List[str], value_lists: List[List[Any]]):
+        """
+        Initialize the combination space.
+
+        Args:
+            names: Placeholder names, outer loop first
+            value_lists: Selected values for each placeholder (same order)
+        """
+        self.names = names
+        self.value_lists = value_lists
+        self.radices = [len(values) for values in value_lists]
+
+        # strides[p] = number of combinations spanned by one step of digit p
+        self.strides = [1] * len(self.radices)
+        size = 1
+        for pos in range(len(self.radices) - 1, -1, -1):
+            self.strides[pos] = size
+            size *= self.radices[pos]
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def digits(self, index: int) -> List[int]:
+        """
+        Decode a combination index into per-placeholder value indexes.
+
+        Args:
+            index: Combination index (0 <= index < size)
+
+        Returns:
+            List of value indexes, outer placeholder first
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        if not 0 <= index < self.size:
+            raise IndexError(f"Combination index {index} out of range (size={self.size})")
+
+        result = [0] * len(self.radices)
+        for pos in range(len(self.radices) - 1, -1, -1):
+            index, result[pos] = divmod(index, self.radices[pos])
+        return result
+
+    def decode(self, index: int) -> Dict[str, Any]:
+        """
+        Decode a combination index into a {placeholder: value} dict.
+
+        Args:
+            index: Combination index
+
+        Returns:
+            Dict mapping placeholder names to selected values
+        """
+        return {
+            name: values[digit]
+            for name, values, digit in zip(self.names, self.value_lists, self.digits(index))
+        }
+
+    def used_digits(self, start: int, stop: int) -> List[List[int]]:
+        """
+        Compute which value indexes appear in combinations [start, stop).
+
+        Computed analytically per placeholder, without enumerating the range.
+
+        Args:
+            start: First combination index (inclusive)
+            stop: Last combination index (exclusive)
+
+        Returns:
+            For each placeholder, the value indexes in first-appearance order
+        """
+        used: List[List[int]] = []
+        if stop <= start:
+            return [[] for _ in self.radices]
+
+        for radix, stride in zip(self.radices, self.strides):
+            first = start // stride
+            last = (stop - 1) // stride
+            span = min(last - first + 1, radix)
+            used.append([(first + offset) % radix for offset in range(span)])
+        return used
+
+
+class IndexPermutation:
+    """
+    Keyed pseudo-random permutation of range(size).
+
+    Balanced Feistel network over the smallest even bit width covering
+    ``size``, with cycle-walking to stay inside the range. Any position is
+    mapped in O(1) (expected < 4 walks) without storing the permutation, so
+    "all N in random order" works for spaces of any size.
+
+    Example:
+        >>> order = IndexPermutation(5, key=42)
+        >>> sorted(order[i] for i in range(5))
+        [0, 1, 2, 3, 4]
+    """
+
+    ROUNDS = 4
+
+    def __init__(self, size: int, key: int):
+        """
+        Initialize the permutation.
+
+        Args:
+            size: Number of indexes to permute
+            key: Permutation key (different keys = different orders)
+        """
+        self.size = size
+        self.key = key
+
+        bits = max(2, (size - 1).bit_length())
+        bits += bits % 2
+        self._half_bits = bits // 2
+        self._half_mask = (1 << self._half_bits) - 1
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, position: int) -> int:
+        """
+        Map a position to its permuted index.
+
+        Args:
+            position: Position in the permuted order (0 <= position < size)
+
+        Returns:
+            Index in range(size)
+
+        Raises:
+            IndexError: If position is out of range
+        """
+        if not 0 <= position < self.size:
+            raise IndexError(f"Position {position} out of range (size={self.size})")
+
+        value = self._encrypt(position)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+    def _encrypt(self, value: int) -> int:
+        """Apply the Feistel rounds to a value of the power-of-two domain."""
+        half_bits = self._half_bits
+        mask = self._half_mask
+        left = value >> half_bits
+        right = value & mask
+        for round_index in range(self.ROUNDS):
+            left, right = right, left ^ (mix64(self.key, round_index, right) & mask)
+        return (left << half_bits) | right
+
+
+class PromptStream(Sequence):
+    """
+    Lazy, index-addressable sequence of prompt dicts.
+
+    Each access renders a fresh dict, so mutating a returned prompt does not
+    affect the stream. Slicing returns another PromptStream over the same
+    renderer (no prompts are built).
+
+    Example:
+        >>> stream = generator.iter_prompts(template, context, generation)
+        >>> len(stream)               # O(1)
+        27000000
+        >>> first = stream[0]         # renders a single prompt
+        >>> for prompt in stream[100:200]:
+        ...     send(prompt)
+    """
+
+    def __init__(
+        self,
+        render: Callable[[int], Dict[str, Any]],
+        indices: range,
+        used_values: Optional[Callable[[range], Dict[str, List[Any]]]] = None,
+        transforms: Tuple[Callable[[Dict[str, Any]], Dict[str, Any]], ...] = ()
+    ):
+        """
+        Initialize the stream.
+
+        Args:
+            render: Function rendering the prompt dict for an absolute index
+            indices: Absolute indexes covered by this stream
+            used_values: Optional fast path computing the variation values
+                used over a range of indexes (without rendering prompts)
+            transforms: Functions applied in order to each rendered prompt
+        """
+        self._render = render
+        self._indices = indices
+        self._used_values = used_values
+        self._transforms = transforms
+
+    @classmethod
+    def from_list(cls, prompts: List[Dict[str, Any]]) -> 'PromptStream':
+        """
+        Wrap an already-built prompt list as a stream.
+
+        Args:
+            prompts: List of prompt dicts
+
+        Returns:
+            PromptStream over the list
+        """
+        return cls(prompts.__getitem__, range(len(prompts)))
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'PromptStream': ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], 'PromptStream']:
+        if isinstance(index, slice):
+            return PromptStream(self._render, self._indices[index], self._used_values, self._transforms)
+        return self._finish(self._render(self._indices[index]))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        render = self._render
+        if not self._transforms:
+            for index in self._indices:
+                yield render(index)
+        else:
+            for index in self._indices:
+                yield self._finish(render(index))
+
+    def __repr__(self) -> str:
+        return f"PromptStream(len={len(self)})"
+
+    def map(self, transform: Callable[[Dict[str, Any]], Dict[str, Any]]) -> 'PromptStream':
+        """
+        Return a stream applying ``transform`` to each rendered prompt.
+
+        Transforms always run in the calling process (they don't need to
+        be picklable for iter_parallel()).
+
+        Args:
+            transform: Function receiving and returning a prompt dict
+
+        Returns:
+            New PromptStream over the same indexes
+        """
+        return PromptStream(self._render, self._indices, self._used_values, self._transforms + (transform,))
+
+    def iter_parallel(self, jobs: int, chunk_size: int = 256) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate the stream, rendering prompts in a process pool.
+
+        This method:
+        1. Pickles the renderer once and ships it to each worker
+        2. Shards the index range into chunks rendered by the workers
+        3. Yields prompts in stream order (a bounded number of chunks is
+           in flight, so the stream is never materialized)
+
+        Falls back to plain iteration when jobs <= 1, when the stream fits
+        in one chunk, or when the renderer cannot be pickled.
+
+        Args:
+            jobs: Number of worker processes
+            chunk_size: Indexes rendered per task
+
+        Yields:
+            Prompt dicts, same order and content as iter(stream)
+        """
+        if jobs <= 1 or len(self._indices) <= chunk_size:
+            yield from self
+            return
+
+        try:
+            payload = pickle.dumps(self._render)
+        except Exception:
+            yield from self
+            return
+
+        indices = self._indices
+        chunks = (indices[start:start + chunk_size] for start in range(0, len(indices), chunk_size))
+        pending: Deque[Future] = deque()
+
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(payload,))
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(_render_chunk, chunk))
+                if len(pending) >= jobs * 2:
+                    for prompt in pending.popleft().result():
+                        yield self._finish(prompt)
+            while pending:
+                for prompt in pending.popleft().result():
+                    yield self._finish(prompt)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _finish(self, prompt: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply the stream transforms to a rendered prompt."""
+        for transform in self._transforms:
+            prompt = transform(prompt)
+        return prompt
+
+    def used_variations(self) -> Optional[Dict[str, List[Any]]]:
+        """
+        Variation values used by this stream, without rendering prompts.
+
+        Returns:
+            Dict mapping placeholder names to used values (first-appearance
+            order), or None if the stream has no fast path
+        """
+        if self._used_values is None or self._indices.step != 1:
+            return None
+        return self._used_values(self._indices)
+
+
+# Renderer of the current worker process (set once by _init_worker)
+_worker_render: Optional[Callable[[int], Dict[str, Any]]] = None
+
+
+def _init_worker(payload: bytes) -> None:
+    """Process pool initializer: unpickle the stream renderer."""
+    global _worker_render
+    _worker_render = pickle.loads(payload)
+
+
+def _render_chunk(indices: range) -> List[Dict[str, Any]]:
+    """Process pool task: render a chunk of indexes."""
+    render = _worker_render
+    assert render is not None, "worker not initialized"
+    return [render(index) for index in indices]
+
+
+def iter_parallel(prompts: Iterable[Dict[str, Any]], jobs: int) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate prompts, rendering PromptStreams in a process pool.
+
+    Args:
+        prompts: PromptStream or list of prompt dicts
+        jobs: Number of worker processes (<= 1 = sequential)
+
+    Returns:
+        Iterator over the prompts, in order
+    """
+    if isinstance(prompts, PromptStream):
+        return prompts.iter_parallel(jobs)
+    return iter(prompts)
+
+
+def collect_used_variations(prompts: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Collect the variation values actually used by a set of prompts.
+
+    Uses the PromptStream fast path when available, otherwise scans the
+    'variations' dict of each prompt.
+
+    Args:
+        prompts: PromptStream or list of prompt dicts
+
+    Returns:
+        Dict mapping placeholder names to used values (first-appearance order)
+    """
+    if isinstance(prompts, PromptStream):
+        used = prompts.used_variations()
+        if used is not None:
+            return used
+
+    collected: Dict[str, List[Any]] = {}
+    for prompt_dict in prompts:
+        for key, value in prompt_dict.get('variations', {}).items():
+            values = collected.setdefault(key, [])
+            if value not in values:
+                values.append(value)
+    return collected
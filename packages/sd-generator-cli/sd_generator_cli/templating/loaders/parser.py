@@ -16,7 +16,8 @@ from ..models.config_models import (
     ADetailerDetector,
     ADetailerConfig,
     OutputConfig,
-    AnnotationsConfig
+    AnnotationsConfig,
+    EncodingConfig
 )
 from ..models.theme_models import ThemeConfigBlock
 import yaml
@@ -752,7 +753,7 @@ class ConfigParser:
 
     def _parse_output_config(self, output_data: Optional[Dict[str, Any]]) -> Optional[OutputConfig]:
         """
-        Parse output configuration with annotations.
+        Parse output configuration with annotations and encoding.
 
         Args:
             output_data: Raw output dict from YAML (can be None)
@@ -784,10 +785,21 @@ class ConfigParser:
                 margin=annotations_data.get('margin', 20)
             )
 
+        # Parse encoding if present
+        encoding_data = output_data.get('encoding')
+        encoding_config = None
+        if encoding_data:
+            encoding_config = EncodingConfig(
+                format=encoding_data.get('format', 'webp'),
+                quality=encoding_data.get('quality', 95),
+                workers=encoding_data.get('workers', 0)
+            )
+
         return OutputConfig(
             session_name=session_name,
             filename_keys=filename_keys,
-            annotations=annotations_config
+            annotations=annotations_config,
+            encoding=encoding_config
         )
 
     def _parse_themes_config(self, themes_data: Optional[Dict[str, Any]]) -> Optional[ThemeConfigBlock]:
@@ -10,9 +10,9 @@ This module handles:
 
 from pathlib import Path
 from typing import List, Dict, Optional, Any
-import yaml
 
 from sd_generator_cli.templating.models import ThemeConfig
+from sd_generator_cli.templating.loaders.yaml_cache import default_parse_cache
 
 
 class ThemeLoader:
@@ -257,8 +257,7 @@ class ThemeLoader:
         """
         theme_yaml = theme_dir / "theme.yaml"
 
-        with open(theme_yaml, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data, _ = default_parse_cache().load(theme_yaml)
 
         imports = data.get('imports', {})
 
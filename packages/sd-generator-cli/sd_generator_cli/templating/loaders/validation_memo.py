@@ -0,0 +1,213 @@
+"""
+Memo of successful schema validations (Template System V2.0).
+
+Pydantic validation of large variation files costs as much as parsing
+them, and the same unchanged files are validated on every load and every
+run. The ValidationMemo remembers which file contents already passed
+validation, keyed on:
+
+- the content hash returned by YamlParseCache.load()
+- the schema class name
+- a fingerprint of the schema sources (and pydantic version), so editing
+  a schema or upgrading pydantic invalidates every entry
+
+Only successful validations are memoized: invalid files are validated
+again on each load, so their warnings and errors are reported as before.
+
+When the YAML disk cache is enabled, entries are also stored as marker
+files next to it (<cache_dir>/validated/), shared across runs.
+Each entry keeps the time the validation took, which is reported as time
+saved when the validation is skipped.
+"""
+
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+import pydantic
+
+from .yaml_cache import default_parse_cache
+
+
+_SCHEMAS_DIR = Path(__file__).parent.parent / "schemas"
+
+_fingerprint: Optional[str] = None
+
+
+def schema_fingerprint() -> str:
+    """
+    Hash of the schema sources and pydantic version.
+
+    Returns:
+        Hex digest (computed once per process)
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.blake2b(pydantic.VERSION.encode(), digest_size=10)
+        for source in sorted(_SCHEMAS_DIR.glob("*.py")):
+            digest.update(source.name.encode())
+            digest.update(source.read_bytes())
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+
+@dataclass
+class ValidationReport:
+    """Counters of a ValidationMemo."""
+    validated: int = 0        # Files validated (memo misses)
+    skipped: int = 0          # Files skipped (unchanged, memoized)
+    seconds_spent: float = 0.0
+    seconds_saved: float = 0.0
+
+    @property
+    def total(self) -> int:
+        """Number of validations requested."""
+        return self.validated + self.skipped
+
+    def summary(self) -> str:
+        """One-line human readable summary."""
+        return (
+            f"Schema validation: {self.skipped} of {self.total} files unchanged (memoized), "
+            f"~{self.seconds_saved:.2f}s saved, {self.seconds_spent:.2f}s spent"
+        )
+
+
+class ValidationMemo:
+    """
+    Memo of file contents that passed schema validation.
+
+    Example:
+        >>> memo = ValidationMemo()
+        >>> data, digest = cache.load(path)
+        >>> if not memo.is_valid(digest, VariationsFileSchema):
+        ...     VariationsFileSchema(**data)
+        ...     memo.record_valid(digest, VariationsFileSchema, seconds=0.12)
+        >>> memo.report().skipped
+        0
+    """
+
+    def __init__(self, memo_dir: Optional[Path] = None):
+        """
+        Initialize the memo.
+
+        Args:
+            memo_dir: Directory of the persistent memo (None = memory only)
+        """
+        self.memo_dir = Path(memo_dir) if memo_dir is not None else None
+        self._entries: Dict[str, float] = {}  # key -> seconds the validation took
+        self._report = ValidationReport()
+
+    def is_valid(self, digest: str, schema_class: type) -> bool:
+        """
+        Check whether this content already passed validation.
+
+        A hit counts as a skipped validation in the report.
+
+        Args:
+            digest: Content hash of the file
+            schema_class: Schema the file is validated against
+
+        Returns:
+            True if validation can be skipped
+        """
+        key = self._key(digest, schema_class)
+        seconds = self._entries.get(key)
+        if seconds is None:
+            seconds = self._read_disk(key)
+            if seconds is None:
+                return False
+            self._entries[key] = seconds
+
+        self._report.skipped += 1
+        self._report.seconds_saved += seconds
+        return True
+
+    def record_valid(self, digest: str, schema_class: type, seconds: float) -> None:
+        """
+        Record a successful validation.
+
+        Args:
+            digest: Content hash of the file
+            schema_class: Schema the file was validated against
+            seconds: Time the validation took
+        """
+        key = self._key(digest, schema_class)
+        self._entries[key] = seconds
+        self._report.validated += 1
+        self._report.seconds_spent += seconds
+        self._write_disk(key, seconds)
+
+    def record_failure(self, seconds: float) -> None:
+        """
+        Count a failed validation (never memoized).
+
+        Args:
+            seconds: Time the validation took
+        """
+        self._report.validated += 1
+        self._report.seconds_spent += seconds
+
+    def report(self) -> ValidationReport:
+        """
+        Snapshot of the counters.
+
+        Returns:
+            ValidationReport (a copy)
+        """
+        return ValidationReport(**vars(self._report))
+
+    def reset_report(self) -> None:
+        """Reset the counters (entries are kept)."""
+        self._report = ValidationReport()
+
+    def clear(self) -> None:
+        """Drop all in-process entries (the persistent memo is kept)."""
+        self._entries.clear()
+
+    def _key(self, digest: str, schema_class: type) -> str:
+        """Build the memo key of a content hash and schema."""
+        return f"{digest}-{schema_class.__name__}-{schema_fingerprint()}"
+
+    def _read_disk(self, key: str) -> Optional[float]:
+        """Read a persistent entry (None if absent or unreadable)."""
+        if self.memo_dir is None:
+            return None
+        try:
+            return float((self.memo_dir / key).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key: str, seconds: float) -> None:
+        """Write a persistent entry (atomic, best effort)."""
+        if self.memo_dir is None:
+            return
+        try:
+            self.memo_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.memo_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(f"{seconds:.6f}")
+            os.replace(tmp_path, self.memo_dir / key)
+        except OSError:
+            pass  # Memo is an optimization - never fail a load
+
+
+_default_memo: Optional[ValidationMemo] = None
+
+
+def default_validation_memo() -> ValidationMemo:
+    """
+    Get the process-wide validation memo shared by all YamlLoader instances.
+
+    Persistent when the YAML disk cache is enabled (see default_parse_cache).
+
+    Returns:
+        Shared ValidationMemo
+    """
+    global _default_memo
+    if _default_memo is None:
+        cache_dir = default_parse_cache().cache_dir
+        _default_memo = ValidationMemo(cache_dir / "validated" if cache_dir is not None else None)
+    return _default_memo
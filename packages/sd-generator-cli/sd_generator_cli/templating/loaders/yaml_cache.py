@@ -0,0 +1,222 @@
+"""
+Parse cache for YAML files (Template System V2.0).
+
+One resolve loads the same files many times (validator, import resolver,
+theme loader, chunks), and large variation files are slow to parse. The
+YamlParseCache keeps parsed files at two levels:
+
+1. In-process LRU keyed on resolved path + mtime/size, bounded by entry
+   count and total bytes. Entries hold the parsed data pickled, so every
+   load returns a fresh copy that callers may modify.
+2. Optional on-disk cache keyed on content hash (~/.sdgen/cache/yaml/),
+   shared across runs. Enabled with SDGEN_YAML_DISK_CACHE=true, or by
+   setting SDGEN_YAML_CACHE_DIR to a directory.
+
+Files modified shortly before they were cached ("racy" entries, mtime
+granularity) are re-hashed on the next load instead of trusting the stat.
+"""
+
+import hashlib
+import io
+import os
+import pickle  # nosec B403 - only reads back pickles written by this module
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+
+# Default on-disk cache location (format version in the directory name)
+DEFAULT_CACHE_DIR = Path.home() / ".sdgen" / "cache" / "yaml-v1"
+
+# Entries whose file changed less than this before caching are re-hashed
+_RACY_NS = 2_000_000_000
+
+
+@dataclass
+class _Entry:
+    """In-process cache entry."""
+    mtime_ns: int
+    size: int
+    digest: str
+    payload: bytes  # Pickled parsed data
+    cached_at_ns: int
+
+
+class YamlParseCache:
+    """
+    Two-level cache of parsed YAML files.
+
+    Example:
+        >>> cache = YamlParseCache(max_entries=256)
+        >>> data, digest = cache.load(Path("variations/hair.yaml"))
+        >>> data, digest = cache.load(Path("variations/hair.yaml"))  # from memory
+        >>> cache.stats()['hits']
+        1
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 64 * 1024 * 1024,
+        cache_dir: Optional[Path] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Max files kept in memory (0 = no in-process cache)
+            max_bytes: Max total size of the pickled entries kept in memory
+            cache_dir: Directory of the on-disk cache (None = memory only)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def load(self, path: Path) -> Tuple[Any, str]:
+        """
+        Load and parse a YAML file, from the cache when possible.
+
+        This method:
+        1. Returns the in-process entry if the file stat is unchanged
+           (racy entries are confirmed by content hash)
+        2. Otherwise reads the file and looks up its content hash on disk
+        3. Otherwise parses the YAML (and stores it on disk)
+
+        Args:
+            path: Resolved path of the YAML file
+
+        Returns:
+            Tuple of (parsed data - a fresh copy, content hash)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            yaml.YAMLError: If the YAML is malformed
+        """
+        key = str(path)
+        stat = os.stat(path)
+        entry = self._entries.get(key)
+
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            if stat.st_mtime_ns + _RACY_NS < entry.cached_at_ns:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return pickle.loads(entry.payload), entry.digest  # nosec B301
+
+        content = Path(path).read_bytes()
+        digest = hashlib.blake2b(content, digest_size=20).hexdigest()
+
+        if entry is not None and entry.digest == digest:
+            # Racy or touched file with unchanged content
+            self.hits += 1
+            self._store(key, stat, digest, entry.payload)
+            return pickle.loads(entry.payload), digest  # nosec B301
+
+        self.misses += 1
+        payload = self._read_disk(digest)
+        if payload is not None:
+            self.disk_hits += 1
+            data = pickle.loads(payload)  # nosec B301
+        else:
+            stream = io.StringIO(content.decode('utf-8'))
+            stream.name = key  # File name in YAML error messages
+            data = yaml.safe_load(stream)
+            payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            self._write_disk(digest, payload)
+
+        self._store(key, stat, digest, payload)
+        return data, digest
+
+    def clear(self) -> None:
+        """Drop all in-process entries (the on-disk cache is kept)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache statistics.
+
+        Returns:
+            Dict with hits, misses, disk_hits, entries and bytes
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_hits': self.disk_hits,
+            'entries': len(self._entries),
+            'bytes': self._bytes
+        }
+
+    def _store(self, key: str, stat: os.stat_result, digest: str, payload: bytes) -> None:
+        """Insert or refresh an in-process entry, then evict LRU entries."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous.payload)
+
+        if self.max_entries <= 0 or len(payload) > self.max_bytes:
+            return
+
+        self._entries[key] = _Entry(stat.st_mtime_ns, stat.st_size, digest, payload, time.time_ns())
+        self._bytes += len(payload)
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted.payload)
+
+    def _read_disk(self, digest: str) -> Optional[bytes]:
+        """Read a pickled entry from the on-disk cache (None if absent)."""
+        if self.cache_dir is None:
+            return None
+        try:
+            return (self.cache_dir / f"{digest}.pickle").read_bytes()
+        except OSError:
+            return None
+
+    def _write_disk(self, digest: str, payload: bytes) -> None:
+        """Write a pickled entry to the on-disk cache (atomic, best effort)."""
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.cache_dir / f"{digest}.pickle")
+        except OSError:
+            pass  # Cache is an optimization - never fail a load
+
+
+_default_cache: Optional[YamlParseCache] = None
+
+
+def default_parse_cache() -> YamlParseCache:
+    """
+    Get the process-wide parse cache shared by all YamlLoader instances.
+
+    The on-disk level is configured from the environment on first use:
+    SDGEN_YAML_CACHE_DIR (directory) or SDGEN_YAML_DISK_CACHE=true
+    (DEFAULT_CACHE_DIR).
+
+    Returns:
+        Shared YamlParseCache
+    """
+    global _default_cache
+    if _default_cache is None:
+        cache_dir: Optional[Path] = None
+        if os.getenv("SDGEN_YAML_CACHE_DIR"):
+            cache_dir = Path(os.environ["SDGEN_YAML_CACHE_DIR"]).expanduser()
+        elif os.getenv("SDGEN_YAML_DISK_CACHE", "false").lower() == "true":
+            cache_dir = DEFAULT_CACHE_DIR
+        _default_cache = YamlParseCache(cache_dir=cache_dir)
+    return _default_cache
@@ -4,8 +4,11 @@ YAML file loader for Template System V2.0.
 This module handles loading of YAML files with proper path resolution.
 All paths are resolved relative to a base path for portability across systems.
 Includes Pydantic schema validation for explicit type checking.
+Parsed files are cached (see yaml_cache.YamlParseCache), and successful
+validations are memoized per content hash (see validation_memo.ValidationMemo).
 """
 
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 import yaml
@@ -19,6 +22,8 @@ from ..schemas import (
     ThemeFileSchema,
 )
 from ..schemas.variations_schema import LegacyVariationsFileSchema
+from .validation_memo import ValidationMemo, default_validation_memo
+from .yaml_cache import YamlParseCache, default_parse_cache
 
 
 class YamlLoader:
@@ -26,19 +31,40 @@ class YamlLoader:
     Loads YAML files with relative path resolution.
 
     All paths are resolved relative to a base path to ensure portability.
-    No caching is used - files are loaded fresh each time for simplicity.
-    Supports optional Pydantic schema validation for explicit type checking.
+    Parsed files are cached by path + mtime/size (and optionally on disk by
+    content hash), so repeated loads of the same file skip YAML parsing.
+    Each load returns a fresh copy of the data.
+    Supports optional Pydantic schema validation for explicit type checking;
+    file contents that already passed validation are not validated again.
     """
 
-    def __init__(self, strict_validation: bool = False):
+    # Map 'type' field to schema
+    SCHEMA_MAP = {
+        'template': TemplateFileSchema,
+        'prompt': PromptFileSchema,
+        'chunk': ChunkFileSchema,
+        'variations': VariationsFileSchema,
+        'theme_config': ThemeFileSchema,
+    }
+
+    def __init__(
+        self,
+        strict_validation: bool = False,
+        cache: Optional[YamlParseCache] = None,
+        memo: Optional[ValidationMemo] = None
+    ):
         """
         Initialize the YAML loader.
 
         Args:
             strict_validation: If True, validation errors raise exceptions.
                              If False, validation errors are warnings only.
+            cache: Parse cache (default: process-wide cache shared by all loaders)
+            memo: Validation memo (default: process-wide memo shared by all loaders)
         """
         self.strict_validation = strict_validation
+        self.cache = cache if cache is not None else default_parse_cache()
+        self.memo = memo if memo is not None else default_validation_memo()
 
     def load_file(
         self,
@@ -71,19 +97,40 @@ class YamlLoader:
         if not resolved_path.exists():
             raise FileNotFoundError(f"File not found: {resolved_path}")
 
-        # Load and parse YAML
+        # Load and parse YAML (cached)
         try:
-            with open(resolved_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data, digest = self.cache.load(resolved_path)
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Failed to parse YAML in {resolved_path}: {e}")
 
-        # Validate if requested
+        # Validate if requested (skipped for contents that already passed)
         if validate:
-            self.validate_yaml(data, resolved_path)
+            self._validate_memoized(data, resolved_path, digest)
 
         return data
 
+    def _validate_memoized(self, data: Any, file_path: Path, digest: str) -> None:
+        """
+        Validate data unless the same content already passed validation.
+
+        Args:
+            data: Parsed YAML data
+            file_path: File path for error messages
+            digest: Content hash of the file
+        """
+        schema_class = self.SCHEMA_MAP.get(data.get('type')) if isinstance(data, dict) else None
+        if schema_class is not None and self.memo.is_valid(digest, schema_class):
+            return
+
+        start = time.perf_counter()
+        validated = self.validate_yaml(data, file_path)
+        elapsed = time.perf_counter() - start
+
+        if validated is not None:
+            self.memo.record_valid(digest, type(validated), elapsed)
+        else:
+            self.memo.record_failure(elapsed)
+
     def resolve_path(self, path: Path | str, base_path: Optional[Path] = None,
                      allow_absolute: bool = False) -> Path:
         """
@@ -167,13 +214,7 @@ class YamlLoader:
         file_type = data['type']
 
         # Map type to schema
-        schema_map = {
-            'template': TemplateFileSchema,
-            'prompt': PromptFileSchema,
-            'chunk': ChunkFileSchema,
-            'variations': VariationsFileSchema,
-            'theme_config': ThemeFileSchema,
-        }
+        schema_map = self.SCHEMA_MAP
 
         if file_type not in schema_map:
             error_msg = (
@@ -7,6 +7,7 @@ from .config_models import (
     GenerationConfig,
     OutputConfig,
     AnnotationsConfig,
+    EncodingConfig,
     ResolvedContext
 )
 
@@ -22,6 +23,7 @@ __all__ = [
     'GenerationConfig',
     'OutputConfig',
     'AnnotationsConfig',
+    'EncodingConfig',
     'ResolvedContext',
     'ThemeConfig',
     'ImportResolution',
@@ -86,16 +86,32 @@ class AnnotationsConfig:
     margin: int = 20
 
 
+@dataclass
+class EncodingConfig:
+    """
+    Configuration for output re-encoding.
+
+    When present, images returned by the API (plain PNG) are re-encoded
+    in a process pool: optimized PNG, lossless WebP or JPEG. SD metadata
+    is preserved.
+    """
+    format: str = "webp"  # png, webp, jpeg
+    quality: int = 95  # JPEG quality (1-100)
+    workers: int = 0  # Encoder processes (0 = CPU count)
+
+
 @dataclass
 class OutputConfig:
     """
     Configuration for output directory and file naming.
 
-    Controls session naming, filename patterns, and automatic annotations.
+    Controls session naming, filename patterns, automatic annotations
+    and output encoding.
     """
     session_name: Optional[str] = None
     filename_keys: List[str] = field(default_factory=list)
     annotations: Optional[AnnotationsConfig] = None
+    encoding: Optional[EncodingConfig] = None
 
 
 @dataclass
@@ -115,6 +131,10 @@ class GenerationConfig:
     - Overrides seed_mode
     - Each variation combination is tested on all seeds in the list
     - Example: 12 variations × 20 seeds = 240 images
+
+    Variation draws (random order, weight-0 values, limit selectors) are
+    random on each run unless stream_key is set: the same key reproduces
+    the same prompt sequence (used to resume sessions).
     """
     mode: str  # 'random' | 'combinatorial'
     seed: int
@@ -122,6 +142,8 @@ class GenerationConfig:
     max_images: int
     # Explicit seed list for seed-sweep mode (overrides seed/seed_mode)
     seed_list: Optional[List[int]] = None
+    # Key for variation draws (None = new random draws)
+    stream_key: Optional[int] = None
 
 
 @dataclass
@@ -10,9 +10,24 @@ Normalization rules (applied in order):
 3. Remove orphan commas at start/end of lines
 4. Normalize spacing around commas (no space before, one space after)
 5. Preserve maximum 1 blank line between content
+
+The rules only ever touch separator runs (maximal runs of whitespace and
+commas), and the result for a run depends only on the run itself and on
+whether it starts the prompt, ends it, or sits between content. The
+normalizer therefore splits the prompt once and maps each run through a
+memo of normalized separators, computed on a miss by the rule methods.
 """
 
 import re
+from typing import Dict, Tuple, Union
+
+
+# Separator run positions (memo keys for edge runs)
+_START = 'start'
+_END = 'end'
+
+# Stand-in for the content around a separator run
+_CONTENT = 'x'
 
 
 class PromptNormalizer:
@@ -23,6 +38,21 @@ class PromptNormalizer:
     for Stable Diffusion API.
     """
 
+    # Maximal run of whitespace and commas (captured, for re.split)
+    SEPARATOR_PATTERN = re.compile(r'([\s,]+)')
+
+    def __init__(self, cache_size: int = 4096):
+        """
+        Initialize the normalizer.
+
+        Args:
+            cache_size: Max normalized separator runs kept in memory
+                (0 = no cache, rules applied pass by pass to each prompt)
+        """
+        self.cache_size = cache_size
+        self._fragments: Dict[Union[str, Tuple[str, str]], str] = {}
+        self._single_line_fragments: Dict[Union[str, Tuple[str, str]], str] = {}
+
     def normalize_prompt(self, prompt: str) -> str:
         """
         Normalize a resolved prompt string.
@@ -45,6 +75,141 @@ class PromptNormalizer:
             >>> normalizer.normalize_prompt("  1girl,, beautiful  ")
             "1girl, beautiful"
         """
+        return self._normalize_runs(prompt, self._fragments, single_line=False)
+
+    def normalize_single_line(self, prompt: str) -> str:
+        """
+        Normalize a prompt for API submission, on a single line.
+
+        Same result as normalize_prompt(prompt.replace('\\n', ', ').replace('\\r', ''))
+        in one pass: newlines only appear in separator runs, so they are
+        converted while the runs are normalized.
+
+        Args:
+            prompt: Prompt string (may contain newlines)
+
+        Returns:
+            Normalized single-line prompt
+        """
+        return self._normalize_runs(prompt, self._single_line_fragments, single_line=True)
+
+    def _normalize_runs(
+        self,
+        prompt: str,
+        fragments: Dict[Union[str, Tuple[str, str]], str],
+        single_line: bool
+    ) -> str:
+        """
+        Normalize a prompt by replacing its separator runs.
+
+        This method:
+        1. Splits the prompt into content and separator runs (one regex pass)
+        2. Looks up each run in the fragment memo (misses use the rules)
+        3. Joins content and normalized runs
+
+        Without a cache (cache_size=0), the rules are applied to the whole
+        prompt instead.
+
+        Args:
+            prompt: Prompt string
+            fragments: Fragment memo for this mode
+            single_line: Convert newlines to ", " (API mode)
+
+        Returns:
+            Normalized prompt string
+        """
+        if self.cache_size <= 0:
+            if single_line:
+                prompt = prompt.replace('\n', ', ').replace('\r', '')
+            return self._apply_rules(prompt)
+
+        parts = self.SEPARATOR_PATTERN.split(prompt)
+        last = len(parts) - 1
+
+        if last == 0:
+            # No separators at all (or empty prompt)
+            return prompt
+
+        if last == 2 and not parts[0] and not parts[2]:
+            # Only whitespace and commas
+            return ""
+
+        runs = parts[1::2]
+        normalized = list(map(fragments.get, runs))
+
+        if not parts[0]:
+            normalized[0] = fragments.get((runs[0], _START))
+        if not parts[last]:
+            normalized[-1] = fragments.get((runs[-1], _END))
+
+        if None in normalized:
+            for i, value in enumerate(normalized):
+                if value is None:
+                    if i == 0 and not parts[0]:
+                        position = _START
+                    elif i == len(runs) - 1 and not parts[last]:
+                        position = _END
+                    else:
+                        position = None
+                    normalized[i] = self._normalize_fragment(runs[i], position, fragments, single_line)
+
+        parts[1::2] = normalized
+        return ''.join(parts)
+
+    def _normalize_fragment(
+        self,
+        run: str,
+        position: Union[str, None],
+        fragments: Dict[Union[str, Tuple[str, str]], str],
+        single_line: bool
+    ) -> str:
+        """
+        Normalize one separator run with the rules and memoize it.
+
+        The run is normalized with a stand-in content character on each
+        side that has content (not at the start/end of the prompt), and
+        the stand-ins are cut off afterwards.
+
+        Args:
+            run: Separator run (whitespace and commas only)
+            position: _START, _END, or None (between content)
+            fragments: Fragment memo to fill
+            single_line: Convert newlines to ", " first (API mode)
+
+        Returns:
+            Normalized run
+        """
+        source = run.replace('\n', ', ').replace('\r', '') if single_line else run
+
+        if position == _START:
+            normalized = self._apply_rules(source + _CONTENT)[:-1]
+            key: Union[str, Tuple[str, str]] = (run, _START)
+        elif position == _END:
+            normalized = self._apply_rules(_CONTENT + source)[1:]
+            key = (run, _END)
+        else:
+            normalized = self._apply_rules(_CONTENT + source + _CONTENT)[1:-1]
+            key = run
+
+        if len(fragments) >= self.cache_size:
+            fragments.clear()
+        fragments[key] = normalized
+
+        return normalized
+
+    def _apply_rules(self, prompt: str) -> str:
+        """
+        Apply the normalization rules pass by pass.
+
+        Reference implementation of normalize_prompt(), used to normalize
+        separator runs.
+
+        Args:
+            prompt: Resolved prompt string
+
+        Returns:
+            Normalized prompt string
+        """
         if not prompt or not prompt.strip():
             return ""
 
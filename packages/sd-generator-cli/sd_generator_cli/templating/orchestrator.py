@@ -25,10 +25,13 @@ from sd_generator_cli.templating.resolvers.template_resolver import TemplateReso
 from sd_generator_cli.templating.resolvers.theme_resolver import ThemeResolver
 from sd_generator_cli.templating.normalizers.normalizer import PromptNormalizer
 from sd_generator_cli.templating.generators.generator import PromptGenerator
+from sd_generator_cli.templating.generators.prompt_stream import PromptStream
+from sd_generator_cli.templating.generators.planner import GenerationPlan
 from sd_generator_cli.templating.models.config_models import (
     PromptConfig,
     TemplateConfig,
     ChunkConfig,
+    GenerationConfig,
     ResolvedContext
 )
 from sd_generator_cli.templating.models.theme_models import ThemeConfig
@@ -387,6 +390,8 @@ class V2Pipeline:
         """
         Generate prompt variations.
 
+        Eager variant of generate_stream() - builds the full list.
+
         Args:
             config: Prompt configuration
             context: Resolved context with imports
@@ -400,42 +405,91 @@ class V2Pipeline:
                 'variations': Dict[str, str]
             }
         """
+        return list(self.generate_stream(config, context))
+
+    def generate_stream(
+        self,
+        config: PromptConfig,
+        context: ResolvedContext
+    ) -> PromptStream:
+        """
+        Generate prompt variations lazily.
+
+        Prompts are rendered on access (see PromptStream), with the negative
+        prompt and parameters attached as each one is produced. The
+        parameters dict is shared by all prompts - consumers copy it before
+        modifying it (see PromptConfigConverter).
+
+        Args:
+            config: Prompt configuration
+            context: Resolved context with imports
+
+        Returns:
+            PromptStream of prompt dicts (same format as generate(), plus
+            'parameters')
+        """
         # Use config.template (the final template after inheritance)
         template = config.template if config.template else ""
 
-        # Get generation config (with default for TemplateConfig)
-        from sd_generator_cli.templating.models import GenerationConfig
-        if hasattr(config, 'generation') and config.generation:
-            generation_config = config.generation
-        else:
-            # Default generation for standalone templates (used in tests)
-            generation_config = GenerationConfig(
-                mode='combinatorial',
-                seed=42,
-                seed_mode='progressive',
-                max_images=10
-            )
-
         # Generate prompts
-        prompts = self.generator.generate_prompts(
+        prompts = self.generator.iter_prompts(
             template=template,
             context=context,
-            generation=generation_config
+            generation=self._generation_config(config)
         )
 
-        # Add negative prompt if specified
+        # Normalize negative prompt once for the whole session
         negative_prompt = config.negative_prompt or ''
-        if negative_prompt:
-            # Normalize negative prompt
-            normalized_negative = self.normalizer.normalize_prompt(negative_prompt)
-            for prompt in prompts:
+        normalized_negative = self.normalizer.normalize_prompt(negative_prompt) if negative_prompt else ''
+        parameters = context.parameters
+
+        def finish(prompt: Dict[str, Any]) -> Dict[str, Any]:
+            if normalized_negative:
                 prompt['negative_prompt'] = normalized_negative
+            # Add parameters from config (shared, not copied per prompt)
+            prompt['parameters'] = parameters
+            return prompt
 
-        # Add parameters from config
-        for prompt in prompts:
-            prompt['parameters'] = context.parameters.copy()
+        return prompts.map(finish)
 
-        return prompts
+    def plan(
+        self,
+        config: PromptConfig,
+        context: ResolvedContext
+    ) -> GenerationPlan:
+        """
+        Plan prompt generation without rendering prompts.
+
+        Args:
+            config: Prompt configuration
+            context: Resolved context with imports
+
+        Returns:
+            GenerationPlan (exact counts after selectors, loop order, image total)
+        """
+        template = config.template if config.template else ""
+        return self.generator.plan(template, context, self._generation_config(config))
+
+    def _generation_config(self, config: PromptConfig) -> GenerationConfig:
+        """
+        Get the generation config of a prompt config (with default for TemplateConfig).
+
+        Args:
+            config: Prompt configuration
+
+        Returns:
+            GenerationConfig
+        """
+        if hasattr(config, 'generation') and config.generation:
+            return config.generation
+
+        # Default generation for standalone templates (used in tests)
+        return GenerationConfig(
+            mode='combinatorial',
+            seed=42,
+            seed_mode='progressive',
+            max_images=10
+        )
 
     def run(
         self,
@@ -640,7 +694,8 @@ class V2Pipeline:
         """
         Calculate total number of combinatorial combinations.
 
-        Does not account for selectors or weight 0 exclusions.
+        Exact count of the combinatorial stream: selectors are applied and
+        weight 0 placeholders (random per combination) are excluded.
 
         Args:
             template: Template string
@@ -649,16 +704,8 @@ class V2Pipeline:
         Returns:
             Total number of combinations
         """
-        variations = self.get_available_variations(template, context)
-
-        if not variations:
-            return 1
-
-        total = 1
-        for values in variations.values():
-            total *= len(values)
-
-        return total
+        generation = GenerationConfig(mode='combinatorial', seed=42, seed_mode='progressive', max_images=0)
+        return self.generator.plan(template, context, generation).combinations
 
     def get_variation_statistics(
         self,
@@ -6,12 +6,16 @@ This module handles resolution of imports with support for:
 - Inline string imports (with MD5 auto-generated keys)
 - Multi-source merging with conflict detection
 - Nested imports (e.g., chunks: {positive: ..., negative: ...})
+
+Loaded files are memoized in a ResolutionGraph shared by all resolvers,
+so batches over many themes and styles load each file once.
 """
 
 from pathlib import Path
 from typing import Dict, List, Any, Union, Optional
 from dataclasses import dataclass
 from ..utils.hash_utils import md5_short
+from .resolution_graph import ResolutionGraph, default_resolution_graph
 
 
 @dataclass
@@ -36,16 +40,18 @@ class ImportResolver:
     - Nested imports: chunks: {positive: ..., negative: ...}
     """
 
-    def __init__(self, loader, parser):
+    def __init__(self, loader, parser, graph: Optional[ResolutionGraph] = None):
         """
         Initialize the import resolver.
 
         Args:
             loader: YamlLoader instance for loading files
             parser: ConfigParser instance for parsing variations
+            graph: Resolution cache (default: process-wide graph shared by all resolvers)
         """
         self.loader = loader
         self.parser = parser
+        self.graph = graph if graph is not None else default_resolution_graph()
 
     def resolve_imports(
         self,
@@ -172,6 +178,11 @@ class ImportResolver:
         If file is a .adetailer.yaml, returns detector config.
         Otherwise, returns variations dict (simple or multi-part).
 
+        Results are memoized in the resolution graph by (resolved path, style),
+        depending on the loaded file and, for styles, on the directory probed
+        for the variant. Style variants are looked up in the graph's
+        directory index.
+
         Args:
             path: Relative path to variation file
             base_path: Base path for resolution
@@ -190,15 +201,20 @@ class ImportResolver:
         """
         # Debug: Always print what we're loading
         placeholder_info = f"[{placeholder_name}] " if placeholder_name else ""
+        requested_path = self.loader.resolve_path(path, base_path)
+        graph_style = None
+        dependencies = []
 
         # If style is provided, try to resolve style variant first
         if style and style != "default":
+            graph_style = style
             style_path = self._resolve_style_variant(path, style)
             if style_path:
                 # Check if style variant exists
                 try:
                     resolved_path_variant = self.loader.resolve_path(style_path, base_path)
-                    if resolved_path_variant.exists():
+                    dependencies.append(resolved_path_variant.parent)
+                    if self.graph.variant_exists(resolved_path_variant):
                         # Style variant found - use it
                         placeholder_info = f"[{placeholder_name}] " if placeholder_name else ""
                         print(f"[RESOLVE] {placeholder_info}Style '{style}' variant found: {style_path}")
@@ -228,6 +244,29 @@ class ImportResolver:
 
         # Resolve the path (don't show it for successful loads)
         resolved_path = self.loader.resolve_path(path, base_path)
+        cached = self.graph.get(requested_path, graph_style)
+        if cached is not None:
+            return cached
+
+        value = self._parse_variation_file(resolved_path, base_path)
+        self.graph.put(requested_path, graph_style, value, [resolved_path, *dependencies])
+        return value
+
+    def _parse_variation_file(
+        self,
+        resolved_path: Path,
+        base_path: Path
+    ) -> Union[Dict[str, str], Dict[str, Dict[str, str]], Dict[str, Any]]:
+        """
+        Load and parse a variation, chunk, adetailer or controlnet file.
+
+        Args:
+            resolved_path: Resolved path of the file to load
+            base_path: Base path for resolution
+
+        Returns:
+            Parsed file (see _load_variation_file)
+        """
         data = self.loader.load_file(resolved_path, base_path)
 
         # Check if this is a chunk file by extension (.chunk.yaml or .chunk.yml)
@@ -0,0 +1,133 @@
+"""
+Compiled render plans for Template System V2.0 - Phase 2.
+
+A RenderPlan is a template compiled once per session into literal segments
+and typed slots. Rendering a prompt is then a single join over the values
+of the current variation state, instead of a regex substitution and a
+context merge per prompt.
+
+Plans are built by TemplateResolver.compile_template().
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+# Slot kinds
+SLOT_PLAIN = 'plain'  # {Name}
+SLOT_SELECTOR = 'selector'  # {Name[selectors]}
+SLOT_PART = 'part'  # {Name:part}
+SLOT_RANDOM = 'random'  # {Name[$0]} - weight 0, random per combination
+
+
+@dataclass
+class RenderSlot:
+    """A placeholder resolved from the variation state at render time."""
+    kind: str  # One of SLOT_PLAIN, SLOT_SELECTOR, SLOT_PART, SLOT_RANDOM
+    name: str  # Placeholder name (key in variation state)
+    part: Optional[str] = None  # Part name for SLOT_PART
+
+    def resolve(self, value: Any) -> str:
+        """
+        Resolve the slot from its variation value.
+
+        Mirrors TemplateResolver._resolve_placeholders() for placeholders
+        present in the variation state.
+
+        Args:
+            value: Value picked for this placeholder (str or multi-part dict)
+
+        Returns:
+            Resolved string
+
+        Raises:
+            ValueError: If a part is requested on a simple variation
+        """
+        if self.kind == SLOT_PART:
+            if isinstance(value, dict):
+                # Part not found - treat as missing value
+                return str(value[self.part]) if self.part in value else ""
+            raise ValueError(
+                f"Cannot access part '{self.part}' of simple variation '{self.name}'. "
+                f"The variation '{self.name}' is not a multi-part variation. "
+                f"Use {{{self.name}}} instead of {{{self.name}:{self.part}}}."
+            )
+
+        if isinstance(value, dict):
+            return default_part(value)
+        return str(value)
+
+
+class RenderPlan:
+    """
+    Template compiled into literal segments and slots.
+
+    Literals and slots alternate: ``literals[0] slot[0] literals[1] ...
+    slot[n-1] literals[n]``. Placeholders that do not depend on the
+    variation state are folded into the literals at compile time.
+
+    Example:
+        >>> plan = resolver.compile_template("{Outfit}, {Angle}", context, {'Outfit', 'Angle'})
+        >>> plan.render({'Outfit': 'casual', 'Angle': 'front'})
+        'casual, front'
+    """
+
+    def __init__(self, literals: List[str], slots: List[RenderSlot]):
+        """
+        Initialize the plan.
+
+        Args:
+            literals: Literal segments (len(slots) + 1 items)
+            slots: Slots between the literal segments
+        """
+        if len(literals) != len(slots) + 1:
+            raise ValueError(
+                f"RenderPlan needs {len(slots) + 1} literals for {len(slots)} slots, got {len(literals)}"
+            )
+        self.literals = literals
+        self.slots = slots
+
+        # Flat (literal, slot) pairs used by render()
+        self._steps = list(zip(literals[1:], slots))
+
+    @property
+    def names(self) -> List[str]:
+        """Placeholder names read from the variation state (template order)."""
+        return [slot.name for slot in self.slots]
+
+    def render(self, variation_state: Dict[str, Any]) -> str:
+        """
+        Render the template for one variation state.
+
+        Args:
+            variation_state: Dict mapping placeholder names to values
+
+        Returns:
+            Resolved template string (not normalized)
+        """
+        parts = [self.literals[0]]
+        append = parts.append
+        for literal, slot in self._steps:
+            value = variation_state[slot.name]
+            if slot.kind != SLOT_PART and value.__class__ is str:
+                append(value)
+            else:
+                append(slot.resolve(value))
+            append(literal)
+        return ''.join(parts)
+
+    def __repr__(self) -> str:
+        return f"RenderPlan(slots={len(self.slots)}, literals={len(self.literals)})"
+
+
+def default_part(multipart_value: Dict[str, Any]) -> str:
+    """
+    Get the default part of a multi-part variation ("main", else first sorted part).
+
+    Same rule as TemplateResolver._get_default_part().
+    """
+    if not multipart_value:
+        return ""
+    if "main" in multipart_value:
+        return str(multipart_value["main"])
+    return str(multipart_value[min(multipart_value)])
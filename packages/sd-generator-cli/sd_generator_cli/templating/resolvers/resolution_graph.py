@@ -0,0 +1,265 @@
+"""
+Memoized import resolution graph for Template System V2.0.
+
+Batches render the same template for many themes and styles, and every
+resolve loads the same shared variation files again (style probing, file
+checks, parsing). The ResolutionGraph keeps resolved imports between
+resolves:
+
+- Nodes are keyed on (resolved path, style) and hold the resolved value
+  (variations dict, chunk config, detector...).
+- Each node records the files and directories it depends on (the file
+  that was loaded, the directory probed for its style variant). A node is
+  dropped as soon as one of its dependencies changes, other nodes are kept.
+- Style variant probing is answered from a per-directory index of file
+  names, rebuilt only when the directory changes.
+
+Dependencies are checked by mtime/size; files modified shortly before
+they were recorded ("racy", mtime granularity) are confirmed by content
+hash.
+"""
+
+import hashlib
+import os
+import pickle  # nosec B403 - only reads back pickles written by this module
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+
+# Dependencies modified less than this before recording are re-hashed
+_RACY_NS = 2_000_000_000
+
+NodeKey = Tuple[str, Optional[str]]
+
+
+@dataclass
+class _Dependency:
+    """Stat (and content hash for racy entries) of a file or directory."""
+    mtime_ns: int
+    size: int
+    digest: Optional[str]  # Only for racy files
+
+
+@dataclass
+class _Node:
+    """Resolved import and its dependencies."""
+    payload: bytes  # Pickled resolved value
+    dependencies: Dict[str, _Dependency]
+
+
+def _content_hash(path: str) -> Optional[str]:
+    """Hash of a file's content or a directory's file names (None if unreadable)."""
+    try:
+        if os.path.isdir(path):
+            content = "\n".join(sorted(os.listdir(path))).encode('utf-8')
+        else:
+            content = Path(path).read_bytes()
+    except OSError:
+        return None
+    return hashlib.blake2b(content, digest_size=20).hexdigest()
+
+
+class ResolutionGraph:
+    """
+    Cache of resolved imports with dependency tracking.
+
+    Example:
+        >>> graph = ResolutionGraph()
+        >>> graph.variant_exists(Path("variations/outfit.sports.yaml"))
+        True
+        >>> value = graph.get(Path("variations/outfit.yaml"), "sports")
+        >>> if value is None:
+        ...     value = load(...)
+        ...     graph.put(Path("variations/outfit.yaml"), "sports", value,
+        ...               [Path("variations/outfit.sports.yaml"), Path("variations")])
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the graph.
+
+        Args:
+            max_entries: Max nodes kept (least recently used are evicted)
+        """
+        self.max_entries = max_entries
+
+        self._nodes: 'OrderedDict[NodeKey, _Node]' = OrderedDict()
+        self._dependents: Dict[str, Set[NodeKey]] = {}  # dependency -> node keys
+        self._listings: Dict[str, Tuple[int, int, FrozenSet[str]]] = {}  # directory -> (mtime_ns, listed_at_ns, names)
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, path: Path, style: Optional[str] = None) -> Any:
+        """
+        Get the resolved value of an import.
+
+        Args:
+            path: Resolved path of the requested file (before style variant)
+            style: Style the file was resolved for (None = no style)
+
+        Returns:
+            Fresh copy of the resolved value, or None if absent or stale
+        """
+        key = (str(path), style)
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return None
+
+        if not all(self._is_current(dep, state) for dep, state in node.dependencies.items()):
+            self._drop(key)
+            self.invalidations += 1
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._nodes.move_to_end(key)
+        return pickle.loads(node.payload)  # nosec B301
+
+    def put(self, path: Path, style: Optional[str], value: Any, dependencies: Iterable[Path]) -> None:
+        """
+        Record the resolved value of an import.
+
+        Values that cannot be pickled are not cached.
+
+        Args:
+            path: Resolved path of the requested file (before style variant)
+            style: Style the file was resolved for (None = no style)
+            value: Resolved value
+            dependencies: Files and directories the value was resolved from
+        """
+        if self.max_entries <= 0:
+            return
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+
+        states: Dict[str, _Dependency] = {}
+        now = time.time_ns()
+        for dependency in dependencies:
+            dep = str(dependency)
+            try:
+                stat = os.stat(dep)
+            except OSError:
+                return  # Dependency vanished while resolving
+            racy = stat.st_mtime_ns + _RACY_NS >= now
+            states[dep] = _Dependency(stat.st_mtime_ns, stat.st_size, _content_hash(dep) if racy else None)
+
+        key = (str(path), style)
+        self._drop(key)
+        self._nodes[key] = _Node(payload, states)
+        for dep in states:
+            self._dependents.setdefault(dep, set()).add(key)
+
+        while len(self._nodes) > self.max_entries:
+            self._drop(next(iter(self._nodes)))
+
+    def invalidate(self, path: Path) -> int:
+        """
+        Drop every node that depends on a file or directory.
+
+        Args:
+            path: Changed file or directory
+
+        Returns:
+            Number of nodes dropped
+        """
+        dep = str(path)
+        self._listings.pop(dep, None)
+        keys = list(self._dependents.get(dep, ()))
+        for key in keys:
+            self._drop(key)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def variant_exists(self, path: Path) -> bool:
+        """
+        Check whether a style variant file exists, using the directory index.
+
+        Args:
+            path: Resolved path of the style variant
+
+        Returns:
+            True if the file exists
+        """
+        directory = str(path.parent)
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return False
+
+        listing = self._listings.get(directory)
+        # Racy listings (directory changed shortly before listing) are rebuilt
+        if listing is None or listing[0] != mtime_ns or mtime_ns + _RACY_NS >= listing[1]:
+            try:
+                listing = (mtime_ns, time.time_ns(), frozenset(os.listdir(directory)))
+            except OSError:
+                return False
+            self._listings[directory] = listing
+
+        return path.name in listing[2]
+
+    def clear(self) -> None:
+        """Drop all nodes and directory listings."""
+        self._nodes.clear()
+        self._dependents.clear()
+        self._listings.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Graph statistics.
+
+        Returns:
+            Dict with hits, misses, invalidations, nodes and directories
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'nodes': len(self._nodes),
+            'directories': len(self._listings)
+        }
+
+    def _is_current(self, dep: str, state: _Dependency) -> bool:
+        """Check a dependency against its recorded state."""
+        try:
+            stat = os.stat(dep)
+        except OSError:
+            return False
+        if stat.st_mtime_ns != state.mtime_ns or stat.st_size != state.size:
+            return False
+        return state.digest is None or _content_hash(dep) == state.digest
+
+    def _drop(self, key: NodeKey) -> None:
+        """Remove a node and its reverse dependency edges."""
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return
+        for dep in node.dependencies:
+            dependents = self._dependents.get(dep)
+            if dependents is not None:
+                dependents.discard(key)
+                if not dependents:
+                    del self._dependents[dep]
+
+
+_default_graph: Optional[ResolutionGraph] = None
+
+
+def default_resolution_graph() -> ResolutionGraph:
+    """
+    Get the process-wide graph shared by all ImportResolver instances.
+
+    Returns:
+        Shared ResolutionGraph
+    """
+    global _default_graph
+    if _default_graph is None:
+        _default_graph = ResolutionGraph()
+    return _default_graph
@@ -11,9 +11,18 @@ This module handles template resolution with support for:
 
 import re
 import random
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from sd_generator_cli.templating.resolvers.render_plan import (
+    RenderPlan,
+    RenderSlot,
+    SLOT_PART,
+    SLOT_PLAIN,
+    SLOT_RANDOM,
+    SLOT_SELECTOR
+)
+
 
 @dataclass
 class Selector:
@@ -108,6 +117,75 @@ class TemplateResolver:
 
         return resolved
 
+    def compile_template(
+        self,
+        template: str,
+        context: Dict[str, Any],
+        dynamic_names: Iterable[str]
+    ) -> RenderPlan:
+        """
+        Compile a Phase-2 template into a render plan.
+
+        The plan renders exactly like resolve_template(template, context with
+        chunks={**chunks, **variation_state}, skip_chunk_injection=True), as
+        long as every variation state provides all dynamic_names.
+
+        This method:
+        1. Splits the template on placeholders
+        2. Keeps placeholders named in dynamic_names as typed slots
+        3. Resolves every other placeholder once (they don't depend on the
+           variation state) and folds it into the literal segments
+
+        Args:
+            template: Template string (chunks already injected in Phase 1)
+            context: Resolution context without variation state
+                (imports, chunks, defaults)
+            dynamic_names: Placeholder names provided by each variation state
+
+        Returns:
+            RenderPlan for the template
+
+        Raises:
+            ValueError: If selector and sub-placeholder are combined, or if a
+                part is requested on a simple value
+        """
+        dynamic_names = set(dynamic_names)
+        weights = self.extract_weights(template)
+
+        literals: List[str] = []
+        slots: List[RenderSlot] = []
+        current: List[str] = []
+        position = 0
+
+        for match in self.PLACEHOLDER_PATTERN.finditer(template):
+            current.append(template[position:match.start()])
+            position = match.end()
+
+            name, selector_str, part_name = match.groups()
+
+            if name not in dynamic_names or (selector_str and part_name):
+                # Static (or invalid) placeholder - resolve once
+                current.append(self._resolve_placeholders(match.group(0), context))
+                continue
+
+            if part_name:
+                kind = SLOT_PART
+            elif weights.get(name, 1) == 0:
+                kind = SLOT_RANDOM
+            elif selector_str:
+                kind = SLOT_SELECTOR
+            else:
+                kind = SLOT_PLAIN
+
+            literals.append(''.join(current))
+            current = []
+            slots.append(RenderSlot(kind=kind, name=name, part=part_name))
+
+        current.append(template[position:])
+        literals.append(''.join(current))
+
+        return RenderPlan(literals, slots)
+
     def _inject_chunks_with_params(
         self,
         template: str,
@@ -859,7 +937,8 @@ class TemplateResolver:
         Args:
             variations: Dict of variations {key: value}
             selector: Parsed selector
-            context: Resolution context (for random seed if needed)
+            context: Resolution context ('random': optional random.Random
+                for limit selectors, system randomness otherwise)
 
         Returns:
             List of selected variation values
@@ -889,8 +968,9 @@ class TemplateResolver:
             if selector.limit >= len(values):
                 return values
             # Random selection using SystemRandom for cryptographically secure randomness from OS
-            # This ensures different results on each run, independent of any seed() calls
-            sys_random = random.SystemRandom()
+            # This ensures different results on each run, independent of any seed() calls,
+            # unless the caller provides a keyed generator (reproducible prompt streams)
+            sys_random = context.get('random') or random.SystemRandom()
             return sys_random.sample(values, selector.limit)
 
         # No selector - return all
@@ -62,12 +62,27 @@ class AnnotationsConfigSchema(BaseModel):
         extra = "forbid"
 
 
+class EncodingConfigSchema(BaseModel):
+    """Schema for output encoding configuration."""
+
+    format: Literal["png", "webp", "jpeg", "jpg"] = Field(
+        default="webp",
+        description="Output format: optimized PNG, lossless WebP or JPEG"
+    )
+    quality: int = Field(default=95, description="JPEG quality", ge=1, le=100)
+    workers: int = Field(default=0, description="Encoder processes (0 = CPU count)", ge=0)
+
+    class Config:
+        extra = "forbid"
+
+
 class OutputConfigSchema(BaseModel):
     """Schema for output configuration."""
 
     session_name: Optional[str] = Field(None, description="Session directory name")
     filename_keys: List[str] = Field(default_factory=list, description="Keys for filename generation")
     annotations: Optional[AnnotationsConfigSchema] = Field(None, description="Annotation settings")
+    encoding: Optional[EncodingConfigSchema] = Field(None, description="Output re-encoding settings")
 
     class Config:
         extra = "forbid"
@@ -4,11 +4,14 @@ Schema validator for recursive YAML validation.
 Provides recursive scanning and validation reporting for all YAML files.
 """
 
+import time
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import yaml
 from pydantic import ValidationError
 
+from ..loaders.validation_memo import default_validation_memo
+from ..loaders.yaml_cache import default_parse_cache
 from ..schemas import (
     TemplateFileSchema,
     PromptFileSchema,
@@ -71,6 +74,9 @@ class SchemaValidator:
         """
         Validate a single YAML file.
 
+        Files whose content already passed validation (see ValidationMemo)
+        are reported valid without running the schema again.
+
         Args:
             file_path: Path to YAML file
 
@@ -79,8 +85,7 @@ class SchemaValidator:
         """
         # Load YAML
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data, digest = default_parse_cache().load(file_path)
         except yaml.YAMLError as e:
             return ValidationResult(
                 file_path=file_path,
@@ -121,10 +126,16 @@ class SchemaValidator:
                 }]
             )
 
-        # Validate against schema
+        # Validate against schema (skipped for unchanged valid files)
         schema_class = self.schema_map[file_type]
+        memo = default_validation_memo()
+        if memo.is_valid(digest, schema_class):
+            return ValidationResult(file_path=file_path, is_valid=True, file_type=file_type)
+
+        start = time.perf_counter()
         try:
             schema_class(**data)
+            memo.record_valid(digest, schema_class, time.perf_counter() - start)
             return ValidationResult(
                 file_path=file_path,
                 is_valid=True,
@@ -2,11 +2,18 @@
 
 This module handles conversion of image files to base64 format
 required by Stable Diffusion WebUI API (ControlNet, etc.).
+
+Encoded images are shared through an EncodedImageCache: a reference image
+used by every prompt of a run is read and encoded once, and every payload
+references the same base64 string.
 """
 
 import base64
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Union
+from typing import Optional, Tuple, Union
 
 
 class ImageEncoder:
@@ -90,3 +97,100 @@ class ImageEncoder:
             return True
 
         return False
+
+
+class EncodedImageCache:
+    """
+    Content-addressed cache of base64-encoded image files.
+
+    Entries are keyed on (resolved path, mtime, size), so an edited file is
+    re-encoded. Least recently used entries are evicted once the encoded
+    size exceeds ``max_bytes``.
+
+    Example:
+        >>> cache = EncodedImageCache(max_bytes=64 * 1024 * 1024)
+        >>> first = cache.encode("poses/pose1.png")
+        >>> first is cache.encode("poses/pose1.png")  # Same shared string
+        True
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Budget for encoded data (oldest entries evicted beyond it)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def encode(self, image_path: Union[str, Path]) -> str:
+        """
+        Get the base64 encoding of an image file (encoded once per version).
+
+        Args:
+            image_path: Path to image file
+
+        Returns:
+            Base64-encoded string of the image contents (shared, do not modify)
+
+        Raises:
+            FileNotFoundError: If image file doesn't exist
+            IOError: If image file cannot be read
+        """
+        path = Path(image_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return ImageEncoder.encode_image_file_from_path(path)  # Raises the usual errors
+
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            encoded = self._entries.get(key)
+            if encoded is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return encoded
+
+        encoded = ImageEncoder.encode_image_file_from_path(path)
+
+        with self._lock:
+            self.misses += 1
+            if key not in self._entries and len(encoded) <= self.max_bytes:
+                self._entries[key] = encoded
+                self._size += len(encoded)
+                while self._size > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._size -= len(evicted)
+        return encoded
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of cached encodings."""
+        return self._size
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_default_cache: Optional[EncodedImageCache] = None
+
+
+def default_encoded_image_cache() -> EncodedImageCache:
+    """
+    Get the process-wide encoded image cache.
+
+    Returns:
+        Shared EncodedImageCache
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = EncodedImageCache()
+    return _default_cache
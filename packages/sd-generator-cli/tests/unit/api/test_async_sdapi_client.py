@@ -0,0 +1,155 @@
+"""
+Unit tests for AsyncSDAPIClient (asyncio client on httpx)
+"""
+
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from sd_generator_cli.api.async_sdapi_client import AsyncSDAPIClient
+from sd_generator_cli.api.sdapi_client import GenerationConfig, PromptConfig
+
+
+def _client(handler, **kwargs):
+    kwargs.setdefault('backoff_factor', 0.0)
+    return AsyncSDAPIClient("http://sd.local:7860/", transport=httpx.MockTransport(handler), **kwargs)
+
+
+class TestAsyncSDAPIClient:
+    """Test async API client"""
+
+    def test_generate_image_sends_same_payload_as_sync_client(self):
+        """Test that payload building is shared with SDAPIClient"""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json={"images": ["data"], "info": "{}"})
+
+        async def run():
+            async with _client(handler) as client:
+                client.set_generation_config(GenerationConfig(steps=12))
+                return await client.generate_image(PromptConfig(prompt="a cat\nsmiling", seed=42))
+
+        result = asyncio.run(run())
+
+        assert result["images"] == ["data"]
+        payload = json.loads(requests_seen[0].content)
+        assert str(requests_seen[0].url) == "http://sd.local:7860/sdapi/v1/txt2img"
+        assert payload["prompt"] == "a cat, smiling"
+        assert payload["seed"] == 42
+        assert payload["steps"] == 12
+
+    def test_requests_run_concurrently(self):
+        """Test that one event loop keeps several requests in flight"""
+        active = [0]
+        peak = [0]
+
+        async def handler(request):
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.02)
+            active[0] -= 1
+            if request.url.path == "/sdapi/v1/txt2img":
+                return httpx.Response(200, json={"images": []})
+            return httpx.Response(200, json={"progress": 0.5})
+
+        async def run():
+            async with _client(handler) as client:
+                await asyncio.gather(
+                    client.generate_image(PromptConfig(prompt="a")),
+                    client.generate_image(PromptConfig(prompt="b")),
+                    client.get_progress()
+                )
+
+        asyncio.run(run())
+
+        assert peak[0] == 3
+
+    def test_metadata_is_cached(self):
+        """Test that options are fetched once for checkpoint and model info"""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"sd_model_checkpoint": "model [hash]", "sd_vae": "vae.pt"})
+
+        async def run():
+            async with _client(handler) as client:
+                checkpoint = await client.get_model_checkpoint()
+                info = await client.get_model_info()
+                return checkpoint, info
+
+        checkpoint, info = asyncio.run(run())
+
+        assert checkpoint == "model [hash]"
+        assert info["vae"] == "vae.pt"
+        assert calls == ["/sdapi/v1/options"]
+
+    def test_transient_errors_are_retried(self):
+        """Test that 503 and connection errors are retried"""
+        responses = [httpx.ConnectError("refused"), httpx.Response(503), httpx.Response(200, json=[{"name": "Euler"}])]
+
+        def handler(request):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        async def run():
+            async with _client(handler) as client:
+                return await client.get_samplers()
+
+        assert asyncio.run(run()) == [{"name": "Euler"}]
+        assert responses == []
+
+    def test_http_errors_are_raised(self):
+        """Test that client errors raise HTTPStatusError"""
+        async def run():
+            async with _client(lambda request: httpx.Response(422, json={"detail": "bad"})) as client:
+                await client.generate_image(PromptConfig(prompt="test"))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+
+    def test_test_connection_failure(self):
+        """Test that an unreachable API returns False without retrying"""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("refused")
+
+        async def run():
+            async with _client(handler) as client:
+                return await client.test_connection()
+
+        assert asyncio.run(run()) is False
+        assert len(calls) == 1
+
+    def test_cancelled_generation_interrupts_webui(self):
+        """Test that cancelling generate_image() sends /sdapi/v1/interrupt"""
+        paths = []
+        started = asyncio.Event()
+
+        async def handler(request):
+            paths.append(request.url.path)
+            if request.url.path == "/sdapi/v1/txt2img":
+                started.set()
+                await asyncio.sleep(10)
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with _client(handler) as client:
+                task = asyncio.create_task(client.generate_image(PromptConfig(prompt="test")))
+                await started.wait()
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(run())
+
+        assert paths == ["/sdapi/v1/txt2img", "/sdapi/v1/interrupt"]
@@ -0,0 +1,177 @@
+"""
+Unit tests for BackendDispatcher (several WebUI instances behind local stub servers)
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from sd_generator_cli.api.backend_dispatcher import (
+    BackendDispatcher,
+    create_api_client,
+    create_pipeline,
+    parse_api_urls,
+)
+from sd_generator_cli.api.sdapi_client import SDAPIClient, PromptConfig
+
+
+class _StubWebUI:
+    """Minimal A1111 API: /sdapi/v1/options and /sdapi/v1/txt2img"""
+
+    def __init__(self, delay: float = 0.0, status: int = 200):
+        self.delay = delay
+        self.status = status
+        self.prompts = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body):
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._reply(200, {"sd_model_checkpoint": "stub"})
+
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                time.sleep(stub.delay)
+                if stub.status != 200:
+                    self._reply(stub.status, {"error": "stub failure"})
+                    return
+                stub.prompts.append(payload['prompt'])
+                self._reply(200, {"images": [""], "info": json.dumps({"prompt": payload['prompt']})})
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stubs():
+    """Factory for stub servers, shut down after the test"""
+    created = []
+
+    def make(**kwargs):
+        stub = _StubWebUI(**kwargs)
+        created.append(stub)
+        return stub
+
+    yield make
+    for stub in created:
+        stub.close()
+
+
+def _prompt(index):
+    return PromptConfig(prompt=f"prompt {index}", filename=f"{index:03d}.png")
+
+
+class TestApiUrls:
+    """Test endpoint parsing and client selection"""
+
+    def test_parse_api_urls(self):
+        """Comma-separated URLs are split and normalized"""
+        assert parse_api_urls("http://a:7860/, http://b:7860") == ["http://a:7860", "http://b:7860"]
+
+    def test_single_url_creates_plain_client(self):
+        """One endpoint keeps the plain SDAPIClient"""
+        client = create_api_client("http://127.0.0.1:7860")
+
+        assert type(client) is SDAPIClient
+
+    def test_several_urls_create_dispatcher(self):
+        """Several endpoints create a dispatcher with one slot per backend"""
+        client = create_api_client("http://a:7860,http://b:7860")
+
+        assert isinstance(client, BackendDispatcher)
+        assert client.api_url == "http://a:7860"
+        assert create_pipeline(client).max_in_flight == 2
+
+
+class TestBackendDispatcher:
+    """Test dispatching, failover and reporting against stub servers"""
+
+    def test_failed_image_is_retried_on_another_backend(self, stubs):
+        """A 5xx response is retried on a healthy backend"""
+        broken = stubs(status=500)
+        healthy = stubs()
+        dispatcher = BackendDispatcher([broken.url, healthy.url])
+
+        for index in range(3):
+            dispatcher.generate_image(_prompt(index))
+
+        stats = {entry['url']: entry for entry in dispatcher.stats()}
+        assert healthy.prompts == ["prompt 0", "prompt 1", "prompt 2"]
+        assert stats[healthy.url]['completed'] == 3
+        assert stats[broken.url]['failed'] >= 1
+
+    def test_failing_backend_enters_cooldown(self, stubs):
+        """Consecutive failures take a backend out of rotation"""
+        broken = stubs(status=503)
+        healthy = stubs()
+        dispatcher = BackendDispatcher([broken.url, healthy.url], max_failures=1)
+
+        for index in range(4):
+            dispatcher.generate_image(_prompt(index))
+
+        stats = {entry['url']: entry for entry in dispatcher.stats()}
+        assert stats[broken.url]['failed'] == 1
+        assert stats[broken.url]['healthy'] is False
+        assert "(down)" in dispatcher.summary_lines()[0]
+
+    def test_error_raised_when_every_backend_fails(self, stubs):
+        """The last error is raised once every backend was tried"""
+        dispatcher = BackendDispatcher([stubs(status=500).url, stubs(status=502).url])
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            dispatcher.generate_image(_prompt(0))
+
+    def test_client_errors_are_not_retried(self, stubs):
+        """4xx responses fail without trying other backends"""
+        rejecting = stubs(status=422)
+        healthy = stubs()
+        dispatcher = BackendDispatcher([rejecting.url, healthy.url])
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            dispatcher.generate_image(_prompt(0))
+        assert healthy.prompts == []
+
+    def test_test_connection_succeeds_with_one_backend_up(self, stubs):
+        """Unreachable backends are marked down, the dispatcher stays usable"""
+        down = stubs()
+        down.close()
+        up = stubs()
+        dispatcher = BackendDispatcher([down.url, up.url])
+
+        assert dispatcher.test_connection(timeout=1) is True
+        assert [entry['healthy'] for entry in dispatcher.stats()] == [False, True]
+
+    def test_faster_backend_takes_more_images_in_order(self, stubs):
+        """Idle backends pull work; results still complete in index order"""
+        slow = stubs(delay=0.2)
+        fast = stubs(delay=0.02)
+        dispatcher = BackendDispatcher([slow.url, fast.url])
+        completed = []
+
+        create_pipeline(dispatcher).run(
+            range(10),
+            request=lambda index: (lambda: dispatcher.generate_image(_prompt(index))),
+            complete=lambda result: completed.append((result.index, result.success))
+        )
+
+        assert completed == [(index, True) for index in range(10)]
+        assert len(fast.prompts) > len(slow.prompts) >= 1
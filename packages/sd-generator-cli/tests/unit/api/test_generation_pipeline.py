@@ -0,0 +1,124 @@
+"""
+Unit tests for GenerationPipeline (pipelined requests and post-processing)
+"""
+
+import threading
+import time
+
+import pytest
+
+from sd_generator_cli.api.generation_pipeline import GenerationPipeline
+
+
+class TestGenerationPipeline:
+    """Test ordering, overlap and backpressure"""
+
+    def test_results_are_completed_in_order(self):
+        """Completion runs in index order even when later requests finish first"""
+        durations = [0.05, 0.0, 0.02, 0.0]
+        completed = []
+
+        def request(item):
+            def call():
+                time.sleep(durations[item])
+                return item * 10
+            return call
+
+        count = GenerationPipeline(max_in_flight=3).run(
+            range(4), request, lambda result: completed.append((result.index, result.response))
+        )
+
+        assert count == 4
+        assert completed == [(0, 0), (1, 10), (2, 20), (3, 30)]
+
+    def test_in_flight_requests_are_bounded(self):
+        """At most max_in_flight requests run at once"""
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def request(item):
+            def call():
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                time.sleep(0.01)
+                with lock:
+                    running[0] -= 1
+            return call
+
+        GenerationPipeline(max_in_flight=2).run(range(8), request, lambda result: None)
+
+        assert peak[0] == 2
+
+    def test_next_request_overlaps_post_processing(self):
+        """The next request is sent while the previous result is post-processed"""
+        second_sent = threading.Event()
+        overlapped = []
+
+        def request(item):
+            def call():
+                if item == 1:
+                    second_sent.set()
+                return item
+            return call
+
+        def complete(result):
+            if result.index == 0:
+                overlapped.append(second_sent.wait(timeout=2))
+
+        GenerationPipeline(max_in_flight=1).run(range(2), request, complete)
+
+        assert overlapped == [True]
+
+    def test_failures_are_reported_as_results(self):
+        """Errors from preparing or running a request become failed results"""
+        def request(item):
+            if item == 0:
+                raise ValueError("bad parameters")
+
+            def call():
+                if item == 1:
+                    raise ConnectionError("API down")
+                return "ok"
+            return call
+
+        results = []
+        GenerationPipeline().run(range(3), request, results.append)
+
+        assert [result.success for result in results] == [False, False, True]
+        assert isinstance(results[0].error, ValueError)
+        assert isinstance(results[1].error, ConnectionError)
+        assert results[2].response == "ok"
+
+    def test_completion_errors_stop_the_run(self):
+        """Exceptions raised by the completion callback are re-raised"""
+        def complete(result):
+            raise RuntimeError("disk full")
+
+        with pytest.raises(RuntimeError, match="disk full"):
+            GenerationPipeline().run(range(20), lambda item: (lambda: item), complete)
+
+    def test_elapsed_excludes_server_queue_wait(self):
+        """A request queued behind another is timed from when the other ends"""
+        gate = threading.Lock()
+
+        def request(item):
+            def call():
+                with gate:  # Server renders one request at a time
+                    time.sleep(0.1)
+            return call
+
+        results = []
+        GenerationPipeline(max_in_flight=2).run(range(2), request, results.append)
+
+        assert all(0.09 < result.elapsed < 0.18 for result in results)
+
+    def test_throttle_sleeps_between_requests(self, monkeypatch):
+        """An explicit throttle delays every request after the first"""
+        sleeps = []
+        monkeypatch.setattr(time, 'sleep', sleeps.append)
+
+        GenerationPipeline(throttle=1.5).run(range(3), lambda item: (lambda: item), lambda result: None)
+
+        assert sleeps == [1.5, 1.5]
@@ -0,0 +1,143 @@
+"""
+Unit tests for HTTPTransport (retries, circuit breaker, metadata cache)
+"""
+
+import pytest
+from unittest.mock import Mock
+import requests
+
+from sd_generator_cli.api.http_transport import HTTPTransport, CircuitOpenError
+
+
+def _response(status_code=200, data=None):
+    response = Mock(status_code=status_code)
+    response.json.return_value = data if data is not None else {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+    return response
+
+
+def _transport(session, **kwargs):
+    kwargs.setdefault('backoff_factor', 0.0)
+    return HTTPTransport(session=session, **kwargs)
+
+
+class TestRetries:
+    """Test retry policy"""
+
+    def test_transient_5xx_is_retried(self):
+        """Test that 503 responses are retried until success"""
+        session = Mock()
+        session.get.side_effect = [_response(503), _response(503), _response(200, {"ok": True})]
+
+        response = _transport(session).get("http://api/sdapi/v1/options", timeout=5)
+
+        assert response.status_code == 200
+        assert session.get.call_count == 3
+
+    def test_connection_reset_is_retried(self):
+        """Test that connection errors are retried"""
+        session = Mock()
+        session.post.side_effect = [requests.exceptions.ConnectionError("reset"), _response(200)]
+
+        response = _transport(session).post("http://api/sdapi/v1/txt2img", json={}, timeout=300)
+
+        assert response.status_code == 200
+        assert session.post.call_count == 2
+
+    def test_retries_are_bounded(self):
+        """Test that the last error is raised once retries are exhausted"""
+        session = Mock()
+        session.get.side_effect = requests.exceptions.ConnectionError("refused")
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            _transport(session, max_retries=2).get("http://api/x", timeout=5)
+        assert session.get.call_count == 3
+
+    def test_server_errors_and_read_timeouts_are_not_retried(self):
+        """Test that 500 and read timeouts fail without retry"""
+        session = Mock()
+        session.get.return_value = _response(500)
+        session.post.side_effect = requests.exceptions.ReadTimeout("slow render")
+        transport = _transport(session)
+
+        assert transport.get("http://api/x", timeout=5).status_code == 500
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            transport.post("http://api/sdapi/v1/txt2img", json={}, timeout=300)
+        assert session.get.call_count == 1
+        assert session.post.call_count == 1
+
+    def test_backoff_is_exponential(self, monkeypatch):
+        """Test retry delays double up to max_backoff"""
+        sleeps = []
+        monkeypatch.setattr('time.sleep', sleeps.append)
+        session = Mock()
+        session.get.side_effect = requests.exceptions.ConnectionError("refused")
+        transport = HTTPTransport(session=session, max_retries=4, backoff_factor=1.0, max_backoff=5.0)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            transport.get("http://api/x", timeout=5)
+
+        assert sleeps == [1.0, 2.0, 4.0, 5.0]
+
+
+class TestCircuitBreaker:
+    """Test fail-fast behavior"""
+
+    def test_circuit_opens_after_repeated_failures(self):
+        """Test that calls fail fast once the threshold is reached"""
+        session = Mock()
+        session.get.side_effect = requests.exceptions.ConnectionError("refused")
+        transport = _transport(session, max_retries=0, failure_threshold=2, reset_timeout=60)
+
+        for _ in range(2):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                transport.get("http://api/x", timeout=5)
+
+        with pytest.raises(CircuitOpenError):
+            transport.get("http://api/x", timeout=5)
+        assert session.get.call_count == 2
+
+    def test_trial_call_closes_circuit(self):
+        """Test that a successful call after the cooldown closes the circuit"""
+        session = Mock()
+        session.get.side_effect = [requests.exceptions.ConnectionError("refused"), _response(200), _response(200)]
+        transport = _transport(session, max_retries=0, failure_threshold=1, reset_timeout=0)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            transport.get("http://api/x", timeout=5)
+
+        assert transport.get("http://api/x", timeout=5).status_code == 200
+        assert transport.breaker.is_open is False
+
+
+class TestMetadataCache:
+    """Test TTL cache"""
+
+    def test_json_is_cached_until_invalidated(self):
+        """Test that cached responses are reused and returned as copies"""
+        session = Mock()
+        session.get.return_value = _response(200, {"samplers": ["Euler"]})
+        transport = _transport(session)
+
+        first = transport.get_json("http://api/sdapi/v1/samplers", timeout=5, ttl=60)
+        first["samplers"].append("mutated")
+        second = transport.get_json("http://api/sdapi/v1/samplers", timeout=5, ttl=60)
+
+        assert second == {"samplers": ["Euler"]}
+        assert session.get.call_count == 1
+
+        transport.invalidate()
+        transport.get_json("http://api/sdapi/v1/samplers", timeout=5, ttl=60)
+        assert session.get.call_count == 2
+
+    def test_errors_are_not_cached(self):
+        """Test that failed responses raise and are fetched again"""
+        session = Mock()
+        session.get.side_effect = [_response(404), _response(200, ["model"])]
+        transport = _transport(session)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            transport.get_json("http://api/adetailer/v1/ad_model", timeout=5, ttl=60)
+
+        assert transport.get_json("http://api/adetailer/v1/ad_model", timeout=5, ttl=60) == ["model"]
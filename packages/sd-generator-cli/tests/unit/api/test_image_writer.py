@@ -10,6 +10,7 @@ import json
 from pathlib import Path
 
 from sd_generator_cli.api import ImageWriter
+from sd_generator_cli.api.response_stream import StreamedImage
 
 
 class TestImageWriter:
@@ -162,6 +163,27 @@ class TestImageWriter:
         with pytest.raises(Exception):
             writer.save_image("invalid_base64!!!", "bad.png")
 
+    def test_save_image_failure_leaves_no_partial_file(self, temp_output_dir):
+        """A failed write leaves neither the target nor a temporary file"""
+        writer = ImageWriter(temp_output_dir)
+        data = base64.b64encode(b'x' * 200_000).decode('ascii')
+
+        with pytest.raises(Exception):
+            writer.save_image(data[:100_000] + "!" + data[100_000:], "bad.png")
+
+        assert list(Path(temp_output_dir).iterdir()) == []
+
+    def test_save_streamed_image(self, temp_output_dir):
+        """Streamed images are moved into place"""
+        spool = Path(temp_output_dir) / "spool.part"
+        spool.write_bytes(b'\x89PNG data')
+        writer = ImageWriter(temp_output_dir)
+
+        filepath = writer.save_image(StreamedImage(spool), "streamed.png")
+
+        assert filepath.read_bytes() == b'\x89PNG data'
+        assert not spool.exists()
+
     def test_save_json_unicode(self, temp_output_dir):
         """Test saving JSON with unicode characters"""
         writer = ImageWriter(temp_output_dir)
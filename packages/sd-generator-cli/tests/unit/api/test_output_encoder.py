@@ -0,0 +1,120 @@
+"""
+Unit tests for OutputEncoder (post-encode stage)
+"""
+
+import pytest
+from PIL import Image, PngImagePlugin
+
+from sd_generator_cli.api.output_encoder import (
+    EXIF_IFD,
+    USER_COMMENT,
+    OutputEncoder,
+    create_output_encoder_from_config,
+    encode_image,
+    final_filename,
+)
+from sd_generator_cli.templating.models.config_models import EncodingConfig
+
+
+PARAMETERS = "a cat, très mignon\nNegative prompt: ugly\nSteps: 20, Sampler: Euler a, Seed: 42"
+
+
+@pytest.fixture
+def api_png(tmp_path):
+    """PNG shaped like a WebUI output (with 'parameters' text chunk)"""
+    path = tmp_path / "image_0001.png"
+    pnginfo = PngImagePlugin.PngInfo()
+    pnginfo.add_text("parameters", PARAMETERS)
+    Image.new("RGB", (32, 32), (200, 30, 30)).save(path, pnginfo=pnginfo)
+    return path
+
+
+class TestEncodeImage:
+    """Test single-image encoding"""
+
+    def test_final_filename(self):
+        """Extension follows the target format"""
+        assert final_filename("image_0001.png", "webp") == "image_0001.webp"
+        assert final_filename("image_0001.png", "jpeg") == "image_0001.jpg"
+        assert final_filename("image_0001.png", "png") == "image_0001.png"
+
+    def test_optimized_png_keeps_text_chunks(self, api_png):
+        """PNG is rewritten in place with its text chunks"""
+        target = encode_image(api_png, "png")
+
+        assert target == api_png
+        with Image.open(target) as img:
+            assert img.info["parameters"] == PARAMETERS
+
+    @pytest.mark.parametrize("image_format,suffix", [("webp", ".webp"), ("jpeg", ".jpg")])
+    def test_parameters_stored_in_exif(self, api_png, image_format, suffix):
+        """WebP/JPEG carry the parameters as EXIF UserComment; the PNG is removed"""
+        target = encode_image(api_png, image_format)
+
+        assert target.suffix == suffix
+        assert not api_png.exists()
+        with Image.open(target) as img:
+            comment = img.getexif().get_ifd(EXIF_IFD)[USER_COMMENT]
+        assert comment[:8] == b"UNICODE\x00"
+        assert comment[8:].decode("utf-16-be") == PARAMETERS
+
+    def test_webp_is_lossless(self, api_png):
+        """WebP output has the same pixels as the source"""
+        with Image.open(api_png) as img:
+            pixels = list(img.getdata())
+
+        with Image.open(encode_image(api_png, "webp")) as img:
+            assert list(img.convert("RGB").getdata()) == pixels
+
+
+class TestOutputEncoder:
+    """Test the process pool stage"""
+
+    def test_rejects_unknown_format(self):
+        """Unsupported formats fail early"""
+        with pytest.raises(ValueError, match="Unsupported output format"):
+            OutputEncoder("gif")
+
+    def test_encodes_in_worker_processes(self, api_png):
+        """Submitted images are encoded and shutdown drains the pool"""
+        encoder = OutputEncoder("jpg", max_workers=1)
+
+        future = encoder.submit(api_png)
+        encoder.shutdown(wait=True)
+
+        assert future.result() == api_png.with_suffix(".jpg")
+        assert future.result().exists()
+        assert encoder.pending_count == 0
+
+    def test_on_complete_gets_encoded_file(self, api_png):
+        """on_complete receives the encoded path and format"""
+        encoder = OutputEncoder("webp", max_workers=1)
+        outcomes = []
+
+        encoder.submit(api_png, on_complete=lambda path, fmt: outcomes.append((path, fmt)))
+        encoder.shutdown(wait=True)
+
+        assert outcomes == [(api_png.with_suffix(".webp"), "webp")]
+
+    def test_on_complete_keeps_png_on_failure(self, tmp_path):
+        """An undecodable source is kept and reported as PNG (no format)"""
+        broken = tmp_path / "image_0001.png"
+        broken.write_bytes(b"not an image")
+        encoder = OutputEncoder("webp", max_workers=1)
+        outcomes = []
+
+        future = encoder.submit(broken, on_complete=lambda path, fmt: outcomes.append((path, fmt)))
+        encoder.shutdown(wait=True)
+
+        assert future.exception() is not None
+        assert outcomes == [(broken, None)]
+        assert broken.exists()
+        assert not broken.with_suffix(".webp").exists()
+
+    def test_create_from_config(self):
+        """Encoder is built from output.encoding, absent config keeps raw PNGs"""
+        encoder = create_output_encoder_from_config(EncodingConfig(format="png", workers=2))
+
+        assert encoder.image_format == "png"
+        assert encoder.max_workers == 2
+        assert create_output_encoder_from_config(None) is None
@@ -0,0 +1,158 @@
+"""
+Unit tests for streaming txt2img response decoding
+"""
+
+import base64
+import json
+import os
+from unittest.mock import patch, Mock
+
+import pytest
+
+from sd_generator_cli.api.response_stream import (
+    ImagesStreamParser,
+    StreamedImage,
+    parse_streamed_response,
+    write_atomic,
+)
+from sd_generator_cli.api.sdapi_client import SDAPIClient, PromptConfig
+
+
+def _body(images, info=None):
+    """txt2img body, as the WebUI serializes it"""
+    return json.dumps({
+        "images": [base64.b64encode(image).decode('ascii') for image in images],
+        "parameters": {"prompt": "a [cat]", "alwayson_scripts": {"x": [1, 2]}},
+        "info": json.dumps(info or {"seed": 42, "all_seeds": [42, 43]})
+    }).encode('utf-8')
+
+
+def _chunks(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestImagesStreamParser:
+    """Test incremental parsing of txt2img bodies"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 100_000])
+    def test_images_decoded_whatever_the_chunking(self, tmp_path, chunk_size):
+        """Images and the other fields survive any chunk boundaries"""
+        images = [os.urandom(1000), os.urandom(1001), b'']
+
+        result = parse_streamed_response(_chunks(_body(images), chunk_size), str(tmp_path))
+
+        assert [image.read_bytes() for image in result['images']] == images
+        assert result['parameters'] == {"prompt": "a [cat]", "alwayson_scripts": {"x": [1, 2]}}
+        assert json.loads(result['info'])['all_seeds'] == [42, 43]
+
+    def test_escaped_slashes_in_images(self, tmp_path):
+        """JSON-escaped '/' in base64 strings is decoded"""
+        image = bytes(range(256)) * 4
+        encoded = base64.b64encode(image).decode('ascii').replace('/', '\\/')
+        body = ('{"images": ["%s"], "info": "{}"}' % encoded).encode('ascii')
+
+        result = parse_streamed_response(_chunks(body, 5), str(tmp_path))
+
+        assert result['images'][0].read_bytes() == image
+
+    def test_nested_images_key_is_not_streamed(self, tmp_path):
+        """Only the top-level images array is spooled"""
+        body = b'{"parameters": {"images": ["abcd"]}, "images": ["YWJj"]}'
+
+        result = parse_streamed_response([body], str(tmp_path))
+
+        assert result['parameters'] == {"images": ["abcd"]}
+        assert result['images'][0].read_bytes() == b'abc'
+
+    def test_truncated_body_removes_spool_files(self, tmp_path):
+        """An incomplete body raises and leaves no spool file behind"""
+        body = _body([os.urandom(5000)])
+
+        with pytest.raises(ValueError):
+            parse_streamed_response([body[:3000]], str(tmp_path))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unreferenced_images_are_deleted(self, tmp_path):
+        """Spool files of discarded images (e.g. grids) are removed"""
+        parser = ImagesStreamParser(str(tmp_path))
+        parser.feed(_body([b'grid', b'image']))
+        result = parser.close()
+
+        del result['images'][0]
+
+        assert len(list(tmp_path.iterdir())) == 1
+
+
+class TestStreamedImage:
+    """Test spool file handling"""
+
+    def test_move_to_renames(self, tmp_path):
+        """Moving renames the spool file to the target"""
+        spool = tmp_path / "spool.part"
+        spool.write_bytes(b'png')
+        image = StreamedImage(spool)
+
+        target = image.move_to(tmp_path / "out.png")
+
+        assert target.read_bytes() == b'png'
+        assert not spool.exists()
+        assert image.path is None
+
+    def test_move_to_copies_across_devices(self, tmp_path):
+        """When rename fails (other filesystem), the copy is renamed into place"""
+        spool = tmp_path / "spool.part"
+        spool.write_bytes(b'png')
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        real_replace = os.replace
+        calls = []
+
+        def replace(source, target):
+            calls.append(source)
+            if len(calls) == 1:
+                raise OSError(18, "Invalid cross-device link")
+            real_replace(source, target)
+
+        with patch('sd_generator_cli.api.response_stream.os.replace', side_effect=replace):
+            StreamedImage(spool).move_to(out_dir / "image.png")
+
+        assert [p.name for p in out_dir.iterdir()] == ["image.png"]
+        assert (out_dir / "image.png").read_bytes() == b'png'
+        assert not spool.exists()
+
+    def test_write_atomic_never_exposes_partial_file(self, tmp_path):
+        """The target only appears once every chunk was written"""
+        target = tmp_path / "image.png"
+        seen = []
+
+        def chunks():
+            for chunk in (b'a', b'b'):
+                seen.append(target.exists())
+                yield chunk
+
+        write_atomic(target, chunks())
+
+        assert seen == [False, False]
+        assert target.read_bytes() == b'ab'
+
+
+class TestSDAPIClientStreaming:
+    """Test SDAPIClient with stream_images"""
+
+    @patch('requests.Session.post')
+    def test_generate_image_streams_images(self, mock_post, tmp_path):
+        """Images come back as StreamedImage objects and the response is closed"""
+        response = Mock(status_code=200)
+        response.iter_content.return_value = _chunks(_body([b'image bytes']), 10)
+        response.__enter__ = Mock(return_value=response)
+        response.__exit__ = Mock(return_value=False)
+        mock_post.return_value = response
+        client = SDAPIClient(stream_images=True, spool_dir=str(tmp_path))
+
+        result = client.generate_image(PromptConfig(prompt="test"))
+
+        assert mock_post.call_args.kwargs['stream'] is True
+        assert isinstance(result['images'][0], StreamedImage)
+        assert result['images'][0].read_bytes() == b'image bytes'
+        response.__exit__.assert_called_once()
@@ -0,0 +1,164 @@
+"""
+Unit tests for ResultCache (cross-session generation result cache)
+"""
+
+import base64
+import os
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from sd_generator_cli.api import BatchGenerator, SDAPIClient, PromptConfig, GenerationConfig
+from sd_generator_cli.api import SessionManager, ImageWriter, SilentProgressReporter
+from sd_generator_cli.api.result_cache import ResultCache, cache_key, link_or_copy
+
+
+PAYLOAD = {"prompt": "a cat", "negative_prompt": "ugly", "seed": 42, "steps": 20, "width": 512}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    yield cache
+    cache.close()
+
+
+def _image(tmp_path, name="image_0000.png", data=b"png bytes"):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return path
+
+
+class TestCacheKey:
+    """Test canonical request hashing"""
+
+    def test_key_ignores_dict_order(self):
+        """Payloads with the same content have the same key"""
+        reordered = dict(reversed(list(PAYLOAD.items())))
+
+        assert cache_key(PAYLOAD, "hash") == cache_key(reordered, "hash")
+
+    def test_key_depends_on_payload_and_model(self):
+        """Any parameter or checkpoint change gives another key"""
+        key = cache_key(PAYLOAD, "hash")
+
+        assert cache_key({**PAYLOAD, "steps": 21}, "hash") != key
+        assert cache_key(PAYLOAD, "other") != key
+
+    def test_random_seed_is_not_cacheable(self):
+        """seed -1 renders a different image every time"""
+        assert cache_key({**PAYLOAD, "seed": -1}, "hash") is None
+
+
+class TestResultCache:
+    """Test store, lookup and eviction"""
+
+    def test_store_and_materialize(self, cache, tmp_path):
+        """Stored images are linked into new sessions with their info"""
+        key = cache_key(PAYLOAD, "hash")
+        cache.store(key, _image(tmp_path), '{"seed": 42}')
+
+        hit = cache.lookup(key)
+        target = cache.materialize(key, tmp_path / "other_session.png")
+
+        assert hit[1] == '{"seed": 42}'
+        assert target.read_bytes() == b"png bytes"
+        assert os.stat(target).st_ino == os.stat(hit[0]).st_ino  # Hardlink, no copy
+        assert cache.hits == 1
+
+    def test_miss(self, cache):
+        """Unknown and uncacheable keys miss"""
+        assert cache.lookup(cache_key(PAYLOAD, "hash")) is None
+        assert cache.lookup(None) is None
+
+    def test_deleted_object_is_dropped(self, cache, tmp_path):
+        """Entries whose image disappeared are removed from the index"""
+        key = cache_key(PAYLOAD, "hash")
+        cache.store(key, _image(tmp_path))
+        cache.object_path(key).unlink()
+
+        assert cache.lookup(key) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_prune_by_size_evicts_least_recently_used(self, tmp_path):
+        """Oldest used entries go first when the cache is too big"""
+        cache = ResultCache(tmp_path / "cache", max_age_days=None, max_size_mb=1500 / (1024 * 1024))
+        keys = [cache_key({**PAYLOAD, "seed": seed}, "hash") for seed in range(3)]
+        for seed, key in enumerate(keys):
+            cache.store(key, _image(tmp_path, data=bytes(1000)))
+            time.sleep(0.01)
+        cache.lookup(keys[0])  # Most recently used
+
+        assert cache.prune() == 2
+        assert cache.lookup(keys[0]) is not None
+        assert cache.lookup(keys[1]) is None
+        assert not cache.object_path(keys[2]).exists()
+        cache.close()
+
+    def test_prune_by_age(self, tmp_path):
+        """Entries unused for longer than max_age_days are evicted"""
+        cache = ResultCache(tmp_path / "cache", max_age_days=0, max_size_mb=None)
+        cache.store(cache_key(PAYLOAD, "hash"), _image(tmp_path))
+        time.sleep(0.01)
+
+        assert cache.prune() == 1
+        assert cache.stats() == {"entries": 0, "size_bytes": 0}
+        cache.close()
+
+    def test_link_or_copy_replaces_target(self, tmp_path):
+        """An existing target is replaced"""
+        source = _image(tmp_path, "source.png", b"new")
+        target = _image(tmp_path, "target.png", b"old")
+
+        link_or_copy(source, target)
+
+        assert target.read_bytes() == b"new"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["source.png", "target.png"]
+
+
+class TestBatchGeneratorResultCache:
+    """Test BatchGenerator with a result cache"""
+
+    def _generator(self, tmp_path, cache, session_name):
+        api_client = Mock(spec=SDAPIClient)
+        api_client.generation_config = GenerationConfig()
+        api_client.test_connection.return_value = True
+        api_client.get_options.return_value = {"sd_checkpoint_hash": "abc123"}
+        api_client.get_payload_for_config.side_effect = lambda pc: {"prompt": pc.prompt, "seed": pc.seed}
+        api_client.generate_image.side_effect = lambda pc, **kwargs: {
+            'images': [base64.b64encode(pc.prompt.encode()).decode()],
+            'info': '{"seed": %d}' % pc.seed
+        }
+        session_manager = SessionManager(base_output_dir=str(tmp_path), session_name=session_name)
+        return BatchGenerator(
+            api_client=api_client,
+            session_manager=session_manager,
+            image_writer=ImageWriter(session_manager.output_dir),
+            progress_reporter=SilentProgressReporter(total_images=2),
+            result_cache=cache
+        )
+
+    def test_second_session_reuses_images(self, tmp_path, cache):
+        """Identical requests of a later session do not reach the API"""
+        prompts = [
+            PromptConfig(prompt="a cat", seed=1, filename="image_0000.png"),
+            PromptConfig(prompt="a dog", seed=5, filename="image_0001.png"),
+            PromptConfig(prompt="a bird", seed=-1, filename="image_0002.png"),
+        ]
+        first = self._generator(tmp_path, cache, "first")
+        first.generate_batch(prompts)
+
+        responses = []
+        second = self._generator(tmp_path, cache, "second")
+        success, total = second.generate_batch(
+            prompts,
+            on_image_generated=lambda idx, pc, ok, response: responses.append(response)
+        )
+
+        assert (success, total) == (3, 3)
+        # Only the random-seed image is generated again
+        assert second.api_client.generate_image.call_count == 1
+        assert (second.session_manager.output_dir / "image_0001.png").read_bytes() == b"a dog"
+        assert responses[1]['info'] == '{"seed": 5}'
+        assert cache.hits == 2
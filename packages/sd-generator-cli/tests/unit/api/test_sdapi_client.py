@@ -33,7 +33,7 @@ class TestSDAPIClient:
         assert client.generation_config.steps == 50
         assert client.generation_config.cfg_scale == 8.5
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_test_connection_success(self, mock_get):
         """Test successful connection test"""
         mock_response = Mock()
@@ -46,10 +46,10 @@ class TestSDAPIClient:
         assert result is True
         mock_get.assert_called_once_with(
             "http://127.0.0.1:7860/sdapi/v1/options",
-            timeout=5
+            timeout=(5.0, 5)
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_test_connection_failure(self, mock_get):
         """Test failed connection test"""
         mock_get.side_effect = requests.exceptions.RequestException("Connection failed")
@@ -59,7 +59,7 @@ class TestSDAPIClient:
 
         assert result is False
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_generate_image_success(self, mock_post):
         """Test successful image generation"""
         mock_response = Mock()
@@ -92,7 +92,7 @@ class TestSDAPIClient:
         assert payload['seed'] == 42
         assert payload['steps'] == 30  # default
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_generate_image_with_hires_fix(self, mock_post):
         """Test image generation with Hires Fix enabled"""
         mock_response = Mock()
@@ -119,7 +119,7 @@ class TestSDAPIClient:
         assert payload['hr_resize_x'] == 1024  # 512 * 2
         assert payload['hr_resize_y'] == 1536  # 768 * 2
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_generate_image_request_exception(self, mock_post):
         """Test image generation with request exception"""
         mock_post.side_effect = requests.exceptions.RequestException("API error")
@@ -215,7 +215,7 @@ class TestSDAPIClient:
         assert ',,' not in payload['prompt']
         assert ',,' not in payload['negative_prompt']
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_generate_image_with_scheduler(self, mock_post):
         """Test image generation with explicit scheduler"""
         mock_response = Mock()
@@ -250,7 +250,7 @@ class TestSDAPIClient:
         assert payload['sampler_name'] == "Euler a"
         assert 'scheduler' not in payload  # Should not include if None
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_samplers(self, mock_get):
         """Test fetching samplers list"""
         mock_response = Mock()
@@ -268,10 +268,10 @@ class TestSDAPIClient:
         assert samplers[0]['name'] == "Euler"
         mock_get.assert_called_once_with(
             "http://127.0.0.1:7860/sdapi/v1/samplers",
-            timeout=5
+            timeout=(5.0, 5)
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_schedulers(self, mock_get):
         """Test fetching schedulers list"""
         mock_response = Mock()
@@ -289,10 +289,10 @@ class TestSDAPIClient:
         assert schedulers[0]['label'] == "Karras"
         mock_get.assert_called_once_with(
             "http://127.0.0.1:7860/sdapi/v1/schedulers",
-            timeout=5
+            timeout=(5.0, 5)
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_sd_models(self, mock_get):
         """Test fetching SD models list"""
         mock_response = Mock()
@@ -314,10 +314,10 @@ class TestSDAPIClient:
         assert models[0]['model_name'] == "model_v1"
         mock_get.assert_called_once_with(
             "http://127.0.0.1:7860/sdapi/v1/sd-models",
-            timeout=5
+            timeout=(5.0, 5)
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_upscalers(self, mock_get):
         """Test fetching upscalers list"""
         mock_response = Mock()
@@ -335,10 +335,10 @@ class TestSDAPIClient:
         assert upscalers[0]['name'] == "R-ESRGAN 4x+"
         mock_get.assert_called_once_with(
             "http://127.0.0.1:7860/sdapi/v1/upscalers",
-            timeout=5
+            timeout=(5.0, 5)
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_options(self, mock_get):
         """Test fetching raw options/settings"""
         mock_response = Mock()
@@ -359,10 +359,10 @@ class TestSDAPIClient:
         assert options['other_setting'] == "value"
         mock_get.assert_called_once_with(
             "http://127.0.0.1:7860/sdapi/v1/options",
-            timeout=5
+            timeout=(5.0, 5)
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_model_checkpoint(self, mock_get):
         """Test fetching currently loaded model checkpoint"""
         mock_response = Mock()
@@ -379,10 +379,10 @@ class TestSDAPIClient:
         assert checkpoint == "animefull_v1.safetensors [abc123def]"
         mock_get.assert_called_once_with(
             "http://127.0.0.1:7860/sdapi/v1/options",
-            timeout=5
+            timeout=(5.0, 5)
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_model_checkpoint_unknown(self, mock_get):
         """Test checkpoint fallback when not in options"""
         mock_response = Mock()
@@ -395,7 +395,7 @@ class TestSDAPIClient:
 
         assert checkpoint == "unknown"
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_model_info(self, mock_get):
         """Test fetching current model info"""
         mock_response = Mock()
@@ -415,10 +415,10 @@ class TestSDAPIClient:
         assert info['clip_skip'] == 2
         mock_get.assert_called_once_with(
             "http://127.0.0.1:7860/sdapi/v1/options",
-            timeout=5
+            timeout=(5.0, 5)
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_adetailer_models(self, mock_get):
         """Test fetching ADetailer models list"""
         mock_response = Mock()
@@ -440,10 +440,10 @@ class TestSDAPIClient:
         assert "hand_yolov8n.pt" in models
         mock_get.assert_called_once_with(
             "http://127.0.0.1:7860/adetailer/v1/ad_model",
-            timeout=5
+            timeout=(5.0, 5)
         )
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_generate_image_with_adetailer(self, mock_post):
         """Test image generation with ADetailer config"""
         from sd_generator_cli.templating.models.config_models import ADetailerConfig, ADetailerDetector
@@ -486,7 +486,7 @@ class TestSDAPIClient:
         assert detector_dict['ad_model'] == "face_yolov9c.pt"
         assert detector_dict['ad_denoising_strength'] == 0.5
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_generate_image_without_adetailer(self, mock_post):
         """Test image generation without ADetailer (no alwayson_scripts)"""
         mock_response = Mock()
@@ -561,3 +561,21 @@ class TestPromptConfig:
         assert config.negative_prompt == "low quality"
         assert config.seed == 42
         assert config.filename == "dog_001.png"
+
+    @patch('requests.Session.get')
+    def test_options_are_cached_across_metadata_calls(self, mock_get):
+        """Test that checkpoint and model info share one /options request"""
+        mock_response = Mock(status_code=200)
+        mock_response.json.return_value = {"sd_model_checkpoint": "model.safetensors [hash]"}
+        mock_get.return_value = mock_response
+
+        client = SDAPIClient()
+        client.get_model_checkpoint()
+        client.get_model_info()
+
+        assert mock_get.call_count == 1
+
+        client.clear_metadata_cache()
+        client.get_options()
+
+        assert mock_get.call_count == 2
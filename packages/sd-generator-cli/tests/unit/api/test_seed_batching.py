@@ -0,0 +1,160 @@
+"""
+Unit tests for seed-sweep request coalescing
+"""
+
+import json
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from sd_generator_cli.api import BatchGenerator, SDAPIClient, PromptConfig, GenerationConfig
+from sd_generator_cli.api import SessionManager, ImageWriter, SilentProgressReporter
+from sd_generator_cli.api.seed_batching import batch_call, coalesce_seed_runs, split_batch_response
+
+
+def _sweep(prompt, seeds, start=0):
+    return [PromptConfig(prompt=prompt, seed=seed, filename=f"{start + i:03d}.png") for i, seed in enumerate(seeds)]
+
+
+def _batch_response(first_seed, count, grid=False):
+    """Response shaped like A1111 txt2img for a batch (optional leading grid)"""
+    images = [f"image-{first_seed + i}" for i in range(count)]
+    infotexts = [f"seed {first_seed + i}" for i in range(count)]
+    if grid:
+        images.insert(0, "grid")
+        infotexts.insert(0, "grid")
+    return {
+        'images': images,
+        'parameters': {},
+        'info': json.dumps({
+            'seed': first_seed,
+            'all_seeds': [first_seed + i for i in range(count)],
+            'infotexts': infotexts,
+            'index_of_first_image': 1 if grid else 0
+        })
+    }
+
+
+class TestCoalesceSeedRuns:
+    """Test grouping of compatible prompt configs"""
+
+    def test_consecutive_seeds_of_same_prompt_are_grouped(self):
+        """Test that runs are split on prompt change, seed gap and max size"""
+        configs = _sweep("cat", [1000, 1001, 1002, 1003, 1004, 1005]) + _sweep("dog", [1000, 1001], 6)
+
+        groups = list(coalesce_seed_runs(configs, lambda config: config, max_batch_size=4))
+
+        assert [[index for index, _ in group] for group in groups] == [[0, 1, 2, 3], [4, 5], [6, 7]]
+
+    def test_incompatible_configs_are_not_grouped(self):
+        """Test that seed gaps, random seeds and parameter changes break runs"""
+        configs = _sweep("cat", [1000, 1005, -1, -1])
+        configs.append(PromptConfig(prompt="cat", seed=2000, parameters={'steps': 20}))
+        configs.append(PromptConfig(prompt="cat", seed=2001, parameters={'steps': 30}))
+
+        groups = list(coalesce_seed_runs(configs, lambda config: config, max_batch_size=4))
+
+        assert all(len(group) == 1 for group in groups)
+
+    def test_max_batch_size_one_disables_coalescing(self):
+        """Test that max_batch_size=1 keeps one image per request"""
+        groups = list(coalesce_seed_runs(_sweep("cat", range(5)), lambda config: config, max_batch_size=1))
+
+        assert len(groups) == 5
+
+
+class TestSplitBatchResponse:
+    """Test splitting batched responses"""
+
+    def test_grid_is_dropped_and_seeds_are_per_image(self):
+        """Test that each image gets its own image, seed and infotext"""
+        responses = split_batch_response(_batch_response(1000, 3, grid=True), 3)
+
+        assert [response['images'] for response in responses] == [['image-1000'], ['image-1001'], ['image-1002']]
+        infos = [json.loads(response['info']) for response in responses]
+        assert [info['seed'] for info in infos] == [1000, 1001, 1002]
+        assert infos[2]['infotexts'] == ["seed 1002"]
+
+    def test_missing_images_raise(self):
+        """Test that short responses are rejected"""
+        with pytest.raises(ValueError):
+            split_batch_response(_batch_response(1000, 2), 3)
+
+
+class TestBatchCall:
+    """Test batched API calls"""
+
+    def test_group_is_sent_as_one_request(self):
+        """Test that a group becomes one txt2img call with batch_size"""
+        client = Mock(spec=SDAPIClient)
+        client.generate_image.return_value = _batch_response(1000, 3)
+
+        outcomes = batch_call(client, _sweep("cat", [1000, 1001, 1002]), GenerationConfig())()
+
+        assert len(outcomes) == 3
+        (prompt_config,), kwargs = client.generate_image.call_args
+        assert prompt_config.seed == 1000
+        assert kwargs['generation_config'].batch_size == 3
+
+    def test_server_error_falls_back_to_single_requests(self):
+        """Test that a failed batch (e.g. out of VRAM) is retried image by image"""
+        error_response = Mock(status_code=500)
+        client = Mock(spec=SDAPIClient)
+        client.generate_image.side_effect = [
+            requests.exceptions.HTTPError(response=error_response),
+            _batch_response(1000, 1),
+            RuntimeError("boom")
+        ]
+
+        outcomes = batch_call(client, _sweep("cat", [1000, 1001]), GenerationConfig())()
+
+        assert outcomes[0]['images'] == ['image-1000']
+        assert isinstance(outcomes[1], RuntimeError)
+        assert client.generate_image.call_count == 3
+
+
+class TestBatchGeneratorCoalescing:
+    """Test seed-sweep coalescing in BatchGenerator"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        temp = tempfile.mkdtemp()
+        yield temp
+        shutil.rmtree(temp)
+
+    def test_seed_sweep_is_batched_with_real_seeds_per_image(self, temp_dir):
+        """Test that each image is saved and reported with its own seed"""
+        client = Mock(spec=SDAPIClient)
+        client.generation_config = GenerationConfig()
+        client.test_connection.return_value = True
+        client.generate_image.side_effect = lambda prompt_config, generation_config=None: _batch_response(
+            prompt_config.seed, generation_config.batch_size, grid=generation_config.batch_size > 1
+        )
+        session_mgr = SessionManager(base_output_dir=temp_dir)
+        writer = Mock(spec=ImageWriter)
+        generator = BatchGenerator(
+            api_client=client,
+            session_manager=session_mgr,
+            image_writer=writer,
+            progress_reporter=SilentProgressReporter(total_images=5),
+            max_batch_size=4
+        )
+        reported = []
+
+        success, total = generator.generate_batch(
+            _sweep("cat", range(1000, 1005)),
+            on_image_generated=lambda index, config, ok, response: reported.append(
+                (index, config.filename, json.loads(response['info'])['seed'])
+            )
+        )
+
+        assert (success, total) == (5, 5)
+        assert client.generate_image.call_count == 2
+        assert reported == [(i, f"{i:03d}.png", 1000 + i) for i in range(5)]
+        assert [call.args for call in writer.save_image.call_args_list] == [
+            (f"image-{1000 + i}", f"{i:03d}.png") for i in range(5)
+        ]
@@ -1,13 +1,25 @@
 """
-Unit tests for ManifestWriter and ManifestImage (Snapshot System V2)
+Unit tests for ManifestWriter, ManifestImage and the images journal (Snapshot System V2)
 """
 
 import pytest
+import os
 import json
+import time
 from pathlib import Path
 from datetime import datetime
 
-from sd_generator_cli.execution.manifest import ManifestWriter, ManifestImage
+from sd_generator_cli.execution.manifest import (
+    ManifestJournal,
+    ManifestWriter,
+    ManifestImage,
+    INTERNED_FORMAT,
+    compact_manifest,
+    expand_manifest,
+    intern_manifest,
+    load_manifest,
+    write_manifest,
+)
 
 
 class TestManifestImage:
@@ -246,3 +258,240 @@ class TestManifestWriter:
 
         assert isinstance(result, Path)
         assert result == tmp_path / "manifest.json"
+
+
+class TestManifestJournal:
+    """Test the images.jsonl journal and compaction"""
+
+    @pytest.fixture
+    def session_dir(self, tmp_path):
+        """Session with an ongoing manifest and one compacted image"""
+        write_manifest(tmp_path, {
+            "snapshot": {"version": "2.0"},
+            "images": [{"filename": "img_0000.png", "seed": 1}],
+            "status": "ongoing"
+        })
+        return tmp_path
+
+    def test_load_merges_journal(self, session_dir):
+        """Readers see compacted and journaled images, in order"""
+        journal = ManifestJournal(session_dir)
+        journal.append({"filename": "img_0001.png", "seed": 2})
+        journal.append({"filename": "img_0002.png", "seed": 3})
+        journal.close()
+
+        manifest = load_manifest(session_dir)
+
+        assert [img["filename"] for img in manifest["images"]] == ["img_0000.png", "img_0001.png", "img_0002.png"]
+
+    def test_torn_line_is_ignored_and_dropped(self, session_dir):
+        """A line cut by a killed process is skipped, then overwritten by the next append"""
+        (session_dir / "images.jsonl").write_text('{"filename": "img_0001.png"}\n{"filen', encoding='utf-8')
+
+        assert len(load_manifest(session_dir)["images"]) == 2
+
+        journal = ManifestJournal(session_dir)
+        journal.append({"filename": "img_0002.png"})
+        journal.close()
+
+        assert [img["filename"] for img in load_manifest(session_dir)["images"]][1:] == ["img_0001.png", "img_0002.png"]
+
+    def test_compact_sets_status_and_removes_journal(self, session_dir):
+        """Compaction writes a single manifest.json"""
+        journal = ManifestJournal(session_dir)
+        journal.append({"filename": "img_0001.png", "seed": 2})
+        journal.close()
+
+        compact_manifest(session_dir, status="completed")
+
+        with open(session_dir / "manifest.json", 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        assert manifest["status"] == "completed"
+        assert len(manifest["images"]) == 2
+        assert not (session_dir / "images.jsonl").exists()
+
+    def test_interrupted_compaction_does_not_duplicate(self, session_dir):
+        """Journal entries already compacted (journal not yet removed) are skipped"""
+        (session_dir / "images.jsonl").write_text('{"filename": "img_0000.png", "seed": 1}\n', encoding='utf-8')
+
+        assert len(load_manifest(session_dir)["images"]) == 1
+
+    def test_compact_rebuilds_corrupted_manifest(self, session_dir):
+        """Journaled images survive a corrupted manifest.json"""
+        (session_dir / "manifest.json").write_text("{", encoding='utf-8')
+        (session_dir / "images.jsonl").write_text('{"filename": "img_0001.png"}\n', encoding='utf-8')
+
+        manifest = compact_manifest(session_dir, status="aborted")
+
+        assert manifest["images"] == [{"filename": "img_0001.png"}]
+        assert load_manifest(session_dir)["status"] == "aborted"
+        assert (session_dir / "manifest.json.corrupt").read_text(encoding='utf-8') == "{"
+
+    def test_appends_are_batched(self, session_dir):
+        """Entries are written by batch, close() flushes the rest"""
+        journal = ManifestJournal(session_dir, batch_size=100, flush_interval=60)
+        journal.append({"filename": "img_0001.png"})
+
+        assert not (session_dir / "images.jsonl").exists()
+        assert journal.pending_count == 1
+
+        journal.close()
+
+        assert len(load_manifest(session_dir)["images"]) == 2
+        assert journal.pending_count == 0
+
+    def test_background_flush_on_batch_size(self, session_dir):
+        """A full batch is written without waiting for close()"""
+        journal = ManifestJournal(session_dir, batch_size=2, flush_interval=60)
+        journal.append({"filename": "img_0001.png"})
+        journal.append({"filename": "img_0002.png"})
+
+        deadline = time.monotonic() + 5
+        while journal.pending_count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        journal.flush()  # Waits for the background write in progress
+
+        assert len(load_manifest(session_dir)["images"]) == 3
+        journal.close()
+
+    def test_failed_flush_keeps_entries_pending(self, session_dir, monkeypatch):
+        """A batch whose write fails is retried by the next flush"""
+        journal = ManifestJournal(session_dir, batch_size=100, flush_interval=60)
+        journal.append({"filename": "img_0001.png"})
+
+        def failing_fsync(fd):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "fsync", failing_fsync)
+        with pytest.raises(OSError):
+            journal.flush()
+        assert journal.pending_count == 1
+
+        monkeypatch.undo()
+        journal.close()
+
+        assert [img["filename"] for img in load_manifest(session_dir)["images"]] == ["img_0000.png", "img_0001.png"]
+
+    def test_atomic_write_keeps_previous_manifest_on_failure(self, session_dir):
+        """A failed write leaves the previous manifest and no temporary file"""
+        with pytest.raises(TypeError):
+            write_manifest(session_dir, {"snapshot": object()})
+
+        assert load_manifest(session_dir)["snapshot"] == {"version": "2.0"}
+        assert [p.name for p in session_dir.iterdir()] == ["manifest.json"]
+
+
+class TestInternedManifest:
+    """Test the interned (compact) manifest format"""
+
+    @pytest.fixture
+    def manifest(self):
+        """Full manifest with shared negative prompts and a selector-rendered prompt"""
+        return {
+            "snapshot": {
+                # As loaded from a "prompt: |" block (prompts are recorded normalized)
+                "resolved_template": {"prompt": "a {Color} cat,\n  {Size}\n", "negative": "ugly"},
+                "variations": {
+                    "Color": {"available": ["red", "blue"], "used": ["red", "blue"], "count": 2},
+                    "Size": {"available": ["small", "large"], "used": ["large"], "count": 2},
+                }
+            },
+            "images": [
+                {"filename": "s_0000.png", "seed": 1, "prompt": "a blue cat,\nlarge", "negative_prompt": "ugly",
+                 "applied_variations": {"Color": "blue", "Size": "large"}, "generation_time": 2.5},
+                {"filename": "s_0001.png", "seed": 2, "prompt": "a red cat,\nlarge", "negative_prompt": "ugly",
+                 "applied_variations": {"Color": "red", "Size": "large"}},
+                {"filename": "s_0002.png", "seed": 3, "prompt": "a green cat, tiny, <lora:x:1>",
+                 "negative_prompt": "blurry", "applied_variations": {"Color": "green"}},
+            ],
+            "status": "completed"
+        }
+
+    def test_images_reference_available_values(self, manifest):
+        """Variation indexes point into snapshot.variations[P].available"""
+        interned = intern_manifest(manifest)
+
+        assert interned["format"] == INTERNED_FORMAT
+        assert interned["tables"]["placeholders"] == ["Color", "Size"]
+        assert interned["tables"]["prompt_template"] == "a {Color} cat,\n{Size}"
+        assert interned["images"][0]["v"] == [1, 1]
+        assert interned["images"][1]["v"] == [0, 1]
+        assert "prompt" not in interned["images"][0]  # Rebuilt from the template
+
+    def test_unknown_values_and_prompts_are_kept(self, manifest):
+        """Values missing from 'available' and non-rebuildable prompts are stored"""
+        image = intern_manifest(manifest)["images"][2]
+        tables = intern_manifest(manifest)["tables"]
+
+        assert image["v"] == [2, None]
+        assert tables["extra_values"] == {"Color": ["green"]}
+        assert tables["negative_prompts"] == ["ugly", "blurry"]
+        assert image["n"] == 1
+        assert image["prompt"] == "a green cat, tiny, <lora:x:1>"
+
+    def test_round_trip(self, manifest):
+        """Expanding gives back the exact images"""
+        expanded = expand_manifest(json.loads(json.dumps(intern_manifest(manifest))))
+
+        assert expanded == manifest
+
+    def test_pipeline_prompts_are_rebuilt(self, tmp_path):
+        """Prompts generated from a block-scalar template are not stored"""
+        from sd_generator_cli.templating.orchestrator import V2Pipeline
+
+        (tmp_path / "colors.yaml").write_text(
+            "type: variations\nname: Colors\nvariations:\n  red: red fur\n  blue: blue fur, shiny\n  green: green fur\n"
+        )
+        (tmp_path / "poses.yaml").write_text(
+            "type: variations\nname: Poses\nvariations:\n  sit: sitting\n  run: running, motion blur\n"
+        )
+        (tmp_path / "cat.prompt.yaml").write_text(
+            "version: '2.0'\nname: cat\ntype: prompt\n"
+            "imports:\n  Color: colors.yaml\n  Pose: poses.yaml\n"
+            "prompt: |\n  masterpiece,  best quality,\n  a cat, {Color}\n  {Pose},\n\n  detailed\n"
+            "negative_prompt: |\n  lowres,\n  bad anatomy\n"
+            "generation:\n  mode: combinatorial\n  seed_mode: progressive\n  seed: 1\n  max_images: 6\n"
+        )
+        pipeline = V2Pipeline(configs_dir=str(tmp_path))
+        resolved_config, context = pipeline.resolve(pipeline.load(str(tmp_path / "cat.prompt.yaml")))
+        prompts = pipeline.generate(resolved_config, context)
+
+        manifest = {
+            "snapshot": {
+                "resolved_template": {"prompt": resolved_config.template, "negative": resolved_config.negative_prompt},
+                "variations": {
+                    name: {"available": list(context.imports[name].values())} for name in ("Color", "Pose")
+                }
+            },
+            "images": [
+                {
+                    "filename": f"cat_{idx:04d}_seed-{prompt['seed']}.png",
+                    "seed": prompt["seed"],
+                    "prompt": prompt["prompt"],
+                    "negative_prompt": prompt["negative_prompt"],
+                    "applied_variations": prompt["variations"]
+                }
+                for idx, prompt in enumerate(prompts)
+            ],
+            "status": "completed"
+        }
+        interned = intern_manifest(manifest)
+
+        assert len(interned["images"]) == 6
+        assert resolved_config.template.endswith("\n")
+        assert not any("prompt" in image for image in interned["images"])
+        assert expand_manifest(interned)["images"] == manifest["images"]
+
+    def test_compacted_manifest_is_interned(self, tmp_path, manifest):
+        """compact_manifest writes the interned format, load_manifest expands it"""
+        write_manifest(tmp_path, {**manifest, "images": manifest["images"][:1], "status": "ongoing"})
+        journal = ManifestJournal(tmp_path)
+        for image in manifest["images"][1:]:
+            journal.append(image)
+        journal.close()
+
+        compact_manifest(tmp_path, status="completed")
+
+        with open(tmp_path / "manifest.json", 'r', encoding='utf-8') as f:
+            assert json.load(f)["format"] == INTERNED_FORMAT
+        assert load_manifest(tmp_path) == manifest
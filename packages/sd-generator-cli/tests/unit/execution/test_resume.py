@@ -0,0 +1,106 @@
+"""
+Unit tests for resume support (sdgen generate --resume)
+"""
+
+import json
+
+import pytest
+
+from sd_generator_cli.execution.resume import (
+    build_resume_info,
+    image_index,
+    load_resume_state,
+    resolve_session_dir,
+)
+
+
+def _write_session(session_dir, images, files, resume=True):
+    """Create a session directory with a manifest and output files"""
+    session_dir.mkdir(parents=True)
+    snapshot = {"version": "2.0"}
+    if resume:
+        snapshot["resume"] = build_resume_info(
+            template_path=session_dir / "portrait.prompt.yaml",
+            stream_key=42,
+            count=10,
+            session_name="portrait"
+        )
+    manifest = {
+        "snapshot": snapshot,
+        "images": [{"filename": name} for name in images],
+        "status": "aborted"
+    }
+    (session_dir / "manifest.json").write_text(json.dumps(manifest), encoding='utf-8')
+    for name in files:
+        (session_dir / name).write_bytes(b'image')
+    return session_dir
+
+
+class TestImageIndex:
+    """Test index extraction from filenames"""
+
+    @pytest.mark.parametrize("filename,expected", [
+        ("portrait_0007.png", 7),
+        ("portrait_0012_seed-1000.webp", 12),
+        ("portrait_10000_seed--1.jpg", 10000),
+        ("portrait_0003.json", 3),
+        ("manifest.json", None),
+        ("portrait_12.png", None),
+    ])
+    def test_image_index(self, filename, expected):
+        """Index is the zero-padded number before the optional seed suffix"""
+        assert image_index(filename) == expected
+
+
+class TestLoadResumeState:
+    """Test loading an interrupted session"""
+
+    def test_done_and_unrecorded_indexes(self, tmp_path):
+        """Indexes come from the manifest and from files on disk"""
+        session_dir = _write_session(
+            tmp_path / "20251014_143052_portrait",
+            images=["portrait_0000.png", "portrait_0001.png"],
+            files=["portrait_0000.png", "portrait_0001.png", "portrait_0002.png",
+                   ".portrait_0003.png.abc.part"]
+        )
+
+        state = load_resume_state(session_dir)
+
+        assert state.done == {0, 1, 2}
+        assert state.unrecorded == {2}
+        assert state.options["stream_key"] == 42
+        assert state.manifest_path == session_dir / "manifest.json"
+
+    def test_session_without_resume_record(self, tmp_path):
+        """Sessions created before resume support are rejected with a clear error"""
+        session_dir = _write_session(tmp_path / "old_session", images=[], files=[], resume=False)
+
+        with pytest.raises(ValueError, match="cannot be resumed"):
+            load_resume_state(session_dir)
+
+    def test_corrupted_manifest(self, tmp_path):
+        """Unreadable manifests raise ValueError"""
+        session_dir = tmp_path / "broken"
+        session_dir.mkdir()
+        (session_dir / "manifest.json").write_text("{", encoding='utf-8')
+
+        with pytest.raises(ValueError, match="Corrupted manifest"):
+            load_resume_state(session_dir)
+
+
+class TestResolveSessionDir:
+    """Test session lookup"""
+
+    def test_by_name_and_path(self, tmp_path):
+        """Sessions are found by path, by name, and by name in dryrun/"""
+        session_dir = _write_session(tmp_path / "session_a", images=[], files=[])
+        dryrun_dir = _write_session(tmp_path / "dryrun" / "session_b", images=[], files=[])
+
+        assert resolve_session_dir(str(session_dir), tmp_path) == session_dir
+        assert resolve_session_dir("session_a", tmp_path) == session_dir
+        assert resolve_session_dir("session_b", tmp_path) == dryrun_dir
+
+    def test_unknown_session(self, tmp_path):
+        """Unknown sessions raise FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            resolve_session_dir("missing", tmp_path)
@@ -0,0 +1,76 @@
+"""
+Unit tests for the per-session image index (index.sqlite)
+"""
+
+import sqlite3
+
+import pytest
+
+from sd_generator_cli.execution.session_index import INDEX_FILENAME, SessionIndex, prompt_hash
+
+
+def _image(idx, seed, **variations):
+    return {
+        "filename": f"s_{idx:04d}_seed-{seed}.png",
+        "seed": seed,
+        "prompt": f"a cat, {', '.join(variations.values())}",
+        "negative_prompt": "ugly",
+        "applied_variations": variations,
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SessionIndex(tmp_path)
+    yield index
+    index.close()
+
+
+def _rows(tmp_path, query, params=()):
+    with sqlite3.connect(tmp_path / INDEX_FILENAME) as db:
+        return db.execute(query, params).fetchall()
+
+
+class TestSessionIndex:
+    """Test index.sqlite population"""
+
+    def test_one_column_per_placeholder(self, tmp_path, index):
+        """Placeholders get a column on first use"""
+        index.add(_image(0, 42, Outfit="red dress"))
+        index.add(_image(1, 43, Outfit="jeans", Hair="blonde"))
+
+        columns = dict(_rows(tmp_path, "SELECT name, column_name FROM placeholders"))
+        assert set(columns) == {"Outfit", "Hair"}
+        assert _rows(
+            tmp_path, f"SELECT idx, seed, {columns['Outfit']}, {columns['Hair']} FROM images ORDER BY idx"
+        ) == [(0, 42, "red dress", None), (1, 43, "jeans", "blonde")]
+
+    def test_index_parsed_from_filename(self, tmp_path, index):
+        """Sequence indexes come from filenames unless given"""
+        index.add_many([_image(7, 1), _image(3, 2)])
+        index.add(_image(9, 3), idx=12)
+
+        assert _rows(tmp_path, "SELECT idx FROM images ORDER BY idx") == [(3,), (7,), (12,)]
+
+    def test_same_index_is_replaced(self, tmp_path, index):
+        """Re-recording an image (resume) does not duplicate it"""
+        index.add(_image(0, 42))
+        index.add(_image(0, 42))
+
+        assert _rows(tmp_path, "SELECT COUNT(*) FROM images") == [(1,)]
+
+    def test_prompt_hash(self, tmp_path, index):
+        """Images store the hash of their resolved prompt"""
+        image = _image(0, 42, Outfit="red dress")
+        index.add(image)
+
+        assert _rows(tmp_path, "SELECT prompt_hash FROM images") == [(prompt_hash(image["prompt"]),)]
+
+    def test_failure_disables_index(self, tmp_path, capsys):
+        """Index errors are reported once and never raised"""
+        index = SessionIndex(tmp_path / "missing")
+
+        index.add(_image(0, 42))
+        index.add(_image(1, 43))
+
+        assert capsys.readouterr().out.count("Session index disabled") == 1
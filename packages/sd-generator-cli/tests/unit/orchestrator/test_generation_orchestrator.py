@@ -147,7 +147,7 @@ generation:
         mock_pipeline = mock_pipeline_class.return_value
         mock_pipeline.load.return_value = sample_prompt_config
         mock_pipeline.resolve.return_value = (MagicMock(), MagicMock())
-        mock_pipeline.generate.return_value = [{"prompt": "test", "seed": 42, "variations": {}}]
+        mock_pipeline.generate_stream.return_value = [{"prompt": "test", "seed": 42, "variations": {}}]
         mock_pipeline.get_variation_statistics.return_value = {
             "total_placeholders": 1,
             "total_combinations": 3,
@@ -174,11 +174,11 @@ generation:
 
         # Mock PromptConfigConverter
         mock_converter = mock_converter_class.return_value
-        mock_converter.convert_prompts.return_value = [MagicMock()]
+        mock_converter.iter_convert.return_value = iter([({}, MagicMock())])
 
         # Mock ImageGenerator
         mock_image_generator = mock_image_gen_class.return_value
-        mock_image_generator.generate_images.return_value = (1, 1)  # success, total
+        mock_image_generator.generate_stream.return_value = (1, 1)  # success, total
 
         # Execute orchestrate
         orchestrator.orchestrate(
@@ -200,7 +200,7 @@ generation:
         # Phase 6: Manifest preparation
         mock_manifest_builder.build_snapshot.assert_called_once()
         # Phase 7: Image generation
-        mock_image_generator.generate_images.assert_called_once()
+        mock_image_generator.generate_stream.assert_called_once()
         # Phase 8: Manifest finalization
         # (verified by ManifestManager.finalize call)
 
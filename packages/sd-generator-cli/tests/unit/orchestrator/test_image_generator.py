@@ -1,13 +1,16 @@
 """Unit tests for ImageGenerator (TDD approach)."""
 
+import base64
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, call
 import pytest
 
 from sd_generator_cli.orchestrator.image_generator import ImageGenerator
+from sd_generator_cli.api.output_encoder import OutputEncoder
 from sd_generator_cli.orchestrator.session_config import SessionConfig
 from sd_generator_cli.orchestrator.session_event_collector import SessionEventCollector
 from sd_generator_cli.orchestrator.manifest_manager import ManifestManager
+from sd_generator_cli.orchestrator.event_types import EventType
 from sd_generator_cli.api.sdapi_client import PromptConfig
 from sd_generator_cli.templating.models.config_models import PromptConfig as TemplatePromptConfig, GenerationConfig
 
@@ -264,6 +267,44 @@ class TestManifestCallbackIntegration:
         prompt_dict = second_call[1]['prompt_dict']
         assert prompt_dict['variations'] == {"Hair": "brunette", "Eyes": "green"}
 
+    def test_failed_encode_records_png(
+        self,
+        mock_api_client,
+        mock_manifest_manager,
+        mock_events,
+        minimal_session_config,
+        sample_prompt_configs,
+        sample_prompts
+    ):
+        """Records the kept PNG (no format) when the image cannot be re-encoded."""
+        # Saved as-is, but not an image the encoder can decode
+        mock_api_client.generate_image.return_value = {
+            "images": [base64.b64encode(b"not an image").decode()],
+            "info": "{}"
+        }
+        minimal_session_config.session_path.mkdir(parents=True, exist_ok=True)
+        generator = ImageGenerator(
+            api_client=mock_api_client,
+            manifest_manager=mock_manifest_manager,
+            events=mock_events,
+            session_config=minimal_session_config,
+            max_batch_size=1,
+            output_encoder=OutputEncoder("webp", max_workers=1)
+        )
+
+        generator.generate_images(sample_prompt_configs, sample_prompts)
+
+        calls = mock_manifest_manager.update_incremental.call_args_list
+        assert sorted(c[1]['filename'] for c in calls) == [cfg.filename for cfg in sample_prompt_configs]
+        assert all(c[1]['image_format'] is None for c in calls)
+        reported = [
+            c[0][1]["path"] for c in mock_events.emit.call_args_list
+            if c[0][0] == EventType.IMAGE_SUCCESS
+        ]
+        assert sorted(reported) == [cfg.filename for cfg in sample_prompt_configs]
+        session_path = minimal_session_config.session_path
+        assert all((session_path / cfg.filename).exists() for cfg in sample_prompt_configs)
+
 
 # ============================================================================
 # Test: Edge cases
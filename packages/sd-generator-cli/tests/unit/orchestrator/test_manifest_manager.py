@@ -1,10 +1,12 @@
 """Unit tests for ManifestManager (TDD approach)."""
 
 import json
+import sqlite3
 from pathlib import Path
 from unittest.mock import Mock
 import pytest
 
+from sd_generator_cli.execution.manifest import load_manifest
 from sd_generator_cli.orchestrator.manifest_manager import ManifestManager
 from sd_generator_cli.orchestrator.session_event_collector import SessionEventCollector
 
@@ -150,8 +152,8 @@ class TestUpdateIncremental:
         )
 
         # Check manifest
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        manager.journal.flush()  # Entries are written in batches
+        manifest = load_manifest(manifest_path.parent)
 
         assert len(manifest["images"]) == 1
         image = manifest["images"][0]
@@ -181,12 +183,42 @@ class TestUpdateIncremental:
         )
 
         # Check that real seed was extracted
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        manager.journal.flush()  # Entries are written in batches
+        manifest = load_manifest(manifest_path.parent)
 
         image = manifest["images"][0]
         assert image["seed"] == 12345  # Real seed from API, not 42 from prompt_dict
 
+    def test_records_generation_time(
+        self,
+        manager,
+        manifest_path,
+        sample_snapshot,
+        sample_prompt_dict
+    ):
+        """Records API latency when provided (omitted otherwise)."""
+        manager.initialize(sample_snapshot)
+
+        manager.update_incremental(
+            idx=0,
+            filename="image_001.png",
+            prompt_dict=sample_prompt_dict,
+            api_response=None,
+            generation_time=4.56789
+        )
+        manager.update_incremental(
+            idx=1,
+            filename="image_002.png",
+            prompt_dict=sample_prompt_dict,
+            api_response=None
+        )
+
+        manager.journal.flush()  # Entries are written in batches
+        manifest = load_manifest(manifest_path.parent)
+
+        assert manifest["images"][0]["generation_time"] == 4.568
+        assert "generation_time" not in manifest["images"][1]
+
     def test_handles_corrupted_manifest_gracefully(
         self,
         manager,
@@ -194,7 +226,7 @@ class TestUpdateIncremental:
         sample_snapshot,
         sample_prompt_dict
     ):
-        """Recreates manifest if corrupted."""
+        """Recreates manifest if corrupted, keeping journaled images."""
         # Initialize manifest
         manager.initialize(sample_snapshot)
 
@@ -202,7 +234,7 @@ class TestUpdateIncremental:
         with open(manifest_path, 'w', encoding='utf-8') as f:
             f.write("INVALID JSON{{{")
 
-        # Update should recreate manifest
+        # Update only appends to the journal
         manager.update_incremental(
             idx=0,
             filename="image_001.png",
@@ -210,9 +242,10 @@ class TestUpdateIncremental:
             api_response=None
         )
 
-        # Should have valid manifest now
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        # Finalize should recreate manifest
+        manager.finalize(status="aborted")
+        manager.journal.flush()  # Entries are written in batches
+        manifest = load_manifest(manifest_path.parent)
 
         assert "snapshot" in manifest
         assert len(manifest["images"]) == 1
@@ -237,14 +270,86 @@ class TestUpdateIncremental:
             )
 
         # Check manifest
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        manager.journal.flush()  # Entries are written in batches
+        manifest = load_manifest(manifest_path.parent)
 
         assert len(manifest["images"]) == 3
         assert manifest["images"][0]["filename"] == "image_000.png"
         assert manifest["images"][1]["filename"] == "image_001.png"
         assert manifest["images"][2]["filename"] == "image_002.png"
 
+    def test_appends_to_journal_without_rewriting_manifest(
+        self,
+        manager,
+        manifest_path,
+        sample_snapshot,
+        sample_prompt_dict
+    ):
+        """Each update appends one journal line; manifest.json is untouched."""
+        manager.initialize(sample_snapshot)
+        manifest_before = manifest_path.read_bytes()
+
+        for i in range(3):
+            manager.update_incremental(
+                idx=i,
+                filename=f"image_{i:03d}.png",
+                prompt_dict=sample_prompt_dict,
+                api_response=None
+            )
+
+        manager.journal.flush()
+        journal = manifest_path.parent / "images.jsonl"
+        assert manifest_path.read_bytes() == manifest_before
+        assert len(journal.read_text(encoding='utf-8').splitlines()) == 3
+
+    def test_finalize_compacts_journal(
+        self,
+        manager,
+        manifest_path,
+        sample_snapshot,
+        sample_prompt_dict
+    ):
+        """Finalize merges the journal into manifest.json and removes it."""
+        manager.initialize(sample_snapshot)
+        manager.update_incremental(
+            idx=0,
+            filename="image_000.png",
+            prompt_dict=sample_prompt_dict,
+            api_response=None
+        )
+
+        manager.finalize(status="completed")
+
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        assert [image["filename"] for image in manifest["images"]] == ["image_000.png"]
+        assert manifest["status"] == "completed"
+        assert not (manifest_path.parent / "images.jsonl").exists()
+
+    def test_records_image_in_session_index(
+        self,
+        manager,
+        manifest_path,
+        sample_snapshot,
+        sample_prompt_dict
+    ):
+        """Each update adds a row to index.sqlite, with its variations."""
+        manager.initialize(sample_snapshot)
+        manager.update_incremental(
+            idx=5,
+            filename="image_005.png",
+            prompt_dict=sample_prompt_dict,
+            api_response=None
+        )
+        manager.finalize(status="completed")
+
+        with sqlite3.connect(manifest_path.parent / "index.sqlite") as db:
+            columns = dict(db.execute("SELECT name, column_name FROM placeholders"))
+            row = db.execute(
+                f"SELECT idx, filename, seed, {columns['Style']} FROM images"
+            ).fetchone()
+        assert row == (5, "image_005.png", 42, "realistic")
+
     def test_handles_missing_api_response_info(
         self,
         manager,
@@ -266,8 +371,8 @@ class TestUpdateIncremental:
         )
 
         # Should use seed from prompt_dict
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
+        manager.journal.flush()  # Entries are written in batches
+        manifest = load_manifest(manifest_path.parent)
 
         image = manifest["images"][0]
         assert image["seed"] == 42  # Fallback to prompt_dict seed
@@ -26,8 +26,8 @@ def mock_pipeline():
     """Mock V2Pipeline."""
     pipeline = MagicMock()
 
-    # Mock generate() to return sample prompts
-    pipeline.generate.return_value = [
+    # Mock generate_stream() to return sample prompts
+    pipeline.generate_stream.return_value = [
         {
             "prompt": "a person with blonde hair and blue eyes",
             "negative_prompt": "low quality",
@@ -135,8 +135,8 @@ class TestGenerateWithStats:
             resolved_config=mock_resolved_config
         )
 
-        # Should call pipeline.generate()
-        mock_pipeline.generate.assert_called_once_with(mock_resolved_config, mock_context)
+        # Should call pipeline.generate_stream()
+        mock_pipeline.generate_stream.assert_called_once_with(mock_resolved_config, mock_context)
 
         # Should return prompts
         assert len(prompts) == 3
@@ -0,0 +1,182 @@
+"""
+Tests for generation planning (PromptGenerator.plan, estimate_latency).
+
+Plan counts are checked against the lengths of the actual prompt streams.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+
+import pytest
+
+from sd_generator_cli.templating.generators.generator import PromptGenerator
+from sd_generator_cli.templating.generators.planner import (
+    GenerationPlan,
+    LatencyEstimate,
+    SOURCE_GENERATION_TIME,
+    SOURCE_SESSION_DURATION,
+    estimate_latency
+)
+from sd_generator_cli.templating.models.config_models import GenerationConfig, ResolvedContext
+
+
+def _values(prefix, count):
+    return {f"{prefix}{i}": f"{prefix}{i}" for i in range(count)}
+
+
+CONTEXT = ResolvedContext(
+    imports={
+        'Hair': _values('hair', 20),
+        'Outfit': _values('outfit', 4),
+        'Angle': _values('angle', 6),
+        'Quality': _values('quality', 3)
+    },
+    chunks={},
+    parameters={}
+)
+
+
+def _generation(mode='combinatorial', max_images=-1, seed_list=None):
+    return GenerationConfig(mode=mode, seed=1, seed_mode='progressive', max_images=max_images, seed_list=seed_list)
+
+
+class TestGenerationPlan:
+    """Test exact post-selector plans."""
+
+    def setup_method(self):
+        self.generator = PromptGenerator()
+
+    @pytest.mark.parametrize("template", [
+        "{Hair[#0-9]}, {Outfit}",
+        "{Hair[5]}, {Outfit[$2]}, {Angle[$10]}",
+        "{Hair[#0,3,99]}, {Outfit[outfit1,outfit2]}, {Quality[$0]}",
+        "{Hair[#2-4;$5]}, {Angle[#0-1;$1]}",
+        "static prompt",
+    ])
+    @pytest.mark.parametrize("mode", ['combinatorial', 'random'])
+    def test_total_matches_stream_length(self, template, mode):
+        """Planned image total equals the number of prompts generated."""
+        generation = _generation(mode=mode, seed_list=[10, 20, 30])
+
+        plan = self.generator.plan(template, CONTEXT, generation)
+
+        assert plan.total_images == len(self.generator.iter_prompts(template, CONTEXT, generation))
+
+    def test_cardinalities_after_selectors(self):
+        """Selected counts reflect selectors, available counts the import."""
+        plan = self.generator.plan(
+            "{Hair[#0-9]}, {Outfit[outfit0,outfit3]}, {Angle[2]}",
+            CONTEXT,
+            _generation()
+        )
+
+        counts = {p.name: (p.selected, p.available) for p in plan.placeholders}
+        assert counts == {'Hair': (10, 20), 'Outfit': (2, 4), 'Angle': (2, 6)}
+        assert plan.combinations == 40
+
+    def test_loop_order_and_weight_zero(self):
+        """Loops are ordered by weight, weight-0 placeholders do not multiply."""
+        plan = self.generator.plan(
+            "{Angle[$10]}, {Outfit[$2]}, {Quality[$0]}, {Hair[$5]}",
+            CONTEXT,
+            _generation()
+        )
+
+        assert plan.loop_order == ['Outfit', 'Hair', 'Angle']
+        assert [p.name for p in plan.placeholders][-1] == 'Quality'
+        assert not plan.placeholders[-1].looped
+        assert plan.combinations == 4 * 20 * 6
+
+    def test_random_mode_includes_every_placeholder(self):
+        """Random mode draws from the full space, weight 0 included."""
+        plan = self.generator.plan("{Outfit}, {Quality[$0]}", CONTEXT, _generation(mode='random'))
+
+        assert plan.combinations == 12
+        assert all(p.looped for p in plan.placeholders)
+
+    def test_seed_sweep_and_max_images(self):
+        """Seed sweeps multiply the total, max_images caps it."""
+        generation = _generation(seed_list=list(range(20)))
+        assert self.generator.plan("{Outfit}, {Angle}", CONTEXT, generation).total_images == 480
+
+        generation = _generation(max_images=100, seed_list=list(range(20)))
+        assert self.generator.plan("{Outfit}, {Angle}", CONTEXT, generation).total_images == 100
+
+    def test_huge_space_is_not_enumerated(self):
+        """Plans of huge spaces are computed from counts only."""
+        imports = {f"P{i}": _values(f"p{i}_", 50) for i in range(10)}
+        template = ", ".join(f"{{P{i}}}" for i in range(10))
+        context = ResolvedContext(imports=imports, chunks={}, parameters={})
+
+        plan = self.generator.plan(template, context, _generation())
+
+        assert plan.combinations == 50 ** 10
+
+    def test_static_template(self):
+        """No variations = one combination."""
+        plan = GenerationPlan(mode='combinatorial')
+
+        assert plan.total_images == 1
+        assert plan.loop_order == []
+
+
+class TestEstimateLatency:
+    """Test wall-clock estimates from past manifests."""
+
+    def _write_session(self, output_dir, name, images, status='completed', started=None, mtime=None):
+        session_dir = output_dir / name
+        session_dir.mkdir(parents=True)
+        manifest_path = session_dir / "manifest.json"
+        manifest = {
+            "snapshot": {"timestamp": (started or datetime.now()).isoformat()},
+            "images": images,
+            "status": status
+        }
+        manifest_path.write_text(json.dumps(manifest), encoding='utf-8')
+        if mtime is not None:
+            os.utime(manifest_path, (mtime, mtime))
+        return manifest_path
+
+    def test_median_of_recorded_latencies(self, tmp_path):
+        """Recorded generation_time values are used first."""
+        self._write_session(tmp_path, "s1", [{"generation_time": t} for t in (4.0, 5.0, 30.0)])
+        self._write_session(tmp_path, "s2", [{"generation_time": 6.0}])
+
+        estimate = estimate_latency(tmp_path)
+
+        assert estimate.source == SOURCE_GENERATION_TIME
+        assert estimate.samples == 4
+        assert estimate.seconds_per_image == pytest.approx(5.5)
+
+    def test_falls_back_to_session_duration(self, tmp_path):
+        """Completed sessions without latencies give duration / image count."""
+        now = time.time()
+        self._write_session(
+            tmp_path, "s1", [{}] * 10,
+            started=datetime.fromtimestamp(now - 100), mtime=now
+        )
+        self._write_session(tmp_path, "s2", [{}] * 5, status='aborted')
+
+        estimate = estimate_latency(tmp_path)
+
+        assert estimate.source == SOURCE_SESSION_DURATION
+        assert estimate.samples == 1
+        assert estimate.seconds_per_image == pytest.approx(10.0, abs=0.1)
+
+    def test_dry_runs_and_empty_dirs_are_ignored(self, tmp_path):
+        """No measurable session = no estimate."""
+        assert estimate_latency(tmp_path / "missing") is None
+
+        self._write_session(tmp_path / "dryrun", "s1", [{"generation_time": 1.0}])
+        (tmp_path / "broken").mkdir()
+        (tmp_path / "broken" / "manifest.json").write_text("{not json", encoding='utf-8')
+
+        assert estimate_latency(tmp_path) is None
+
+    def test_estimate_seconds(self):
+        """API latencies exclude the delay between images, durations include it."""
+        assert LatencyEstimate(5.0, 1, SOURCE_GENERATION_TIME).estimate_seconds(10, 2.0) == 68.0
+        assert LatencyEstimate(7.0, 1, SOURCE_SESSION_DURATION).estimate_seconds(10, 2.0) == 70.0
+        assert LatencyEstimate(5.0, 1, SOURCE_GENERATION_TIME).estimate_seconds(0) == 0.0
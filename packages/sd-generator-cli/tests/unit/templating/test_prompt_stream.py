@@ -0,0 +1,283 @@
+"""
+Tests for lazy prompt streams (CombinationSpace, IndexPermutation, PromptStream).
+"""
+
+import itertools
+
+import pytest
+
+from sd_generator_cli.templating.generators.generator import PromptGenerator
+from sd_generator_cli.templating.generators.prompt_stream import (
+    CombinationSpace,
+    IndexPermutation,
+    PromptStream,
+    collect_used_variations
+)
+from sd_generator_cli.templating.models.config_models import GenerationConfig, ResolvedContext
+
+
+def _context(**imports):
+    return ResolvedContext(imports=imports, chunks={}, parameters={})
+
+
+def _values(prefix, count):
+    return {f"{prefix}{i}": f"{prefix}{i}" for i in range(count)}
+
+
+class TestCombinationSpace:
+    """Test mixed-radix decoding."""
+
+    def test_decode_matches_itertools_product(self):
+        """Decoding every index reproduces itertools.product order."""
+        lists = [['a1', 'a2'], ['b1', 'b2', 'b3'], ['c1', 'c2']]
+        space = CombinationSpace(['A', 'B', 'C'], lists)
+
+        assert len(space) == 12
+        decoded = [tuple(space.decode(i).values()) for i in range(len(space))]
+        assert decoded == list(itertools.product(*lists))
+
+    def test_empty_space_has_single_combination(self):
+        """No weighted placeholders = one empty combination."""
+        space = CombinationSpace([], [])
+        assert len(space) == 1
+        assert space.decode(0) == {}
+
+    def test_out_of_range_raises(self):
+        """Indexes outside the space raise IndexError."""
+        space = CombinationSpace(['A'], [['a1', 'a2']])
+        with pytest.raises(IndexError):
+            space.digits(2)
+
+    def test_used_digits(self):
+        """used_digits() matches a brute-force scan."""
+        space = CombinationSpace(['A', 'B', 'C'], [['x'] * 3, ['y'] * 4, ['z'] * 5])
+        for start, stop in [(0, 1), (0, 7), (3, 25), (17, 60), (0, 60)]:
+            expected = [[], [], []]
+            for index in range(start, stop):
+                for pos, digit in enumerate(space.digits(index)):
+                    if digit not in expected[pos]:
+                        expected[pos].append(digit)
+            assert space.used_digits(start, stop) == expected
+
+
+class TestPromptStream:
+    """Test lazy generation via PromptGenerator.iter_prompts()."""
+
+    def setup_method(self):
+        self.generator = PromptGenerator()
+
+    def test_huge_space_is_not_materialized(self):
+        """8 placeholders x 30 values: len() and access are immediate."""
+        names = [f"P{i}" for i in range(8)]
+        template = ", ".join(f"{{{name}}}" for name in names)
+        context = _context(**{name: _values(name.lower(), 30) for name in names})
+        generation = GenerationConfig(mode='combinatorial', seed=1, seed_mode='progressive', max_images=-1)
+
+        stream = self.generator.iter_prompts(template, context, generation)
+
+        assert len(stream) == 30 ** 8
+        last = stream[-1]
+        assert last['prompt'] == ", ".join(f"p{i}29" for i in range(8))
+        assert last['seed'] == 1 + 30 ** 8 - 1
+
+    def test_stream_matches_eager_generation(self):
+        """Iterating the stream yields the same prompts as generate_prompts()."""
+        template = "{Outfit[$2]}, {Angle[$10]}"
+        context = _context(Outfit=_values('o', 3), Angle=_values('a', 4))
+        generation = GenerationConfig(mode='combinatorial', seed=10, seed_mode='progressive', max_images=-1)
+
+        stream = self.generator.iter_prompts(template, context, generation)
+        eager = self.generator.generate_prompts(template, context, generation)
+
+        assert list(stream) == eager
+
+    def test_slicing_and_offsets(self):
+        """Slices are lazy streams addressing the same indexes."""
+        template = "{A}, {B}"
+        context = _context(A=_values('a', 10), B=_values('b', 10))
+        generation = GenerationConfig(mode='combinatorial', seed=0, seed_mode='progressive', max_images=-1)
+
+        stream = self.generator.iter_prompts(template, context, generation)
+        window = stream[25:30]
+
+        assert isinstance(window, PromptStream)
+        assert len(window) == 5
+        assert [p['prompt'] for p in window] == ['a2, b5', 'a2, b6', 'a2, b7', 'a2, b8', 'a2, b9']
+        assert window[0]['seed'] == 25
+
+    def test_max_images_limits_length(self):
+        """max_images caps the stream length."""
+        template = "{A}, {B}"
+        context = _context(A=_values('a', 10), B=_values('b', 10))
+        generation = GenerationConfig(mode='combinatorial', seed=0, seed_mode='fixed', max_images=7)
+
+        assert len(self.generator.iter_prompts(template, context, generation)) == 7
+
+    def test_seed_sweep_indexing(self):
+        """Seed-sweep: image index = combination x seed."""
+        template = "{A}"
+        context = _context(A=_values('a', 3))
+        generation = GenerationConfig(mode='combinatorial', seed=0, seed_mode='fixed', max_images=-1)
+        generation.seed_list = [100, 200]
+
+        stream = self.generator.iter_prompts(template, context, generation)
+
+        assert len(stream) == 6
+        assert [(p['prompt'], p['seed']) for p in stream] == [
+            ('a0', 100), ('a0', 200), ('a1', 100), ('a1', 200), ('a2', 100), ('a2', 200)
+        ]
+
+    def test_weight_zero_is_stable_per_index(self):
+        """Weight-0 picks are random but stable when an index is re-read."""
+        template = "{Color[$1]}, {Quality[$0]}"
+        context = _context(Color=_values('c', 5), Quality=_values('q', 4))
+        generation = GenerationConfig(mode='combinatorial', seed=0, seed_mode='fixed', max_images=-1)
+
+        stream = self.generator.iter_prompts(template, context, generation)
+
+        assert len(stream) == 5
+        for index in range(5):
+            assert stream[index] == stream[index]
+            assert stream[index]['variations']['Quality'] in context.imports['Quality'].values()
+
+
+class TestCollectUsedVariations:
+    """Test used-values collection."""
+
+    def test_fast_path_matches_scan(self):
+        """Stream fast path gives the same values as scanning prompts."""
+        template = "{A[$1]}, {B[$2]}, {C[$0]}"
+        context = _context(A=_values('a', 4), B=_values('b', 5), C=_values('c', 3))
+        generation = GenerationConfig(mode='combinatorial', seed=0, seed_mode='fixed', max_images=-1)
+
+        stream = PromptGenerator().iter_prompts(template, context, generation)[3:12]
+
+        assert collect_used_variations(stream) == collect_used_variations(list(stream))
+
+    def test_plain_list(self):
+        """Lists of prompt dicts are scanned."""
+        prompts = [
+            {'variations': {'Hair': 'blonde'}},
+            {'variations': {'Hair': 'red'}},
+            {'variations': {'Hair': 'blonde'}}
+        ]
+        assert collect_used_variations(prompts) == {'Hair': ['blonde', 'red']}
+
+
+class TestIndexPermutation:
+    """Test keyed index permutations."""
+
+    @pytest.mark.parametrize("size", [0, 1, 2, 3, 7, 16, 17, 1000, 4097])
+    def test_is_a_permutation(self, size):
+        """Every position maps to a distinct index in range(size)."""
+        order = IndexPermutation(size, key=1234)
+        assert sorted(order[i] for i in range(size)) == list(range(size))
+
+    def test_keys_give_different_orders(self):
+        """Different keys shuffle differently."""
+        first = [IndexPermutation(100, key=1)[i] for i in range(100)]
+        second = [IndexPermutation(100, key=2)[i] for i in range(100)]
+        assert first != second
+
+    def test_out_of_range_raises(self):
+        """Positions outside the permutation raise IndexError."""
+        with pytest.raises(IndexError):
+            IndexPermutation(5, key=0)[5]
+
+
+class TestRandomStream:
+    """Test random mode via PromptGenerator.iter_prompts()."""
+
+    def setup_method(self):
+        self.generator = PromptGenerator()
+
+    def test_all_combinations_in_random_order(self):
+        """Requesting the full space returns every combination exactly once."""
+        template = "{A}, {B}, {C}"
+        context = _context(A=_values('a', 4), B=_values('b', 5), C=_values('c', 6))
+        generation = GenerationConfig(mode='random', seed=0, seed_mode='progressive', max_images=120)
+
+        prompts = self.generator.generate_prompts(template, context, generation)
+
+        combos = {tuple(p['variations'].values()) for p in prompts}
+        assert len(prompts) == 120
+        assert len(combos) == 120
+        assert [p['seed'] for p in prompts] == list(range(120))
+
+    def test_max_images_beyond_space_is_capped(self):
+        """Asking for more than the space holds returns the whole space."""
+        template = "{A}, {B}"
+        context = _context(A=_values('a', 2), B=_values('b', 2))
+        generation = GenerationConfig(mode='random', seed=0, seed_mode='fixed', max_images=50)
+
+        assert len(self.generator.generate_prompts(template, context, generation)) == 4
+
+    def test_million_combinations_are_addressable(self):
+        """A multi-million space streams without materializing (max_images <= 0 = all)."""
+        names = [f"P{i}" for i in range(5)]
+        template = ", ".join(f"{{{name}}}" for name in names)
+        context = _context(**{name: _values(name.lower(), 20) for name in names})
+        generation = GenerationConfig(mode='random', seed=0, seed_mode='fixed', max_images=-1)
+
+        stream = self.generator.iter_prompts(template, context, generation)
+
+        assert len(stream) == 20 ** 5
+        head = [tuple(p['variations'].values()) for p in stream[:2000]]
+        assert len(set(head)) == 2000
+
+    def test_seed_sweep(self):
+        """Seed-sweep: each unique combination is tested on all seeds."""
+        template = "{A}"
+        context = _context(A=_values('a', 3))
+        generation = GenerationConfig(mode='random', seed=0, seed_mode='fixed', max_images=5)
+        generation.seed_list = [7, 8]
+
+        prompts = self.generator.generate_prompts(template, context, generation)
+
+        assert [p['seed'] for p in prompts] == [7, 8, 7, 8, 7]
+        assert prompts[0]['prompt'] == prompts[1]['prompt']
+        assert len({p['prompt'] for p in prompts}) == 3
+
+    def test_used_variations_fast_path(self):
+        """Random stream fast path gives the same values as scanning prompts."""
+        template = "{A}, {B}"
+        context = _context(A=_values('a', 6), B=_values('b', 7))
+        generation = GenerationConfig(mode='random', seed=0, seed_mode='fixed', max_images=10)
+
+        stream = self.generator.iter_prompts(template, context, generation)
+
+        assert collect_used_variations(stream) == collect_used_variations(list(stream))
+
+
+class TestParallelIteration:
+    """Test process-pool rendering via PromptStream.iter_parallel()."""
+
+    def test_parallel_matches_sequential(self):
+        """Workers render the same prompts, in the same order."""
+        template = "{A[$1]}, {B[$2]}, {C[$0]}"
+        context = _context(A=_values('a', 6), B=_values('b', 7), C=_values('c', 3))
+        generation = GenerationConfig(mode='combinatorial', seed=5, seed_mode='progressive', max_images=-1)
+
+        stream = PromptGenerator().iter_prompts(template, context, generation)
+
+        assert list(stream.iter_parallel(jobs=2, chunk_size=5)) == list(stream)
+
+    def test_random_mode_and_transforms(self):
+        """Random order and map() transforms are preserved."""
+        template = "{A}, {B}"
+        context = _context(A=_values('a', 10), B=_values('b', 10))
+        generation = GenerationConfig(mode='random', seed=0, seed_mode='fixed', max_images=60)
+
+        stream = PromptGenerator().iter_prompts(template, context, generation)
+        tagged = stream[10:].map(lambda prompt: {**prompt, 'negative_prompt': 'lowres'})
+
+        parallel = list(tagged.iter_parallel(jobs=3, chunk_size=7))
+
+        assert parallel == list(tagged)
+        assert len(parallel) == 50
+        assert all(prompt['negative_prompt'] == 'lowres' for prompt in parallel)
+
+    def test_unpicklable_renderer_falls_back(self):
+        """Streams over closures are iterated sequentially."""
+        stream = PromptStream(lambda index: {'prompt': str(index)}, range(20))
+        assert [p['prompt'] for p in stream.iter_parallel(jobs=2, chunk_size=4)] == [str(i) for i in range(20)]
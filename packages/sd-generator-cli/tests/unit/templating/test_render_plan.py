@@ -0,0 +1,145 @@
+"""
+Tests for compiled render plans (TemplateResolver.compile_template).
+
+Every test checks the plan against resolve_template(), which stays the
+reference implementation for Phase-2 placeholder resolution.
+"""
+
+import itertools
+
+import pytest
+
+from sd_generator_cli.templating.generators.generator import PromptGenerator
+from sd_generator_cli.templating.models.config_models import GenerationConfig, ResolvedContext
+from sd_generator_cli.templating.resolvers.render_plan import (
+    RenderPlan,
+    SLOT_PART,
+    SLOT_PLAIN,
+    SLOT_RANDOM,
+    SLOT_SELECTOR
+)
+from sd_generator_cli.templating.resolvers.template_resolver import TemplateResolver
+
+
+IMPORTS = {
+    'Outfit': {
+        'casual': {'main': 'jeans, t-shirt', 'lora': '<lora:casual:0.6>'},
+        'formal': {'main': 'suit', 'lora': '<lora:formal:0.8>'}
+    },
+    'Hair': {'short': 'short hair', 'long': 'long hair', 'bob': 'bob cut'},
+    'Quality': {'hq': 'masterpiece', 'lq': 'sketch'},
+    'Mood': {'happy': {'lora': 'smile'}, 'sad': {'negative': 'tears'}},
+    'Style': {'anime': 'anime style', 'photo': 'photo'}
+}
+
+
+def _reference(resolver, template, chunks, variation_state):
+    """Render with the per-prompt resolver path."""
+    return resolver.resolve_template(
+        template,
+        {'imports': IMPORTS, 'chunks': {**chunks, **variation_state}, 'defaults': {}},
+        skip_chunk_injection=True
+    )
+
+
+def _states(names):
+    """All variation states over the given import names."""
+    value_lists = [list(IMPORTS[name].values()) for name in names]
+    for combo in itertools.product(*value_lists):
+        yield dict(zip(names, combo))
+
+
+class TestCompileTemplate:
+    """Test plan compilation and rendering parity."""
+
+    def setup_method(self):
+        self.resolver = TemplateResolver()
+
+    @pytest.mark.parametrize("template", [
+        "{Outfit}, {Hair[$5]}, {Quality[$0]}",
+        "1girl, {Outfit:lora}, {Outfit}, {Hair}, {Hair}",
+        "{Mood}, {Mood:lora}, {Mood:negative}, ",
+        "{Hair[#0,2]} and {Style}, static {Missing} end",
+        "no placeholders at all",
+        "{Outfit}{Hair}{Quality}",
+        "",
+    ])
+    def test_render_matches_resolve_template(self, template):
+        """Plan output is byte-identical to resolve_template() for every state."""
+        chunks = {'Style': 'watercolor'}
+        dynamic = [name for name in ('Outfit', 'Hair', 'Quality', 'Mood') if '{' + name in template]
+        plan = self.resolver.compile_template(
+            template,
+            {'imports': IMPORTS, 'chunks': chunks, 'defaults': {}},
+            dynamic
+        )
+
+        for state in _states(dynamic):
+            assert plan.render(state) == _reference(self.resolver, template, chunks, state)
+
+    def test_static_placeholders_are_folded(self):
+        """Placeholders outside the variation state become literals."""
+        plan = self.resolver.compile_template(
+            "{Style}, {Hair}, {Removed}.",
+            {'imports': IMPORTS, 'chunks': {'Style': 'oil painting'}, 'defaults': {}},
+            ['Hair']
+        )
+
+        assert plan.literals == ['oil painting, ', ', .']
+        assert plan.names == ['Hair']
+
+    def test_slot_kinds(self):
+        """Slots are typed by syntax and weight."""
+        plan = self.resolver.compile_template(
+            "{Outfit}, {Hair[#0,1;$3]}, {Outfit:lora}, {Quality[$0]}",
+            {'imports': IMPORTS, 'chunks': {}, 'defaults': {}},
+            ['Outfit', 'Hair', 'Quality']
+        )
+
+        assert [slot.kind for slot in plan.slots] == [SLOT_PLAIN, SLOT_SELECTOR, SLOT_PART, SLOT_RANDOM]
+
+    def test_selector_with_part_raises(self):
+        """{Name[sel]:part} is rejected at compile time."""
+        with pytest.raises(ValueError, match="Selectors cannot be combined"):
+            self.resolver.compile_template(
+                "{Outfit[#0]:lora}",
+                {'imports': IMPORTS, 'chunks': {}, 'defaults': {}},
+                ['Outfit']
+            )
+
+    def test_part_of_simple_variation_raises(self):
+        """{Name:part} on a simple value raises at render time."""
+        plan = self.resolver.compile_template(
+            "{Hair:lora}",
+            {'imports': IMPORTS, 'chunks': {}, 'defaults': {}},
+            ['Hair']
+        )
+
+        with pytest.raises(ValueError, match="Cannot access part 'lora'"):
+            plan.render({'Hair': 'short hair'})
+
+    def test_literal_count_is_checked(self):
+        """RenderPlan requires one more literal than slots."""
+        assert RenderPlan(['static'], []).render({}) == 'static'
+        with pytest.raises(ValueError):
+            RenderPlan(['a', 'b'], [])
+
+
+class TestGeneratorUsesPlan:
+    """Generated prompts are unchanged by plan compilation."""
+
+    def test_combinatorial_prompts_match_reference(self):
+        """Every combinatorial prompt equals the normalized reference render."""
+        generator = PromptGenerator()
+        template = "{Outfit[$1]}, {Outfit:lora}, {Hair[$2]}, {Quality[$0]}"
+        context = ResolvedContext(imports=IMPORTS, chunks={'Style': 'ink'}, parameters={})
+        generation = GenerationConfig(mode='combinatorial', seed=1, seed_mode='progressive', max_images=-1)
+
+        prompts = generator.generate_prompts(template, context, generation)
+
+        assert len(prompts) == 6
+        for prompt in prompts:
+            expected = generator.normalizer.normalize_prompt(
+                _reference(generator.resolver, template, context.chunks, prompt['variations'])
+            )
+            assert prompt['prompt'] == expected
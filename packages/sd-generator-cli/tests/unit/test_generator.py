@@ -246,6 +246,31 @@ class TestPromptGenerator:
         combos = [(r['variations']['A'], r['variations']['B']) for r in results]
         assert len(combos) == len(set(combos))
 
+    def test_stream_key_reproduces_sequence(self):
+        """Test that the same stream_key rebuilds the same random sequence."""
+        template = "{Color[4]}, {Size}"
+        context = ResolvedContext(
+            imports={
+                'Color': {str(i): f'color{i}' for i in range(10)},
+                'Size': {'small': 'small', 'medium': 'medium', 'large': 'large'}
+            },
+            chunks={},
+            parameters={}
+        )
+
+        def prompts(stream_key):
+            generation = GenerationConfig(
+                mode='random',
+                seed=42,
+                seed_mode='progressive',
+                max_images=8,
+                stream_key=stream_key
+            )
+            return [r['prompt'] for r in self.generator.generate_prompts(template, context, generation)]
+
+        assert prompts(1234) == prompts(1234)
+        assert prompts(1234) != prompts(5678)
+
     # ===== Seed Management Tests =====
 
     def test_seed_mode_fixed(self):
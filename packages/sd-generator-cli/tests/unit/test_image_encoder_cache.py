@@ -0,0 +1,91 @@
+"""
+Unit tests for EncodedImageCache and ControlNet payload encoding.
+"""
+
+import base64
+import os
+
+import pytest
+
+from sd_generator_cli.api.sdapi_client import SDAPIClient, PromptConfig
+from sd_generator_cli.templating.models.controlnet import ControlNetConfig, ControlNetUnit
+from sd_generator_cli.utils.image_encoder import EncodedImageCache, default_encoded_image_cache
+
+
+def _image(path, content=b"\x89PNG fake image data"):
+    path.write_bytes(content)
+    return path
+
+
+class TestEncodedImageCache:
+    """Tests for the shared encoding cache."""
+
+    def test_repeated_encodes_share_one_string(self, tmp_path):
+        """The file is encoded once and the same string is returned."""
+        cache = EncodedImageCache()
+        path = _image(tmp_path / "pose.png")
+
+        first = cache.encode(path)
+        second = cache.encode(str(path))
+
+        assert first is second
+        assert base64.b64decode(first) == path.read_bytes()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_modified_file_is_reencoded(self, tmp_path):
+        """A new mtime/size is a new cache key."""
+        cache = EncodedImageCache()
+        path = _image(tmp_path / "pose.png")
+        cache.encode(path)
+
+        _image(path, b"\x89PNG another image")
+        os.utime(path, ns=(0, 10**9))
+
+        assert base64.b64decode(cache.encode(path)) == b"\x89PNG another image"
+
+    def test_byte_budget_evicts_least_recently_used(self, tmp_path):
+        """Entries beyond the byte budget are evicted oldest first."""
+        paths = [_image(tmp_path / f"{name}.png", name.encode() * 30) for name in "abc"]
+        cache = EncodedImageCache(max_bytes=100)
+
+        for path in paths:
+            cache.encode(path)
+
+        assert cache.size_bytes <= 100
+        cache.encode(paths[2])
+        assert cache.hits == 1
+        cache.encode(paths[0])
+        assert cache.misses == 4
+
+    def test_missing_file_raises(self, tmp_path):
+        """Missing files raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            EncodedImageCache().encode(tmp_path / "missing.png")
+
+
+class TestControlNetPayloadEncoding:
+    """Tests for ControlNet image encoding in SDAPIClient payloads."""
+
+    def test_payloads_share_encoding_and_units_keep_paths(self, tmp_path):
+        """Encoding happens at payload build time, configs are not mutated."""
+        default_encoded_image_cache().clear()
+        path = _image(tmp_path / "pose.png")
+        config = ControlNetConfig(units=[ControlNetUnit(model="control_openpose", image=str(path))])
+        client = SDAPIClient()
+
+        payloads = [
+            client.get_payload_for_config(PromptConfig(prompt=f"p{i}", parameters={'controlnet': config}))
+            for i in range(3)
+        ]
+
+        images = [payload["alwayson_scripts"]["controlnet"]["args"][0]["image"] for payload in payloads]
+        assert base64.b64decode(images[0]) == path.read_bytes()
+        assert images[0] is images[1] is images[2]
+        assert config.units[0].image == str(path)
+
+    def test_missing_controlnet_image_raises_runtime_error(self, tmp_path):
+        """Missing reference images keep the existing error."""
+        config = ControlNetConfig(units=[ControlNetUnit(model="control_openpose", image=str(tmp_path / "x.png"))])
+
+        with pytest.raises(RuntimeError, match="ControlNet image not found"):
+            SDAPIClient().get_payload_for_config(PromptConfig(prompt="p", parameters={'controlnet': config}))
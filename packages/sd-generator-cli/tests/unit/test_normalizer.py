@@ -9,6 +9,8 @@ Tests the 5 normalization rules from spec section 8.1:
 5. Preserve max 1 blank line
 """
 
+import random
+
 import pytest
 from sd_generator_cli.templating.normalizers.normalizer import PromptNormalizer
 
@@ -186,3 +188,39 @@ class TestPromptNormalizer:
         expected = "1girl, 20 years old, slim build"
         result = self.normalizer.normalize_prompt(input_text)
         assert result == expected
+
+
+class TestSinglePassNormalizer:
+    """Differential tests: single-pass normalizer vs the rule-by-rule passes."""
+
+    FRAGMENTS = ['1girl', 'blue eyes', ',', ', ', ',,', ' , ', ' ', '  ', '\n', '\n\n\n', '\t', '\r\n', '\xa0', '(smile:1.2)']
+
+    def _random_prompts(self, count, seed=0):
+        rng = random.Random(seed)
+        for _ in range(count):
+            yield ''.join(rng.choice(self.FRAGMENTS) for _ in range(rng.randint(0, 12)))
+
+    @pytest.mark.parametrize("cache_size", [4096, 3, 0])
+    def test_matches_rule_passes(self, cache_size):
+        """normalize_prompt() is byte-identical to the reference passes."""
+        normalizer = PromptNormalizer(cache_size=cache_size)
+        reference = PromptNormalizer()
+
+        for prompt in self._random_prompts(5000):
+            assert normalizer.normalize_prompt(prompt) == reference._apply_rules(prompt), repr(prompt)
+
+    def test_single_line_matches_api_conversion(self):
+        """normalize_single_line() = newline conversion + normalization."""
+        normalizer = PromptNormalizer()
+
+        for prompt in self._random_prompts(5000, seed=1):
+            expected = normalizer._apply_rules(prompt.replace('\n', ', ').replace('\r', ''))
+            assert normalizer.normalize_single_line(prompt) == expected, repr(prompt)
+
+    def test_fragment_cache_is_bounded(self):
+        """The fragment memo never grows past cache_size."""
+        normalizer = PromptNormalizer(cache_size=8)
+
+        for prompt in self._random_prompts(2000, seed=2):
+            normalizer.normalize_prompt(prompt)
+            assert len(normalizer._fragments) <= 8
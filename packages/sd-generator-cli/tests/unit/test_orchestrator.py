@@ -408,6 +408,24 @@ class TestV2Pipeline:
         # Should be 1 (static prompt)
         assert total == 1
 
+    def test_calculate_total_combinations_with_selectors_and_weights(self):
+        """Test that selectors and weight 0 are accounted for."""
+        template = "{A[#0-1]}, {B[b1,b3]}, {C[$0]}"
+        context = ResolvedContext(
+            imports={
+                'A': {'a1': 'a1', 'a2': 'a2', 'a3': 'a3'},
+                'B': {'b1': 'b1', 'b2': 'b2', 'b3': 'b3'},
+                'C': {'c1': 'c1', 'c2': 'c2'}  # Weight 0 - random per combination
+            },
+            chunks={},
+            parameters={}
+        )
+
+        total = self.pipeline.calculate_total_combinations(template, context)
+
+        # Should be 2 × 2 = 4 (C excluded)
+        assert total == 4
+
     # ===== Integration Tests =====
 
     def test_end_to_end_mock(self):
@@ -0,0 +1,150 @@
+"""
+Unit tests for ResolutionGraph (memoized import resolution).
+"""
+
+import os
+import time
+
+import pytest
+
+from sd_generator_cli.templating.loaders.parser import ConfigParser
+from sd_generator_cli.templating.loaders.yaml_loader import YamlLoader
+from sd_generator_cli.templating.resolvers.import_resolver import ImportResolver
+from sd_generator_cli.templating.resolvers.resolution_graph import ResolutionGraph, default_resolution_graph
+
+
+def _write(path, text, age_seconds=0):
+    """Write a file, optionally back-dating its mtime (trusted stat)."""
+    path.write_text(text, encoding='utf-8')
+    if age_seconds:
+        past = time.time() - age_seconds
+        os.utime(path, (past, past))
+    return path
+
+
+class TestResolutionGraph:
+    """Tests for nodes, dependencies and the directory index."""
+
+    def test_get_returns_fresh_copies(self, tmp_path):
+        """Hits return a copy that callers may modify."""
+        graph = ResolutionGraph()
+        path = _write(tmp_path / "hair.yaml", "short: short hair\n", 60)
+        graph.put(path, None, {'short': 'short hair'}, [path])
+
+        graph.get(path)['short'] = 'changed'
+
+        assert graph.get(path) == {'short': 'short hair'}
+        assert graph.stats()['hits'] == 2
+
+    def test_key_includes_style(self, tmp_path):
+        """The same file resolved for another style is a miss."""
+        graph = ResolutionGraph()
+        path = _write(tmp_path / "hair.yaml", "short: short hair\n", 60)
+        graph.put(path, "sports", {'short': 'short hair'}, [path])
+
+        assert graph.get(path, "sports") is not None
+        assert graph.get(path, "casual") is None
+        assert graph.get(path) is None
+
+    def test_changed_dependency_drops_only_its_dependents(self, tmp_path):
+        """A changed file invalidates the nodes that loaded it."""
+        graph = ResolutionGraph()
+        hair = _write(tmp_path / "hair.yaml", "short: short hair\n", 60)
+        eyes = _write(tmp_path / "eyes.yaml", "blue: blue eyes\n", 60)
+        graph.put(hair, None, {'short': 'short hair'}, [hair])
+        graph.put(eyes, None, {'blue': 'blue eyes'}, [eyes])
+
+        _write(hair, "long: long hair\n")
+
+        assert graph.get(hair) is None
+        assert graph.get(eyes) == {'blue': 'blue eyes'}
+        assert graph.stats()['invalidations'] == 1
+
+    def test_same_size_rewrite_of_racy_file_is_detected(self, tmp_path):
+        """Files recorded right after a change are confirmed by content hash."""
+        graph = ResolutionGraph()
+        path = _write(tmp_path / "a.yaml", "value: 1\n")
+        graph.put(path, None, {'value': 1}, [path])
+        stat = os.stat(path)
+
+        _write(path, "value: 2\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert graph.get(path) is None
+
+    def test_invalidate(self, tmp_path):
+        """invalidate() drops the dependents of a path."""
+        graph = ResolutionGraph()
+        path = _write(tmp_path / "hair.yaml", "short: short hair\n", 60)
+        graph.put(path, None, {}, [path, tmp_path])
+        graph.put(path, "sports", {}, [path, tmp_path])
+
+        assert graph.invalidate(tmp_path) == 2
+        assert graph.stats()['nodes'] == 0
+
+    def test_variant_index_tracks_directory_changes(self, tmp_path):
+        """New variant files are seen after the directory changes."""
+        graph = ResolutionGraph()
+        variant = tmp_path / "hair.sports.yaml"
+
+        assert graph.variant_exists(variant) is False
+        _write(variant, "short: short hair\n")
+
+        assert graph.variant_exists(variant) is True
+
+    def test_lru_eviction(self, tmp_path):
+        """The least recently used node is evicted first."""
+        graph = ResolutionGraph(max_entries=2)
+        paths = [_write(tmp_path / f"{name}.yaml", f"{name}: x\n", 60) for name in "abc"]
+        for path in paths:
+            graph.put(path, None, {}, [path])
+
+        assert graph.stats()['nodes'] == 2
+        assert graph.get(paths[0]) is None
+
+
+class TestImportResolverGraph:
+    """Tests for ImportResolver graph wiring."""
+
+    @pytest.fixture
+    def resolver(self):
+        return ImportResolver(YamlLoader(), ConfigParser(), graph=ResolutionGraph())
+
+    def test_resolvers_share_the_default_graph(self):
+        """All resolvers use the process-wide graph by default."""
+        assert ImportResolver(YamlLoader(), ConfigParser()).graph is default_resolution_graph()
+
+    def test_repeated_loads_hit_the_graph(self, resolver, tmp_path, monkeypatch):
+        """A file is parsed once across resolves."""
+        _write(tmp_path / "hair.yaml", "short: short hair\n", 60)
+        parsed = []
+        original = resolver._parse_variation_file
+        monkeypatch.setattr(resolver, '_parse_variation_file', lambda *args: parsed.append(args) or original(*args))
+
+        first = resolver._load_variation_file("hair.yaml", tmp_path)
+        second = resolver._load_variation_file("hair.yaml", tmp_path)
+
+        assert first == second == {'short': 'short hair'}
+        assert len(parsed) == 1
+
+    def test_style_variant_resolution(self, resolver, tmp_path, capsys):
+        """Styles use their variant when it exists and fall back otherwise."""
+        _write(tmp_path / "hair.yaml", "short: short hair\n", 60)
+        _write(tmp_path / "hair.sports.yaml", "tied: tied hair\n", 60)
+
+        assert resolver._load_variation_file("hair.yaml", tmp_path, style="sports") == {'tied': 'tied hair'}
+        assert resolver._load_variation_file("hair.yaml", tmp_path, style="casual") == {'short': 'short hair'}
+        assert resolver._load_variation_file("hair.yaml", tmp_path, style="sports") == {'tied': 'tied hair'}
+
+        out = capsys.readouterr().out
+        assert out.count("[RESOLVE]") == 2
+        assert "[FALLBACK]" in out
+
+    def test_new_variant_file_is_picked_up(self, resolver, tmp_path):
+        """Adding a style variant invalidates the styled node."""
+        _write(tmp_path / "hair.yaml", "short: short hair\n", 60)
+        resolver._load_variation_file("hair.yaml", tmp_path, style="sports")
+
+        _write(tmp_path / "hair.sports.yaml", "tied: tied hair\n")
+
+        assert resolver._load_variation_file("hair.yaml", tmp_path, style="sports") == {'tied': 'tied hair'}
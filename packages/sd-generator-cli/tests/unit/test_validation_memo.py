@@ -0,0 +1,107 @@
+"""
+Unit tests for ValidationMemo (memoized schema validation).
+"""
+
+from sd_generator_cli.templating.loaders.validation_memo import (
+    ValidationMemo,
+    ValidationReport,
+    default_validation_memo
+)
+from sd_generator_cli.templating.loaders.yaml_cache import YamlParseCache
+from sd_generator_cli.templating.loaders.yaml_loader import YamlLoader
+from sd_generator_cli.templating.schemas import ChunkFileSchema, VariationsFileSchema
+
+
+VALID = "type: variations\nversion: '2.0'\nname: Hair\nvariations:\n  short: short hair\n"
+INVALID = "type: variations\nversion: '2.0'\nname: Hair\nvariations: not-a-dict\n"
+
+
+class TestValidationMemo:
+    """Tests for memo keys and counters."""
+
+    def test_miss_then_hit(self):
+        """Recorded validations are skipped next time, with time saved."""
+        memo = ValidationMemo()
+
+        assert memo.is_valid("abc", VariationsFileSchema) is False
+        memo.record_valid("abc", VariationsFileSchema, 0.5)
+
+        assert memo.is_valid("abc", VariationsFileSchema) is True
+        assert memo.report() == ValidationReport(validated=1, skipped=1, seconds_spent=0.5, seconds_saved=0.5)
+
+    def test_key_includes_schema(self):
+        """The same content validated against another schema is a miss."""
+        memo = ValidationMemo()
+        memo.record_valid("abc", VariationsFileSchema, 0.1)
+
+        assert memo.is_valid("abc", ChunkFileSchema) is False
+
+    def test_persistent_memo_is_shared_across_instances(self, tmp_path):
+        """A new process (memo instance) reads entries from disk."""
+        ValidationMemo(tmp_path / "validated").record_valid("abc", VariationsFileSchema, 0.25)
+
+        memo = ValidationMemo(tmp_path / "validated")
+
+        assert memo.is_valid("abc", VariationsFileSchema) is True
+        assert memo.report().seconds_saved == 0.25
+
+    def test_report_is_a_snapshot(self):
+        """report() returns a copy, reset_report() keeps entries."""
+        memo = ValidationMemo()
+        memo.record_valid("abc", VariationsFileSchema, 0.1)
+        report = memo.report()
+
+        memo.reset_report()
+
+        assert report.validated == 1
+        assert memo.report().total == 0
+        assert memo.is_valid("abc", VariationsFileSchema) is True
+
+
+class TestYamlLoaderMemo:
+    """Tests for YamlLoader validation fast path."""
+
+    def _loader(self):
+        return YamlLoader(cache=YamlParseCache(), memo=ValidationMemo())
+
+    def test_loaders_share_the_default_memo(self):
+        """All loaders use the process-wide memo by default."""
+        assert YamlLoader().memo is default_validation_memo()
+
+    def test_unchanged_file_is_validated_once(self, tmp_path, monkeypatch):
+        """Repeated loads of a valid file skip validation."""
+        loader = self._loader()
+        (tmp_path / "hair.yaml").write_text(VALID, encoding='utf-8')
+        calls = []
+        original = loader.validate_yaml
+        monkeypatch.setattr(loader, 'validate_yaml', lambda *args: calls.append(args) or original(*args))
+
+        loader.load_file("hair.yaml", tmp_path)
+        loader.load_file("hair.yaml", tmp_path)
+
+        assert len(calls) == 1
+        assert loader.memo.report().skipped == 1
+
+    def test_changed_file_is_validated_again(self, tmp_path):
+        """A content change is a memo miss."""
+        loader = self._loader()
+        path = tmp_path / "hair.yaml"
+        path.write_text(VALID, encoding='utf-8')
+        loader.load_file("hair.yaml", tmp_path)
+
+        path.write_text(VALID.replace("short hair", "long hair"), encoding='utf-8')
+        loader.load_file("hair.yaml", tmp_path)
+
+        assert loader.memo.report().validated == 2
+        assert loader.memo.report().skipped == 0
+
+    def test_invalid_file_warns_on_every_load(self, tmp_path, capsys):
+        """Failed validations are not memoized."""
+        loader = self._loader()
+        (tmp_path / "hair.yaml").write_text(INVALID, encoding='utf-8')
+
+        loader.load_file("hair.yaml", tmp_path)
+        loader.load_file("hair.yaml", tmp_path)
+
+        assert capsys.readouterr().out.count("WARNING") == 2
+        assert loader.memo.report().skipped == 0
@@ -0,0 +1,156 @@
+"""
+Unit tests for YamlParseCache (YAML parse cache used by YamlLoader).
+"""
+
+import os
+import time
+
+import pytest
+import yaml
+
+from sd_generator_cli.templating.loaders.yaml_cache import YamlParseCache, default_parse_cache
+from sd_generator_cli.templating.loaders.yaml_loader import YamlLoader
+
+
+def _write(path, text, age_seconds=0):
+    """Write a file, optionally back-dating its mtime (trusted stat)."""
+    path.write_text(text, encoding='utf-8')
+    if age_seconds:
+        past = time.time() - age_seconds
+        os.utime(path, (past, past))
+    return path
+
+
+class TestInProcessCache:
+    """Tests for the path + mtime/size level."""
+
+    def test_second_load_is_a_hit(self, tmp_path):
+        """Unchanged files are served from memory."""
+        cache = YamlParseCache()
+        path = _write(tmp_path / "hair.yaml", "type: variations\nvariations:\n  short: short hair\n", 60)
+
+        first, digest = cache.load(path)
+        second, digest_again = cache.load(path)
+
+        assert first == second == {'type': 'variations', 'variations': {'short': 'short hair'}}
+        assert digest == digest_again
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_loads_return_fresh_copies(self, tmp_path):
+        """Mutating loaded data does not affect the cache."""
+        cache = YamlParseCache()
+        path = _write(tmp_path / "a.yaml", "items:\n  a: 1\n", 60)
+
+        cache.load(path)[0]['items']['a'] = 99
+
+        assert cache.load(path)[0] == {'items': {'a': 1}}
+
+    def test_changed_content_is_reparsed(self, tmp_path):
+        """Same-size rewrites right after caching are detected by content hash."""
+        cache = YamlParseCache()
+        path = _write(tmp_path / "a.yaml", "value: 1\n")
+        cache.load(path)
+
+        _write(path, "value: 2\n")
+
+        assert cache.load(path)[0] == {'value': 2}
+
+    def test_touched_file_with_same_content_is_a_hit(self, tmp_path):
+        """A new mtime with unchanged content reuses the parsed entry."""
+        cache = YamlParseCache()
+        path = _write(tmp_path / "a.yaml", "value: 1\n", 60)
+        cache.load(path)
+
+        os.utime(path)
+
+        assert cache.load(path)[0] == {'value': 1}
+        assert cache.stats()['misses'] == 1
+
+    def test_lru_eviction_by_entries(self, tmp_path):
+        """The least recently used file is evicted first."""
+        cache = YamlParseCache(max_entries=2)
+        paths = [_write(tmp_path / f"{name}.yaml", f"name: {name}\n", 60) for name in "abc"]
+
+        cache.load(paths[0])
+        cache.load(paths[1])
+        cache.load(paths[0])  # a is now most recent
+        cache.load(paths[2])  # evicts b
+
+        assert cache.stats()['entries'] == 2
+        cache.load(paths[0])
+        cache.load(paths[1])
+        assert cache.stats()['misses'] == 4
+
+    def test_size_cap(self, tmp_path):
+        """Entries above the byte cap are not kept in memory."""
+        cache = YamlParseCache(max_bytes=100)
+        path = _write(tmp_path / "big.yaml", "\n".join(f"key{i}: value {i}" for i in range(50)), 60)
+
+        cache.load(path)
+        cache.load(path)
+
+        assert cache.stats()['entries'] == 0
+        assert cache.stats()['bytes'] == 0
+        assert cache.stats()['misses'] == 2
+
+    def test_yaml_error_names_the_file(self, tmp_path):
+        """Parse errors keep the file name in their message."""
+        cache = YamlParseCache()
+        path = _write(tmp_path / "broken.yaml", "key: [unclosed\n")
+
+        with pytest.raises(yaml.YAMLError, match="broken.yaml"):
+            cache.load(path)
+
+
+class TestDiskCache:
+    """Tests for the content-hash level."""
+
+    def test_disk_cache_is_shared_across_instances(self, tmp_path):
+        """A new process (cache instance) reads parsed files from disk."""
+        cache_dir = tmp_path / "cache"
+        path = _write(tmp_path / "a.yaml", "value: 1\n")
+
+        YamlParseCache(cache_dir=cache_dir).load(path)
+        cache = YamlParseCache(cache_dir=cache_dir)
+        data, _ = cache.load(path)
+
+        assert data == {'value': 1}
+        assert cache.stats()['disk_hits'] == 1
+        assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    def test_disk_cache_is_content_addressed(self, tmp_path):
+        """Identical content at another path hits the same disk entry."""
+        cache = YamlParseCache(cache_dir=tmp_path / "cache")
+        cache.load(_write(tmp_path / "a.yaml", "value: 1\n"))
+
+        cache.load(_write(tmp_path / "copy.yaml", "value: 1\n"))
+
+        assert cache.stats()['disk_hits'] == 1
+
+    def test_unwritable_cache_dir_is_ignored(self, tmp_path):
+        """Disk cache failures never fail a load."""
+        blocker = _write(tmp_path / "not_a_dir", "x")
+        cache = YamlParseCache(cache_dir=blocker / "cache")
+
+        assert cache.load(_write(tmp_path / "a.yaml", "value: 1\n"))[0] == {'value': 1}
+
+
+class TestYamlLoaderCache:
+    """Tests for YamlLoader cache wiring."""
+
+    def test_loaders_share_the_default_cache(self):
+        """All loaders use the process-wide cache by default."""
+        assert YamlLoader().cache is default_parse_cache()
+        assert YamlLoader().cache is YamlLoader().cache
+
+    def test_loader_uses_injected_cache(self, tmp_path):
+        """Repeated load_file() calls hit the cache."""
+        cache = YamlParseCache()
+        loader = YamlLoader(cache=cache)
+        _write(tmp_path / "a.yaml", "type: chunk\nversion: '2.0'\ntemplate: test\n", 60)
+
+        loader.load_file("a.yaml", tmp_path, validate=False)
+        loader.load_file("a.yaml", tmp_path, validate=False)
+
+        assert cache.stats()['hits'] == 1
@@ -2,9 +2,10 @@
 Shared data models.
 """
 
-from sd_generator_common.models.manifest import ManifestModel, SessionStatus
+from sd_generator_common.models.manifest import InternedManifestModel, ManifestModel, SessionStatus
 
 __all__ = [
+    "InternedManifestModel",
     "ManifestModel",
     "SessionStatus",
 ]
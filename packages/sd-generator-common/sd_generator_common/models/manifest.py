@@ -6,11 +6,30 @@ It contains:
 - Generation configuration (snapshot)
 - Generated images list
 - Session status (FSM: ongoing → completed/aborted)
+
+While a session runs, images are appended to images.jsonl (one JSON entry
+per line) instead of rewriting manifest.json; the journal is merged into
+manifest.json when the session ends, in the compact interned schema
+(see InternedManifestModel).
+
+The interned codec (intern_manifest(), image_expander(), expand_manifest())
+works on parsed JSON dicts; the CLI writes manifests and the webui streams
+them through it.
 """
 
+import json
+import re
 from enum import Enum
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Final, Iterator, List, Literal, Optional, Sequence
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+MANIFEST_FILENAME = "manifest.json"
+IMAGES_JOURNAL_FILENAME = "images.jsonl"
+INTERNED_FORMAT: Final = "interned-v1"
+_PLACEHOLDER_REF = re.compile(r"\{([^{}]+)\}")  # {Placeholder} references in templates
 
 
 class SessionStatus(str, Enum):
@@ -35,6 +54,8 @@ class ImageEntry(BaseModel):
     prompt: str
     negative_prompt: str
     applied_variations: Dict[str, str] = Field(default_factory=dict)
+    generation_time: Optional[float] = None  # API latency in seconds
+    format: Optional[str] = None  # Re-encoded output format (None = API PNG)
 
 
 class VariationInfo(BaseModel):
@@ -137,6 +158,34 @@ class ManifestModel(BaseModel):
         description="Actual number of images generated (len(images))",
     )
 
+    @classmethod
+    def load(cls, session_dir: Path) -> "ManifestModel":
+        """
+        Load the manifest of a session, images journal included.
+
+        Interned manifests are expanded to the full schema.
+
+        Raises:
+            FileNotFoundError: If the session has no manifest.json
+        """
+        data = expand_manifest(json.loads((session_dir / MANIFEST_FILENAME).read_text(encoding="utf-8")))
+        images = data.setdefault("images", [])
+        known = {image.get("filename") for image in images}
+
+        journal_path = session_dir / IMAGES_JOURNAL_FILENAME
+        if journal_path.exists():
+            for line in journal_path.read_text(encoding="utf-8").splitlines():
+                try:
+                    image = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Blank or torn last line
+                if image.get("filename") not in known:
+                    images.append(image)
+
+        manifest = cls(**data)
+        manifest.update_image_counts()
+        return manifest
+
     def update_image_counts(self) -> None:
         """Update images_requested and images_actual from snapshot and images list."""
         self.images_requested = self.snapshot.generation_params.max_images
@@ -146,3 +195,289 @@ class ManifestModel(BaseModel):
         """Pydantic config."""
 
         use_enum_values = True  # Serialize enums as strings
+
+
+class ManifestTables(BaseModel):
+    """Shared string tables of an interned manifest."""
+
+    prompt_template: Optional[str] = None  # Normalized template prompts are rebuilt from
+    placeholders: List[str] = Field(default_factory=list)  # Order of InternedImageEntry.v
+    extra_values: Dict[str, List[str]] = Field(default_factory=dict)  # Values missing from snapshot "available"
+    negative_prompts: List[str] = Field(default_factory=lambda: [""])
+
+
+class InternedImageEntry(BaseModel):
+    """Image entry of an interned manifest (strings replaced by indices)."""
+
+    filename: str
+    seed: int
+    v: Optional[List[Optional[int]]] = None  # Value index per tables.placeholders (None = not applied)
+    n: int = 0  # Index in tables.negative_prompts
+    prompt: Optional[str] = None  # Only when the template does not rebuild it
+    generation_time: Optional[float] = None
+    format: Optional[str] = None
+
+
+class InternedManifestModel(BaseModel):
+    """
+    Compact manifest schema (format "interned-v1").
+
+    Each full image entry repeats its resolved prompt, negative prompt and
+    variation values, so manifests grow with prompt length x images. In
+    the interned schema, images reference:
+    - variation values by index: into snapshot.variations[P].available,
+      then tables.extra_values[P]
+    - the negative prompt by id, in tables.negative_prompts
+
+    Prompts are rebuilt lazily from tables.prompt_template, the normalized
+    snapshot.resolved_template (image(), iter_images()); images whose
+    prompt cannot be rebuilt keep it.
+
+    Written by the CLI when a session ends (and by the migration tool,
+    tools/migrate_manifests_interned.py).
+    """
+
+    format: Literal["interned-v1"] = INTERNED_FORMAT
+    snapshot: SnapshotModel
+    tables: ManifestTables = Field(default_factory=ManifestTables)
+    images: List[InternedImageEntry] = Field(default_factory=list)
+    status: SessionStatus = SessionStatus.ONGOING
+    _expand: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = PrivateAttr(default=None)
+
+    def image(self, index: int) -> ImageEntry:
+        """Rebuild the full entry of one image (prompt reconstructed on access)."""
+        if self._expand is None:
+            self._expand = image_expander(self.model_dump(include={"snapshot", "tables"}))
+        return ImageEntry(**self._expand(self.images[index].model_dump(exclude_none=True)))
+
+    def iter_images(self) -> Iterator[ImageEntry]:
+        """Rebuild full image entries one at a time."""
+        for index in range(len(self.images)):
+            yield self.image(index)
+
+    def to_manifest(self) -> ManifestModel:
+        """Convert to the full manifest schema."""
+        manifest = ManifestModel(snapshot=self.snapshot, images=list(self.iter_images()), status=self.status)
+        manifest.update_image_counts()
+        return manifest
+
+    class Config:
+        """Pydantic config."""
+
+        use_enum_values = True  # Serialize enums as strings
+
+
+# ========== Interned schema codec (parsed JSON dicts) ==========
+
+
+@lru_cache(maxsize=32)
+def _template_parts(template: str) -> List[str]:
+    """Template split on {references}: odd items are placeholder names."""
+    return _PLACEHOLDER_REF.split(template)
+
+
+def render_prompt(template: str, variations: Dict[str, Any]) -> str:
+    """
+    Rebuild a prompt from the session template and the image's variations.
+
+    Only plain ``{Placeholder}`` references are substituted: images whose
+    prompt differs (selectors, chunks, values changed by normalization)
+    keep it verbatim in the interned format.
+    """
+    parts = list(_template_parts(template))
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        parts[i] = str(variations[name]) if name in variations else "{" + name + "}"
+    return "".join(parts)
+
+
+def _available_values(snapshot: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """snapshot.variations[*].available, by placeholder."""
+    return {
+        name: info.get("available") or []
+        for name, info in (snapshot.get("variations") or {}).items()
+        if isinstance(info, dict)
+    }
+
+
+def _best_template(candidates: Sequence[str], images: List[Dict[str, Any]]) -> str:
+    """Candidate template whose plain substitution rebuilds the most prompts."""
+    best, best_count = candidates[0], -1
+    for candidate in candidates:
+        count = sum(
+            render_prompt(candidate, image.get("applied_variations") or {}) == image.get("prompt", "")
+            for image in images
+        )
+        if count > best_count:
+            best, best_count = candidate, count
+        if count == len(images):
+            break
+    return best
+
+
+def intern_manifest(manifest: Dict[str, Any], template_candidates: Sequence[str] = ()) -> Dict[str, Any]:
+    """
+    Convert a manifest to the interned format.
+
+    Image entries reference their variation values by index (into
+    ``snapshot.variations[P].available``, then ``tables.extra_values[P]``)
+    and their negative prompt by id (``tables.negative_prompts``). The
+    prompt is omitted when render_prompt() with ``tables.prompt_template``
+    rebuilds it exactly. Other image fields (generation_time, format, ...)
+    are kept as-is.
+
+    Args:
+        manifest: Manifest in the full format (returned as-is if already interned)
+        template_candidates: Forms of snapshot.resolved_template.prompt to
+            try first (e.g. normalized like the recorded prompts); the form
+            rebuilding the most prompts becomes tables.prompt_template
+
+    Returns:
+        New manifest dict, ``format`` = INTERNED_FORMAT
+    """
+    if manifest.get("format") == INTERNED_FORMAT:
+        return manifest
+
+    snapshot = manifest.get("snapshot") or {}
+    template = (snapshot.get("resolved_template") or {}).get("prompt")
+    if template is not None:
+        candidates = list(dict.fromkeys([*template_candidates, template]))
+        template = _best_template(candidates, manifest.get("images", []))
+    available = _available_values(snapshot)
+
+    placeholders: List[str] = []
+    positions: Dict[str, int] = {}
+    value_ids: Dict[str, Dict[Any, int]] = {}
+    extra_values: Dict[str, List[Any]] = {}
+    negative_prompts: List[str] = []
+    negative_ids: Dict[str, int] = {}
+
+    def value_id(name: str, value: Any) -> int:
+        ids = value_ids.get(name)
+        if ids is None:
+            ids = value_ids[name] = {}
+            for i, known in enumerate(available.get(name, [])):
+                if isinstance(known, str):
+                    ids.setdefault(known, i)
+        if isinstance(value, str) and value in ids:
+            return ids[value]
+        extras = extra_values.setdefault(name, [])
+        extras.append(value)
+        new_id = len(available.get(name, [])) + len(extras) - 1
+        if isinstance(value, str):
+            ids[value] = new_id
+        return new_id
+
+    images = []
+    for image in manifest.get("images", []):
+        entry = {key: value for key, value in image.items()
+                 if key not in ("prompt", "negative_prompt", "applied_variations")}
+
+        variations = image.get("applied_variations") or {}
+        ids: List[Optional[int]] = [None] * len(placeholders)
+        for name, value in variations.items():
+            if name not in positions:
+                positions[name] = len(placeholders)
+                placeholders.append(name)
+                ids.append(None)
+            ids[positions[name]] = value_id(name, value)
+        if variations:
+            entry["v"] = ids
+
+        negative = image.get("negative_prompt", "")
+        if negative not in negative_ids:
+            negative_ids[negative] = len(negative_prompts)
+            negative_prompts.append(negative)
+        entry["n"] = negative_ids[negative]
+
+        prompt = image.get("prompt", "")
+        if template is None or render_prompt(template, variations) != prompt:
+            entry["prompt"] = prompt
+        images.append(entry)
+
+    interned: Dict[str, Any] = {"format": INTERNED_FORMAT}
+    interned.update((key, value) for key, value in manifest.items() if key != "images")
+    interned["tables"] = {
+        "prompt_template": template,
+        "placeholders": placeholders,
+        "extra_values": extra_values,
+        "negative_prompts": negative_prompts,
+    }
+    interned["images"] = images
+    return interned
+
+
+def image_expander(manifest: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build the function rebuilding full image entries of an interned manifest.
+
+    The lookup tables are built once, so entries can be expanded one at a
+    time (streaming) as cheaply as in bulk.
+
+    Args:
+        manifest: Interned manifest (at least "snapshot" and "tables")
+
+    Returns:
+        Function mapping an interned image entry to a full entry
+    """
+    snapshot = manifest.get("snapshot") or {}
+    tables = manifest.get("tables") or {}
+    template = tables.get("prompt_template")
+    if template is None:
+        # Written before prompt_template was recorded
+        template = (snapshot.get("resolved_template") or {}).get("prompt", "")
+    placeholders = tables.get("placeholders", [])
+    negative_prompts = tables.get("negative_prompts", [""])
+    extra_values = tables.get("extra_values") or {}
+    available = _available_values(snapshot)
+    # Value table of each position in "v"
+    value_tables = [available.get(name, []) + extra_values.get(name, []) for name in placeholders]
+
+    def expand(entry: Dict[str, Any]) -> Dict[str, Any]:
+        variations = {}
+        for name, values, value_id in zip(placeholders, value_tables, entry.get("v") or []):
+            if value_id is not None:
+                variations[name] = values[value_id]
+
+        image = {"filename": entry.get("filename"), "seed": entry.get("seed")}
+        image["prompt"] = entry["prompt"] if "prompt" in entry else render_prompt(template, variations)
+        image["negative_prompt"] = negative_prompts[entry.get("n", 0)]
+        image["applied_variations"] = variations
+        for key, value in entry.items():
+            if key not in ("v", "n", "prompt") and key not in image:
+                image[key] = value
+        return image
+
+    return expand
+
+
+def expand_image(entry: Dict[str, Any], manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuild one image entry of an interned manifest (lazy access).
+
+    Args:
+        entry: Interned image entry
+        manifest: Interned manifest the entry belongs to
+
+    Returns:
+        Image entry in the full format
+    """
+    return image_expander(manifest)(entry)
+
+
+def expand_manifest(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert an interned manifest back to the full format.
+
+    Args:
+        manifest: Manifest in either format (full manifests are returned as-is)
+
+    Returns:
+        Manifest dict with full image entries
+    """
+    if manifest.get("format") != INTERNED_FORMAT:
+        return manifest
+    expand = image_expander(manifest)
+    expanded = {key: value for key, value in manifest.items() if key not in ("format", "tables", "images")}
+    expanded["images"] = [expand(entry) for entry in manifest.get("images", [])]
+    return expanded
@@ -8,17 +8,22 @@ import asyncio
 import json
 import logging
 import sqlite3
+import threading
 from datetime import datetime
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Set, Optional, List, Dict, Any
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileCreatedEvent, DirCreatedEvent, FileModifiedEvent
+from watchdog.events import FileSystemEventHandler, FileCreatedEvent, DirCreatedEvent, FileModifiedEvent, FileMovedEvent
 from sd_generator_watchdog.observer_factory import get_observer_class
 
 
 logger = logging.getLogger(__name__)
 
+# Minimum delay (seconds) between two imports triggered by images.jsonl appends
+# (the CLI flushes the journal about every second; each import re-reads the session)
+JOURNAL_IMPORT_INTERVAL = 10.0
+
 
 # Import SessionStatsService from webui package
 # Note: watchdog depends on webui for this service
@@ -73,6 +78,8 @@ class SessionSyncService:
         self.session_observers: Dict[str, "Observer"] = {}  # type: ignore[valid-type]
         self._stop_event = asyncio.Event()
         self._sessions_in_db: Set[str] = set()
+        self._journal_imports: Dict[str, threading.Timer] = {}
+        self._journal_lock = threading.Lock()
 
     def _session_exists_in_db(self, session_name: str) -> bool:
         """Check if a session exists in database (single query)."""
@@ -130,6 +137,37 @@ class SessionSyncService:
             logger.error(f"Error importing {session_name}: {e}", exc_info=True)
             return False
 
+    def _schedule_journal_import(self, session_path: Path) -> None:
+        """
+        Import a session shortly after its images journal grew.
+
+        Appends arriving while an import is scheduled are covered by it, so a
+        running session is re-imported at most once per JOURNAL_IMPORT_INTERVAL.
+        """
+        session_name = session_path.name
+
+        with self._journal_lock:
+            if session_name in self._journal_imports:
+                return
+
+            timer = threading.Timer(JOURNAL_IMPORT_INTERVAL, self._run_journal_import, args=(session_path,))
+            timer.daemon = True
+            self._journal_imports[session_name] = timer
+            timer.start()
+
+    def _run_journal_import(self, session_path: Path) -> None:
+        """Run a scheduled journal import (timer thread)."""
+        with self._journal_lock:
+            self._journal_imports.pop(session_path.name, None)
+        self._import_session(session_path)
+
+    def _cancel_journal_import(self, session_name: str) -> None:
+        """Drop a scheduled journal import (the session is no longer watched)."""
+        with self._journal_lock:
+            timer = self._journal_imports.pop(session_name, None)
+        if timer is not None:
+            timer.cancel()
+
     def _start_watching_session(self, session_path: Path) -> None:
         """Start watching a specific session for manifest updates."""
         session_name = session_path.name
@@ -154,6 +192,8 @@ class SessionSyncService:
 
     def _stop_watching_session(self, session_name: str) -> None:
         """Stop watching a specific session."""
+        self._cancel_journal_import(session_name)
+
         observer = self.session_observers.get(session_name)
         if observer is None:
             return
@@ -339,6 +379,10 @@ class SessionDirectoryHandler(FileSystemEventHandler):
     Triggers import when:
     - New directory created (potential new session)
     - manifest.json created in a directory
+
+    Re-computes stats when manifest.json is rewritten (modified, or moved
+    into place by an atomic write) or images.jsonl gets new images (at most
+    once per JOURNAL_IMPORT_INTERVAL).
     """
 
     def __init__(self, sync_service: SessionSyncService):
@@ -384,36 +428,53 @@ class SessionDirectoryHandler(FileSystemEventHandler):
 
     def on_modified(self, event):
         """Handle modification events."""
-        if isinstance(event, FileModifiedEvent) and event.src_path.endswith("manifest.json"):
-            # manifest.json modified - update session stats
+        if not isinstance(event, FileModifiedEvent):
+            return
+
+        if event.src_path.endswith("manifest.json"):
+            self._on_manifest_changed(Path(event.src_path))
+
+        elif event.src_path.endswith("images.jsonl"):
+            # Images appended to the journal of a running session
             session_path = Path(event.src_path).parent
-            session_name = session_path.name
+            if session_path.name in self.sync_service._sessions_in_db:
+                self.sync_service._schedule_journal_import(session_path)
+
+    def on_moved(self, event):
+        """Handle move events (manifest.json is replaced atomically by the CLI)."""
+        if isinstance(event, FileMovedEvent) and event.dest_path.endswith("manifest.json"):
+            self._on_manifest_changed(Path(event.dest_path))
+
+    def _on_manifest_changed(self, manifest_file: Path):
+        """Re-compute stats of a session whose manifest.json was rewritten."""
+        # manifest.json modified - update session stats
+        session_path = manifest_file.parent
+        session_name = session_path.name
 
-            # Only update if session already in DB
-            if session_name in self.sync_service._sessions_in_db:
-                logger.info(f"📝 Manifest updated for: {session_name}, re-computing stats")
-                self.sync_service._import_session(session_path)
+        # Only update if session already in DB
+        if session_name in self.sync_service._sessions_in_db:
+            logger.info(f"📝 Manifest updated for: {session_name}, re-computing stats")
+            self.sync_service._import_session(session_path)
 
-                # Check if session is completed or aborted
-                manifest_file = Path(event.src_path)
-                try:
-                    with open(manifest_file, 'r') as f:
-                        manifest = json.load(f)
-                        status = manifest.get("status", "in_progress")
+            # Check if session is completed or aborted
+            try:
+                with open(manifest_file, 'r') as f:
+                    manifest = json.load(f)
+                    status = manifest.get("status", "in_progress")
 
-                        if status in ("completed", "aborted"):
-                            # Session finished - stop watching
-                            logger.info(f"✅ Session {status}: {session_name}")
-                            self.sync_service._stop_watching_session(session_name)
-                except Exception as e:
-                    logger.warning(f"Failed to read manifest status for {session_name}: {e}")
+                    if status in ("completed", "aborted"):
+                        # Session finished - stop watching
+                        logger.info(f"✅ Session {status}: {session_name}")
+                        self.sync_service._stop_watching_session(session_name)
+            except Exception as e:
+                logger.warning(f"Failed to read manifest status for {session_name}: {e}")
 
-            else:
-                # Not in DB yet - treat as new session
-                logger.info(f"📄 Manifest detected for new session: {session_name}")
-                self.sync_service._import_session(session_path)
-                # Start watching this new session
-                self.sync_service._start_watching_session(session_path)
+        else:
+            # Not in DB yet - treat as new session
+            logger.info(f"📄 Manifest detected for new session: {session_name}")
+            self.sync_service._import_session(session_path)
+            # Start watching this new session
+            self.sync_service._start_watching_session(session_path)
 
     async def _delayed_import(self, session_path: Path):
         """
@@ -6,17 +6,24 @@ Approche progressive pour gérer 12k+ images efficacement.
 """
 
 from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
+import json
 import re
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from sd_generator_webui.auth import AuthService
 from sd_generator_webui.config import IMAGES_DIR
 from sd_generator_webui.services.session_metadata import SessionMetadataService
 from sd_generator_webui.services.session_stats import SessionStatsService
+from sd_generator_webui.repositories.session_index_repository import (
+    SessionIndexRepository,
+    SQLiteSessionIndexRepository
+)
 from sd_generator_webui.storage.session_storage import SessionStorage, LocalSessionStorage
 from sd_generator_webui.storage.local_storage import LocalStorage
 from sd_generator_webui.models import (
@@ -24,6 +31,8 @@ from sd_generator_webui.models import (
     SessionMetadataUpdate,
     SessionStatsResponse,
     GlobalStatsResponse,
+    IndexedImagesResponse,
+    PlaceholderValuesResponse,
 )
 
 
@@ -87,6 +96,7 @@ router = APIRouter(prefix="/api/sessions", tags=["sessions"])
 _metadata_service: Optional[SessionMetadataService] = None
 _stats_service: Optional[SessionStatsService] = None
 _storage: Optional[SessionStorage] = None
+_index_repository: Optional[SessionIndexRepository] = None
 
 
 def get_storage() -> SessionStorage:
@@ -114,6 +124,14 @@ def get_stats_service() -> SessionStatsService:
     return _stats_service
 
 
+def get_index_repository() -> SessionIndexRepository:
+    """Get or create the session index repository instance."""
+    global _index_repository
+    if _index_repository is None:
+        _index_repository = SQLiteSessionIndexRepository()
+    return _index_repository
+
+
 @router.get("/", response_model=SessionListResponse)
 async def list_sessions(
     page: int = 1,
@@ -314,11 +332,29 @@ async def get_session_metadata(
 @router.get("/{session_name}/manifest")
 async def get_session_manifest(
     session_name: str,
+    offset: Optional[int] = Query(None, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    fields: Optional[str] = None,
     user_guid: str = Depends(AuthService.validate_guid)
 ):
     """
     Get manifest.json for a specific session.
 
+    Without parameters, returns the whole manifest (images included).
+    With offset, limit or fields, streams one page of image entries,
+    decoded from manifest.json / images.jsonl as they are sent:
+
+        {"session": ..., "offset": 0, "limit": 100, "images": [...], "next_offset": 100}
+
+    next_offset is null on the last page. The snapshot is served
+    separately (GET /{session_name}/manifest/snapshot).
+
+    Args:
+        session_name: Nom de la session
+        offset: Number of image entries to skip (default: 0)
+        limit: Page size (default: 100, max 1000)
+        fields: Comma-separated image fields to return (e.g. "filename,seed,applied_variations")
+
     Returns 404 if session doesn't exist or has no manifest.
     """
     storage = get_storage()
@@ -327,13 +363,194 @@ async def get_session_manifest(
     if not storage.session_exists(session_path):
         raise HTTPException(status_code=404, detail="Session non trouvée")
 
-    # Read manifest via storage
-    manifest_data = storage.read_manifest(session_path)
+    if offset is None and limit is None and fields is None:
+        # Read manifest via storage
+        manifest_data = storage.read_manifest(session_path)
 
-    if manifest_data is None:
+        if manifest_data is None:
+            raise HTTPException(status_code=404, detail="Manifest non trouvé")
+
+        return manifest_data
+
+    if storage.manifest_version(session_path) is None:
         raise HTTPException(status_code=404, detail="Manifest non trouvé")
 
-    return manifest_data
+    field_names = None
+    if fields is not None:
+        field_names = [name.strip() for name in fields.split(",") if name.strip()]
+        if not field_names:
+            raise HTTPException(status_code=400, detail="fields ne peut pas être vide")
+
+    offset = offset or 0
+    limit = limit or 100
+
+    # Fetch one entry ahead: reveals invalid manifests before the response starts,
+    # and whether a next page exists
+    images = storage.iter_manifest_images(session_path, offset=offset)
+    try:
+        first = list(islice(images, 1))
+    except ValueError:
+        raise HTTPException(status_code=500, detail="Manifest invalide")
+
+    return StreamingResponse(
+        _stream_manifest_page(session_name, chain(first, images), offset, limit, field_names),
+        media_type="application/json"
+    )
+
+
+def _stream_manifest_page(
+    session_name: str,
+    images: Iterator[Dict],
+    offset: int,
+    limit: int,
+    field_names: Optional[List[str]]
+) -> Iterator[str]:
+    """JSON page of image entries, written one entry at a time."""
+    yield f'{{"session": {json.dumps(session_name)}, "offset": {offset}, "limit": {limit}, "images": ['
+
+    count = 0
+    next_offset = None
+    try:
+        for image in images:
+            if count == limit:
+                next_offset = offset + limit
+                break
+            if field_names is not None:
+                image = {name: image[name] for name in field_names if name in image}
+            yield ("," if count else "") + json.dumps(image, ensure_ascii=False)
+            count += 1
+    except ValueError as e:
+        # Response already started: end the page, the client sees next_offset null
+        print(f"Warning: Manifest of {session_name} became unreadable while streaming: {e}")
+
+    yield f'], "next_offset": {json.dumps(next_offset)}}}'
+
+
+@router.get("/{session_name}/manifest/snapshot")
+async def get_session_manifest_snapshot(
+    session_name: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    user_guid: str = Depends(AuthService.validate_guid)
+):
+    """
+    Get the manifest of a session without its images (snapshot, status).
+
+    Cacheable: the ETag follows manifest.json (it changes when the session
+    is compacted or resumed, not when images are appended to the journal).
+    Requests with a matching If-None-Match get 304 without reading the file.
+
+    Returns 404 if session doesn't exist or has no manifest.
+    """
+    storage = get_storage()
+    session_path = IMAGES_DIR / session_name
+
+    if not storage.session_exists(session_path):
+        raise HTTPException(status_code=404, detail="Session non trouvée")
+
+    version = storage.manifest_version(session_path)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Manifest non trouvé")
+
+    etag = f'"{version}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match is not None and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    head = storage.read_manifest_head(session_path)
+    if head is None:
+        raise HTTPException(status_code=404, detail="Manifest non trouvé")
+
+    response.headers.update(headers)
+    return head
+
+
+def _get_indexed_session_path(session_name: str) -> Path:
+    """Session directory with an image index, or 404."""
+    storage = get_storage()
+    session_path = IMAGES_DIR / session_name
+
+    if not storage.session_exists(session_path):
+        raise HTTPException(status_code=404, detail="Session non trouvée")
+
+    if not get_index_repository().has_index(session_path):
+        raise HTTPException(status_code=404, detail="Index non trouvé (session générée sans index.sqlite)")
+
+    return session_path
+
+
+@router.get("/{session_name}/index/images", response_model=IndexedImagesResponse)
+async def query_indexed_images(
+    session_name: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    seed_min: Optional[int] = None,
+    seed_max: Optional[int] = None,
+    var: List[str] = Query(default=[]),
+    user_guid: str = Depends(AuthService.validate_guid)
+):
+    """
+    Query the images of a session through its index (index.sqlite).
+
+    Args:
+        session_name: Nom de la session
+        offset: Number of matching images to skip
+        limit: Page size (max 1000)
+        seed_min: Minimum seed (inclusive)
+        seed_max: Maximum seed (inclusive)
+        var: Placeholder filters, "Placeholder=value" (repeatable, all must match)
+
+    Example:
+        GET /sessions/{name}/index/images?var=Outfit=red dress&seed_min=100&limit=50
+
+    Does not load manifest.json: usable on sessions with tens of thousands of images.
+    """
+    session_path = _get_indexed_session_path(session_name)
+
+    filters = {}
+    for item in var:
+        name, sep, value = item.partition("=")
+        if not sep:
+            raise HTTPException(status_code=400, detail=f"Filtre invalide (attendu Placeholder=valeur): {item}")
+        filters[name] = value
+
+    try:
+        images, total_count = get_index_repository().query_images(
+            session_path, filters=filters, seed_min=seed_min, seed_max=seed_max, offset=offset, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return IndexedImagesResponse(
+        session=session_name,
+        images=images,
+        total_count=total_count,
+        offset=offset,
+        limit=limit
+    )
+
+
+@router.get("/{session_name}/index/placeholders", response_model=PlaceholderValuesResponse)
+async def get_placeholder_values(
+    session_name: str,
+    name: Optional[str] = None,
+    user_guid: str = Depends(AuthService.validate_guid)
+):
+    """
+    List the values used for each placeholder of a session, with image counts.
+
+    Args:
+        session_name: Nom de la session
+        name: Only this placeholder (default: all)
+    """
+    session_path = _get_indexed_session_path(session_name)
+
+    try:
+        placeholders = get_index_repository().get_placeholder_values(session_path, placeholder=name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return PlaceholderValuesResponse(session=session_name, placeholders=placeholders)
 
 
 @router.patch("/{session_name}/metadata", response_model=SessionMetadata)
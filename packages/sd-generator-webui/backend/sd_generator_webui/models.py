@@ -226,3 +226,37 @@ class GlobalStatsResponse(BaseModel):
 
     # Stats metadata
     computed_at: datetime = Field(default_factory=datetime.now, description="When these stats were computed")
+
+
+class IndexedImage(BaseModel):
+    """Image row of a session index (index.sqlite)."""
+
+    idx: int
+    filename: str
+    seed: Optional[int] = None
+    prompt_hash: Optional[str] = None
+    variations: Dict[str, str] = Field(default_factory=dict)
+
+
+class IndexedImagesResponse(BaseModel):
+    """Response for GET /api/sessions/{name}/index/images."""
+
+    session: str
+    images: List[IndexedImage]
+    total_count: int = Field(..., description="Images matching the filters (all pages)")
+    offset: int = 0
+    limit: int = 100
+
+
+class PlaceholderValue(BaseModel):
+    """A placeholder value and the number of images using it."""
+
+    value: str
+    count: int
+
+
+class PlaceholderValuesResponse(BaseModel):
+    """Response for GET /api/sessions/{name}/index/placeholders."""
+
+    session: str
+    placeholders: Dict[str, List[PlaceholderValue]]
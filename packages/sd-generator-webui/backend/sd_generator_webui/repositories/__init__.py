@@ -2,7 +2,7 @@
 Repository pattern implementations for data access abstraction.
 
 This module provides abstract base classes and concrete implementations
-for accessing session data (stats and metadata) from various storage backends.
+for accessing session data (stats, metadata and image indexes) from various storage backends.
 """
 
 from sd_generator_webui.repositories.base import Repository, BatchRepository
@@ -14,6 +14,10 @@ from sd_generator_webui.repositories.session_metadata_repository import (
     SessionMetadataRepository,
     SQLiteSessionMetadataRepository
 )
+from sd_generator_webui.repositories.session_index_repository import (
+    SessionIndexRepository,
+    SQLiteSessionIndexRepository
+)
 
 __all__ = [
     "Repository",
@@ -22,4 +26,6 @@ __all__ = [
     "SQLiteSessionStatsRepository",
     "SessionMetadataRepository",
     "SQLiteSessionMetadataRepository",
+    "SessionIndexRepository",
+    "SQLiteSessionIndexRepository",
 ]
@@ -0,0 +1,227 @@
+"""
+Session Index Repository - Data access layer for per-session image indexes.
+
+The CLI maintains an index.sqlite file in each session directory while
+generating (see sd_generator_cli.execution.session_index):
+
+- images: idx, filename, seed, prompt_hash, one column per placeholder
+- placeholders: placeholder name -> column name
+
+Filtering images or listing placeholder values queries this index
+instead of loading and scanning manifest.json.
+"""
+
+import re
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+INDEX_FILENAME = "index.sqlite"
+
+
+class SessionIndexRepository:
+    """
+    Abstract repository interface for session image indexes.
+
+    Implementations can use different storage backends.
+    """
+
+    def has_index(self, session_path: Path) -> bool:
+        """
+        Check if a session has an image index.
+
+        Args:
+            session_path: Path to session directory
+
+        Returns:
+            True if the index exists
+        """
+        raise NotImplementedError("Subclass must implement has_index()")
+
+    def query_images(
+        self,
+        session_path: Path,
+        filters: Optional[Dict[str, str]] = None,
+        seed_min: Optional[int] = None,
+        seed_max: Optional[int] = None,
+        offset: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get one page of images matching filters, in generation order.
+
+        Args:
+            session_path: Path to session directory
+            filters: Placeholder name -> required value
+            seed_min: Minimum seed (inclusive)
+            seed_max: Maximum seed (inclusive)
+            offset: Number of matching images to skip
+            limit: Maximum number of images to return
+
+        Returns:
+            Tuple of (images, total matching count). Each image is a dict
+            with idx, filename, seed, prompt_hash and variations.
+
+        Raises:
+            ValueError: If a filter names an unknown placeholder
+        """
+        raise NotImplementedError("Subclass must implement query_images()")
+
+    def get_placeholder_values(
+        self,
+        session_path: Path,
+        placeholder: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        List the values used for each placeholder, most used first.
+
+        Args:
+            session_path: Path to session directory
+            placeholder: Only this placeholder (None = all)
+
+        Returns:
+            Dict mapping placeholder name to [{"value", "count"}, ...]
+
+        Raises:
+            ValueError: If placeholder is unknown
+        """
+        raise NotImplementedError("Subclass must implement get_placeholder_values()")
+
+
+class SQLiteSessionIndexRepository(SessionIndexRepository):
+    """
+    SQLite implementation of SessionIndexRepository.
+
+    Indexes are opened read-only: they are written by the CLI only, and
+    may be read while a session is still generating (WAL mode).
+    """
+
+    def has_index(self, session_path: Path) -> bool:
+        """
+        Check if a session has an image index.
+
+        Args:
+            session_path: Path to session directory
+
+        Returns:
+            True if the index exists
+        """
+        return (session_path / INDEX_FILENAME).is_file()
+
+    def query_images(
+        self,
+        session_path: Path,
+        filters: Optional[Dict[str, str]] = None,
+        seed_min: Optional[int] = None,
+        seed_max: Optional[int] = None,
+        offset: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get one page of images matching filters, in generation order.
+
+        Args:
+            session_path: Path to session directory
+            filters: Placeholder name -> required value
+            seed_min: Minimum seed (inclusive)
+            seed_max: Maximum seed (inclusive)
+            offset: Number of matching images to skip
+            limit: Maximum number of images to return
+
+        Returns:
+            Tuple of (images, total matching count)
+
+        Raises:
+            ValueError: If a filter names an unknown placeholder
+        """
+        with closing(self._connect(session_path)) as conn:
+            columns = self._get_columns(conn)
+
+            # Column names come from the placeholders table, values are bound
+            conditions: List[str] = []
+            params: List[Any] = []
+            for name, value in (filters or {}).items():
+                if name not in columns:
+                    raise ValueError(f"Unknown placeholder: {name}")
+                conditions.append(f"{columns[name]} = ?")
+                params.append(value)
+            if seed_min is not None:
+                conditions.append("seed >= ?")
+                params.append(seed_min)
+            if seed_max is not None:
+                conditions.append("seed <= ?")
+                params.append(seed_max)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+            total_count = conn.execute(f"SELECT COUNT(*) FROM images {where}", params).fetchone()[0]
+
+            selected = ", ".join(["idx", "filename", "seed", "prompt_hash", *columns.values()])
+            rows = conn.execute(
+                f"SELECT {selected} FROM images {where} ORDER BY idx LIMIT ? OFFSET ?",
+                params + [limit, offset]
+            ).fetchall()
+
+        images = []
+        for row in rows:
+            images.append({
+                "idx": row["idx"],
+                "filename": row["filename"],
+                "seed": row["seed"],
+                "prompt_hash": row["prompt_hash"],
+                "variations": {
+                    name: row[column] for name, column in columns.items() if row[column] is not None
+                },
+            })
+        return images, total_count
+
+    def get_placeholder_values(
+        self,
+        session_path: Path,
+        placeholder: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        List the values used for each placeholder, most used first.
+
+        Args:
+            session_path: Path to session directory
+            placeholder: Only this placeholder (None = all)
+
+        Returns:
+            Dict mapping placeholder name to [{"value", "count"}, ...]
+
+        Raises:
+            ValueError: If placeholder is unknown
+        """
+        with closing(self._connect(session_path)) as conn:
+            columns = self._get_columns(conn)
+            if placeholder is not None:
+                if placeholder not in columns:
+                    raise ValueError(f"Unknown placeholder: {placeholder}")
+                columns = {placeholder: columns[placeholder]}
+
+            values = {}
+            for name, column in columns.items():
+                rows = conn.execute(
+                    f"SELECT {column}, COUNT(*) FROM images WHERE {column} IS NOT NULL "
+                    f"GROUP BY {column} ORDER BY COUNT(*) DESC, {column}"
+                ).fetchall()
+                values[name] = [{"value": value, "count": count} for value, count in rows]
+            return values
+
+    def _connect(self, session_path: Path) -> sqlite3.Connection:
+        """Open the index of a session read-only."""
+        index_path = (session_path / INDEX_FILENAME).resolve()
+        conn = sqlite3.connect(f"{index_path.as_uri()}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _get_columns(self, conn: sqlite3.Connection) -> Dict[str, str]:
+        """Placeholder name -> images column, in creation order."""
+        rows = conn.execute("SELECT name, column_name FROM placeholders ORDER BY rowid").fetchall()
+        # Columns are interpolated in queries: only accept the CLI's v1, v2, ... names
+        return {
+            row["name"]: row["column_name"] for row in rows
+            if re.fullmatch(r"v\d+", row["column_name"])
+        }
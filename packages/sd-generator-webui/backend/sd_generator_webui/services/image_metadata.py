@@ -7,10 +7,34 @@ from typing import Any, Optional
 from PIL import Image
 
 
+# EXIF tags holding SD parameters in WebP/JPEG outputs (Exif sub-IFD UserComment)
+_EXIF_IFD = 0x8769
+_EXIF_USER_COMMENT = 0x9286
+
+
+def _read_user_comment(img: Image.Image) -> str:
+    """Read SD parameters from EXIF UserComment (WebP/JPEG, AUTOMATIC1111 convention)."""
+    raw = img.getexif().get_ifd(_EXIF_IFD).get(_EXIF_USER_COMMENT)
+    if not raw:
+        return ''
+    if isinstance(raw, str):
+        return raw
+
+    prefix, data = raw[:8], raw[8:]
+    if prefix == b'UNICODE\x00':
+        # Big-endian UTF-16 (piexif); fall back to little-endian if it has no BOM hint
+        encoding = 'utf-16-le' if data[:1] != b'\x00' and data[1:2] == b'\x00' else 'utf-16-be'
+        return data.decode(encoding, errors='ignore')
+    return data.decode('utf-8', errors='ignore')
+
+
 def extract_png_metadata(image_path: str | Path) -> dict[str, Any]:
     """
     Extract metadata from PNG image generated by Stable Diffusion WebUI.
 
+    Also reads WebP/JPEG outputs re-encoded by the CLI (parameters stored
+    in the EXIF UserComment tag).
+
     Reads the 'parameters' chunk from PNG metadata which contains:
     - Full prompt
     - Negative prompt
@@ -36,6 +60,8 @@ def extract_png_metadata(image_path: str | Path) -> dict[str, Any]:
         with Image.open(image_path) as img:
             # Get 'parameters' chunk (SD WebUI standard)
             parameters = img.info.get('parameters', '')
+            if not parameters and 'exif' in img.info:
+                parameters = _read_user_comment(img)
     except Exception as e:
         raise ValueError(f"Failed to read image: {e}") from e
 
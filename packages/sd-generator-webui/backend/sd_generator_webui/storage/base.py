@@ -12,7 +12,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, TextIO
 
 
 @dataclass
@@ -90,6 +90,23 @@ class Storage(ABC):
         """
         pass
 
+    @abstractmethod
+    def open_text(self, path: Path, encoding: str = "utf-8") -> TextIO:
+        """
+        Open a file for streaming text reads (caller closes it).
+
+        Args:
+            path: Path to file
+            encoding: Text encoding (default: utf-8)
+
+        Returns:
+            Readable text file object
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        pass
+
     @abstractmethod
     def read_bytes(self, path: Path) -> bytes:
         """
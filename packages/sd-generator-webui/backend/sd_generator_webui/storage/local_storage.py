@@ -7,7 +7,7 @@ using local filesystem via pathlib.
 
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, TextIO
 
 from sd_generator_webui.storage.base import Storage, FileMetadata
 
@@ -36,6 +36,10 @@ class LocalStorage(Storage):
         """Read text content from file."""
         return path.read_text(encoding=encoding)
 
+    def open_text(self, path: Path, encoding: str = "utf-8") -> TextIO:
+        """Open file for streaming text reads."""
+        return path.open("r", encoding=encoding)
+
     def read_bytes(self, path: Path) -> bytes:
         """Read binary content from file."""
         return path.read_bytes()
@@ -4,7 +4,8 @@ Session Storage - Filesystem operations for sessions.
 This module provides storage adapter for session-related filesystem operations:
 - Listing session folders
 - Counting images in sessions
-- Reading manifest.json files
+- Reading manifest.json files (with the images.jsonl journal of running sessions)
+- Streaming manifest image entries without loading the files
 - Checking session existence
 """
 
@@ -12,11 +13,113 @@ import json
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, TextIO
 
+from sd_generator_common.models.manifest import INTERNED_FORMAT, expand_manifest, image_expander
 from sd_generator_webui.storage.base import Storage, FileMetadata
 
 
+# Append-only images journal written by the CLI during generation,
+# merged into manifest.json when the session ends
+IMAGES_JOURNAL_FILENAME = "images.jsonl"
+
+
+class _JsonStream:
+    """
+    Incremental reader of a JSON document from a text file.
+
+    Decodes one value at a time with json.JSONDecoder.raw_decode over a
+    buffer refilled from the file, so the members of a large object or the
+    items of a large array can be visited without loading the document.
+    """
+
+    _DECODER = json.JSONDecoder()
+    _WHITESPACE = " \t\r\n"
+
+    def __init__(self, fp: TextIO, chunk_size: int = 64 * 1024):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append a chunk to the buffer (at least the unread size). False at end of file."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(max(self._chunk_size, len(self._buffer) - self._pos))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, without consuming it ("" at end of file)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in self._WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._buffer[self._pos:self._pos + 1]
+
+    def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be char."""
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self._pos}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number ending with the buffer may continue in the next chunk
+            if end < len(self._buffer) or not self._fill():
+                self._pos = end
+                return value
+
+    def members(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the next JSON object.
+
+        The caller consumes each member's value (value() or items()) before
+        asking for the next key.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self._pos += 1
+            else:
+                self.expect("}")
+                return
+
+    def items(self) -> Iterator[Any]:
+        """Iterate over the items of the next JSON array, decoding one at a time."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self._pos += 1
+            else:
+                self.expect("]")
+                return
+
+
 class SessionStorage(ABC):
     """
     Abstract storage interface for session operations.
@@ -79,7 +182,57 @@ class SessionStorage(ABC):
             session_path: Path to session directory
 
         Returns:
-            Parsed manifest dict, or None if doesn't exist
+            Parsed manifest dict in the full format (interned manifests
+            expanded, images journal merged), or None if doesn't exist
+        """
+        pass
+
+    @abstractmethod
+    def read_manifest_head(self, session_path: Path) -> Optional[Dict]:
+        """
+        Read manifest.json from session without its images.
+
+        Args:
+            session_path: Path to session directory
+
+        Returns:
+            Manifest dict without "images" (snapshot, status),
+            or None if doesn't exist or is invalid
+        """
+        pass
+
+    @abstractmethod
+    def iter_manifest_images(self, session_path: Path, offset: int = 0) -> Iterator[Dict]:
+        """
+        Stream the image entries of a session, in the full format.
+
+        Yields the same entries as read_manifest()["images"] (manifest
+        images, then the images journal), decoding one entry at a time.
+
+        Args:
+            session_path: Path to session directory
+            offset: Number of entries to skip
+
+        Returns:
+            Iterator over image entries (empty if no manifest)
+
+        Raises:
+            ValueError: If manifest.json is not valid JSON
+        """
+        pass
+
+    @abstractmethod
+    def manifest_version(self, session_path: Path) -> Optional[str]:
+        """
+        Version token of manifest.json, without reading it.
+
+        Changes whenever the file is rewritten (session compacted, resumed).
+
+        Args:
+            session_path: Path to session directory
+
+        Returns:
+            Opaque version string, or None if doesn't exist
         """
         pass
 
@@ -191,6 +344,10 @@ class LocalSessionStorage(SessionStorage):
         """
         Read manifest.json from session (local filesystem).
 
+        Interned manifests are expanded, and images of a running session
+        (images.jsonl journal) are appended to manifest["images"], so
+        callers see a single form.
+
         Args:
             session_path: Path to session directory
 
@@ -204,10 +361,145 @@ class LocalSessionStorage(SessionStorage):
 
         try:
             content = self.storage.read_text(manifest_path)
-            return json.loads(content)
+            manifest = json.loads(content)
         except (json.JSONDecodeError, FileNotFoundError):
             return None
 
+        if isinstance(manifest, dict):
+            manifest = expand_manifest(manifest)
+
+        journal_path = session_path / IMAGES_JOURNAL_FILENAME
+        if isinstance(manifest, dict) and self.storage.exists(journal_path):
+            try:
+                journal = self.storage.read_text(journal_path)
+            except FileNotFoundError:
+                journal = ""  # Compacted since exists()
+            images = manifest.setdefault("images", [])
+            known = {image.get("filename") for image in images}
+            for line in journal.splitlines():
+                try:
+                    image = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Blank or torn last line
+                if image.get("filename") not in known:
+                    images.append(image)
+
+        return manifest
+
+    def read_manifest_head(self, session_path: Path) -> Optional[Dict]:
+        """
+        Read manifest.json from session without its images (local filesystem).
+
+        Interned manifests store their images last, so reading stops at
+        the images array; full-format manifests ("status" after the images)
+        are scanned to the end, one entry at a time.
+
+        Args:
+            session_path: Path to session directory
+
+        Returns:
+            Manifest dict without "images", or None if doesn't exist or is invalid
+        """
+        manifest_path = session_path / "manifest.json"
+
+        if not self.storage.exists(manifest_path):
+            return None
+
+        head = {}
+        try:
+            with self.storage.open_text(manifest_path) as fp:
+                stream = _JsonStream(fp)
+                for key in stream.members():
+                    if key != "images":
+                        head[key] = stream.value()
+                    elif head.get("format") == INTERNED_FORMAT:
+                        break
+                    else:
+                        for _ in stream.items():
+                            pass
+        except (ValueError, FileNotFoundError):
+            return None
+
+        return {key: value for key, value in head.items() if key not in ("format", "tables")}
+
+    def iter_manifest_images(self, session_path: Path, offset: int = 0) -> Iterator[Dict]:
+        """
+        Stream the image entries of a session (local filesystem).
+
+        Skipped entries are decoded but not expanded; journal entries already
+        in manifest.json are skipped, as in read_manifest().
+
+        Args:
+            session_path: Path to session directory
+            offset: Number of entries to skip
+
+        Returns:
+            Iterator over image entries in the full format
+
+        Raises:
+            ValueError: If manifest.json is not valid JSON
+        """
+        manifest_path = session_path / "manifest.json"
+        known = set()
+
+        if self.storage.exists(manifest_path):
+            try:
+                fp = self.storage.open_text(manifest_path)
+            except FileNotFoundError:
+                fp = None  # Removed since exists()
+            if fp is not None:
+                with fp:
+                    stream = _JsonStream(fp)
+                    head = {}
+                    for key in stream.members():
+                        if key != "images":
+                            head[key] = stream.value()
+                            continue
+                        expand = image_expander(head) if head.get("format") == INTERNED_FORMAT else None
+                        for entry in stream.items():
+                            known.add(entry.get("filename"))
+                            if offset > 0:
+                                offset -= 1
+                                continue
+                            yield expand(entry) if expand else entry
+                        break
+
+        journal_path = session_path / IMAGES_JOURNAL_FILENAME
+        if not self.storage.exists(journal_path):
+            return
+        try:
+            fp = self.storage.open_text(journal_path)
+        except FileNotFoundError:
+            return  # Compacted since exists()
+        with fp:
+            for line in fp:
+                try:
+                    image = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Blank or torn last line
+                if image.get("filename") in known:
+                    continue
+                if offset > 0:
+                    offset -= 1
+                    continue
+                yield image
+
+    def manifest_version(self, session_path: Path) -> Optional[str]:
+        """
+        Version token of manifest.json from its size and modification time (local filesystem).
+
+        Args:
+            session_path: Path to session directory
+
+        Returns:
+            Version string, or None if doesn't exist
+        """
+        try:
+            metadata = self.storage.get_metadata(session_path / "manifest.json")
+        except FileNotFoundError:
+            return None
+        return f"{metadata.size:x}-{int(metadata.modified_at.timestamp() * 1_000_000):x}"
+
     def session_exists(self, session_path: Path) -> bool:
         """
         Check if session directory exists (local filesystem).
@@ -0,0 +1,74 @@
+"""
+Tests for SessionIndexRepository.
+
+Tests filtering, pagination and placeholder values over an index.sqlite
+file shaped like the ones written by the CLI.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from sd_generator_webui.repositories.session_index_repository import SQLiteSessionIndexRepository
+
+
+@pytest.fixture
+def session_path(tmp_path: Path) -> Path:
+    """Create a session with an index of 6 images (Outfit x Hair)."""
+    with sqlite3.connect(tmp_path / "index.sqlite") as conn:
+        conn.executescript("""
+            CREATE TABLE images (
+                idx INTEGER PRIMARY KEY, filename TEXT NOT NULL, seed INTEGER, prompt_hash TEXT,
+                v1 TEXT, v2 TEXT
+            );
+            CREATE TABLE placeholders (name TEXT PRIMARY KEY, column_name TEXT NOT NULL UNIQUE);
+            INSERT INTO placeholders VALUES ('Outfit', 'v1'), ('Hair', 'v2');
+        """)
+        outfits = ["red dress", "jeans", "red dress", "jeans", "red dress", "red dress"]
+        for idx, outfit in enumerate(outfits):
+            conn.execute(
+                "INSERT INTO images VALUES (?, ?, ?, ?, ?, ?)",
+                (idx, f"s_{idx:04d}.png", 100 + idx, "abc", outfit, "blonde" if idx % 2 else None)
+            )
+    return tmp_path
+
+
+class TestSessionIndexRepository:
+    """Test suite for SessionIndexRepository."""
+
+    @pytest.fixture
+    def repository(self) -> SQLiteSessionIndexRepository:
+        """Create repository."""
+        return SQLiteSessionIndexRepository()
+
+    def test_has_index(self, repository, session_path, tmp_path):
+        """Test has_index detects index.sqlite."""
+        assert repository.has_index(session_path)
+        assert not repository.has_index(tmp_path / "other")
+
+    def test_query_filters_and_paginates(self, repository, session_path):
+        """Test filters combine and total_count covers all pages."""
+        images, total_count = repository.query_images(
+            session_path, filters={"Outfit": "red dress"}, seed_min=101, offset=1, limit=1
+        )
+
+        assert total_count == 3  # idx 2, 4, 5
+        assert [image["idx"] for image in images] == [4]
+        assert images[0]["variations"] == {"Outfit": "red dress"}
+
+    def test_query_unknown_placeholder(self, repository, session_path):
+        """Test filtering on an unknown placeholder raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown placeholder"):
+            repository.query_images(session_path, filters={"Pose": "standing"})
+
+    def test_placeholder_values(self, repository, session_path):
+        """Test placeholder values are counted, most used first."""
+        values = repository.get_placeholder_values(session_path)
+
+        assert values["Outfit"] == [
+            {"value": "red dress", "count": 4},
+            {"value": "jeans", "count": 2},
+        ]
+        assert values["Hair"] == [{"value": "blonde", "count": 3}]
+        assert list(repository.get_placeholder_values(session_path, placeholder="Hair")) == ["Hair"]
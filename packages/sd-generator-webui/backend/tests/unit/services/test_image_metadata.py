@@ -0,0 +1,52 @@
+"""
+Tests for extract_png_metadata on PNG and re-encoded (WebP/JPEG) images.
+"""
+
+import pytest
+from PIL import Image, PngImagePlugin
+
+from sd_generator_webui.services.image_metadata import extract_png_metadata
+
+
+PARAMETERS = "a cat\nNegative prompt: ugly\nSteps: 20, Sampler: Euler a, Seed: 42"
+
+
+def _user_comment(text: str) -> bytes:
+    return b'UNICODE\x00' + text.encode('utf-16-be')
+
+
+class TestExtractPngMetadata:
+    """Test suite for extract_png_metadata."""
+
+    def test_reads_png_parameters_chunk(self, tmp_path):
+        """Test parameters are read from the PNG text chunk."""
+        path = tmp_path / "image.png"
+        pnginfo = PngImagePlugin.PngInfo()
+        pnginfo.add_text("parameters", PARAMETERS)
+        Image.new("RGB", (8, 8)).save(path, pnginfo=pnginfo)
+
+        metadata = extract_png_metadata(path)
+
+        assert metadata["prompt"] == "a cat"
+        assert metadata["seed"] == 42
+
+    @pytest.mark.parametrize("suffix,image_format", [(".webp", "WEBP"), (".jpg", "JPEG")])
+    def test_reads_exif_user_comment(self, tmp_path, suffix, image_format):
+        """Test parameters are read from EXIF UserComment in WebP/JPEG outputs."""
+        path = tmp_path / f"image{suffix}"
+        exif = Image.Exif()
+        exif.get_ifd(0x8769)[0x9286] = _user_comment(PARAMETERS)
+        Image.new("RGB", (8, 8)).save(path, image_format, exif=exif)
+
+        metadata = extract_png_metadata(path)
+
+        assert metadata["negative_prompt"] == "ugly"
+        assert metadata["sampler"] == "Euler a"
+
+    def test_image_without_metadata_raises(self, tmp_path):
+        """Test images without parameters are rejected."""
+        path = tmp_path / "plain.webp"
+        Image.new("RGB", (8, 8)).save(path, "WEBP")
+
+        with pytest.raises(ValueError, match="no metadata"):
+            extract_png_metadata(path)
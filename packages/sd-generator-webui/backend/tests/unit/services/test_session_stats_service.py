@@ -4,6 +4,7 @@ Tests for SessionStatsService with mocked repository.
 Tests that service correctly delegates to repository and focuses on business logic.
 """
 
+import json
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, MagicMock
@@ -12,6 +13,7 @@ import pytest
 
 from sd_generator_webui.services.session_stats import SessionStatsService
 from sd_generator_webui.models_stats import SessionStats
+from sd_generator_webui.storage.session_storage import LocalSessionStorage
 
 
 class TestSessionStatsService:
@@ -79,6 +81,53 @@ class TestSessionStatsService:
         assert saved_stats.session_name == "test_session"
         assert result.session_name == "test_session"
 
+    def test_compute_stats_reads_images_journal(self, service, tmp_path):
+        """Test compute_stats sees images of a running session (images.jsonl)."""
+        session_path = tmp_path / "test_session"
+        session_path.mkdir()
+        (session_path / "manifest.json").write_text(
+            '{"snapshot": {}, "images": [{"filename": "a.png", "seed": 5}]}'
+        )
+        # Duplicate of a compacted entry, then a torn last line
+        (session_path / "images.jsonl").write_text(
+            '{"filename": "a.png", "seed": 5}\n'
+            '{"filename": "b.png", "seed": 9}\n'
+            '{"filename": "c.png", "se'
+        )
+
+        stats = service.compute_stats(session_path)
+
+        assert stats.seed_min == 5
+        assert stats.seed_max == 9
+
+    def test_read_manifest_expands_interned_format(self, tmp_path):
+        """Test read_manifest rebuilds image entries of interned manifests."""
+        session_path = tmp_path / "test_session"
+        session_path.mkdir()
+        (session_path / "manifest.json").write_text(json.dumps({
+            "format": "interned-v1",
+            "snapshot": {
+                "resolved_template": {"prompt": "a {Color}  cat\n", "negative": "ugly"},
+                "variations": {"Color": {"available": ["red", "blue"]}}
+            },
+            "tables": {"prompt_template": "a {Color} cat", "placeholders": ["Color"], "extra_values": {"Color": ["green"]}, "negative_prompts": ["ugly"]},
+            "images": [
+                {"filename": "a.png", "seed": 5, "v": [1], "n": 0},
+                {"filename": "b.png", "seed": 6, "v": [2], "n": 0, "prompt": "a green cat, <lora:x>"}
+            ],
+            "status": "completed"
+        }))
+
+        manifest = LocalSessionStorage().read_manifest(session_path)
+
+        assert "tables" not in manifest
+        assert manifest["images"] == [
+            {"filename": "a.png", "seed": 5, "prompt": "a blue cat", "negative_prompt": "ugly",
+             "applied_variations": {"Color": "blue"}},
+            {"filename": "b.png", "seed": 6, "prompt": "a green cat, <lora:x>", "negative_prompt": "ugly",
+             "applied_variations": {"Color": "green"}}
+        ]
+
     def test_compute_stats_handles_missing_manifest(self, service, tmp_path):
         """Test compute_stats handles missing manifest gracefully."""
         session_path = tmp_path / "test_session"
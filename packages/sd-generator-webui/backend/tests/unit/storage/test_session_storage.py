@@ -0,0 +1,122 @@
+"""
+Tests for LocalSessionStorage manifest streaming.
+
+Tests that paged reads (iter_manifest_images, read_manifest_head) see the
+same entries as read_manifest, for full and interned manifests and for
+running sessions (images.jsonl journal).
+"""
+
+import json
+import os
+from itertools import islice
+from pathlib import Path
+
+import pytest
+
+from sd_generator_webui.storage.session_storage import LocalSessionStorage
+
+
+SNAPSHOT = {
+    "resolved_template": {"prompt": "a {Color} cat", "negative": "ugly"},
+    "variations": {"Color": {"available": ["red", "blue"]}}
+}
+
+
+def _image(idx: int, color: str) -> dict:
+    return {
+        "filename": f"s_{idx:04d}.png",
+        "seed": 100 + idx,
+        "prompt": f"a {color} cat",
+        "negative_prompt": "ugly",
+        "applied_variations": {"Color": color},
+    }
+
+
+@pytest.fixture
+def storage() -> LocalSessionStorage:
+    """Create local session storage."""
+    return LocalSessionStorage()
+
+
+@pytest.fixture
+def full_session(tmp_path: Path) -> Path:
+    """Create a completed session with a full-format manifest of 5 images."""
+    images = [_image(idx, ["red", "blue"][idx % 2]) for idx in range(5)]
+    (tmp_path / "manifest.json").write_text(
+        json.dumps({"snapshot": SNAPSHOT, "images": images, "status": "completed"}, indent=2)
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def interned_session(tmp_path: Path) -> Path:
+    """Create a completed session with an interned manifest of 3 images."""
+    (tmp_path / "manifest.json").write_text(json.dumps({
+        "format": "interned-v1",
+        "snapshot": SNAPSHOT,
+        "status": "completed",
+        "tables": {"placeholders": ["Color"], "extra_values": {}, "negative_prompts": ["ugly"]},
+        "images": [
+            {"filename": f"s_{idx:04d}.png", "seed": 100 + idx, "v": [idx % 2], "n": 0}
+            for idx in range(3)
+        ]
+    }))
+    return tmp_path
+
+
+class TestManifestStreaming:
+    """Test suite for paged manifest reads."""
+
+    def test_pages_match_read_manifest(self, storage, full_session):
+        """Test offset pages cover read_manifest images in order."""
+        images = storage.read_manifest(full_session)["images"]
+
+        assert list(storage.iter_manifest_images(full_session)) == images
+        assert list(islice(storage.iter_manifest_images(full_session, offset=2), 2)) == images[2:4]
+        assert list(storage.iter_manifest_images(full_session, offset=10)) == []
+
+    def test_interned_entries_are_expanded(self, storage, interned_session):
+        """Test interned entries are streamed in the full format."""
+        images = list(storage.iter_manifest_images(interned_session, offset=1))
+
+        assert images == [_image(1, "blue"), _image(2, "red")]
+        assert images == storage.read_manifest(interned_session)["images"][1:]
+
+    def test_journal_follows_manifest(self, storage, full_session):
+        """Test running sessions stream images.jsonl after manifest images."""
+        (full_session / "images.jsonl").write_text(
+            json.dumps(_image(4, "red")) + "\n"  # Already compacted
+            + json.dumps(_image(5, "blue")) + "\n"
+            + json.dumps(_image(6, "red")) + "\n"
+            + '{"filename": "s_0007.png", "se'  # Torn last line
+        )
+
+        images = list(storage.iter_manifest_images(full_session, offset=4))
+
+        assert [image["filename"] for image in images] == ["s_0004.png", "s_0005.png", "s_0006.png"]
+        assert list(storage.iter_manifest_images(full_session)) == storage.read_manifest(full_session)["images"]
+
+    def test_invalid_manifest_raises(self, storage, tmp_path):
+        """Test streaming an invalid manifest raises ValueError."""
+        (tmp_path / "manifest.json").write_text('{"snapshot": {}, "images": [{"filename": ')
+
+        with pytest.raises(ValueError):
+            list(storage.iter_manifest_images(tmp_path))
+
+    @pytest.mark.parametrize("session", ["full_session", "interned_session"])
+    def test_read_manifest_head(self, storage, session, request):
+        """Test read_manifest_head returns the manifest without images."""
+        session_path = request.getfixturevalue(session)
+
+        assert storage.read_manifest_head(session_path) == {"snapshot": SNAPSHOT, "status": "completed"}
+
+    def test_manifest_version_changes_on_rewrite(self, storage, full_session):
+        """Test manifest_version follows manifest.json rewrites."""
+        manifest_path = full_session / "manifest.json"
+        version = storage.manifest_version(full_session)
+
+        manifest_path.write_text(manifest_path.read_text().replace("completed", "aborted"))
+        os.utime(manifest_path, ns=(0, 0))
+
+        assert storage.manifest_version(full_session) not in (None, version)
+        assert storage.manifest_version(full_session / "missing") is None
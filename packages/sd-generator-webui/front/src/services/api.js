@@ -98,6 +98,20 @@ class ApiService {
     return response.data
   }
 
+  // Manifest without images (snapshot, status) - cached by the browser (ETag)
+  async getSessionManifestSnapshot(sessionName) {
+    const response = await this.client.get(`/api/sessions/${sessionName}/manifest/snapshot`)
+    return response.data
+  }
+
+  // One page of manifest image entries: { images, next_offset } (next_offset null on the last page)
+  async getSessionManifestImages(sessionName, { offset = 0, limit = 1000, fields = null } = {}) {
+    const params = { offset, limit }
+    if (fields) params.fields = fields.join(',')
+    const response = await this.client.get(`/api/sessions/${sessionName}/manifest`, { params })
+    return response.data
+  }
+
   async getGlobalStats() {
     const response = await this.client.get('/api/sessions/stats')
     return response.data
@@ -22,11 +22,16 @@ Examples:
         --background-alpha 200
 """
 
-import json
 import argparse
+import sys
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 
+# Add CLI package to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "packages" / "sd-generator-cli"))
+
+from sd_generator_cli.execution.manifest import load_manifest  # noqa: E402
+
 try:
     from PIL import Image, ImageDraw, ImageFont
 except ImportError:
@@ -211,8 +216,8 @@ def annotate_session(
         print(f"ERROR: manifest.json not found in {session_dir}")
         return 0
 
-    with open(manifest_path, 'r', encoding='utf-8') as f:
-        manifest = json.load(f)
+    # Interned manifests and images journal included
+    manifest = load_manifest(session_dir)
 
     images = manifest.get('images', [])
     if not images:
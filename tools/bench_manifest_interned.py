@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark manifest size and parse time: full vs interned format.
+
+Builds a synthetic manifest (N images, multi-placeholder ``prompt: |``
+template, prompts normalized like the generator does) or loads the
+manifest of an existing session, writes it in both formats and prints file
+sizes, json parse times, the time to expand every interned image
+(load_manifest) and the time to rebuild a single image lazily
+(expand_image). Checks the interned form expands back to the exact
+original images.
+
+Usage:
+    python3 tools/bench_manifest_interned.py
+    python3 tools/bench_manifest_interned.py --images 100000 --placeholders 10
+    python3 tools/bench_manifest_interned.py --session ./apioutput/20251014_173320-name
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add CLI and common packages to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "packages" / "sd-generator-cli"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "packages" / "sd-generator-common"))
+
+from sd_generator_cli.execution.manifest import (  # noqa: E402
+    expand_manifest,
+    intern_manifest,
+    load_manifest,
+)
+from sd_generator_common.models.manifest import expand_image, render_prompt  # noqa: E402
+from sd_generator_cli.templating.normalizers import PromptNormalizer  # noqa: E402
+
+
+def build_manifest(images: int, placeholders: int, values: int) -> dict:
+    """Build a manifest shaped like a random-mode session."""
+    names = [f"Placeholder{i}" for i in range(placeholders)]
+    available = {
+        name: [f"{name.lower()} value {v}, detailed, high quality" for v in range(values)]
+        for name in names
+    }
+    # As loaded from a "prompt: |" block: one placeholder per line, trailing newline
+    template = "masterpiece, best quality, 1girl,\n" + ",\n".join(f"{{{name}}}" for name in names) + "\n"
+    negative = "lowres, bad anatomy, bad hands, text, error, missing fingers, worst quality, low quality"
+    normalizer = PromptNormalizer()
+
+    rng = random.Random(42)
+    entries = []
+    for idx in range(images):
+        variations = {name: rng.choice(available[name]) for name in names}
+        prompt = normalizer.normalize_prompt(render_prompt(template, variations))
+        entries.append({
+            "filename": f"session_{idx:04d}_seed-{1000 + idx}.png",
+            "seed": 1000 + idx,
+            "prompt": prompt,
+            "negative_prompt": negative,
+            "applied_variations": variations,
+            "generation_time": round(rng.uniform(2, 6), 3),
+        })
+
+    return {
+        "snapshot": {
+            "version": "2.0",
+            "resolved_template": {"prompt": template, "negative": negative},
+            "variations": {
+                name: {"available": available[name], "used": available[name], "count": values}
+                for name in names
+            },
+        },
+        "images": entries,
+        "status": "completed",
+    }
+
+
+def timed(func, repeat: int = 3) -> float:
+    """Best of `repeat` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the interned manifest format")
+    parser.add_argument("--images", type=int, default=20_000, help="Number of images")
+    parser.add_argument("--placeholders", type=int, default=6, help="Number of placeholders")
+    parser.add_argument("--values", type=int, default=50, help="Values per placeholder")
+    parser.add_argument("--session", type=Path, help="Benchmark the manifest of this session instead")
+    args = parser.parse_args()
+
+    if args.session:
+        manifest = load_manifest(args.session)
+        description = f"{len(manifest['images']):,} ({args.session.name})"
+    else:
+        manifest = build_manifest(args.images, args.placeholders, args.values)
+        description = f"{args.images:,} ({args.placeholders} placeholders x {args.values} values)"
+    interned = intern_manifest(manifest)
+    stored_prompts = sum("prompt" in entry for entry in interned["images"])
+
+    if expand_manifest(interned)["images"] != manifest["images"]:
+        print("✗ Interned manifest does not expand to the original images")
+        return 1
+
+    full_text = json.dumps(manifest, indent=2, ensure_ascii=False)
+    interned_text = json.dumps(interned, indent=2, ensure_ascii=False)
+    full_size = len(full_text.encode("utf-8"))
+    interned_size = len(interned_text.encode("utf-8"))
+
+    full_parse = timed(lambda: json.loads(full_text))
+    interned_parse = timed(lambda: json.loads(interned_text))
+    expand_all = timed(lambda: expand_manifest(json.loads(interned_text)))
+    parsed = json.loads(interned_text)
+    lazy_one = timed(lambda: expand_image(parsed["images"][-1], parsed), repeat=100)
+
+    print(f"Images:               {description}")
+    print(f"Prompts stored:       {stored_prompts:,} (not rebuilt from the template)")
+    print(f"Full manifest:        {full_size / 1024 / 1024:8.2f} MB")
+    print(f"Interned manifest:    {interned_size / 1024 / 1024:8.2f} MB  ({full_size / interned_size:.1f}x smaller)")
+    print(f"Parse full:           {full_parse * 1000:8.1f} ms")
+    print(f"Parse interned:       {interned_parse * 1000:8.1f} ms  ({full_parse / interned_parse:.1f}x faster)")
+    print(f"Parse + expand all:   {expand_all * 1000:8.1f} ms")
+    print(f"Expand one (lazy):    {lazy_one * 1e6:8.1f} µs")
+    print("✓ Interned manifest expands to the original images")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark prompt normalization: rule-by-rule passes vs single-pass normalizer.
+
+Builds N prompts (default 100k) from a multi-line template with variation
+fragments, checks that both paths are byte-identical and prints throughput,
+for both normalize_prompt() and the API single-line conversion.
+
+Usage:
+    python3 tools/bench_normalizer.py
+    python3 tools/bench_normalizer.py --prompts 500000 --no-cache
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add CLI package to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "packages" / "sd-generator-cli"))
+
+from sd_generator_cli.templating.normalizers.normalizer import PromptNormalizer  # noqa: E402
+
+
+TEMPLATE = """masterpiece, best quality, {quality},
+
+1girl, {hair}, {eyes},  {outfit} ,
+{pose},, {background}
+{lora}"""
+
+FRAGMENTS = {
+    "quality": ["highres", "absurdres, ultra detailed", ""],
+    "hair": ["long hair", "short hair, bangs", "ponytail ,", ""],
+    "eyes": ["blue eyes", "green eyes,", "heterochromia"],
+    "outfit": ["school uniform", "casual, jeans , t-shirt", "", "kimono"],
+    "pose": ["standing", "sitting,", "looking at viewer", ""],
+    "background": ["city street", "forest,,", "simple background"],
+    "lora": ["<lora:detail:0.5>", "", "<lora:style:0.8>,"],
+}
+
+
+def build_prompts(count: int, seed: int):
+    """Render the template with random fragments."""
+    rng = random.Random(seed)
+    return [
+        TEMPLATE.format(**{name: rng.choice(values) for name, values in FRAGMENTS.items()})
+        for _ in range(count)
+    ]
+
+
+def run(label: str, reference, candidate, prompts) -> bool:
+    """Time both functions over the prompts and compare outputs."""
+    start = time.perf_counter()
+    expected = [reference(p) for p in prompts]
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [candidate(p) for p in prompts]
+    candidate_time = time.perf_counter() - start
+
+    count = len(prompts)
+    print(f"{label}")
+    print(f"  rule passes:  {reference_time:7.3f}s  ({count / reference_time:>10,.0f} prompts/s)")
+    print(f"  single pass:  {candidate_time:7.3f}s  ({count / candidate_time:>10,.0f} prompts/s)")
+    print(f"  speedup:      {reference_time / candidate_time:7.1f}x")
+
+    if actual != expected:
+        print("  ✗ Outputs differ")
+        return False
+    print("  ✓ Outputs are byte-identical")
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the prompt normalizer")
+    parser.add_argument("--prompts", type=int, default=100_000, help="Number of prompts")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for fragment picks")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the fragment memo")
+    args = parser.parse_args()
+
+    prompts = build_prompts(args.prompts, args.seed)
+    normalizer = PromptNormalizer(cache_size=0 if args.no_cache else 4096)
+
+    ok = run("normalize_prompt()", normalizer._apply_rules, normalizer.normalize_prompt, prompts)
+
+    ok = run(
+        "API single-line normalization",
+        lambda p: normalizer._apply_rules(p.replace("\n", ", ").replace("\r", "")),
+        normalizer.normalize_single_line,
+        prompts
+    ) and ok
+
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
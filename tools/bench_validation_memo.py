@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark schema validation: every load vs ValidationMemo fast path.
+
+Writes a synthetic variation library (default 50 files × 2000 entries) and
+loads every file several times through YamlLoader (parse cache enabled in
+all runs, so only validation differs):
+
+- validate: a memo-less loader, every load runs the Pydantic schema
+- memo: first load validates, repeated loads skip validation
+- persistent: a fresh memo (new process) reading the on-disk memo
+
+Usage:
+    python3 tools/bench_validation_memo.py
+    python3 tools/bench_validation_memo.py --files 200 --entries 5000 --loads 5
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add CLI package to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "packages" / "sd-generator-cli"))
+
+from sd_generator_cli.templating.loaders.validation_memo import ValidationMemo  # noqa: E402
+from sd_generator_cli.templating.loaders.yaml_cache import YamlParseCache  # noqa: E402
+from sd_generator_cli.templating.loaders.yaml_loader import YamlLoader  # noqa: E402
+
+
+class NoMemo(ValidationMemo):
+    """Memo that never hits (validates on every load)."""
+
+    def is_valid(self, digest, schema_class):
+        return False
+
+
+def write_library(root: Path, files: int, entries: int) -> list:
+    """Write variation files."""
+    paths = []
+    for i in range(files):
+        path = root / f"variations_{i:03d}.yaml"
+        lines = ["type: variations", "version: '2.0'", f"name: Library{i}", "variations:"]
+        lines += [f"  key_{j}: value {j} of file {i}, detailed description" for j in range(entries)]
+        path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+def run(loader: YamlLoader, paths: list, loads: int) -> float:
+    """Load every file ``loads`` times, return elapsed seconds."""
+    start = time.perf_counter()
+    for _ in range(loads):
+        for path in paths:
+            loader.load_file(path)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the validation memo")
+    parser.add_argument("--files", type=int, default=50, help="Number of variation files")
+    parser.add_argument("--entries", type=int, default=2000, help="Entries per file")
+    parser.add_argument("--loads", type=int, default=5, help="Loads of each file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        paths = write_library(root, args.files, args.entries)
+        cache = YamlParseCache(max_bytes=1 << 30)
+        run(YamlLoader(cache=cache, memo=NoMemo()), paths, 1)  # Warm parse cache
+
+        validate = run(YamlLoader(cache=cache, memo=NoMemo()), paths, args.loads)
+
+        memo = ValidationMemo(root / "validated")
+        memo_time = run(YamlLoader(cache=cache, memo=memo), paths, args.loads)
+
+        persistent = ValidationMemo(root / "validated")
+        persistent_time = run(YamlLoader(cache=cache, memo=persistent), paths, args.loads)
+
+    total = args.files * args.loads
+    print(f"Loads:              {total:,} ({args.files} files × {args.entries} entries × {args.loads})")
+    print(f"Validate each load: {validate:8.3f}s")
+    print(f"Memo (in-process):  {memo_time:8.3f}s  ({validate / memo_time:6.1f}x)")
+    print(f"Memo (persistent):  {persistent_time:8.3f}s  ({validate / persistent_time:6.1f}x)")
+    print(f"Report:             {persistent.report().summary()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
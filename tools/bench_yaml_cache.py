@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark YAML loading: uncached parsing vs YamlParseCache (memory and disk).
+
+Writes a synthetic variation library (default 50 files × 2000 entries) to a
+temporary directory and loads every file several times, as one resolve
+does (validator, import resolver, themes, chunks):
+
+- no cache: every load parses the YAML
+- memory: first load parses, repeated loads hit the in-process LRU
+- disk: a fresh cache instance (new process) reading the on-disk cache
+
+Usage:
+    python3 tools/bench_yaml_cache.py
+    python3 tools/bench_yaml_cache.py --files 200 --entries 5000 --loads 5
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add CLI package to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "packages" / "sd-generator-cli"))
+
+from sd_generator_cli.templating.loaders.yaml_cache import YamlParseCache  # noqa: E402
+
+
+def write_library(root: Path, files: int, entries: int) -> list:
+    """Write variation files and back-date them (stat-trusted entries)."""
+    paths = []
+    past = time.time() - 60
+    for i in range(files):
+        path = root / f"variations_{i:03d}.yaml"
+        lines = ["type: variations", "version: '2.0'", f"name: Library{i}", "variations:"]
+        lines += [f"  key_{j}: value {j} of file {i}, detailed description" for j in range(entries)]
+        path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        os.utime(path, (past, past))
+        paths.append(path)
+    return paths
+
+
+def run(cache: YamlParseCache, paths: list, loads: int) -> float:
+    """Load every file ``loads`` times, return elapsed seconds."""
+    start = time.perf_counter()
+    for _ in range(loads):
+        for path in paths:
+            cache.load(path)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the YAML parse cache")
+    parser.add_argument("--files", type=int, default=50, help="Number of variation files")
+    parser.add_argument("--entries", type=int, default=2000, help="Entries per file")
+    parser.add_argument("--loads", type=int, default=5, help="Loads of each file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        paths = write_library(root, args.files, args.entries)
+
+        uncached = run(YamlParseCache(max_entries=0), paths, args.loads)
+        memory = run(YamlParseCache(max_bytes=1 << 30), paths, args.loads)
+
+        disk_dir = root / "cache"
+        run(YamlParseCache(max_entries=0, cache_dir=disk_dir), paths, 1)  # Fill disk cache
+        disk = run(YamlParseCache(max_bytes=1 << 30, cache_dir=disk_dir), paths, args.loads)
+
+        reference = YamlParseCache(max_entries=0).load(paths[0])[0]
+        if YamlParseCache(cache_dir=disk_dir).load(paths[0])[0] != reference:
+            print("✗ Cached data differs from parsed data")
+            return 1
+
+    total = args.files * args.loads
+    print(f"Loads:              {total:,} ({args.files} files × {args.entries} entries × {args.loads})")
+    print(f"No cache:           {uncached:8.3f}s")
+    print(f"Memory cache:       {memory:8.3f}s  ({uncached / memory:6.1f}x)")
+    print(f"Disk cache (warm):  {disk:8.3f}s  ({uncached / disk:6.1f}x)")
+    print("✓ Cached data matches parsed data")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Migrate session manifests to the interned format (or back)
+
+Sessions written before the interned manifest schema repeat the resolved
+prompt, negative prompt and variation values in every image entry. This
+tool rewrites their manifest.json with intern_manifest(): values are
+referenced by index, prompts rebuilt from the template.
+
+Each conversion is checked before writing: a manifest is only rewritten if
+expanding the interned form gives back exactly the same images. Ongoing
+sessions are skipped (the CLI compacts them itself when they end).
+
+Usage:
+    python3 tools/migrate_manifests_interned.py /path/to/sessions --dry-run
+    python3 tools/migrate_manifests_interned.py /path/to/sessions
+    python3 tools/migrate_manifests_interned.py /path/to/sessions/20251014_173320-name --revert
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+# Add CLI and common packages to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "packages" / "sd-generator-cli"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "packages" / "sd-generator-common"))
+
+from sd_generator_cli.execution.manifest import (  # noqa: E402
+    INTERNED_FORMAT,
+    MANIFEST_FILENAME,
+    expand_manifest,
+    intern_manifest,
+    write_manifest,
+)
+
+
+def find_sessions(path: Path) -> List[Path]:
+    """Session directories under path (or path itself if it is a session)."""
+    if (path / MANIFEST_FILENAME).is_file():
+        return [path]
+    return sorted(p.parent for p in path.glob(f"*/{MANIFEST_FILENAME}"))
+
+
+def migrate_session(session_dir: Path, revert: bool = False, dry_run: bool = False) -> Tuple[str, int, int]:
+    """
+    Convert one session manifest
+
+    Args:
+        session_dir: Session directory
+        revert: Convert interned manifests back to the full format
+        dry_run: Compute sizes without writing
+
+    Returns:
+        Tuple of (outcome, size before, size after); outcome is one of
+        "converted", "skipped: <reason>"
+    """
+    manifest_path = session_dir / MANIFEST_FILENAME
+    content = manifest_path.read_text(encoding='utf-8')
+    size_before = len(content.encode('utf-8'))
+
+    try:
+        manifest = json.loads(content)
+    except json.JSONDecodeError as e:
+        return f"skipped: invalid JSON ({e})", size_before, size_before
+
+    if manifest.get("status", "ongoing") == "ongoing":
+        return "skipped: session ongoing", size_before, size_before
+
+    is_interned = manifest.get("format") == INTERNED_FORMAT
+    if is_interned != revert:
+        return "skipped: already converted", size_before, size_before
+
+    if revert:
+        converted = expand_manifest(manifest)
+    else:
+        converted = intern_manifest(manifest)
+        if expand_manifest(converted).get("images") != manifest.get("images", []):
+            return "skipped: images cannot be rebuilt exactly", size_before, size_before
+
+    size_after = len(json.dumps(converted, indent=2, ensure_ascii=False).encode('utf-8'))
+    if not dry_run:
+        write_manifest(session_dir, converted)
+    return "converted", size_before, size_after
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Migrate session manifests to the interned format",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Preview size savings
+  python3 tools/migrate_manifests_interned.py ./apioutput --dry-run
+
+  # Convert every session
+  python3 tools/migrate_manifests_interned.py ./apioutput
+
+  # Back to the full format (tools that read manifest.json directly)
+  python3 tools/migrate_manifests_interned.py ./apioutput --revert
+        """
+    )
+    parser.add_argument('path', type=Path, help='Sessions directory, or a single session directory')
+    parser.add_argument('--revert', action='store_true', help='Convert interned manifests back to the full format')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would be converted without writing')
+    args = parser.parse_args()
+
+    sessions = find_sessions(args.path)
+    if not sessions:
+        print(f"No session with a {MANIFEST_FILENAME} found in {args.path}")
+        return 1
+
+    converted = 0
+    total_before = 0
+    total_after = 0
+    for session_dir in sessions:
+        outcome, size_before, size_after = migrate_session(session_dir, revert=args.revert, dry_run=args.dry_run)
+        if outcome == "converted":
+            converted += 1
+            total_before += size_before
+            total_after += size_after
+            print(f"✓ {session_dir.name}: {size_before / 1024:,.1f} KB → {size_after / 1024:,.1f} KB")
+        else:
+            print(f"- {session_dir.name}: {outcome}")
+
+    action = "Would convert" if args.dry_run else "Converted"
+    print(f"\n{action} {converted}/{len(sessions)} sessions")
+    if converted:
+        print(f"Manifest size: {total_before / 1024:,.1f} KB → {total_after / 1024:,.1f} KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())